@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Benchmark for the list comparator options on large list configs (port groups, VMs, users).
+
+Usage:
+    python3 -m benchmarks.comparator_benchmark --size 50000 --repeat 3
+"""
+import argparse
+import random
+import timeit
+
+from config_modules_vmware.framework.utils.comparator import Comparator
+from config_modules_vmware.framework.utils.comparator import ComparatorOptionForList
+
+
+def _build_port_groups(size):
+    return [
+        {
+            "name": f"dvpg-{i}",
+            "switch_name": f"dvs-{i % 16}",
+            "vlan_id": i % 4094,
+            "allow_promiscuous": False,
+            "forged_transmits": bool(i % 2),
+            "uplinks": [f"uplink-{i % 4}", f"uplink-{(i + 1) % 4}"],
+        }
+        for i in range(size)
+    ]
+
+
+def _build_data(size, compliant):
+    current = _build_port_groups(size)
+    desired = _build_port_groups(size)
+    random.Random(size).shuffle(desired)
+    for port_group in desired:
+        port_group["uplinks"].reverse()
+    if not compliant:
+        desired[size // 2]["vlan_id"] = -1
+    return current, desired
+
+
+def run(size, repeat):
+    """Run the benchmark and print the best time for each comparator option."""
+    for compliant in (True, False):
+        current, desired = _build_data(size, compliant)
+        results = {}
+        for option in (ComparatorOptionForList.COMPARE_AFTER_SORT, ComparatorOptionForList.COMPARE_AFTER_HASH):
+            results[option] = Comparator.get_non_compliant_configs(current, desired, comparator_option=option)
+            best = min(
+                timeit.repeat(
+                    lambda: Comparator.get_non_compliant_configs(current, desired, comparator_option=option),
+                    number=1,
+                    repeat=repeat,
+                )
+            )
+            print(f"size={size} compliant={compliant} option={option.name}: {best:.3f}s")
+        if len({repr(result) for result in results.values()}) != 1:
+            raise AssertionError("Comparator options returned different results")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark list comparator options.")
+    parser.add_argument("--size", type=int, default=50000, help="Number of elements in each list.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per option.")
+    args = parser.parse_args()
+    run(args.size, args.repeat)
@@ -0,0 +1 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
@@ -0,0 +1,512 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Synthetic vCenter inventory for replaying VMOMI and REST responses without a vCenter.
+
+Managed object references are created without a stub, they are bound to the client stub when the responses are
+deserialized.
+"""
+import datetime
+import math
+import threading
+
+from pyVmomi import vim  # pylint: disable=E0401
+from pyVmomi import vmodl  # pylint: disable=E0401
+
+VCENTER_VERSION = "8.0.3"
+VCENTER_BUILD = "24022515"
+ROOT_FOLDER_MOID = "group-d1"
+
+# Advanced settings of the vCenter read and updated by the vpxd option controls.
+DEFAULT_VPXD_OPTIONS = {
+    "config.log.level": "info",
+    "config.vpxd.hostPasswordLength": 32,
+    "config.SDDC.Deployed.ComplianceKit": "",
+    "event.maxAge": 30,
+    "event.maxAgeEnabled": True,
+    "task.maxAge": 30,
+    "task.maxAgeEnabled": True,
+    "VirtualCenter.VimPasswordExpirationInDays": 30,
+    "vpxd.event.syslog.enabled": True,
+}
+
+# Advanced settings of each ESXi host read and updated by the ESXi advanced settings controls.
+DEFAULT_HOST_OPTIONS = {
+    "Annotations.WelcomeMessage": "",
+    "Config.HostAgent.log.level": "info",
+    "Config.HostAgent.plugins.solo.enableMob": False,
+    "Config.HostAgent.vmacore.soap.sessionTimeout": 30,
+    "DCUI.Access": "root",
+    "Mem.ShareForceSalting": 2,
+    "Net.BlockGuestBPDU": 1,
+    "Security.AccountLockFailures": 5,
+    "Security.AccountUnlockTime": 900,
+    "Security.PasswordHistory": 5,
+    "Security.PasswordMaxDays": 90,
+    "Syslog.global.logHost": "",
+    "UserVars.DcuiTimeOut": 600,
+    "UserVars.ESXiShellInteractiveTimeOut": 900,
+    "UserVars.HostClientSessionTimeout": 900,
+    "UserVars.SuppressShellWarning": 0,
+}
+
+# Services of each ESXi host, key -> (label, running, policy).
+DEFAULT_HOST_SERVICES = {
+    "TSM": ("ESXi Shell", False, "off"),
+    "TSM-SSH": ("SSH", False, "off"),
+    "ntpd": ("NTP Daemon", True, "on"),
+    "sfcbd-watchdog": ("CIM Server", False, "off"),
+    "slpd": ("slpd", False, "off"),
+    "snmpd": ("SNMP Server", False, "off"),
+}
+
+# Appliance REST API resources updated with PUT, path -> function converting the request body to the new value.
+REST_UPDATES = {
+    "api/appliance/ntp": lambda body: body["servers"],
+    "api/appliance/timesync": lambda body: body["mode"],
+    "api/appliance/networking/dns/servers": lambda body: body,
+    "api/appliance/logging/forwarding": lambda body: body["cfg_list"],
+}
+
+_MANAGERS = {
+    "propertyCollector": vmodl.query.PropertyCollector,
+    "viewManager": vim.view.ViewManager,
+    "setting": vim.option.OptionManager,
+    "sessionManager": vim.SessionManager,
+    "authorizationManager": vim.AuthorizationManager,
+    "alarmManager": vim.alarm.AlarmManager,
+    "eventManager": vim.event.EventManager,
+    "taskManager": vim.TaskManager,
+    "extensionManager": vim.ExtensionManager,
+    "searchIndex": vim.SearchIndex,
+    "dvSwitchManager": vim.dvs.DistributedVirtualSwitchManager,
+}
+_MANAGER_MOIDS = {
+    "propertyCollector": "propertyCollector",
+    "viewManager": "ViewManager",
+    "setting": "VpxSettings",
+    "sessionManager": "SessionManager",
+    "authorizationManager": "AuthorizationManager",
+    "alarmManager": "AlarmManager",
+    "eventManager": "EventManager",
+    "taskManager": "TaskManager",
+    "extensionManager": "ExtensionManager",
+    "searchIndex": "SearchIndex",
+    "dvSwitchManager": "DVSManager",
+}
+
+
+class SyntheticInventory(object):
+    """
+    Inventory of a vCenter with one datacenter, clusters of hosts, distributed switches with port groups and
+    datastores, sized by the number of hosts.
+    The properties of the managed objects and the advanced options are updated by the replayed remediation calls.
+    """
+
+    def __init__(
+        self,
+        num_hosts,
+        port_groups_per_host=2,
+        hosts_per_cluster=32,
+        hosts_per_switch=64,
+        hosts_per_datastore=8,
+        hostname="vcenter.vsphere.local",
+    ):
+        """
+        :param num_hosts: Number of ESXi hosts.
+        :type num_hosts: int
+        :param port_groups_per_host: Number of distributed port groups per host, spread over the switches.
+        :type port_groups_per_host: int
+        :param hosts_per_cluster: Maximum number of hosts per cluster.
+        :type hosts_per_cluster: int
+        :param hosts_per_switch: Maximum number of hosts per distributed switch.
+        :type hosts_per_switch: int
+        :param hosts_per_datastore: Number of hosts sharing a datastore.
+        :type hosts_per_datastore: int
+        :param hostname: vCenter hostname.
+        :type hostname: str
+        """
+        self.num_hosts = num_hosts
+        self.hostname = hostname
+        self.lock = threading.Lock()
+        # option manager moid -> dict of option key to value
+        self.options = {_MANAGER_MOIDS["setting"]: dict(DEFAULT_VPXD_OPTIONS)}
+        self.vpxd_options = self.options[_MANAGER_MOIDS["setting"]]
+        # host access manager moid -> lockdown exception users
+        self.lockdown_exceptions = {}
+        # moid -> (managed object type, dict of property name to value)
+        self.entities = {}
+        self._children = {}
+        self._next_moid = 1000
+        self._build(
+            max(port_groups_per_host * num_hosts, 4),
+            hosts_per_cluster,
+            hosts_per_switch,
+            hosts_per_datastore,
+        )
+        # REST API path -> json value
+        self.rest_resources = {
+            "api/appliance/system/version": {
+                "product": "VMware vCenter Server",
+                "type": "vCenter Server with an embedded Platform Services Controller",
+                "version": f"{VCENTER_VERSION}.00000",
+                "build": VCENTER_BUILD,
+            },
+            "api/appliance/ntp": ["ntp-1.vsphere.local", "ntp-2.vsphere.local"],
+            "api/appliance/timesync": "NTP",
+            "api/appliance/networking/dns/servers": {"mode": "is_static", "servers": ["10.0.0.53", "10.0.0.54"]},
+            "api/appliance/logging/forwarding": [{"hostname": "syslog.vsphere.local", "port": 514, "protocol": "UDP"}],
+            "api/appliance/recovery/backup/schedules": {},
+            "api/appliance/tls/profiles/global": {"profile": "NIST_2024"},
+            "api/appliance/tls/profiles/NIST_2024": {
+                "protocol_versions": [{"version": "tlsv1_2", "ciphers": []}, {"version": "tlsv1_3", "ciphers": []}]
+            },
+            "api/vcenter/certificate-management/vcenter/tls": {
+                "issuer_dn": "CN=CA, DC=vsphere, DC=local, C=US, ST=California, O=vcenter.vsphere.local",
+                "subject_dn": f"CN={hostname}, C=US",
+                "valid_from": "2024-01-01T00:00:00.000Z",
+                "valid_to": "2034-01-01T00:00:00.000Z",
+            },
+            "api/vcenter/host": self.get_host_summaries(),
+        }
+
+    def _new_moid(self, prefix):
+        self._next_moid += 1
+        return f"{prefix}-{self._next_moid}"
+
+    def add_entity(self, moid, vimtype, **props):
+        """
+        Add a managed object to the inventory.
+        :param moid: Managed object id.
+        :type moid: str
+        :param vimtype: Managed object type, e.g. vim.HostSystem.
+        :type vimtype: type
+        :param props: Property values, the parent of managed entities is given as 'parent'.
+        :return: Managed object reference.
+        """
+        self.entities[moid] = (vimtype, props)
+        parent = props.get("parent")
+        if parent is not None:
+            self._children.setdefault(parent._moId, []).append(moid)
+        return vimtype(moid)
+
+    def _build(self, num_port_groups, hosts_per_cluster, hosts_per_switch, hosts_per_datastore):
+        managers = {name: vimtype(_MANAGER_MOIDS[name]) for name, vimtype in _MANAGERS.items()}
+        for name, manager in managers.items():
+            self.add_entity(manager._moId, type(manager))
+        self.entities["AuthorizationManager"][1]["roleList"] = [
+            vim.AuthorizationManager.Role(roleId=role_id, system=role_id < 0, name=name, privilege=[])
+            for role_id, name in ((-1, "Admin"), (-2, "ReadOnly"), (-5, "NoAccess"), (1001, "Operator"))
+        ]
+        self.entities["ExtensionManager"][1]["extensionList"] = []
+        root_folder = self.add_entity(
+            ROOT_FOLDER_MOID, vim.Folder, name="Datacenters", childType=["Folder", "Datacenter"]
+        )
+        self.content = vim.ServiceInstanceContent(
+            rootFolder=root_folder,
+            about=vim.AboutInfo(
+                name="VMware vCenter Server",
+                fullName=f"VMware vCenter Server {VCENTER_VERSION} build-{VCENTER_BUILD}",
+                vendor="VMware, Inc.",
+                version=VCENTER_VERSION,
+                build=VCENTER_BUILD,
+                osType="linux-x64",
+                productLineId="vpx",
+                apiType="VirtualCenter",
+                apiVersion="8.0.3.0",
+                instanceUuid="6a7a0b7e-4c1f-4b4e-9a4e-0c9f3a2f4a10",
+                licenseProductName="VMware VirtualCenter Server",
+                licenseProductVersion="8.0",
+            ),
+            **managers,
+        )
+
+        datacenter = self.add_entity("datacenter-1", vim.Datacenter, name="datacenter-1", parent=root_folder)
+        folders = {}
+        for folder_name, child_type in (
+            ("host", "ComputeResource"),
+            ("network", "Network"),
+            ("datastore", "Datastore"),
+        ):
+            folders[folder_name] = self.add_entity(
+                self._new_moid("group"), vim.Folder, name=folder_name, parent=datacenter, childType=[child_type]
+            )
+        self.entities[datacenter._moId][1].update(
+            hostFolder=folders["host"], networkFolder=folders["network"], datastoreFolder=folders["datastore"]
+        )
+
+        hosts = []
+        for cluster_index in range(math.ceil(self.num_hosts / hosts_per_cluster)):
+            cluster = self.add_entity(
+                self._new_moid("domain-c"),
+                vim.ClusterComputeResource,
+                name=f"cluster-{cluster_index + 1}",
+                parent=folders["host"],
+            )
+            cluster_hosts = []
+            for _ in range(min(hosts_per_cluster, self.num_hosts - len(hosts))):
+                host = self._add_host(f"esxi-{len(hosts) + 1:04d}.vsphere.local", cluster)
+                hosts.append(host)
+                cluster_hosts.append(host)
+            self.entities[cluster._moId][1]["host"] = cluster_hosts
+
+        for datastore_index in range(math.ceil(self.num_hosts / hosts_per_datastore)):
+            name = f"datastore-{datastore_index + 1}"
+            moid = self._new_moid("datastore")
+            self.add_entity(
+                moid,
+                vim.Datastore,
+                name=name,
+                parent=folders["datastore"],
+                summary=vim.Datastore.Summary(
+                    datastore=vim.Datastore(moid),
+                    name=name,
+                    url=f"ds:///vmfs/volumes/{moid}/",
+                    capacity=4 * 1024**4,
+                    freeSpace=2 * 1024**4,
+                    accessible=True,
+                    type="VMFS",
+                ),
+            )
+
+        num_switches = math.ceil(self.num_hosts / hosts_per_switch)
+        switches = []
+        for switch_index in range(num_switches):
+            moid = self._new_moid("dvs")
+            name = f"dvs-{switch_index + 1}"
+            switch_hosts = hosts[switch_index * hosts_per_switch : (switch_index + 1) * hosts_per_switch]
+            switch = self.add_entity(
+                moid,
+                vim.dvs.VmwareDistributedVirtualSwitch,
+                name=name,
+                parent=folders["network"],
+                config=vim.dvs.VmwareDistributedVirtualSwitch.ConfigInfo(
+                    uuid=f"50 2b {switch_index:02x} 00",
+                    name=name,
+                    numStandalonePorts=0,
+                    numPorts=len(switch_hosts) * 16,
+                    maxPorts=2147483647,
+                    configVersion="1",
+                    networkResourceManagementEnabled=True,
+                    maxMtu=9000,
+                    uplinkPortPolicy=vim.DistributedVirtualSwitch.NameArrayUplinkPortPolicy(
+                        uplinkPortName=["uplink1", "uplink2"]
+                    ),
+                    defaultPortConfig=vim.dvs.VmwareDistributedVirtualSwitch.VmwarePortConfigPolicy(),
+                    productInfo=vim.dvs.ProductSpec(name="DVS", vendor="VMware, Inc.", version="8.0.3"),
+                    contact=vim.DistributedVirtualSwitch.ContactInfo(),
+                    ipfixConfig=vim.dvs.VmwareDistributedVirtualSwitch.IpfixConfig(
+                        collectorPort=0,
+                        activeFlowTimeout=60,
+                        idleFlowTimeout=15,
+                        samplingRate=4096,
+                        internalFlowsOnly=False,
+                    ),
+                    host=[
+                        vim.dvs.HostMember(
+                            config=vim.dvs.HostMember.ConfigInfo(
+                                host=host, maxProxySwitchPorts=64, backing=vim.dvs.HostMember.PnicBacking()
+                            ),
+                            status="up",
+                        )
+                        for host in switch_hosts
+                    ],
+                    healthCheckConfig=[
+                        vim.dvs.VmwareDistributedVirtualSwitch.VlanMtuHealthCheckConfig(enable=False, interval=1),
+                        vim.dvs.VmwareDistributedVirtualSwitch.TeamingHealthCheckConfig(enable=False, interval=1),
+                    ],
+                    createTime=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+                ),
+            )
+            switches.append(switch)
+            self._add_port_group(switch, folders["network"], f"{name}-uplinks", 0, uplink=True)
+
+        for port_group_index in range(num_port_groups):
+            switch = switches[port_group_index % num_switches]
+            self._add_port_group(
+                switch,
+                folders["network"],
+                f"pg-{port_group_index + 1:05d}",
+                100 + port_group_index % 3900,
+            )
+
+    def _add_host(self, name, cluster):
+        moid = self._new_moid("host")
+        host = vim.HostSystem(moid)
+        suffix = moid.partition("-")[2]
+        date_time_info = vim.host.DateTimeInfo(
+            timeZone=vim.host.DateTimeSystem.TimeZone(key="UTC", name="UTC", description="UTC", gmtOffset=0),
+            systemClockProtocol="ntp",
+            ntpConfig=vim.host.NtpConfig(server=["ntp-1.vsphere.local", "ntp-2.vsphere.local"]),
+        )
+        config_manager = vim.host.ConfigManager(
+            advancedOption=self.add_entity(f"EsxHostAdvSettings-{suffix}", vim.option.OptionManager),
+            serviceSystem=self.add_entity(
+                f"serviceSystem-{suffix}",
+                vim.host.ServiceSystem,
+                serviceInfo=vim.host.ServiceInfo(
+                    service=[
+                        vim.host.Service(
+                            key=key, label=label, required=False, uninstallable=False, running=running, policy=policy
+                        )
+                        for key, (label, running, policy) in DEFAULT_HOST_SERVICES.items()
+                    ]
+                ),
+            ),
+            dateTimeSystem=self.add_entity(
+                f"dateTimeSystem-{suffix}", vim.host.DateTimeSystem, dateTimeInfo=date_time_info
+            ),
+            hostAccessManager=self.add_entity(
+                f"hostAccessManager-{suffix}",
+                vim.host.HostAccessManager,
+                lockdownMode="lockdownDisabled",
+            ),
+        )
+        self.options[config_manager.advancedOption._moId] = dict(DEFAULT_HOST_OPTIONS)
+        self.lockdown_exceptions[config_manager.hostAccessManager._moId] = []
+        return self.add_entity(
+            moid,
+            vim.HostSystem,
+            name=name,
+            parent=cluster,
+            runtime=vim.host.RuntimeInfo(connectionState="connected", powerState="poweredOn", inMaintenanceMode=False),
+            configManager=config_manager,
+            config=vim.host.ConfigInfo(
+                host=host,
+                product=vim.AboutInfo(
+                    name="VMware ESXi",
+                    fullName=f"VMware ESXi {VCENTER_VERSION} build-{VCENTER_BUILD}",
+                    vendor="VMware, Inc.",
+                    version=VCENTER_VERSION,
+                    build=VCENTER_BUILD,
+                    osType="vmnix-x86",
+                    productLineId="embeddedEsx",
+                    apiType="HostAgent",
+                    apiVersion="8.0.3.0",
+                ),
+                dateTimeInfo=date_time_info,
+            ),
+        )
+
+    def _add_port_group(self, switch, network_folder, name, vlan_id, uplink=False):
+        moid = self._new_moid("dvportgroup")
+        security_policy = vim.dvs.VmwareDistributedVirtualSwitch.SecurityPolicy(
+            allowPromiscuous=vim.BoolPolicy(value=False),
+            macChanges=vim.BoolPolicy(value=False),
+            forgedTransmits=vim.BoolPolicy(value=False),
+        )
+        self.add_entity(
+            moid,
+            vim.dvs.DistributedVirtualPortgroup,
+            name=name,
+            parent=network_folder,
+            key=moid,
+            config=vim.dvs.DistributedVirtualPortgroup.ConfigInfo(
+                key=moid,
+                name=name,
+                numPorts=8,
+                type="earlyBinding",
+                distributedVirtualSwitch=switch,
+                configVersion="1",
+                uplink=uplink,
+                backingType="standard",
+                defaultPortConfig=vim.dvs.VmwareDistributedVirtualSwitch.VmwarePortConfigPolicy(
+                    securityPolicy=security_policy,
+                    vlan=vim.dvs.VmwareDistributedVirtualSwitch.VlanIdSpec(vlanId=vlan_id),
+                ),
+                policy=vim.dvs.VmwareDistributedVirtualSwitch.VMwarePortgroupPolicy(),
+            ),
+        )
+
+    def apply_drift(self):
+        """
+        Change part of the configuration away from its initial values, so that check compliance finds drifts and
+        remediation has changes to apply: every other port group, the vpxd options and the NTP and DNS servers.
+        """
+        with self.lock:
+            port_groups = [
+                props["config"]
+                for vimtype, props in self.entities.values()
+                if vimtype is vim.dvs.DistributedVirtualPortgroup and not props["config"].uplink
+            ]
+            for config in port_groups[::2]:
+                security_policy = config.defaultPortConfig.securityPolicy
+                security_policy.allowPromiscuous.value = True
+                security_policy.macChanges.value = True
+                security_policy.forgedTransmits.value = True
+            self.vpxd_options.update(
+                {"config.log.level": "verbose", "event.maxAge": 7, "task.maxAge": 7, "vpxd.event.syslog.enabled": False}
+            )
+            self.rest_resources["api/appliance/ntp"] = ["drifted-ntp.vsphere.local"]
+            self.rest_resources["api/appliance/networking/dns/servers"] = {
+                "mode": "is_static",
+                "servers": ["10.0.0.99"],
+            }
+
+    def get_type(self, moid):
+        """
+        Get the managed object type.
+        :param moid: Managed object id.
+        :type moid: str
+        :return: Managed object type or None if not in the inventory.
+        """
+        entity = self.entities.get(moid)
+        return entity[0] if entity else None
+
+    def get_property(self, moid, name):
+        """
+        Get a property of a managed object.
+        :param moid: Managed object id.
+        :type moid: str
+        :param name: Property name, nested properties are separated with '.'.
+        :type name: str
+        :return: Property value or None if unset.
+        :raise: KeyError if the managed object is not in the inventory.
+        """
+        first, _, rest = name.partition(".")
+        if moid == "ServiceInstance" and first == "content":
+            value = self.content
+        else:
+            value = self.entities[moid][1].get(first)
+        for attribute in rest.split(".") if rest else []:
+            value = getattr(value, attribute, None)
+        return value
+
+    def get_contained(self, container_moid, vimtypes, recursive=True):
+        """
+        Get the managed entities in a container, like a container view.
+        :param container_moid: Managed object id of the folder, datacenter or cluster.
+        :type container_moid: str
+        :param vimtypes: Managed entity types to include, all types if empty.
+        :type vimtypes: list
+        :param recursive: Include the entities of nested containers.
+        :type recursive: bool
+        :return: Managed object ids in depth first order.
+        :rtype: list
+        """
+        contained = []
+        pending = list(reversed(self._children.get(container_moid, [])))
+        while pending:
+            moid = pending.pop()
+            vimtype = self.entities[moid][0]
+            if not vimtypes or any(issubclass(vimtype, requested) for requested in vimtypes):
+                contained.append(moid)
+            if recursive:
+                pending.extend(reversed(self._children.get(moid, [])))
+        return contained
+
+    def get_host_summaries(self):
+        """
+        Get the hosts in the format of the vCenter 'api/vcenter/host' REST API.
+        :return: List of host summaries.
+        :rtype: list
+        """
+        return [
+            {
+                "host": moid,
+                "name": props["name"],
+                "connection_state": "CONNECTED",
+                "power_state": "POWERED_ON",
+            }
+            for moid, (vimtype, props) in self.entities.items()
+            if vimtype is vim.HostSystem
+        ]
@@ -0,0 +1,267 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Replay of vCenter REST and VMOMI responses through the existing client classes.
+
+The transports of the clients are patched below the client code: urllib3 pool managers for REST and the SOAP stub
+for VMOMI. SOAP requests and responses are still serialized and deserialized, so the client side cost is measured.
+Responses come from recorded fixtures when available, from the synthetic inventory otherwise.
+"""
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack
+from unittest import mock
+from urllib.parse import urlsplit
+
+import urllib3
+from pyVmomi import SoapStubAdapter  # pylint: disable=E0401
+from pyVmomi import vmodl  # pylint: disable=E0401
+
+from benchmarks.fleet.responder import SyntheticVcenter
+from config_modules_vmware.framework.clients.vcenter.dependencies import pyVmomi as vendored_pyvmomi
+from config_modules_vmware.framework.clients.vcenter.dependencies.pyVim import sso
+
+# Container view ids differ per session, they are masked in the keys of the recorded SOAP responses.
+_SESSION_MOID = re.compile(r"session\[[^\]]*\][\w-]*")
+
+
+def load_fixtures(path):
+    """
+    Load recorded fixtures.
+    :param path: Path of the fixtures json file.
+    :type path: str
+    :return: Dict with the recorded 'rest' and 'soap' responses.
+    :rtype: dict
+    """
+    with open(path, encoding="utf-8") as fixtures_file:
+        fixtures = json.load(fixtures_file)
+    return {"rest": fixtures.get("rest", {}), "soap": fixtures.get("soap", {})}
+
+
+def get_rest_key(method, url):
+    """
+    Get the key of a REST response in the fixtures.
+    :param method: HTTP method.
+    :type method: str
+    :param url: Request url.
+    :type url: str
+    :return: Key, e.g. 'GET api/appliance/ntp'.
+    :rtype: str
+    """
+    split_url = urlsplit(url)
+    path = split_url.path.lstrip("/")
+    return f"{method} {path}?{split_url.query}" if split_url.query else f"{method} {path}"
+
+
+def get_soap_key(stub, mo, info, args):
+    """
+    Get the key of a SOAP response in the fixtures, from the method, the managed object and the serialized request.
+    :return: Key, e.g. 'Fetch host-1001 3f2a...'.
+    :rtype: str
+    """
+    request = stub.SerializeRequest(mo, info, args)
+    if isinstance(request, bytes):
+        request = request.decode("utf-8")
+    digest = hashlib.sha1(_SESSION_MOID.sub("session[]", request).encode(), usedforsecurity=False).hexdigest()
+    return f"{info.wsdlName} {_SESSION_MOID.sub('session[]', mo._moId)} {digest}"
+
+
+def _get_soap_adapter(stub):
+    # the SSO client uses the pyVmomi copy vendored in the package, with its own types and serializer
+    return sys.modules[type(stub).__module__]
+
+
+def serialize_result(stub, info, result):
+    """
+    Serialize a VMOMI method result as the content of the SOAP response body.
+    :return: Serialized result.
+    :rtype: str
+    """
+    if result is None:
+        return ""
+    soap_adapter = _get_soap_adapter(stub)
+    return soap_adapter.Serialize(
+        result,
+        soap_adapter.Object(name="returnval", type=info.result, version=stub.version, flags=info.resultFlags),
+        stub.version,
+    ).decode(soap_adapter.XML_ENCODING)
+
+
+def _deserialize_result(stub, outer_stub, info, returnval):
+    soap_adapter = _get_soap_adapter(stub)
+    response = (
+        f"{soap_adapter.SOAP_START}<{info.wsdlName}Response>{returnval}"
+        f"</{info.wsdlName}Response>{soap_adapter.SOAP_END}"
+    )
+    return soap_adapter.SoapResponseDeserializer(outer_stub).Deserialize(response.encode(), info.result)
+
+
+class ReplayTransport(object):
+    """
+    Context manager patching the REST and SOAP transports of the clients to replay responses with a fixed latency.
+    Unhandled requests are answered with a 404 status or a NotSupported fault and counted, so the fixtures can be
+    completed by recording them from a vCenter.
+    """
+
+    def __init__(self, inventory, latency_ms=0, fixtures=None):
+        """
+        :param inventory: Synthetic inventory serving the responses not found in the fixtures.
+        :type inventory: SyntheticInventory
+        :param latency_ms: Latency added to each request in milliseconds.
+        :type latency_ms: float
+        :param fixtures: Recorded fixtures, see :func:`load_fixtures`.
+        :type fixtures: dict
+        """
+        self.inventory = inventory
+        self.vcenter = SyntheticVcenter(inventory)
+        self.latency = latency_ms / 1000
+        self.fixtures = fixtures or {"rest": {}, "soap": {}}
+        self.calls = Counter()
+        self.unhandled = Counter()
+        self._lock = threading.Lock()
+        self._exit_stack = None
+
+    def __enter__(self):
+        self._exit_stack = ExitStack()
+        transport = self
+
+        def urlopen(manager, method, url, redirect=True, **kwargs):
+            return transport.handle_rest(method, url, kwargs.get("body"))
+
+        def invoke_method(stub, mo, info, args, outerStub=None):
+            return transport.handle_soap(stub, mo, info, args, outerStub)
+
+        for manager_class in (urllib3.PoolManager, urllib3.ProxyManager):
+            self._exit_stack.enter_context(mock.patch.object(manager_class, "urlopen", urlopen))
+        for stub_class in (SoapStubAdapter, vendored_pyvmomi.SoapStubAdapter):
+            self._exit_stack.enter_context(mock.patch.object(stub_class, "InvokeMethod", invoke_method))
+        self._exit_stack.enter_context(
+            mock.patch.object(sso.SsoAuthenticator, "get_bearer_saml_assertion", self._get_saml_assertion)
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._exit_stack.close()
+
+    def _get_saml_assertion(self, *args, **kwargs):
+        time.sleep(self.latency)
+        self._count("sts", "get_bearer_saml_assertion", True)
+        return f'<saml2:Assertion xmlns:saml2="urn:oasis:names:tc:SAML:2.0:assertion" ID="_{uuid.uuid4()}"/>'
+
+    def _count(self, protocol, key, handled):
+        with self._lock:
+            self.calls[protocol] += 1
+            if not handled:
+                self.unhandled[f"{protocol} {key}"] += 1
+
+    def handle_rest(self, method, url, body):
+        """
+        Answer a REST request.
+        :return: Response.
+        :rtype: urllib3.HTTPResponse
+        """
+        time.sleep(self.latency)
+        key = get_rest_key(method, url)
+        recorded = self.fixtures["rest"].get(key)
+        if recorded is not None:
+            status, payload = recorded["status"], recorded.get("body")
+        else:
+            status, payload = self.vcenter.request(method, key.partition(" ")[2], body)
+        self._count("rest", key, status != 404)
+        data = b"" if payload is None else json.dumps(payload).encode()
+        return urllib3.HTTPResponse(
+            body=data, status=status, headers={"Content-Type": "application/json"}, preload_content=True
+        )
+
+    def handle_soap(self, stub, mo, info, args, outer_stub=None):
+        """
+        Answer a VMOMI method call, with the calling conventions of SoapStubAdapter.InvokeMethod.
+        """
+        if outer_stub is None:
+            outer_stub = stub
+        time.sleep(self.latency)
+        key = get_soap_key(stub, mo, info, args)
+        recorded = self.fixtures["soap"].get(key)
+        self._count("soap", f"{info.wsdlName} {mo._moId}", recorded is not None or self.vcenter.handles(info.wsdlName))
+        status = 200
+        try:
+            if recorded is not None:
+                returnval = recorded
+            else:
+                returnval = serialize_result(stub, info, self.vcenter.invoke(mo, info, args))
+            result = _deserialize_result(stub, outer_stub, info, returnval)
+        except vmodl.MethodFault as fault:
+            status, result = 500, fault
+        if outer_stub is not stub:
+            return status, result
+        if status != 200:
+            raise result
+        return result
+
+
+class FixtureRecorder(object):
+    """
+    Context manager recording the REST and SOAP responses of a vCenter in the fixtures format of
+    :class:`ReplayTransport`, while running the workflows against it.
+    """
+
+    def __init__(self):
+        self.fixtures = {"rest": {}, "soap": {}}
+        self._lock = threading.Lock()
+        self._exit_stack = None
+
+    def __enter__(self):
+        self._exit_stack = ExitStack()
+        recorder = self
+
+        def recorded_urlopen(original):
+            def urlopen(manager, method, url, redirect=True, **kwargs):
+                response = original(manager, method, url, redirect=redirect, **kwargs)
+                try:
+                    body = json.loads(response.data) if response.data else None
+                except ValueError:
+                    return response
+                with recorder._lock:
+                    recorder.fixtures["rest"][get_rest_key(method, url)] = {"status": response.status, "body": body}
+                return response
+
+            return urlopen
+
+        def recorded_invoke_method(original):
+            def invoke_method(stub, mo, info, args, outerStub=None):
+                key = get_soap_key(stub, mo, info, args)
+                response = original(stub, mo, info, args, outerStub)
+                status, result = response if outerStub is not None and outerStub is not stub else (200, response)
+                if status == 200:
+                    with recorder._lock:
+                        recorder.fixtures["soap"][key] = serialize_result(stub, info, result)
+                return response
+
+            return invoke_method
+
+        for manager_class in (urllib3.PoolManager, urllib3.ProxyManager):
+            self._exit_stack.enter_context(
+                mock.patch.object(manager_class, "urlopen", recorded_urlopen(manager_class.urlopen))
+            )
+        for stub_class in (SoapStubAdapter, vendored_pyvmomi.SoapStubAdapter):
+            self._exit_stack.enter_context(
+                mock.patch.object(stub_class, "InvokeMethod", recorded_invoke_method(stub_class.InvokeMethod))
+            )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._exit_stack.close()
+
+    def save(self, path):
+        """
+        Save the recorded fixtures.
+        :param path: Path of the fixtures json file.
+        :type path: str
+        """
+        with open(path, "w", encoding="utf-8") as fixtures_file:
+            json.dump(self.fixtures, fixtures_file, indent=2, sort_keys=True)
@@ -0,0 +1,336 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Responses of a vCenter computed from a synthetic inventory, shared by the in-process replay and the local simulator.
+
+REST requests are answered with a status and a json payload, VMOMI calls with the python object of the result, the
+transports serialize them. The inventory is updated by the remediation calls, so a check compliance after a
+remediation sees the remediated values.
+"""
+import datetime
+import json
+import threading
+import time
+import uuid
+from urllib.parse import parse_qs
+
+from pyVmomi import vim  # pylint: disable=E0401
+from pyVmomi import vmodl  # pylint: disable=E0401
+from pyVmomi import VmomiSupport  # pylint: disable=E0401
+
+from benchmarks.fleet.inventory import REST_UPDATES
+
+CIS_TASKS_PATH = "rest/cis/tasks/"
+NOT_FOUND = {"error_type": "NOT_FOUND", "messages": []}
+
+
+def _typed(vimtype, name, value):
+    # plain lists are converted to the array type of the property, so they can be serialized in a DynamicProperty
+    if isinstance(value, list) and not hasattr(value, "Item"):
+        try:
+            return vimtype._GetPropertyInfo(name).type(value)
+        except (AttributeError, KeyError):
+            return value
+    return value
+
+
+class SyntheticVcenter(object):
+    """
+    REST and VMOMI responses of a vCenter serving a :class:`SyntheticInventory`.
+    Only the methods used by the vCenter and ESXi controls are implemented, other methods raise a NotSupported fault.
+    """
+
+    def __init__(self, inventory, cis_task_seconds=0):
+        """
+        :param inventory: Synthetic inventory.
+        :type inventory: SyntheticInventory
+        :param cis_task_seconds: Time for a CIS task started with 'vmw-task=true' to reach SUCCEEDED.
+        :type cis_task_seconds: float
+        """
+        self.inventory = inventory
+        self.cis_task_seconds = cis_task_seconds
+        self._lock = threading.Lock()
+        self._views = {}
+        # CIS task id -> (start time, operation)
+        self._cis_tasks = {}
+        self._soap_handlers = {
+            "RetrieveServiceContent": lambda mo, args: self.inventory.content,
+            "Login": self._login,
+            "LoginByToken": self._login,
+            "Logout": lambda mo, args: None,
+            "SessionIsActive": lambda mo, args: True,
+            "CurrentTime": lambda mo, args: datetime.datetime.now(datetime.timezone.utc),
+            "CreateContainerView": self._create_container_view,
+            "DestroyView": self._destroy_view,
+            "Fetch": self._fetch,
+            "RetrieveProperties": lambda mo, args: self._retrieve_properties(args[0]),
+            "RetrievePropertiesEx": self._retrieve_properties_ex,
+            "GetAlarm": lambda mo, args: [],
+            "QueryOptions": self._query_options,
+            "UpdateOptions": self._update_options,
+            "ReconfigureDVPortgroup_Task": self._reconfigure_port_group,
+            "UpdateDVSHealthCheckConfig_Task": self._update_health_check_config,
+            "EnableNetworkResourceManagement": self._enable_network_resource_management,
+            "UpdateServicePolicy": lambda mo, args: self._update_service(mo, args[0], policy=args[1]),
+            "StartService": lambda mo, args: self._update_service(mo, args[0], running=True),
+            "StopService": lambda mo, args: self._update_service(mo, args[0], running=False),
+            "RestartService": lambda mo, args: self._update_service(mo, args[0], running=True),
+            "RefreshServices": lambda mo, args: None,
+            "QueryDateTime": lambda mo, args: datetime.datetime.now(datetime.timezone.utc),
+            "UpdateDateTimeConfig": self._update_date_time_config,
+            "ChangeLockdownMode": self._change_lockdown_mode,
+            "QueryLockdownExceptions": lambda mo, args: list(self.inventory.lockdown_exceptions[mo._moId]),
+            "UpdateLockdownExceptions": self._update_lockdown_exceptions,
+        }
+
+    def handles(self, method_name):
+        """
+        Check if a VMOMI method is implemented.
+        :param method_name: WSDL name of the method, e.g. 'RetrievePropertiesEx'.
+        :type method_name: str
+        :rtype: bool
+        """
+        return method_name in self._soap_handlers
+
+    def invoke(self, mo, info, args):
+        """
+        Invoke a VMOMI method on the inventory.
+        :param mo: Managed object the method is invoked on, only its moid is used.
+        :param info: Method info.
+        :param args: Method arguments, in the order of info.params.
+        :type args: list
+        :return: Method result.
+        :raise: vmodl.MethodFault raised by the method, NotSupported if the method is not implemented.
+        """
+        handler = self._soap_handlers.get(info.wsdlName)
+        if handler is None:
+            raise vmodl.fault.NotSupported(msg=f"{info.wsdlName} is not implemented")
+        with self.inventory.lock:
+            return handler(mo, args)
+
+    def request(self, method, path, body):
+        """
+        Answer a REST request.
+        :param method: HTTP method.
+        :type method: str
+        :param path: Request path without the leading '/', with the query if any, e.g. 'api/appliance/ntp'.
+        :type path: str
+        :param body: Request body.
+        :type body: str or bytes
+        :return: Tuple of HTTP status and json payload, None for no content.
+        :rtype: tuple
+        """
+        resource, _, query = path.partition("?")
+        if resource.endswith("/session"):
+            return (200, {"value": uuid.uuid4().hex}) if method == "POST" else (200, None)
+        if resource.startswith(CIS_TASKS_PATH) and method == "GET":
+            return self._get_cis_task(resource[len(CIS_TASKS_PATH) :])
+        if method == "POST" and parse_qs(query).get("vmw-task") == ["true"]:
+            task_id = f"{uuid.uuid4()}:{resource.replace('/', '.')}"
+            with self._lock:
+                self._cis_tasks[task_id] = (time.monotonic(), resource)
+            return 202, task_id
+        with self.inventory.lock:
+            if path not in self.inventory.rest_resources:
+                return 404, NOT_FOUND
+            if method == "GET":
+                return 200, self.inventory.rest_resources[path]
+            if method in ("PUT", "PATCH") and path in REST_UPDATES:
+                self.inventory.rest_resources[path] = REST_UPDATES[path](json.loads(body or "null"))
+                return 204, None
+        return 404, NOT_FOUND
+
+    def _get_cis_task(self, task_id):
+        with self._lock:
+            task = self._cis_tasks.get(task_id)
+        if task is None:
+            return 404, NOT_FOUND
+        start_time, operation = task
+        running = time.monotonic() - start_time < self.cis_task_seconds
+        value = {
+            "status": "RUNNING" if running else "SUCCEEDED",
+            "operation": operation,
+            "cancelable": False,
+            "progress": {"completed": 0 if running else 100, "total": 100},
+        }
+        if not running:
+            value["result"] = {"status": "COMPLIANT"}
+        return 200, {"value": value}
+
+    def _login(self, mo, args):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return vim.UserSession(
+            key=uuid.uuid4().hex,
+            userName="VSPHERE.LOCAL\\Administrator",
+            fullName="Administrator vsphere.local",
+            loginTime=now,
+            lastActiveTime=now,
+            locale="en",
+            messageLocale="en",
+            extensionSession=False,
+            ipAddress="127.0.0.1",
+            userAgent="benchmark",
+            callCount=0,
+        )
+
+    @staticmethod
+    def _get_vimtype(vimtype):
+        return VmomiSupport.GetWsdlType("urn:vim25", vimtype) if isinstance(vimtype, str) else vimtype
+
+    def _create_container_view(self, mo, args):
+        container, vimtypes, recursive = args
+        moid = f"session[{uuid.uuid4()}]{uuid.uuid4()}"
+        self._views[moid] = self.inventory.get_contained(
+            container._moId, [self._get_vimtype(vimtype) for vimtype in vimtypes or []], recursive
+        )
+        return vim.view.ContainerView(moid)
+
+    def _destroy_view(self, mo, args):
+        self._views.pop(mo._moId, None)
+
+    def _get_ref(self, moid):
+        vimtype = vim.view.ContainerView if moid in self._views else self.inventory.get_type(moid)
+        return vimtype(moid)
+
+    def _get_property(self, moid, name):
+        if moid in self._views:
+            if name == "view":
+                return [self._get_ref(view_moid) for view_moid in self._views[moid]]
+            return None
+        try:
+            return _typed(self.inventory.get_type(moid), name, self.inventory.get_property(moid, name))
+        except KeyError:
+            raise vmodl.fault.ManagedObjectNotFound(
+                obj=self._get_ref(moid) if moid in self.inventory.entities else None
+            )
+
+    def _fetch(self, mo, args):
+        return self._get_property(mo._moId, args[0])
+
+    def _select(self, moid, select_set, selected):
+        for selection in select_set or []:
+            if not isinstance(selection, vmodl.query.PropertyCollector.TraversalSpec):
+                continue
+            try:
+                value = self._get_property(moid, selection.path)
+            except vmodl.fault.ManagedObjectNotFound:
+                continue
+            for ref in value if isinstance(value, list) else [value]:
+                if isinstance(ref, VmomiSupport.ManagedObject) and ref._moId not in selected:
+                    if not selection.skip:
+                        selected.append(ref._moId)
+                    self._select(ref._moId, selection.selectSet, selected)
+
+    def _retrieve_properties(self, spec_set):
+        property_collector = vmodl.query.PropertyCollector
+        object_contents = []
+        for filter_spec in spec_set:
+            selected = []
+            for object_spec in filter_spec.objectSet:
+                if not object_spec.skip:
+                    selected.append(object_spec.obj._moId)
+                self._select(object_spec.obj._moId, object_spec.selectSet, selected)
+            for moid in selected:
+                vimtype = vim.view.ContainerView if moid in self._views else self.inventory.get_type(moid)
+                property_specs = [spec for spec in filter_spec.propSet if issubclass(vimtype, spec.type)]
+                if not property_specs:
+                    continue
+                names = []
+                for property_spec in property_specs:
+                    if property_spec.all:
+                        names.extend(self.inventory.entities.get(moid, (None, {}))[1])
+                    names.extend(property_spec.pathSet or [])
+                properties = [
+                    vmodl.DynamicProperty(name=name, val=value)
+                    for name in dict.fromkeys(names)
+                    for value in [self._get_property(moid, name)]
+                    if value is not None
+                ]
+                object_contents.append(property_collector.ObjectContent(obj=vimtype(moid), propSet=properties))
+        return object_contents
+
+    def _retrieve_properties_ex(self, mo, args):
+        object_contents = self._retrieve_properties(args[0])
+        return vmodl.query.PropertyCollector.RetrieveResult(objects=object_contents) if object_contents else None
+
+    def _query_options(self, mo, args):
+        name = args[0] if args else None
+        options = [
+            vim.option.OptionValue(key=key, value=value)
+            for key, value in self.inventory.options[mo._moId].items()
+            if not name or key == name or (name.endswith(".") and key.startswith(name))
+        ]
+        if name and not options:
+            raise vim.fault.InvalidName(name=name)
+        return options
+
+    def _update_options(self, mo, args):
+        for option in args[0] or []:
+            self.inventory.options[mo._moId][option.key] = option.value
+
+    def _new_task(self, mo, name):
+        moid = f"task-{uuid.uuid4().int % 10**6}"
+        task = vim.Task(moid)
+        self.inventory.entities[moid] = (
+            vim.Task,
+            {
+                "info": vim.TaskInfo(
+                    key=moid,
+                    task=task,
+                    descriptionId=name,
+                    entity=self._get_ref(mo._moId),
+                    state="success",
+                    reason=vim.TaskReasonUser(userName="VSPHERE.LOCAL\\Administrator"),
+                    cancelled=False,
+                    cancelable=False,
+                    queueTime=datetime.datetime.now(datetime.timezone.utc),
+                    eventChainId=1,
+                )
+            },
+        )
+        return task
+
+    def _reconfigure_port_group(self, mo, args):
+        config = self.inventory.get_property(mo._moId, "config")
+        default_port_config = getattr(args[0], "defaultPortConfig", None)
+        if default_port_config:
+            for policy_name in ("securityPolicy", "vlan"):
+                policy = getattr(default_port_config, policy_name, None)
+                if policy is None:
+                    continue
+                if policy_name == "vlan":
+                    config.defaultPortConfig.vlan = policy
+                    continue
+                for setting in ("allowPromiscuous", "macChanges", "forgedTransmits"):
+                    if getattr(policy, setting, None) is not None:
+                        setattr(config.defaultPortConfig.securityPolicy, setting, getattr(policy, setting))
+        config.configVersion = str(int(config.configVersion) + 1)
+        return self._new_task(mo, "ReconfigureDVPortgroup_Task")
+
+    def _update_health_check_config(self, mo, args):
+        self.inventory.get_property(mo._moId, "config").healthCheckConfig = args[0]
+        return self._new_task(mo, "UpdateDVSHealthCheckConfig_Task")
+
+    def _enable_network_resource_management(self, mo, args):
+        self.inventory.get_property(mo._moId, "config").networkResourceManagementEnabled = args[0]
+
+    def _update_service(self, mo, service_key, **changes):
+        for service in self.inventory.get_property(mo._moId, "serviceInfo").service:
+            if service.key == service_key:
+                for name, value in changes.items():
+                    setattr(service, name, value)
+                return
+        raise vim.fault.NotFound(msg=f"Service {service_key} not found")
+
+    def _update_date_time_config(self, mo, args):
+        config = args[0]
+        date_time_info = self.inventory.get_property(mo._moId, "dateTimeInfo")
+        if config.protocol:
+            date_time_info.systemClockProtocol = config.protocol
+        if config.ntpConfig is not None:
+            date_time_info.ntpConfig = vim.host.NtpConfig(server=list(config.ntpConfig.server or []))
+
+    def _change_lockdown_mode(self, mo, args):
+        self.inventory.entities[mo._moId][1]["lockdownMode"] = args[0]
+
+    def _update_lockdown_exceptions(self, mo, args):
+        self.inventory.lockdown_exceptions[mo._moId] = list(args[0] or [])
@@ -0,0 +1,495 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Local HTTPS server standing in for a vCenter, serving the REST API and the VMOMI SOAP API from a synthetic inventory.
+
+The clients connect to it unchanged: VcRestClient through urllib3 and VcVmomiClient through the pyVmomi SOAP stub,
+over TLS with a self-signed certificate (verify_ssl=False). Since VcVmomiClient always connects to port 443, the
+server listens on 443 by default; several vCenters can be simulated on one machine by binding 127.0.0.2, 127.0.0.3,
+etc. Latency, throttling and error injection apply to every request, so parallelism and session reuse can be tested
+under load without a vCenter. SSO (STS and SSO admin) endpoints are not simulated.
+"""
+import datetime
+import http.server
+import ipaddress
+import json
+import os
+import random
+import re
+import ssl
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from xml.parsers import expat
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from pyVmomi import SoapAdapter  # pylint: disable=E0401
+from pyVmomi import SoapStubAdapter  # pylint: disable=E0401
+from pyVmomi import vmodl  # pylint: disable=E0401
+from pyVmomi import VmomiSupport  # pylint: disable=E0401
+
+from benchmarks.fleet.responder import SyntheticVcenter
+
+SOAP_PATH = "/sdk"
+SOAP_VERSION = VmomiSupport.newestVersions.GetName("vim")
+SESSION_COOKIE = "vmware_soap_session"
+FETCH = "Fetch"
+# Depth of the parameters of a SOAP request: Envelope > Body > method > parameter.
+_PARAMETER_DEPTH = 4
+
+
+def generate_self_signed_certificate(hostname, directory):
+    """
+    Generate a self-signed certificate for the simulator.
+    :param hostname: Hostname or IP address the certificate is issued for.
+    :type hostname: str
+    :param directory: Directory to write the certificate and key files to.
+    :type directory: str
+    :return: Tuple of certificate file path and key file path.
+    :rtype: tuple
+    """
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, hostname)])
+    try:
+        alternative_name = x509.IPAddress(ipaddress.ip_address(hostname))
+    except ValueError:
+        alternative_name = x509.DNSName(hostname)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=365))
+        .add_extension(x509.SubjectAlternativeName([alternative_name]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    certfile = os.path.join(directory, "simulator.crt")
+    keyfile = os.path.join(directory, "simulator.key")
+    with open(certfile, "wb") as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(keyfile, "wb") as key_file:
+        key_file.write(
+            key.private_bytes(
+                serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+            )
+        )
+    return certfile, keyfile
+
+
+class SoapCodec(object):
+    """
+    Server side of the VMOMI SOAP protocol: requests are deserialized and responses serialized with pyVmomi.
+    """
+
+    def __init__(self, version=SOAP_VERSION):
+        """
+        :param version: VMOMI version of the responses.
+        :type version: str
+        """
+        self.version = version
+        # the stub is never connected, managed object references in the requests are bound to it
+        self._stub = SoapStubAdapter("localhost", version=version)
+        self._ns_map = dict(SoapAdapter.SOAP_NSMAP, **{"urn:vim25": ""})
+
+    def parse_request(self, body):
+        """
+        Deserialize a SOAP request.
+        :param body: Request body.
+        :type body: bytes
+        :return: Tuple of managed object, method info and list of arguments.
+        :raise: vmodl.fault.InvalidRequest if the method is unknown.
+        """
+        method_name, this, parameters = self._split_request(body)
+        try:
+            mo_type = VmomiSupport.GetWsdlType("urn:vim25", this[0])
+            if method_name == FETCH:
+                info = self._get_fetch_info(mo_type, parameters)
+            else:
+                info = next(info for info in mo_type._GetMethodList() if info.wsdlName == method_name)
+        except (KeyError, StopIteration, TypeError):
+            raise vmodl.fault.InvalidRequest(msg=f"Unknown method {method_name}")
+        args = []
+        for param in info.params:
+            elements = parameters.get(param.name)
+            if not elements:
+                args.append(None)
+                continue
+            # each parameter is deserialized as the result of a response, the parameter elements being renamed
+            returnval = "".join(f"<returnval{element[len(param.name) + 1 :]}</returnval>" for element in elements)
+            response = (
+                f'{SoapAdapter.SOAP_START}<{method_name}Response xmlns="urn:vim25">'
+                f"{returnval}</{method_name}Response>{SoapAdapter.SOAP_END}"
+            )
+            args.append(SoapAdapter.SoapResponseDeserializer(self._stub).Deserialize(response.encode(), param.type))
+        return mo_type(this[1], self._stub), info, args
+
+    def _get_fetch_info(self, mo_type, parameters):
+        # property accessors are invoked as a Fetch method, see StubAdapterAccessorMixin.InvokeAccessor
+        element = parameters["prop"][0]
+        prop_info = mo_type._GetPropertyInfo(element[element.index(">") + 1 :])
+        return VmomiSupport.Object(
+            name=prop_info.name,
+            type=VmomiSupport.ManagedObject,
+            wsdlName=FETCH,
+            version=prop_info.version,
+            params=(VmomiSupport.Object(name="prop", type=str, version=self.version, flags=0),),
+            isTask=False,
+            resultFlags=prop_info.flags,
+            result=prop_info.type,
+            methodResult=prop_info.type,
+        )
+
+    @staticmethod
+    def _split_request(body):
+        # returns the method name, (type, moid) of _this and the xml of the parameter elements by name, without
+        # their closing tag
+        parser = expat.ParserCreate()
+        state = {"depth": 0, "method": None, "this": None, "start": None, "empty": False, "text": []}
+        parameters = {}
+
+        def start_element(name, attrs):
+            state["depth"] += 1
+            state["empty"] = False
+            if state["depth"] == _PARAMETER_DEPTH - 1:
+                state["method"] = name.rpartition(":")[2]
+            elif state["depth"] == _PARAMETER_DEPTH:
+                state["start"] = (name, parser.CurrentByteIndex, attrs.get("type"))
+                state["empty"] = True
+                state["text"] = []
+
+        def end_element(name):
+            if state["depth"] == _PARAMETER_DEPTH:
+                name, start, this_type = state["start"]
+                element = body[start : parser.CurrentByteIndex].decode()
+                if state["empty"] and element.endswith("/>"):
+                    # empty element tag, the end index is after the tag
+                    element = element[:-2] + ">"
+                if name == "_this":
+                    state["this"] = (this_type, "".join(state["text"]))
+                else:
+                    parameters.setdefault(name, []).append(element)
+            state["depth"] -= 1
+
+        def character_data(data):
+            state["empty"] = False
+            if state["depth"] == _PARAMETER_DEPTH:
+                state["text"].append(data)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        parser.Parse(body, True)
+        return state["method"], state["this"], parameters
+
+    def serialize_result(self, info, result):
+        """
+        Serialize the result of a method as a SOAP response.
+        :rtype: bytes
+        """
+        returnval = ""
+        if result is not None:
+            returnval = SoapAdapter.Serialize(
+                result,
+                SoapAdapter.Object(name="returnval", type=info.result, version=self.version, flags=info.resultFlags),
+                self.version,
+            ).decode(SoapAdapter.XML_ENCODING)
+        return (
+            f'{SoapAdapter.SOAP_START}<{info.wsdlName}Response xmlns="urn:vim25">{returnval}'
+            f"</{info.wsdlName}Response>{SoapAdapter.SOAP_END}"
+        ).encode(SoapAdapter.XML_ENCODING)
+
+    def serialize_fault(self, fault):
+        """
+        Serialize a fault as a SOAP fault response, returned with status 500.
+        :type fault: vmodl.MethodFault
+        :rtype: bytes
+        """
+        message = SoapAdapter.XmlEscape(fault.msg or type(fault).__name__)
+        # the detail holds the fault properties in a <{wsdlName}Fault> element, the message is the faultstring
+        name = type(fault)._wsdlName
+        properties = []
+        for prop in type(fault)._GetPropertyList():
+            value = getattr(fault, prop.name)
+            if prop.name == "msg" or value is None or (isinstance(value, list) and not value):
+                continue
+            properties.append(SoapAdapter.Serialize(value, prop, self.version, self._ns_map).decode())
+        return (
+            f"{SoapAdapter.SOAP_START}<soapenv:Fault><faultcode>ServerFaultCode</faultcode>"
+            f'<faultstring>{message}</faultstring><detail><{name}Fault xmlns="urn:vim25" xsi:type="{name}">'
+            f"{''.join(properties)}</{name}Fault></detail></soapenv:Fault>{SoapAdapter.SOAP_END}"
+        ).encode(SoapAdapter.XML_ENCODING)
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, the latency is only the configured one
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # the TLS handshake runs in the request thread, not in the accepting thread
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.do_handshake()
+        super().setup()
+
+    def do_GET(self):
+        self.server.simulator.handle(self)
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+    def log_message(self, format, *args):  # pylint: disable=W0622
+        if self.server.simulator.verbose:
+            super().log_message(format, *args)
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class VcenterSimulator(object):
+    """
+    HTTPS server simulating a vCenter from a :class:`SyntheticInventory`.
+
+    Each request waits for the latency, then may be throttled or fail with an injected error:
+
+    - with max_concurrent_requests, requests over the limit are rejected with 503 Service Unavailable;
+    - with requests_per_second, requests over the rate are rejected with 429 Too Many Requests and a Retry-After;
+    - with error_rate, that fraction of the requests matching error_pattern fail, REST requests with error_status and
+      SOAP requests with a SystemError fault.
+    """
+
+    def __init__(
+        self,
+        inventory,
+        address="127.0.0.1",
+        port=443,
+        certfile=None,
+        keyfile=None,
+        latency_ms=0,
+        jitter_ms=0,
+        max_concurrent_requests=0,
+        requests_per_second=0,
+        error_rate=0.0,
+        error_status=503,
+        error_pattern=None,
+        cis_task_seconds=0,
+        seed=None,
+        verbose=False,
+    ):
+        """
+        :param inventory: Synthetic inventory to serve.
+        :type inventory: SyntheticInventory
+        :param address: Address to listen on.
+        :type address: str
+        :param port: Port to listen on, 0 for any free port.
+        :type port: int
+        :param certfile: Server certificate file, a self-signed certificate is generated if not set.
+        :type certfile: str
+        :param keyfile: Server private key file.
+        :type keyfile: str
+        :param latency_ms: Latency added to each request in milliseconds.
+        :type latency_ms: float
+        :param jitter_ms: Maximum random latency added on top of latency_ms in milliseconds.
+        :type jitter_ms: float
+        :param max_concurrent_requests: Maximum number of requests handled concurrently, 0 for no limit.
+        :type max_concurrent_requests: int
+        :param requests_per_second: Maximum request rate, 0 for no limit.
+        :type requests_per_second: float
+        :param error_rate: Fraction of the requests failing with an injected error, between 0 and 1.
+        :type error_rate: float
+        :param error_status: HTTP status of the injected REST errors.
+        :type error_status: int
+        :param error_pattern: Regular expression matched against the request key ('GET api/appliance/ntp' for REST,
+            'SOAP RetrievePropertiesEx' for SOAP) to restrict the injected errors, all requests if not set.
+        :type error_pattern: str
+        :param cis_task_seconds: Time for a CIS task to reach SUCCEEDED.
+        :type cis_task_seconds: float
+        :param seed: Seed of the random error injection and jitter.
+        :type seed: int
+        :param verbose: Log each request to stderr.
+        :type verbose: bool
+        """
+        self.inventory = inventory
+        self.vcenter = SyntheticVcenter(inventory, cis_task_seconds=cis_task_seconds)
+        self.codec = SoapCodec()
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_second = requests_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_pattern = re.compile(error_pattern) if error_pattern else None
+        self.verbose = verbose
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._in_flight = 0
+        self._tokens = float(requests_per_second)
+        self._tokens_updated = time.monotonic()
+        self._thread = None
+        self._server = _Server((address, port), _RequestHandler)
+        self._server.simulator = self
+        if not certfile:
+            certfile, keyfile = generate_self_signed_certificate(address, tempfile.mkdtemp(prefix="vcenter-simulator-"))
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(certfile, keyfile)
+        self._server.socket = ssl_context.wrap_socket(
+            self._server.socket, server_side=True, do_handshake_on_connect=False
+        )
+
+    @property
+    def address(self):
+        """
+        Address and port the server listens on.
+        :rtype: tuple
+        """
+        return self._server.server_address[:2]
+
+    def start(self):
+        """
+        Serve in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="vcenter-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Serve in the calling thread until :meth:`stop` is called.
+        """
+        self._server.serve_forever()
+
+    def stop(self):
+        """
+        Stop serving and close the listening socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _acquire(self):
+        # returns None if the request can be handled, the status rejecting it otherwise
+        with self._lock:
+            if self.requests_per_second:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.requests_per_second),
+                    self._tokens + (now - self._tokens_updated) * self.requests_per_second,
+                )
+                self._tokens_updated = now
+                if self._tokens < 1:
+                    return 429
+                self._tokens -= 1
+            if self.max_concurrent_requests and self._in_flight >= self.max_concurrent_requests:
+                return 503
+            self._in_flight += 1
+        return None
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _inject_error(self, key):
+        if not self.error_rate or (self.error_pattern and not self.error_pattern.search(key)):
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _sleep(self):
+        if self.jitter:
+            with self._lock:
+                delay = self.latency + self._random.uniform(0, self.jitter)
+        else:
+            delay = self.latency
+        if delay:
+            time.sleep(delay)
+
+    def handle(self, request_handler):
+        """
+        Handle a request received by the server.
+        :type request_handler: http.server.BaseHTTPRequestHandler
+        """
+        length = int(request_handler.headers.get("Content-Length") or 0)
+        body = request_handler.rfile.read(length) if length else b""
+        rejected_status = self._acquire()
+        if rejected_status:
+            with self._lock:
+                self.stats["throttled"] += 1
+            payload = {"error_type": "SERVICE_UNAVAILABLE" if rejected_status == 503 else "UNABLE_TO_ALLOCATE_RESOURCE"}
+            self._send(request_handler, rejected_status, json.dumps(payload).encode(), {"Retry-After": "1"})
+            return
+        try:
+            self._sleep()
+            path = request_handler.path.lstrip("/")
+            if request_handler.command == "POST" and request_handler.path.split("?")[0] == SOAP_PATH:
+                self._handle_soap(request_handler, body)
+            else:
+                self._handle_rest(request_handler, path, body)
+        finally:
+            self._release()
+
+    def _handle_rest(self, request_handler, path, body):
+        key = f"{request_handler.command} {path}"
+        if self._inject_error(key):
+            self._count("rest", injected=True)
+            payload = json.dumps({"error_type": "SERVICE_UNAVAILABLE", "messages": []}).encode()
+            self._send(request_handler, self.error_status, payload)
+            return
+        status, payload = self.vcenter.request(request_handler.command, path, body)
+        self._count("rest", unhandled=status == 404)
+        self._send(request_handler, status, b"" if payload is None else json.dumps(payload).encode())
+
+    def _handle_soap(self, request_handler, body):
+        headers = {"Content-Type": f"text/xml; charset={SoapAdapter.XML_ENCODING}"}
+        if not request_handler.headers.get("Cookie"):
+            headers["Set-Cookie"] = f'{SESSION_COOKIE}="{uuid.uuid4()}"; Path=/; HttpOnly; Secure;'
+        try:
+            mo, info, args = self.codec.parse_request(body)
+            if self._inject_error(f"SOAP {info.wsdlName}"):
+                self._count("soap", injected=True)
+                raise vmodl.fault.SystemError(msg="Injected error", reason="Injected error")
+            self._count("soap", unhandled=not self.vcenter.handles(info.wsdlName))
+            response = self.codec.serialize_result(info, self.vcenter.invoke(mo, info, args))
+            status = 200
+        except vmodl.MethodFault as fault:
+            response = self.codec.serialize_fault(fault)
+            status = 500
+        except Exception as e:  # pylint: disable=W0703
+            # errors of the simulator itself are reported to the client as a vCenter internal error
+            response = self.codec.serialize_fault(vmodl.fault.SystemError(msg=str(e), reason=str(e)))
+            status = 500
+        self._send(request_handler, status, response, headers)
+
+    def _count(self, protocol, unhandled=False, injected=False):
+        with self._lock:
+            self.stats[protocol] += 1
+            if unhandled:
+                self.stats[f"{protocol}_unhandled"] += 1
+            if injected:
+                self.stats["injected_errors"] += 1
+
+    @staticmethod
+    def _send(request_handler, status, data, headers=None):
+        request_handler.send_response(status)
+        headers = headers or {"Content-Type": "application/json"}
+        for name, value in headers.items():
+            request_handler.send_header(name, value)
+        request_handler.send_header("Content-Length", str(len(data)))
+        request_handler.end_headers()
+        if data and request_handler.command != "HEAD":
+            request_handler.wfile.write(data)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+End-to-end benchmark of the vCenter controls on synthetic fleets, without a vCenter.
+
+get_current_configuration, check_compliance and remediate_with_desired_state run through ControllerInterface and the
+existing clients, with the REST and VMOMI responses replayed from a synthetic inventory of the given number of hosts
+and, optionally, from fixtures recorded on a vCenter. The desired state is the configuration read from the synthetic
+inventory, which is drifted before check compliance and before each remediation.
+Controls reading files or running commands on the appliance itself (e.g. sso-config.sh, dcli) fail fast and are
+reported with their status, so the report stays comparable across commits.
+
+Usage:
+    python3 -m benchmarks.fleet_benchmark --hosts 1 50 500 --latency-ms 5 --repeat 3 --output report.json
+    python3 -m benchmarks.fleet_benchmark --compare baseline.json report.json
+    python3 -m benchmarks.fleet_benchmark --record fixtures.json --vcenter vcenter.example.com \\
+        --username administrator@vsphere.local --password '***'
+    python3 -m benchmarks.fleet_benchmark --hosts 50 --fixtures fixtures.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import platform
+import statistics
+import subprocess  # nosec
+import time
+
+from benchmarks.fleet.inventory import SyntheticInventory
+from benchmarks.fleet.replay import FixtureRecorder
+from benchmarks.fleet.replay import load_fixtures
+from benchmarks.fleet.replay import ReplayTransport
+from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
+from config_modules_vmware.interfaces.controller_interface import ControllerInterface
+from config_modules_vmware.schemas import schema_utility
+from config_modules_vmware.services.config import Config
+
+GET_CURRENT = "get_current_configuration"
+CHECK_COMPLIANCE = "check_compliance"
+REMEDIATE = "remediate_with_desired_state"
+OPERATIONS = (GET_CURRENT, CHECK_COMPLIANCE, REMEDIATE)
+
+# Desired state of the controls whose current configuration is not a valid desired state.
+DESIRED_CONTROLS = {
+    "dvpg_promiscuous_mode_policy": {"__GLOBAL__": {"promiscuous_mode": False}},
+    "dvpg_forged_transmits_policy": {"__GLOBAL__": {"allow_forged_transmits": False}},
+    "dvpg_mac_address_change_policy": {"__GLOBAL__": {"allow_mac_address_change": False}},
+}
+
+
+def _get_commit():
+    try:
+        return subprocess.run(  # nosec
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _get_control_statuses(operation, response):
+    """Get the number of controls per status in the response of an operation."""
+    statuses = {}
+    if operation == GET_CURRENT:
+        controls = response.get("result", {}).get("compliance_config", {}).get("vcenter", {})
+        statuses["SUCCESS"] = len(controls)
+        message = response.get("message") or ""
+        statuses["FAILED"] = message.count("compliance_config.vcenter.")
+    else:
+        controls = response.get("changes", {}).get("compliance_config", {}).get("vcenter", {})
+        for control_result in controls.values():
+            status = getattr(control_result.get("status"), "value", str(control_result.get("status")))
+            statuses[status] = statuses.get(status, 0) + 1
+    return statuses
+
+
+def _run_operation(operation, inventory, desired_state_spec):
+    with VcenterContext(
+        hostname=inventory.hostname, username="benchmark", password="benchmark", verify_ssl=False
+    ) as ctx:
+        controller_interface = ControllerInterface(ctx)
+        start_time = time.perf_counter()
+        if operation == GET_CURRENT:
+            response = controller_interface.get_current_configuration()
+        elif operation == CHECK_COMPLIANCE:
+            response = controller_interface.check_compliance(desired_state_spec)
+        else:
+            response = controller_interface.remediate_with_desired_state(desired_state_spec)
+        return time.perf_counter() - start_time, response
+
+
+def _get_desired_state_spec(inventory):
+    """Get the configuration of the inventory, keeping the controls whose configuration is a valid desired state."""
+    _, response = _run_operation(GET_CURRENT, inventory, None)
+    desired_controls = {}
+    for control, value in response.get("result", {}).get("compliance_config", {}).get("vcenter", {}).items():
+        try:
+            schema_utility.validate_input_against_schema(
+                {"compliance_config": {"vcenter": {control: value}}}, "compliance"
+            )
+        except Exception:  # pylint: disable=W0703
+            continue
+        desired_controls[control] = value
+    for control, value in DESIRED_CONTROLS.items():
+        desired_controls[control] = {"value": value}
+    return {"compliance_config": {"vcenter": desired_controls}}
+
+
+def run(hosts, operations, latency_ms, repeat, fixtures_path):
+    """Run the operations on each fleet size and return the results."""
+    fixtures = load_fixtures(fixtures_path) if fixtures_path else None
+    results = []
+    for num_hosts in hosts:
+        inventory = SyntheticInventory(num_hosts)
+        with ReplayTransport(inventory, latency_ms=0, fixtures=fixtures) as transport:
+            desired_state_spec = _get_desired_state_spec(inventory)
+            inventory.apply_drift()
+            transport.latency = latency_ms / 1000
+            for operation in operations:
+                durations = []
+                responses = []
+                calls_before = dict(transport.calls)
+                for _ in range(repeat):
+                    if operation == REMEDIATE:
+                        inventory.apply_drift()
+                    duration, response = _run_operation(operation, inventory, desired_state_spec)
+                    durations.append(duration)
+                    responses.append(response)
+                calls = {
+                    protocol: (count - calls_before.get(protocol, 0)) // repeat
+                    for protocol, count in transport.calls.items()
+                }
+                result = {
+                    "hosts": num_hosts,
+                    "operation": operation,
+                    "controls": len(desired_state_spec["compliance_config"]["vcenter"]),
+                    "durations_seconds": [round(duration, 4) for duration in durations],
+                    "min_seconds": round(min(durations), 4),
+                    "median_seconds": round(statistics.median(durations), 4),
+                    "status": getattr(responses[-1].get("status"), "value", str(responses[-1].get("status"))),
+                    "control_statuses": _get_control_statuses(operation, responses[-1]),
+                    "calls_per_run": calls,
+                }
+                if "timings" in responses[-1]:
+                    result["timings"] = responses[-1]["timings"]
+                results.append(result)
+                print(
+                    f"hosts={num_hosts} {operation}: median {result['median_seconds']:.3f}s "
+                    f"min {result['min_seconds']:.3f}s status={result['status']} calls={calls}"
+                )
+            unhandled = dict(transport.unhandled.most_common())
+            if unhandled:
+                results[-1]["unhandled_requests"] = unhandled
+    return results
+
+
+def record(fixtures_path, vcenter, username, password):
+    """Record the responses of a vCenter for get current configuration and check compliance."""
+    with FixtureRecorder() as recorder:
+        with VcenterContext(hostname=vcenter, username=username, password=password, verify_ssl=False) as ctx:
+            response = ControllerInterface(ctx).get_current_configuration()
+        with VcenterContext(hostname=vcenter, username=username, password=password, verify_ssl=False) as ctx:
+            ControllerInterface(ctx).check_compliance(response.get("result", {}))
+    recorder.save(fixtures_path)
+    print(f"Recorded {len(recorder.fixtures['rest'])} REST and {len(recorder.fixtures['soap'])} SOAP responses")
+
+
+def compare(baseline_path, report_path):
+    """Print the median durations of two reports side by side."""
+    with open(baseline_path, encoding="utf-8") as baseline_file, open(report_path, encoding="utf-8") as report_file:
+        baseline, report = json.load(baseline_file), json.load(report_file)
+    baseline_results = {(result["hosts"], result["operation"]): result for result in baseline["results"]}
+    print(f"baseline {baseline.get('commit')} -> {report.get('commit')}")
+    for result in report["results"]:
+        baseline_result = baseline_results.get((result["hosts"], result["operation"]))
+        if not baseline_result:
+            continue
+        ratio = result["median_seconds"] / baseline_result["median_seconds"] if baseline_result["median_seconds"] else 0
+        print(
+            f"hosts={result['hosts']} {result['operation']}: {baseline_result['median_seconds']:.3f}s -> "
+            f"{result['median_seconds']:.3f}s ({ratio:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the vCenter controls end to end on synthetic fleets.")
+    parser.add_argument("--hosts", type=int, nargs="+", default=[1, 50, 500], help="Fleet sizes in number of hosts.")
+    parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS), help="Operations to run."
+    )
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latency added to each replayed request.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per operation and fleet size.")
+    parser.add_argument("--fixtures", help="Recorded fixtures replayed before the synthetic responses.")
+    parser.add_argument("--output", help="Path of the json report.")
+    parser.add_argument("--control-timings", action="store_true", help="Include the per control timings.")
+    parser.add_argument("--log-file", help="Log to this file at INFO level, logging is disabled otherwise.")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "REPORT"), help="Compare two json reports.")
+    parser.add_argument("--record", metavar="FIXTURES", help="Record the responses of a vCenter to this file.")
+    parser.add_argument("--vcenter", help="vCenter hostname to record from.")
+    parser.add_argument("--username", help="vCenter username to record with.")
+    parser.add_argument("--password", help="vCenter password to record with.")
+    args = parser.parse_args()
+
+    if args.log_file:
+        logging.basicConfig(filename=args.log_file, level=logging.INFO)
+    else:
+        logging.disable(logging.CRITICAL)
+
+    if args.compare:
+        compare(*args.compare)
+    elif args.record:
+        record(args.record, args.vcenter, args.username, args.password)
+    else:
+        if args.control_timings:
+            Config.get_section("timings")["Enabled"] = "true"
+        report = {
+            "commit": _get_commit(),
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "latency_ms": args.latency_ms,
+            "repeat": args.repeat,
+            "fixtures": args.fixtures,
+            "results": run(args.hosts, args.operations, args.latency_ms, args.repeat, args.fixtures),
+        }
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as output_file:
+                json.dump(report, output_file, indent=2)
+            print(f"Report written to {args.output}")
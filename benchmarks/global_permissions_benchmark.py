@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright 2025 Broadcom. All Rights Reserved.
+"""
+Benchmark for parsing the mob3 global access control list page with many global permissions.
+The previous BeautifulSoup based parsing is measured as well if beautifulsoup4 is installed.
+
+Usage:
+    python3 -m benchmarks.global_permissions_benchmark --size 10000 --repeat 3
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from config_modules_vmware.controllers.vcenter.utils import vc_users_groups_roles_utils
+
+_PERMISSION_HTML = """<li>
+<table>
+<tr><th>NAME</th><th>TYPE</th><th>VALUE</th></tr>
+<tr><td>dynamicProperty</td><td>DynamicProperty[]</td><td>Unset</td></tr>
+<tr><td>dynamicType</td><td>string</td><td>Unset</td></tr>
+<tr><td>principal</td><td>Principal</td><td>
+<table>
+<tr><th>NAME</th><th>TYPE</th><th>VALUE</th></tr>
+<tr><td>dynamicProperty</td><td>DynamicProperty[]</td><td>Unset</td></tr>
+<tr><td>dynamicType</td><td>string</td><td>Unset</td></tr>
+<tr><td>group</td><td>boolean</td><td>{group}</td></tr>
+<tr><td>name</td><td>string</td><td>{name}</td></tr>
+</table>
+</td></tr>
+<tr><td>propagate</td><td>boolean</td><td>{propagate}</td></tr>
+<tr><td>roles</td><td>long[]</td><td><ul class="noindent"><li>{role_id}</li></ul></td></tr>
+<tr><td>version</td><td>long</td><td>1</td></tr>
+</table>
+</li>
+"""
+
+
+def _build_page(size):
+    permissions = "".join(
+        _PERMISSION_HTML.format(
+            name=f"example.com\\user-{i}",
+            group=str(i % 5 == 0).lower(),
+            propagate=str(i % 2 == 0).lower(),
+            role_id=i % 100,
+        )
+        for i in range(size)
+    )
+    return (
+        "<html><head><title>Method Invocation Result: Permission[]</title></head><body>"
+        f"<h1>Method Invocation Result: Permission[]</h1><ul>{permissions}</ul></body></html>"
+    )
+
+
+def _parse_with_beautifulsoup(perm_html):
+    from bs4 import BeautifulSoup
+
+    global_permissions = []
+    soup = BeautifulSoup(perm_html, "html.parser")
+    for li_tag in [li_tag for li_tag in soup.find_all("li") if li_tag.table]:
+        rows = li_tag.table.find_all("tr")
+        global_permissions.append(
+            {
+                "name": rows[vc_users_groups_roles_utils.USER_NAME_ROW].find_all("td")[-1].text,
+                "type": "GROUP"
+                if rows[vc_users_groups_roles_utils.GROUP_ROW].find_all("td")[-1].text == "true"
+                else "USER",
+                "propagate": rows[vc_users_groups_roles_utils.PROPAGATE_ROW].find_all("td")[-1].text == "true",
+                "role_id": int(rows[vc_users_groups_roles_utils.ROLE_ID_ROW].li.text),
+            }
+        )
+    return global_permissions
+
+
+def run(size, repeat):
+    """Run the benchmark and print the best time and the peak memory for each parser."""
+    perm_html = _build_page(size)
+    print(f"size={size} page={len(perm_html) / 1024 / 1024:.1f}MiB")
+    parsers = {"html.parser streaming": vc_users_groups_roles_utils._parse_global_permissions}
+    try:
+        import bs4  # noqa: F401
+
+        parsers["beautifulsoup"] = _parse_with_beautifulsoup
+    except ImportError:
+        print("beautifulsoup4 not installed, skipping the previous parser")
+
+    results = {}
+    for name, parse_func in parsers.items():
+        tracemalloc.start()
+        results[name] = parse_func(perm_html)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        best = min(timeit.repeat(lambda: parse_func(perm_html), number=1, repeat=repeat))
+        print(f"size={size} parser={name}: {best:.3f}s, peak memory {peak / 1024 / 1024:.1f}MiB")
+    if len(results[next(iter(results))]) != size or len({repr(result) for result in results.values()}) != 1:
+        raise AssertionError("Parsers returned different results")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark mob3 global permissions parsing.")
+    parser.add_argument("--size", type=int, default=10000, help="Number of global permissions in the page.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs per parser.")
+    args = parser.parse_args()
+    run(args.size, args.repeat)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Benchmark for the per-call overhead of LoggerAdapter, with and without controller metadata and hostname in the logging
+context, for enabled and disabled levels, and for payload-sized debug messages formatted eagerly or deferred.
+
+Usage:
+    python3 -m benchmarks.logging_benchmark --calls 100000 --payload-size 65536 --repeat 5
+"""
+import argparse
+import logging
+import timeit
+
+from config_modules_vmware.controllers.vcenter.ntp_config import NtpConfig
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.logging.logging_context import ControllerMetadataLoggingContext
+from config_modules_vmware.framework.logging.logging_context import HostnameLoggingContext
+
+
+class _FormattingHandler(logging.Handler):
+    """Handler formatting each record without writing it, so only the logging overhead is measured."""
+
+    def emit(self, record):
+        self.format(record)
+
+
+def _build_scenarios(logger, adapter, payload):
+    return {
+        "logger info": lambda: logger.info("Calling '%s':'%s'", "GET", "https://vc-1/api/appliance/ntp"),
+        "adapter info": lambda: adapter.info("Calling '%s':'%s'", "GET", "https://vc-1/api/appliance/ntp"),
+        "adapter debug disabled": lambda: adapter.debug("Calling '%s':'%s'", "GET", "https://vc-1/api/appliance/ntp"),
+        "adapter debug disabled payload eager": lambda: adapter.debug(f"Response content: {payload}"),
+        "adapter debug disabled payload deferred": lambda: adapter.debug("Response content: %s", payload),
+    }
+
+
+def run(calls, payload_size, repeat):
+    """Run the benchmark and print the best time per log call of each scenario."""
+    logger = logging.getLogger("benchmarks.logging_benchmark")
+    logger.propagate = False
+    logger.addHandler(_FormattingHandler())
+    logger.setLevel(logging.INFO)
+    adapter = LoggerAdapter(logger)
+    payload = b"x" * payload_size
+    for name, scenario in _build_scenarios(logger, adapter, payload).items():
+        best = min(timeit.repeat(scenario, number=calls, repeat=repeat))
+        print(f"no context - {name}: {best / calls * 1e9:.0f}ns per call")
+    with HostnameLoggingContext("vcenter-1.vsphere.local"), ControllerMetadataLoggingContext(NtpConfig.metadata):
+        for name, scenario in _build_scenarios(logger, adapter, payload).items():
+            best = min(timeit.repeat(scenario, number=calls, repeat=repeat))
+            print(f"hostname and controller - {name}: {best / calls * 1e9:.0f}ns per call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the per-call overhead of LoggerAdapter.")
+    parser.add_argument("--calls", type=int, default=100000, help="Number of log calls per timed run.")
+    parser.add_argument("--payload-size", type=int, default=65536, help="Size in bytes of the debug payload.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per scenario.")
+    args = parser.parse_args()
+    run(args.calls, args.payload_size, args.repeat)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Local vCenter stand-in for load tests: serves the REST API used by VcRestClient (sessions, hosts, CIS tasks,
+appliance NTP/DNS/syslog) and the VMOMI SOAP API used by VcVmomiClient (ServiceInstance, PropertyCollector, host
+config managers, tasks) from a synthetic inventory, with tunable latency, throttling and error injection.
+
+VcVmomiClient connects to port 443, so the simulator listens on 443 unless REST only is tested. Contexts connect with
+the simulator address as hostname and verify_ssl=False, e.g. VcenterContext(hostname="127.0.0.1", username="user",
+password="pass", verify_ssl=False). Several vCenters can be simulated with one simulator per loopback address.
+
+Usage:
+    python3 -m benchmarks.vcenter_simulator --hosts 2000 --port-groups-per-host 4 --latency-ms 20 --jitter-ms 10
+    python3 -m benchmarks.vcenter_simulator --address 127.0.0.2 --max-concurrent-requests 16 \\
+        --requests-per-second 200 --error-rate 0.01 --error-pattern 'RetrievePropertiesEx|api/appliance'
+"""
+import argparse
+import time
+
+from benchmarks.fleet.inventory import SyntheticInventory
+from benchmarks.fleet.simulator import VcenterSimulator
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate a vCenter on a local address.")
+    parser.add_argument("--address", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=443, help="Port to listen on.")
+    parser.add_argument("--certfile", help="Server certificate, a self-signed certificate is generated if not set.")
+    parser.add_argument("--keyfile", help="Server private key.")
+    parser.add_argument("--hosts", type=int, default=500, help="Number of ESXi hosts in the inventory.")
+    parser.add_argument("--port-groups-per-host", type=int, default=2, help="Number of port groups per host.")
+    parser.add_argument("--hosts-per-cluster", type=int, default=32, help="Maximum number of hosts per cluster.")
+    parser.add_argument("--hosts-per-switch", type=int, default=64, help="Maximum number of hosts per switch.")
+    parser.add_argument("--drift", action="store_true", help="Drift the configuration of the inventory.")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Latency added to each request.")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Maximum random latency added to each request.")
+    parser.add_argument(
+        "--max-concurrent-requests", type=int, default=0, help="Requests over this limit get a 503, 0 for no limit."
+    )
+    parser.add_argument(
+        "--requests-per-second", type=float, default=0, help="Requests over this rate get a 429, 0 for no limit."
+    )
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of the requests failing, 0 to 1.")
+    parser.add_argument("--error-status", type=int, default=503, help="HTTP status of the failing REST requests.")
+    parser.add_argument(
+        "--error-pattern", help="Only fail requests matching this regex, e.g. 'GET api/appliance/ntp|SOAP Fetch'."
+    )
+    parser.add_argument("--cis-task-seconds", type=float, default=0, help="Time for a CIS task to succeed.")
+    parser.add_argument("--seed", type=int, help="Seed of the error injection and jitter.")
+    parser.add_argument("--stats-interval", type=float, default=10, help="Seconds between request statistics.")
+    parser.add_argument("--verbose", action="store_true", help="Log each request.")
+    args = parser.parse_args()
+
+    inventory = SyntheticInventory(
+        args.hosts,
+        port_groups_per_host=args.port_groups_per_host,
+        hosts_per_cluster=args.hosts_per_cluster,
+        hosts_per_switch=args.hosts_per_switch,
+        hostname=args.address,
+    )
+    if args.drift:
+        inventory.apply_drift()
+    simulator = VcenterSimulator(
+        inventory,
+        address=args.address,
+        port=args.port,
+        certfile=args.certfile,
+        keyfile=args.keyfile,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        max_concurrent_requests=args.max_concurrent_requests,
+        requests_per_second=args.requests_per_second,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_pattern=args.error_pattern,
+        cis_task_seconds=args.cis_task_seconds,
+        seed=args.seed,
+        verbose=args.verbose,
+    )
+    address, port = simulator.address
+    print(f"Simulating a vCenter with {len(inventory.entities)} managed objects on https://{address}:{port}")
+    with simulator:
+        try:
+            while True:
+                time.sleep(args.stats_interval)
+                print(dict(simulator.stats))
+        except KeyboardInterrupt:
+            print(dict(simulator.stats))
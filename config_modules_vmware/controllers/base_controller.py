@@ -73,7 +73,14 @@ class BaseController(ABC):
             # If errors are seen during get, return "FAILED" status with errors.
             return {consts.STATUS: ComplianceStatus.FAILED, consts.ERRORS: errors}
 
-        # If no errors seen, compare the current and desired value. If not same, return "NON_COMPLIANT" with values.
+        # If the fingerprints of current and desired value match, the values are compliant and the detailed
+        # comparison can be skipped.
+        if Comparator.is_fingerprint_match(
+            current_value, desired_values, comparator_option=self.comparator_option, instance_key=self.instance_key
+        ):
+            return {consts.STATUS: ComplianceStatus.COMPLIANT}
+
+        # Otherwise, compare the current and desired value. If not same, return "NON_COMPLIANT" with values.
         # Otherwise, return "COMPLIANT".
         current_non_compliant_configs, desired_non_compliant_configs = Comparator.get_non_compliant_configs(
             current_value, desired_values, comparator_option=self.comparator_option, instance_key=self.instance_key
@@ -8,10 +8,8 @@ from typing import Tuple
 from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.controllers.nsxt_manager.ntp_config import NsxtNtpCommon
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
-from config_modules_vmware.framework.clients.common.consts import STATUS
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
-from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
 logger = LoggerAdapter(logging.getLogger(__name__))
@@ -65,7 +63,8 @@ class NtpConfig(BaseController):
     def set(self, context: BaseContext, desired_values: Dict) -> Tuple[str, List[Any]]:
         """
         Set NTP config in NSXT edge.
-        Also post set, check_compliance is run again to validate that the values are set.
+        Also post set, the NTP servers read back in the admin CLI session are validated against the desired
+        values.
 
         | Sample desired state for NTP.
 
@@ -85,8 +84,8 @@ class NtpConfig(BaseController):
         logger.info("Setting NTP control config for audit.")
         errors = []
         try:
-            NsxtNtpCommon.set_ntp(context, desired_values)
-            if self.check_compliance(context, desired_values).get(STATUS) != ComplianceStatus.COMPLIANT:
+            current_values = NsxtNtpCommon.set_ntp(context, desired_values)
+            if not NsxtNtpCommon.is_ntp_compliant(current_values, desired_values, self.comparator_option):
                 raise Exception("Failed to update NTP servers")
             status = RemediateStatus.SUCCESS
         except Exception as e:
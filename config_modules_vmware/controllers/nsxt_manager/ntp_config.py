@@ -7,15 +7,16 @@ from typing import Tuple
 
 from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
-from config_modules_vmware.framework.clients.common.consts import STATUS
+from config_modules_vmware.framework.clients.nsxt.nsxt_admin_cli_client import NsxtAdminCliClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
-from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
-from config_modules_vmware.framework.utils import utils
+from config_modules_vmware.framework.utils.comparator import Comparator
 
 logger = LoggerAdapter(logging.getLogger(__name__))
 
+GET_NTP_SERVERS_CMD = "get ntp-servers"
+
 
 class NsxtNtpCommon:
     """Manage Ntp config with get and set methods."""
@@ -30,7 +31,7 @@ class NsxtNtpCommon:
         :rtype: bool
         """
         logger.info(f"Adding ntp server {server}")
-        utils.run_shell_cmd(f"su -c 'set ntp-server {server}' admin")
+        NsxtAdminCliClient().run_command(f"set ntp-server {server}")
         return True
 
     @staticmethod
@@ -43,14 +44,14 @@ class NsxtNtpCommon:
         :rtype: bool
         """
         logger.info(f"Deleting ntp server {server}")
-        utils.run_shell_cmd(f"su -c 'del ntp-server {server}' admin")
+        NsxtAdminCliClient().run_command(f"del ntp-server {server}")
         return True
 
     @staticmethod
-    def set_ntp(context: BaseContext, desired_values: Dict) -> None:
+    def set_ntp(context: BaseContext, desired_values: Dict) -> Dict:
         """
         Set NTP config in NSXT.
-        Also post set, check_compliance is run again to validate that the values are set.
+        All adds and deletes are applied and the NTP servers are read back in a single admin CLI session.
 
         | Sample desired state for NTP.
 
@@ -63,7 +64,9 @@ class NsxtNtpCommon:
         :param context: Product context instance.
         :type context: BaseContext
         :param desired_values: Desired value for the NTP config. Dict with keys "servers".
-        :raises Exception: If there is an exception when trying to get NTP
+        :return: NTP config read back after the update. Dict with keys "servers".
+        :rtype: dict
+        :raises Exception: If there is an exception when trying to get NTP or the admin CLI reports an error
         """
         logger.info(f"Setting NTP control config for {context.product_category.value}.")
         current_ntp_servers, get_errors = NsxtNtpCommon.get_ntp(context)
@@ -76,20 +79,49 @@ class NsxtNtpCommon:
         logger.debug(f"Current NTP servers: {current_ntp_servers}")
         logger.debug(f"Desired NTP servers: {desired_ntp_servers}")
 
+        commands = []
         for ntp_server in set(desired_ntp_servers) - set(current_ntp_servers):
-            NsxtNtpCommon.add_ntp(ntp_server)
+            logger.info(f"Adding ntp server {ntp_server}")
+            commands.append(f"set ntp-server {ntp_server}")
 
         for ntp_server in set(current_ntp_servers) - set(desired_ntp_servers):
-            NsxtNtpCommon.del_ntp(ntp_server)
-        return None
+            logger.info(f"Deleting ntp server {ntp_server}")
+            commands.append(f"del ntp-server {ntp_server}")
+
+        if not commands:
+            return {"servers": current_ntp_servers}
+        command_output = NsxtAdminCliClient().run_commands_and_read(commands, GET_NTP_SERVERS_CMD)
+        return {"servers": NsxtNtpCommon._parse_ntp_servers(command_output)}
+
+    @staticmethod
+    def _parse_ntp_servers(command_output: str) -> List[str]:
+        return list(command_output.strip().split("\n"))
+
+    @staticmethod
+    def is_ntp_compliant(current_values: Dict, desired_values: Dict, comparator_option) -> bool:
+        """
+        Check the NTP config read back after an update against the desired values.
+        :param current_values: NTP config read back after the update. Dict with keys "servers".
+        :type current_values: dict
+        :param desired_values: Desired value for the NTP config. Dict with keys "servers".
+        :type desired_values: dict
+        :param comparator_option: Comparator option of the controller.
+        :type comparator_option: ComparatorOptionForList
+        :return: True if the values match.
+        :rtype: bool
+        """
+        current_non_compliant_configs, desired_non_compliant_configs = Comparator.get_non_compliant_configs(
+            current_values, desired_values, comparator_option=comparator_option
+        )
+        return not current_non_compliant_configs and not desired_non_compliant_configs
 
     @staticmethod
     def get_ntp(context):
         logger.info(f"Getting NTP servers for {context.product_category.value}")
         errors = []
         try:
-            command_output = utils.run_shell_cmd("su -c 'get ntp-servers' admin")[0]
-            ntp_servers = list(command_output.strip().split("\n"))
+            command_output = NsxtAdminCliClient().run_command(GET_NTP_SERVERS_CMD)
+            ntp_servers = NsxtNtpCommon._parse_ntp_servers(command_output)
         except Exception as e:
             logger.exception(f"Exception retrieving ntp value - {e}")
             errors.append(str(e))
@@ -145,7 +177,8 @@ class NtpConfig(BaseController):
     def set(self, context: BaseContext, desired_values: Dict) -> Tuple[str, List[Any]]:
         """
         Set NTP config in NSXT manager.
-        Also post set, check_compliance is run again to validate that the values are set.
+        Also post set, the NTP servers read back in the admin CLI session are validated against the desired
+        values.
 
         | Sample desired state for NTP.
 
@@ -165,8 +198,8 @@ class NtpConfig(BaseController):
         logger.info("Setting NTP control config for audit.")
         errors = []
         try:
-            NsxtNtpCommon.set_ntp(context, desired_values)
-            if self.check_compliance(context, desired_values).get(STATUS) != ComplianceStatus.COMPLIANT:
+            current_values = NsxtNtpCommon.set_ntp(context, desired_values)
+            if not NsxtNtpCommon.is_ntp_compliant(current_values, desired_values, self.comparator_option):
                 raise Exception("Failed to update NTP servers")
             status = RemediateStatus.SUCCESS
         except Exception as e:
@@ -156,14 +156,14 @@ class UsersGroupsRolesConfig(BaseController):
         """
         sso_domain_url = rest_client.get_base_url() + sddc_manager_consts.SSO_DOMAINS_URL
         sso_domains_response = rest_client.get_helper(sso_domain_url)
-        logger.debug(f"Response for sso_domains:  {sso_domains_response}")
+        logger.debug("Response for sso_domains:  %s", sso_domains_response)
         all_sso_users = {}
         for sso_domain in sso_domains_response.get(ELEMENTS, []):
             sso_domain_entities_url = (
                 f"{rest_client.get_base_url()}{sddc_manager_consts.SSO_DOMAINS_URL}/{sso_domain}/entities"
             )
             sso_domain_entities_response = rest_client.get_helper(sso_domain_entities_url)
-            logger.debug(f"Response for sso_domains_entities: {sso_domain_entities_response}")
+            logger.debug("Response for sso_domains_entities: %s", sso_domain_entities_response)
             for entity in sso_domain_entities_response.get(ELEMENTS, []):
                 key = entity.get(ID).lower()
                 if entity.get(TYPE) == "GROUP" or entity.get(TYPE) == "USER":
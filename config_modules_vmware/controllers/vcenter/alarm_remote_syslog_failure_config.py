@@ -68,28 +68,18 @@ class AlarmRemoteSyslogFailureConfig(BaseController):
         result = []
         try:
             logger.info(f"Get all the alarms with eventId {ESX_REMOTE_SYSLOG_FAILURE_EVENT}.")
-            content = context.vc_vmomi_client().content
-            alarm_manager = content.alarmManager
-
-            # Get all alarm definitions (currently there is no support to query an alarm for specific event)
-            alarm_definitions = alarm_manager.GetAlarm(content.rootFolder)
+            # Alarm definitions are retrieved once and shared with other alarm controllers using this context
+            alarm_catalog = context.alarm_catalog()
             alarms = []
             self.alarm_name_to_def_map = {}
 
             # Fetch details of all the alarms for which any expression within an alarm has eventId :
             # ESX_REMOTE_SYSLOG_FAILURE_EVENT
-            for alarm_def in alarm_definitions:
-                # vim.alarm.EventAlarmExpression might not have 'expression' attribute if there is no expression
-                if hasattr(alarm_def.info.expression, "expression"):
-                    for expression in alarm_def.info.expression.expression:
-                        if (
-                            isinstance(expression, vim.alarm.EventAlarmExpression)
-                            and expression.eventTypeId == ESX_REMOTE_SYSLOG_FAILURE_EVENT
-                        ):
-                            target_type = vc_alarms_utils.get_target_type(expression.objectType)
-                            alarms.append(vc_alarms_utils.get_alarm_details(alarm_def, target_type))
-                            # create a map for later use
-                            self.alarm_name_to_def_map[alarm_def.info.name] = alarm_def
+            for alarm_def, alarm_info, expression in alarm_catalog.get_event_alarms(ESX_REMOTE_SYSLOG_FAILURE_EVENT):
+                target_type = vc_alarms_utils.get_target_type(expression.objectType)
+                alarms.append(vc_alarms_utils.get_alarm_details(alarm_def, target_type, alarm_info=alarm_info))
+                # create a map for later use
+                self.alarm_name_to_def_map[alarm_info.name] = alarm_def
             result = alarms
 
         except Exception as e:
@@ -137,6 +127,7 @@ class AlarmRemoteSyslogFailureConfig(BaseController):
                     # if alarm already exist, reconfigure to expected values
                     logger.debug(f"Reconfiguring alarm with spec: {spec}.")
                     alarm.ReconfigureAlarm(spec)
+                context.invalidate_alarm_catalog()
             except vim.fault.DuplicateName:
                 logger.exception(f"Error creating duplicate alarm {alarm_name}")
                 status = RemediateStatus.FAILED
@@ -67,22 +67,14 @@ class AlarmSSOConfig(BaseController):
         result = []
         try:
             logger.info(f"Get all the alarms with eventId {SSO_EVENT_ID}.")
-            content = context.vc_vmomi_client().content
-            alarm_manager = content.alarmManager
-
-            # Get all alarm definitions (currently there is no support to query an alarm for specific event)
-            alarm_definitions = alarm_manager.GetAlarm(content.rootFolder)
+            # Alarm definitions are retrieved once and shared with other alarm controllers using this context
+            alarm_catalog = context.alarm_catalog()
             alarms = []
 
             # Fetch details of all the alarms for which any expression within an alarm has eventId : SSO_EVENT_ID
-            for alarm_def in alarm_definitions:
-                # vim.alarm.EventAlarmExpression might not have 'expression' attribute if there is no expression
-                if hasattr(alarm_def.info.expression, "expression"):
-                    for expression in alarm_def.info.expression.expression:
-                        if isinstance(expression, vim.alarm.EventAlarmExpression):
-                            if expression.eventTypeId == SSO_EVENT_ID:
-                                target_type = vc_alarms_utils.get_target_type(expression.objectType)
-                                alarms.append(vc_alarms_utils.get_alarm_details(alarm_def, target_type))
+            for alarm_def, alarm_info, expression in alarm_catalog.get_event_alarms(SSO_EVENT_ID):
+                target_type = vc_alarms_utils.get_target_type(expression.objectType)
+                alarms.append(vc_alarms_utils.get_alarm_details(alarm_def, target_type, alarm_info=alarm_info))
             result = alarms
 
         except Exception as e:
@@ -112,6 +104,7 @@ class AlarmSSOConfig(BaseController):
                 content = context.vc_vmomi_client().content
                 spec = vc_alarms_utils.create_alarm_spec(desired_alarm_value, SSO_EVENT_ID)
                 content.alarmManager.CreateAlarm(content.rootFolder, spec)
+                context.invalidate_alarm_catalog()
             except vim.fault.DuplicateName:
                 logger.exception(f"Error creating duplicate alarm {alarm_name}")
                 status = RemediateStatus.FAILED
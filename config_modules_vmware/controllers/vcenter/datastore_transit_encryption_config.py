@@ -11,6 +11,7 @@ from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import query_clusters_concurrently
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
@@ -89,11 +90,12 @@ class DatastoreTransitEncryptionPolicy(BaseController):
         vsan_clusters = vc_vsan_vmomi_client.get_all_vsan_enabled_clusters()
         logger.info(f"Retrieved all vSAN enabled clusters {vsan_clusters}")
 
-        vsan_ccs = vc_vsan_vmomi_client.get_vsan_cluster_config_system()
-        logger.info(f"Retrieved vSAN cluster config system {vsan_ccs}")
+        # clusters are queried concurrently, the configs are shared with the other vSAN controllers of this context
+        vsan_cluster_configs = query_clusters_concurrently(
+            vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster, vsan_clusters
+        )
 
-        for cluster_ref in vsan_clusters:
-            vsan_cluster_config = vsan_ccs.VsanClusterGetConfig(cluster_ref)
+        for cluster_ref, vsan_cluster_config in zip(vsan_clusters, vsan_cluster_configs):
             data_in_transit_encryption_config = getattr(
                 vsan_cluster_config, DATA_IN_TRANSIT_ENCRYPTION_CONFIG_PYVMOMI_KEY, None
             )
@@ -116,14 +118,14 @@ class DatastoreTransitEncryptionPolicy(BaseController):
         """
         all_cluster_transit_encryption_configs = []
         data_in_transit_encryption_configs = self.__get_transit_encryption_config_for_clusters(context)
-        vc_vmomi_client = context.vc_vmomi_client()
+        inventory_index = context.inventory_index()
 
         for cluster_ref, transit_encryption_config in data_in_transit_encryption_configs:
             cluster_transit_encryption_config = {}
             is_enabled = getattr(transit_encryption_config, ENABLED_PYVMOMI_KEY, None)
             rekey_interval = getattr(transit_encryption_config, REKEY_INTERVAL_PYVMOMI_KEY, None)
-            datacenter_obj = vc_vmomi_client.find_datacenter_for_obj(cluster_ref)
-            data_center_name = getattr(datacenter_obj, "name", "")
+            datacenter_moid = inventory_index.get_ancestor(cluster_ref._moId, vim.Datacenter)
+            data_center_name = inventory_index.get_name(datacenter_moid) or ""
             cluster_transit_encryption_config[DATA_CENTER_NAME_KEY] = data_center_name
             cluster_transit_encryption_config[CLUSTER_NAME_KEY] = cluster_ref.name
             cluster_transit_encryption_config[TRANSIT_ENCRYPTION_ENABLED] = is_enabled
@@ -175,6 +177,7 @@ class DatastoreTransitEncryptionPolicy(BaseController):
                 cluster_reconfig_spec.dataInTransitEncryptionConfig.rekeyInterval = desired_rekey_interval
                 # reconfigure vSAN cluster
                 encryption_config_task = vsan_ccs.ReconfigureEx(cluster_ref, cluster_reconfig_spec)
+                vc_vsan_vmomi_client.invalidate_vsan_cluster_cache(cluster_ref)
                 vc_task = vc_vsan_vmomi_client.convert_vsan_to_vc_task(encryption_config_task)
                 # Set timeout based on number of hosts in cluster
                 task_timeout = len(cluster_ref.host) * PER_HOST_TASK_TIMEOUT if cluster_ref.host else BASE_TASK_TIMEOUT
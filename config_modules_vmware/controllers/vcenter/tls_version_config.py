@@ -276,7 +276,7 @@ class TlsVersion(BaseController):
                     _, tls_output_data, _ = utils.run_shell_cmd(
                         command=f"{command}", env=self._get_environment_variables(), timeout=CMD_TIMEOUT
                     )
-                    logger.debug(f"Captured output post update: {tls_output_data}")
+                    logger.debug("Captured output post update: %s", tls_output_data)
                 status = RemediateStatus.SUCCESS
         except Exception as e:
             errors.append(str(e))
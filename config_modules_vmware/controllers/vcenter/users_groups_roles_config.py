@@ -116,26 +116,27 @@ class UsersGroupsRolesConfig(BaseController):
         else:
             return name.lower()
 
-    def _is_global_defined_permission(self, permission: Dict, global_users_roles: List) -> bool:
+    def _get_global_permission_key(self, permission: Dict) -> Tuple:
+        """
+        Get the key a permission is matched with global permissions by.
+        :param permission: global or vCenter retrieved permission.
+        :type permission: Dict
+        :return: Tuple of normalized name, role, type and propagate flag.
+        :rtype: Tuple
+        """
+        return self._normalize_domain(permission[NAME]), permission[ROLE], permission[TYPE], permission[PROPAGATE]
+
+    def _is_global_defined_permission(self, permission: Dict, global_permission_keys: set) -> bool:
         """
         Check if a permission retrieved with vCenter method is global defined permission.
         :param permission: vCenter retrieved permission.
         :type permission: Dict
-        :param global_users_roles: global permissions.
-        :type global_users_roles: List
+        :param global_permission_keys: keys of global permissions, see _get_global_permission_key.
+        :type global_permission_keys: set
         :return: True if it is global defined permission otherwise it is vCenter local permission
         :rtype: bool
         """
-        for global_permission in global_users_roles:
-            if (
-                self._normalize_domain(global_permission[NAME]) == self._normalize_domain(permission[NAME])
-                and global_permission[ROLE] == permission[ROLE]
-                and global_permission[TYPE] == permission[TYPE]
-                and global_permission[PROPAGATE] == permission[PROPAGATE]
-                and permission[PROPAGATE]
-            ):
-                return True
-        return False
+        return bool(permission[PROPAGATE]) and self._get_global_permission_key(permission) in global_permission_keys
 
     def _get_global_permissions(self, context: VcenterContext) -> List:
         """Get global permissions through interbal APIs.
@@ -145,10 +146,7 @@ class UsersGroupsRolesConfig(BaseController):
         :return: List of dictionary (with keys-'role', 'name', 'type', and 'propagate') objects.
         :rtype: List
         """
-        content = context.vc_vmomi_client().content
-        authorization_manager = content.authorizationManager
-        role_collection = authorization_manager.roleList
-        role_id_name_map = {role.roleId: role.name for role in role_collection}
+        role_id_name_map = context.authorization_snapshot().get_role_id_name_map()
 
         global_users_roles = []
         vc_invsvc_mob3_client = context.vc_invsvc_mob3_client()
@@ -170,13 +168,15 @@ class UsersGroupsRolesConfig(BaseController):
         :rtype: List
         """
         content = context.vc_vmomi_client().content
-        authorization_manager = content.authorizationManager
-        role_collection = authorization_manager.roleList
+        authorization_snapshot = context.authorization_snapshot()
+        global_permission_keys = {
+            self._get_global_permission_key(global_permission) for global_permission in global_users_roles
+        }
 
         vc_users_roles = []
         unique_entries = set()  # Set to store unique (name, role, type)
-        for role in role_collection:
-            permissions = authorization_manager.RetrieveRolePermissions(role.roleId)
+        for role in authorization_snapshot.get_roles():
+            permissions = authorization_snapshot.get_permissions_by_role_id(role.roleId)
             for permission in permissions:
                 # skip permissions not in vcenter level
                 # exclude permission that is not defined on this vcenter.
@@ -198,7 +198,7 @@ class UsersGroupsRolesConfig(BaseController):
                     unique_entries.add(key_tuple)
                     # check if this permission is global permission, if yes, exclude
                     # from compliance checking for vcenter portion
-                    if self._is_global_defined_permission(vc_permission, global_users_roles):
+                    if self._is_global_defined_permission(vc_permission, global_permission_keys):
                         logger.debug(f"Skip this global permission: {vc_permission}")
                         continue
                 vc_users_roles.append(vc_permission)
@@ -251,8 +251,10 @@ class UsersGroupsRolesConfig(BaseController):
         """
 
         logger.debug(f"Remediate drifts for global permissions: {global_remediate_configs}")
-        # remediate global permissions
-        vc_invsvc_mob3_client = context.vc_invsvc_mob3_client()
+        # remediate global permissions, all removals and all additions are batched in one mob3 call each.
+        # A modified entry is removed before it is added again, same as the drift order.
+        principals_to_remove = []
+        permissions_to_add = []
         for op, entry in global_remediate_configs:
             user = entry[NAME]
             role_id = role_name_id_map[entry[ROLE]]
@@ -262,13 +264,14 @@ class UsersGroupsRolesConfig(BaseController):
                 logger.debug(
                     f"Adding Permission for Entry: user - {user}, role id: {role_id}, group - {group}, propagate - {propagate}"
                 )
-                vc_users_groups_roles_utils.add_global_permission(
-                    vc_invsvc_mob3_client, user, role_id, group, propagate
-                )
+                permissions_to_add.append((user, role_id, group, propagate))
             else:  # op == TO_DELETE
                 logger.debug(f"Removing Permission for Entry: {user}, group: {group}")
-                vc_users_groups_roles_utils.remove_global_permission(vc_invsvc_mob3_client, user, group)
+                principals_to_remove.append((user, group))
             logger.debug(f"Op: {op} for Global Permission Entry: {entry}")
+        vc_invsvc_mob3_client = context.vc_invsvc_mob3_client()
+        vc_users_groups_roles_utils.remove_global_permissions(vc_invsvc_mob3_client, principals_to_remove)
+        vc_users_groups_roles_utils.add_global_permissions(vc_invsvc_mob3_client, permissions_to_add)
 
     def _set_vcenter_permissions(
         self, context: VcenterContext, vc_remediate_configs: List[Dict], role_name_id_map: Dict
@@ -316,10 +319,7 @@ class UsersGroupsRolesConfig(BaseController):
         self._create_alias_domain_name_mapping(context)
 
         try:
-            content = context.vc_vmomi_client().content
-            authorization_manager = content.authorizationManager
-            role_collection = authorization_manager.roleList
-            role_name_id_map = {role.name: role.roleId for role in role_collection}
+            role_name_id_map = context.authorization_snapshot().get_role_name_id_map()
 
             # remediate global permissions.
             global_remediate_configs = desired_values.get(GLOBAL_CONFIG)
@@ -337,6 +337,9 @@ class UsersGroupsRolesConfig(BaseController):
             logger.exception(f"An error occurred: {e}")
             errors.append(str(e))
             status = RemediateStatus.FAILED
+        finally:
+            # permissions might have been set or removed, even if remediation failed midway
+            context.invalidate_authorization_snapshot()
 
         return status, errors
 
@@ -119,25 +119,28 @@ def get_target_type(object_type) -> str:
     return target_type
 
 
-def get_alarm_details(alarm_def: vim.alarm.Alarm, target_type: str) -> Dict:
+def get_alarm_details(alarm_def: vim.alarm.Alarm, target_type: str, alarm_info: vim.alarm.AlarmInfo = None) -> Dict:
     """
     Get alarm details for the given alarm_def object and for a given target_type
     :param alarm_def: Alarm definition holding alarm info.
     :type alarm_def: vim.alarm.Alarm
     :param target_type: Target product for the alarm
     :type: str
+    :param alarm_info: Alarm info already retrieved for the alarm, fetched from alarm_def if not provided.
+    :type alarm_info: vim.alarm.AlarmInfo
     :return: Dictionary with alarm details - with keys 'alarm_name', 'alarm_description', 'rule_expressions' etc.
     :rtype: dict
     """
-    logger.info(f"Get alarm details for {alarm_def}: {alarm_def.info.name}")
+    if alarm_info is None:
+        alarm_info = alarm_def.info
+    logger.info(f"Get alarm details for {alarm_def}: {alarm_info.name}")
     result = {}
-    alarm_info = alarm_def.info
-    result[ALARM_NAME] = alarm_def.info.name
-    result[ALARM_DESCRIPTION] = alarm_def.info.description
-    result[ENABLED] = alarm_def.info.enabled
+    result[ALARM_NAME] = alarm_info.name
+    result[ALARM_DESCRIPTION] = alarm_info.description
+    result[ENABLED] = alarm_info.enabled
     result[TARGET_TYPE] = target_type
     result[RULE_EXPRESSIONS] = []
-    result[ACTION_FREQUENCY] = alarm_def.info.actionFrequency
+    result[ACTION_FREQUENCY] = alarm_info.actionFrequency
     for expression in alarm_info.expression.expression:
         if isinstance(expression, vim.alarm.EventAlarmExpression):
             rule = {
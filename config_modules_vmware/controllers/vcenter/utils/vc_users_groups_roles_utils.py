@@ -1,10 +1,10 @@
 # Copyright 2025 Broadcom. All Rights Reserved.
 import logging
+from html.parser import HTMLParser
 from typing import List
+from typing import Tuple
 from urllib.parse import quote
 
-from bs4 import BeautifulSoup
-
 from config_modules_vmware.framework.clients.common import consts
 from config_modules_vmware.framework.clients.vcenter.vc_invsvc_mob3_client import VcInvsvcMob3Client
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
@@ -16,24 +16,113 @@ GROUP_ROW = 7
 PROPAGATE_ROW = 9
 ROLE_ID_ROW = 10
 
+# size of the chunks the mob3 response is fed to the parser with
+PARSE_CHUNK_SIZE = 64 * 1024
+# elements the permissions are extracted from, all other elements are skipped
+_PERMISSION_ELEMENTS = {"li", "table", "tr", "td"}
+
+
+class _GlobalPermissionTableParser(HTMLParser):
+    """
+    Streaming extractor of the permission tables in the mob3 global access control list page.
+    Only the cells needed for the permissions are kept, no document tree is built.
 
-def _parse_global_permissions(perm_html: BeautifulSoup) -> List:
-    """Parsing mob3 api returned global permissions in beautifulsoup format.
+    A permission is an "li" element with a table, its rows are all "tr" elements of its first table including the
+    rows of nested tables (e.g. principal). For each row the text of the last "td" and of the first "li" is kept.
+    """
 
-    :param perm_html: mob3 api returned result in beautifulsoup format.
-    :type perm_html: BeautifulSoup
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # open permission elements, entries of (tag, li frame or None, text buffer or None).
+        # A li frame keeps the depth of its first table while it is open (None before, -1 after) and its rows.
+        self._open_tags = []
+        # rows of tables currently open
+        self._open_rows = []
+        # text buffers of td and li elements currently open
+        self._open_texts = []
+        # rows of the permission tables in document order
+        self.tables = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in _PERMISSION_ELEMENTS:
+            return
+        li_frame = None
+        text = None
+        if tag == "li":
+            text = []
+            for row in self._open_rows:
+                if row["li"] is None:
+                    row["li"] = text
+            li_frame = {"table_depth": None, "rows": []}
+        elif tag == "table":
+            for open_tag in self._open_tags:
+                open_li_frame = open_tag[1]
+                if open_li_frame is not None and open_li_frame["table_depth"] is None:
+                    open_li_frame["table_depth"] = len(self._open_tags)
+                    self.tables.append(open_li_frame["rows"])
+        elif tag == "tr":
+            row = {"td": None, "li": None}
+            for open_tag in self._open_tags:
+                open_li_frame = open_tag[1]
+                if open_li_frame is not None and open_li_frame["table_depth"] not in (None, -1):
+                    open_li_frame["rows"].append(row)
+            self._open_rows.append(row)
+        elif tag == "td":
+            text = []
+            for row in self._open_rows:
+                row["td"] = text
+        if text is not None:
+            self._open_texts.append(text)
+        self._open_tags.append((tag, li_frame, text))
+
+    def handle_endtag(self, tag):
+        if tag not in _PERMISSION_ELEMENTS or not any(open_tag[0] == tag for open_tag in self._open_tags):
+            return
+        while self._open_tags:
+            open_tag, _, text = self._open_tags.pop()
+            if text is not None:
+                # buffers are opened in tag order, the last one belongs to the tag being closed. Equal buffers of
+                # nested td and li elements must not be mistaken for each other.
+                self._open_texts.pop()
+            if open_tag == "tr":
+                self._open_rows.pop()
+            elif open_tag == "table":
+                self._close_table(len(self._open_tags))
+            if open_tag == tag:
+                break
+
+    def _close_table(self, table_depth):
+        # rows after the first table of a li are not part of its permission
+        for open_tag in self._open_tags:
+            open_li_frame = open_tag[1]
+            if open_li_frame is not None and open_li_frame["table_depth"] == table_depth:
+                open_li_frame["table_depth"] = -1
+
+    def handle_data(self, data):
+        for text in self._open_texts:
+            text.append(data)
+
+
+def _parse_global_permissions(perm_html: str) -> List:
+    """Parsing mob3 api returned global permissions page.
+
+    :param perm_html: mob3 api returned html page.
+    :type perm_html: str
     :return: a list of parsed global permissions.
     :rtype: List
     """
+    parser = _GlobalPermissionTableParser()
+    for start in range(0, len(perm_html), PARSE_CHUNK_SIZE):
+        parser.feed(perm_html[start : start + PARSE_CHUNK_SIZE])
+    parser.close()
+
     global_permissions = []
-    li_tags = [li_tag for li_tag in perm_html.find_all("li") if li_tag.table]
-    for li_tag in li_tags:
-        rows = li_tag.table.find_all("tr")
+    for rows in parser.tables:
         global_permission = {
-            "name": rows[USER_NAME_ROW].find_all("td")[-1].text,
-            "type": "GROUP" if rows[GROUP_ROW].find_all("td")[-1].text == "true" else "USER",
-            "propagate": True if rows[PROPAGATE_ROW].find_all("td")[-1].text == "true" else False,
-            "role_id": int(rows[ROLE_ID_ROW].li.text),
+            "name": "".join(rows[USER_NAME_ROW]["td"]),
+            "type": "GROUP" if "".join(rows[GROUP_ROW]["td"]) == "true" else "USER",
+            "propagate": True if "".join(rows[PROPAGATE_ROW]["td"]) == "true" else False,
+            "role_id": int("".join(rows[ROLE_ID_ROW]["li"])),
         }
         global_permissions.append(global_permission)
     logger.debug(f"Global Permissions: {global_permissions}")
@@ -51,101 +140,106 @@ def get_global_permissions(vc_invsvc_mob3_client: VcInvsvcMob3Client) -> List:
     base_url = vc_invsvc_mob3_client.get_base_url()
     mob_url = f"{base_url}/?moid=authorizationService&method=AuthorizationService.GetGlobalAccessControlList"
 
-    nonce, cookie_str = vc_invsvc_mob3_client.get_session_nonce(mob_url)
-    logger.debug(f"Get session nonce: {nonce}")
-    body = f"vmware-session-nonce={nonce}"
-
-    headers = {consts.CONTENT_TYPE: consts.HEADER_TYPE_WWW_FORM, consts.CACHE_CONTROL: consts.HEADER_TYPE_NO_CACHE}
-    if cookie_str:
-        headers["Cookie"] = cookie_str
-
-    response = vc_invsvc_mob3_client.post_helper(
-        mob_url, body=body, headers=headers, raw_response=True, raise_for_status=True
-    )
+    response = vc_invsvc_mob3_client.invoke_method(mob_url, headers={consts.CACHE_CONTROL: consts.HEADER_TYPE_NO_CACHE})
 
     if response.status == 200:
-        perm_html = BeautifulSoup(response.data.decode("utf-8"), "html.parser")
-        global_permissions = _parse_global_permissions(perm_html)
+        global_permissions = _parse_global_permissions(response.data.decode("utf-8"))
         return global_permissions
     logger.error(f"Failed to get global permissions: {response.status}")
     raise Exception(f"Failed to retrieve global permissions: {response.status}")
 
 
-def add_global_permission(
-    vc_invsvc_mob3_client: VcInvsvcMob3Client, vc_user: str, vc_role_id: int, group: bool, propagate: bool
-) -> None:
-    """Add global permission.
+def add_global_permissions(vc_invsvc_mob3_client: VcInvsvcMob3Client, permissions: List[Tuple]) -> None:
+    """Add global permissions in one mob3 api call.
 
     :param vc_invsvc_mob3_client: vcenter inventory mob3 api client.
     :type vc_invsvc_mob3_client: VcInvsvcMob3Client
-    :param vc_user: user name (including domain).
-    :type vc_user: str
-    :param vc_role_id: role id number.
-    :type vc_role_id: int
-    :param group: group or member (group if True otherwise member).
-    :type group: bool
-    :param propagate: permission propagate flag (propagate to sub object if True otherwise only this object).
-    :type propagate: bool
+    :param permissions: list of (user name including domain, role id, group flag, propagate flag).
+    :type permissions: List[Tuple]
     :return: None
     :rtype: None
     """
+    if not permissions:
+        return
 
     base_url = vc_invsvc_mob3_client.get_base_url()
     mob_url = f"{base_url}/?moid=authorizationService&method=AuthorizationService.AddGlobalAccessControlList"
-    nonce, cookie_str = vc_invsvc_mob3_client.get_session_nonce(mob_url)
 
-    vc_user_escaped = quote(vc_user)
-    body = (
-        f"vmware-session-nonce={nonce}&permissions=%3Cpermissions%3E%0D%0A"
-        f"+++%3Cprincipal%3E%0D%0A++++++%3Cname%3E{vc_user_escaped}%3C%2Fname%3E%0D%0A"
+    params = "permissions=" + "%0D%0A".join(
+        f"%3Cpermissions%3E%0D%0A"
+        f"+++%3Cprincipal%3E%0D%0A++++++%3Cname%3E{quote(vc_user)}%3C%2Fname%3E%0D%0A"
         f"++++++%3Cgroup%3E{group}%3C%2Fgroup%3E%0D%0A+++%3C%2Fprincipal%3E%0D%0A"
         f"+++%3Croles%3E{vc_role_id}%3C%2Froles%3E%0D%0A"
         f"+++%3Cpropagate%3E{str(propagate).lower()}%3C%2Fpropagate%3E%0D%0A%3C%2Fpermissions%3E"
+        for vc_user, vc_role_id, group, propagate in permissions
     )
 
-    headers = {consts.CONTENT_TYPE: consts.HEADER_TYPE_WWW_FORM}
-    if cookie_str:
-        headers["Cookie"] = cookie_str
-
-    response = vc_invsvc_mob3_client.post_helper(
-        mob_url, body=body, headers=headers, raw_response=True, raise_for_status=True
-    )
+    response = vc_invsvc_mob3_client.invoke_method(mob_url, params=params)
     if response.status != 200:
         logger.error(f"Failed to add global permission: {response.status}")
         raise Exception(f"Failed to add global permission: {response.status}")
 
 
-def remove_global_permission(vc_invsvc_mob3_client: VcInvsvcMob3Client, vc_user: str, group: bool) -> None:
-    """Remove global permission.
+def add_global_permission(
+    vc_invsvc_mob3_client: VcInvsvcMob3Client, vc_user: str, vc_role_id: int, group: bool, propagate: bool
+) -> None:
+    """Add global permission.
 
     :param vc_invsvc_mob3_client: vcenter inventory mob3 api client.
     :type vc_invsvc_mob3_client: VcInvsvcMob3Client
     :param vc_user: user name (including domain).
     :type vc_user: str
+    :param vc_role_id: role id number.
+    :type vc_role_id: int
     :param group: group or member (group if True otherwise member).
     :type group: bool
+    :param propagate: permission propagate flag (propagate to sub object if True otherwise only this object).
+    :type propagate: bool
+    :return: None
+    :rtype: None
+    """
+    add_global_permissions(vc_invsvc_mob3_client, [(vc_user, vc_role_id, group, propagate)])
+
+
+def remove_global_permissions(vc_invsvc_mob3_client: VcInvsvcMob3Client, principals: List[Tuple]) -> None:
+    """Remove global permissions of principals in one mob3 api call.
+
+    :param vc_invsvc_mob3_client: vcenter inventory mob3 api client.
+    :type vc_invsvc_mob3_client: VcInvsvcMob3Client
+    :param principals: list of (user name including domain, group flag).
+    :type principals: List[Tuple]
     :return: None
     :rtype: None
     """
+    if not principals:
+        return
 
     base_url = vc_invsvc_mob3_client.get_base_url()
     mob_url = f"{base_url}/?moid=authorizationService&method=AuthorizationService.RemoveGlobalAccess"
-    nonce, cookie_str = vc_invsvc_mob3_client.get_session_nonce(mob_url)
 
-    vc_user_escaped = quote(vc_user)
-    body = (
-        f"vmware-session-nonce={nonce}&principals=%3Cprincipals%3E%0D%0A"
-        f"+++%3Cname%3E{vc_user_escaped}%3C%2Fname%3E%0D%0A"
+    params = "principals=" + "%0D%0A".join(
+        f"%3Cprincipals%3E%0D%0A"
+        f"+++%3Cname%3E{quote(vc_user)}%3C%2Fname%3E%0D%0A"
         f"+++%3Cgroup%3E{group}%3C%2Fgroup%3E%0D%0A%3C%2Fprincipals%3E"
+        for vc_user, group in principals
     )
 
-    headers = {consts.CONTENT_TYPE: consts.HEADER_TYPE_WWW_FORM}
-    if cookie_str:
-        headers["Cookie"] = cookie_str
-
-    response = vc_invsvc_mob3_client.post_helper(
-        mob_url, body=body, headers=headers, raw_response=True, raise_for_status=True
-    )
+    response = vc_invsvc_mob3_client.invoke_method(mob_url, params=params)
     if response.status != 200:
         logger.error(f"Failed to remove global permission: {response.status}")
         raise Exception(f"Failed to remove global permission: {response.status}")
+
+
+def remove_global_permission(vc_invsvc_mob3_client: VcInvsvcMob3Client, vc_user: str, group: bool) -> None:
+    """Remove global permission.
+
+    :param vc_invsvc_mob3_client: vcenter inventory mob3 api client.
+    :type vc_invsvc_mob3_client: VcInvsvcMob3Client
+    :param vc_user: user name (including domain).
+    :type vc_user: str
+    :param group: group or member (group if True otherwise member).
+    :type group: bool
+    :return: None
+    :rtype: None
+    """
+    remove_global_permissions(vc_invsvc_mob3_client, [(vc_user, group)])
@@ -13,6 +13,7 @@ from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_inventory_index import InventoryIndex
 from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VcVmomiClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
@@ -102,7 +103,7 @@ class VmMigrateEncryptionPolicy(BaseController):
         vc_vmomi_client = context.vc_vmomi_client()
         errors = []
         try:
-            result = self.__get_all_vm_migrate_encryption_policy(vc_vmomi_client)
+            result = self.__get_all_vm_migrate_encryption_policy(vc_vmomi_client, context.inventory_index())
         except Exception as e:
             logger.exception(f"An error occurred: {e}")
             errors.append(str(e))
@@ -157,20 +158,41 @@ class VmMigrateEncryptionPolicy(BaseController):
         """
         pass  # pylint: disable=unnecessary-pass
 
-    def _vm_name_check(self, vm_name: str, exclude_vm_names: List) -> bool:
+    def _compile_vm_name_matchers(self, exclude_vm_names: List) -> List[re.Pattern]:
+        """
+        Compile the exclude list once per desired spec instead of per VM.
+
+        All names/patterns are combined into a single case-insensitive alternation, which gives the same result
+        as calling re.match for each pattern in turn. If any pattern has groups (its backreferences would bind to
+        the groups of the other patterns once combined) or inline global flags, each one is compiled on its own.
+
+        :param exclude_vm_names: a list of vm names/patterns to compare.
+        :type exclude_vm_names: List
+        :return: a list of compiled patterns.
+        :rtype: List
+        """
+        exclude_vm_matchers = [re.compile(name, re.IGNORECASE) for name in exclude_vm_names]
+        if len(exclude_vm_matchers) <= 1:
+            return exclude_vm_matchers
+        default_flags = re.compile("", re.IGNORECASE).flags
+        if any(matcher.groups or matcher.flags != default_flags for matcher in exclude_vm_matchers):
+            return exclude_vm_matchers
+        return [re.compile("|".join(f"(?:{name})" for name in exclude_vm_names), re.IGNORECASE)]
+
+    def _vm_name_check(self, vm_name: str, exclude_vm_matchers: List[re.Pattern]) -> bool:
         """
         Check if a given vm name matches any name/pattern in exclude list.
 
         :param vm_name: vm name.
         :type vm_name: str
-        :param exclude_vm_names: a list of vm names/patterns to compare.
-        :type exclude_vm_names: List
+        :param exclude_vm_matchers: compiled vm names/patterns to compare.
+        :type exclude_vm_matchers: List
         :return: True if vm_name matches any name or pattern in exclude list
         :rtype: bool
         """
-        for exclude_vm_name in exclude_vm_names:
-            if re.match(exclude_vm_name, vm_name, re.IGNORECASE):
-                logger.debug(f"VM name: {vm_name} -match-: {exclude_vm_name}")
+        for exclude_vm_matcher in exclude_vm_matchers:
+            if exclude_vm_matcher.match(vm_name):
+                logger.debug(f"VM name: {vm_name} -match-: {exclude_vm_matcher.pattern}")
                 return True
         return False
 
@@ -190,7 +212,7 @@ class VmMigrateEncryptionPolicy(BaseController):
         vm_type = exclude_vms.get("vm_type", {})
         exclude_vm_in_bad_state = vm_type.get("vm_disconnected", False)
         exclude_vm_fully_encrypted = vm_type.get("vm_fully_encrypted", False)
-        exclude_vm_names = exclude_vms.get("vm_name_match", [])
+        exclude_vm_matchers = self._compile_vm_name_matchers(exclude_vms.get("vm_name_match", []))
         for vm_migrate_encryption_config in all_vm_migrate_encryption_configs:
             vm_name = vm_migrate_encryption_config["vm_name"]
             vm_state = vm_migrate_encryption_config["vm_state"]
@@ -210,7 +232,7 @@ class VmMigrateEncryptionPolicy(BaseController):
                 excluded_vms.setdefault("encrypted", []).append(vm_name)
                 continue
             # check if vm name matches the name in exclude list
-            if self._vm_name_check(vm_name, exclude_vm_names):
+            if self._vm_name_check(vm_name, exclude_vm_matchers):
                 logger.debug(
                     f"Exclude this VM -  name: {vm_name}, state: {vm_state}, policy: {migrate_policy} - name match"
                 )
@@ -245,12 +267,16 @@ class VmMigrateEncryptionPolicy(BaseController):
             cause = getattr(cause, "__cause__", None)
         return False
 
-    def __get_all_vm_migrate_encryption_policy(self, vc_vmomi_client: VcVmomiClient) -> List[Dict]:
+    def __get_all_vm_migrate_encryption_policy(
+        self, vc_vmomi_client: VcVmomiClient, inventory_index: InventoryIndex
+    ) -> List[Dict]:
         """
         Get all VM migrate Encryption policies.
 
         :param vc_vmomi_client: VC vmomi client instance.
         :type vc_vmomi_client: VcVmomiClient
+        :param inventory_index: vCenter inventory index.
+        :type inventory_index: InventoryIndex
         :return: List containing VM migration Encryption policy for all Virtual Machines
         :rtype: Dict
         """
@@ -264,7 +290,7 @@ class VmMigrateEncryptionPolicy(BaseController):
                 )
                 vm_migrate_encryption_config = {
                     "vm_name": vm_ref.name,
-                    "path": vc_vmomi_client.get_vm_path_in_datacenter(vm_ref),
+                    "path": self._get_vm_path(vc_vmomi_client, inventory_index, vm_ref),
                     "migrate_encryption_policy": vm_ref.config.migrateEncryption
                     if vm_ref.config and hasattr(vm_ref.config, "migrateEncryption")
                     else "None",
@@ -329,21 +355,30 @@ class VmMigrateEncryptionPolicy(BaseController):
             errors.append(f"Resource pool for VM: {vm_ref.name} not found")
         return resource_pool, errors
 
-    def _is_in_non_compiliant_list(self, vm_name: str, non_compliant_configs: List) -> bool:
+    def _get_vm_path(self, vc_vmomi_client: VcVmomiClient, inventory_index: InventoryIndex, vm_ref) -> str:
         """
-        Check if a given vm name is in non compliant vm list.
+        Look up the VM path in the inventory index, walking the parent chain only for VMs not in the index.
 
-        :param vm_name: vm name.
-        :type vm_name: str
-        :param non_compliant_configs: non compliant vm config list.
-        :type non_compliant_configs: List
-        :return: True if vm_name matches any item in non compliant config list
-        :rtype: bool
+        :param vc_vmomi_client: VC vmomi client instance.
+        :type vc_vmomi_client: VcVmomiClient
+        :param inventory_index: vCenter inventory index.
+        :type inventory_index: InventoryIndex
+        :param vm_ref: vm reference object.
+        :type vm_ref: vim.VirtualMachine
+        :return: Path of the VM in its datacenter.
+        :rtype: str
         """
-        return any(item.get("vm_name") == vm_name for item in non_compliant_configs)
+        vm_path = inventory_index.get_vm_path_in_datacenter(vm_ref._moId)
+        if vm_path is None:
+            vm_path = vc_vmomi_client.get_vm_path_in_datacenter(vm_ref)
+        return vm_path
 
     def __set_vm_migrate_encryption_policy_for_all_non_compliant_vms(
-        self, vc_vmomi_client: VcVmomiClient, desired_values: Dict, non_compliant_configs: List
+        self,
+        vc_vmomi_client: VcVmomiClient,
+        inventory_index: InventoryIndex,
+        desired_values: Dict,
+        non_compliant_configs: List,
     ) -> Tuple[List[dict], List[dict], List[str]]:
         """
         Set VM migrate Encryption policies for all non-compliant VMs.
@@ -373,6 +408,8 @@ class VmMigrateEncryptionPolicy(BaseController):
 
         :param vc_vmomi_client: VC vmomi client instance.
         :type vc_vmomi_client: VcVmomiClient
+        :param inventory_index: vCenter inventory index.
+        :type inventory_index: InventoryIndex
         :param desired_values: Dictionary containing VM migration Encryption policy.
         :type desired_values: Dict
         :return: list of current non compliant and desired configs and list of errors if any
@@ -381,6 +418,7 @@ class VmMigrateEncryptionPolicy(BaseController):
         desired_global_vm_migrate_encryption_policy = desired_values.get(GLOBAL, {}).get(DESIRED_KEY)
         overrides = desired_values.get(OVERRIDES, [])
         all_vm_refs = vc_vmomi_client.get_objects_by_vimtype(vim.VirtualMachine)
+        non_compliant_vm_names = {item.get(VM_NAME) for item in non_compliant_configs}
         errors = []
         remediated = []
         remediated_desired = []
@@ -388,9 +426,9 @@ class VmMigrateEncryptionPolicy(BaseController):
         for vm_ref in all_vm_refs:
             try:
                 vm_name = vm_ref.name
-                if not self._is_in_non_compiliant_list(vm_name, non_compliant_configs):
+                if vm_name not in non_compliant_vm_names:
                     continue
-                vm_path = vc_vmomi_client.get_vm_path_in_datacenter(vm_ref)
+                vm_path = self._get_vm_path(vc_vmomi_client, inventory_index, vm_ref)
                 current_vm_migrate_encryption_policy = (
                     vm_ref.config.migrateEncryption
                     if vm_ref.config and hasattr(vm_ref.config, "migrateEncryption")
@@ -592,7 +630,7 @@ class VmMigrateEncryptionPolicy(BaseController):
         non_compliant_configs = result.get(consts.CURRENT, [])
         vc_vmomi_client = context.vc_vmomi_client()
         remediated, remediated_desired, errors = self.__set_vm_migrate_encryption_policy_for_all_non_compliant_vms(
-            vc_vmomi_client, desired_values, non_compliant_configs
+            vc_vmomi_client, context.inventory_index(), desired_values, non_compliant_configs
         )
 
         if not errors:
@@ -8,6 +8,7 @@ from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import query_clusters_concurrently
 from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import VcVsanVmomiClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
@@ -250,21 +251,25 @@ class VSANHCLProxyConfig(BaseController):
         # get all vSAN enabled clusters
         all_vsan_enabled_clusters = vc_vsan_vmomi_client.get_all_vsan_enabled_clusters()
         for cluster_ref in all_vsan_enabled_clusters:
-            cluster_proxy_config = vc_vsan_vmomi_client.get_vsan_cluster_health_config_for_cluster(cluster_ref)
-            cluster_proxy_config.vsanTelemetryProxy.host = desired_values.get("host")
-            cluster_proxy_config.vsanTelemetryProxy.port = desired_values.get("port")
-            cluster_proxy_config.vsanTelemetryProxy.user = desired_values.get("user")
-            cluster_proxy_config.vsanTelemetryProxy.password = desired_values.get("password")
-            # Get Internet access config for cluster
-            internet_access_config = vc_vsan_vmomi_client.get_vsan_config_by_key_for_cluster(
-                "enableinternetaccess", cluster_ref
-            )
-
-            internet_access_config.value = "true" if desired_values.get("internet_access_enabled") else "false"
-            cluster_proxy_config.configs.append(internet_access_config)
-            # get vSAN health system
-            vsan_health_system = vc_vsan_vmomi_client.get_vsan_health_system()
-            vsan_health_system.SetVsanClusterTelemetryConfig(cluster_ref, cluster_proxy_config)
+            try:
+                cluster_proxy_config = vc_vsan_vmomi_client.get_vsan_cluster_health_config_for_cluster(cluster_ref)
+                cluster_proxy_config.vsanTelemetryProxy.host = desired_values.get("host")
+                cluster_proxy_config.vsanTelemetryProxy.port = desired_values.get("port")
+                cluster_proxy_config.vsanTelemetryProxy.user = desired_values.get("user")
+                cluster_proxy_config.vsanTelemetryProxy.password = desired_values.get("password")
+                # Get Internet access config for cluster
+                internet_access_config = vc_vsan_vmomi_client.get_vsan_config_by_key_for_cluster(
+                    "enableinternetaccess", cluster_ref
+                )
+
+                internet_access_config.value = "true" if desired_values.get("internet_access_enabled") else "false"
+                cluster_proxy_config.configs.append(internet_access_config)
+                # get vSAN health system
+                vsan_health_system = vc_vsan_vmomi_client.get_vsan_health_system()
+                vsan_health_system.SetVsanClusterTelemetryConfig(cluster_ref, cluster_proxy_config)
+            finally:
+                # the cached health config was modified above, query it again on next use
+                vc_vsan_vmomi_client.invalidate_vsan_cluster_cache(cluster_ref)
 
     def __get_proxy_config_for_all_vsan_clusters(self, vc_vsan_vmomi_client: VcVsanVmomiClient) -> List:
         """
@@ -275,10 +280,11 @@ class VSANHCLProxyConfig(BaseController):
         :return: List of proxy configurations for all clusters.
         :rtype: List
         """
-        proxy_configs = []
-        all_vsan_enabled_clusters = vc_vsan_vmomi_client.get_all_vsan_enabled_clusters()
-        for cluster_ref in all_vsan_enabled_clusters:
+
+        def get_proxy_config_for_cluster(cluster_ref):
             telemetry_proxy_config = vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster(cluster_ref)
             telemetry_proxy_config["cluster_name"] = cluster_ref.name
-            proxy_configs.append(telemetry_proxy_config)
-        return proxy_configs
+            return telemetry_proxy_config
+
+        all_vsan_enabled_clusters = vc_vsan_vmomi_client.get_all_vsan_enabled_clusters()
+        return query_clusters_concurrently(get_proxy_config_for_cluster, all_vsan_enabled_clusters)
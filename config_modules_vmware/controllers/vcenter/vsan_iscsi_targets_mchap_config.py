@@ -1,12 +1,15 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 import logging
 from typing import Dict
+from typing import List
 from typing import Tuple
 
 from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import query_clusters_concurrently
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import VcVsanVmomiClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
@@ -59,23 +62,12 @@ class VsanIscsiTargetsMchapConfig(BaseController):
         try:
             # get all vsan enabled clusters
             all_vsan_enabled_clusters = vc_vsan_vmomi_client.get_all_vsan_enabled_clusters()
-            for cluster_ref in all_vsan_enabled_clusters:
-                # check vsan iscsi target service config (cluster level config)
-                auth_type = vc_vsan_vmomi_client.get_vsan_iscsi_targets_auth_type_for_cluster(cluster_ref)
-                if auth_type is not None:
-                    result.append({f"{self.__get_dc_cluster_target_path(cluster_ref)}": auth_type})
-
-                # check each individual targets
-                if vc_vsan_vmomi_client.is_vsan_iscsi_targets_enabled_for_cluster(cluster_ref):
-                    cluster_iscsi_targets = vc_vsan_vmomi_client.get_vsan_iscsi_targets_for_cluster()
-                    iscsi_targets = cluster_iscsi_targets.GetIscsiTargets(cluster_ref)
-                    for iscsi_target in iscsi_targets:
-                        auth_type = iscsi_target.authSpec.authType
-                        result.append(
-                            {
-                                f"{self.__get_dc_cluster_target_path(cluster_ref, target_name=iscsi_target.alias)}": auth_type
-                            }
-                        )
+            # clusters are queried concurrently, results are kept in the order of the clusters
+            for cluster_result in query_clusters_concurrently(
+                lambda cluster_ref: self.__get_auth_types_for_cluster(vc_vsan_vmomi_client, cluster_ref),
+                all_vsan_enabled_clusters,
+            ):
+                result.extend(cluster_result)
 
         except Exception as e:
             logger.exception(f"An error occurred: {e}")
@@ -100,6 +92,33 @@ class VsanIscsiTargetsMchapConfig(BaseController):
         status = RemediateStatus.SKIPPED
         return status, errors
 
+    def __get_auth_types_for_cluster(self, vc_vsan_vmomi_client: VcVsanVmomiClient, cluster_ref) -> List:
+        """
+        Get the iscsi target service auth type and the auth type of each target of the cluster.
+
+        :param vc_vsan_vmomi_client: vSAN vmomi client.
+        :type vc_vsan_vmomi_client: VcVsanVmomiClient
+        :param cluster_ref: vSAN enabled cluster.
+        :return: List of dicts of target path to auth type.
+        :rtype: List
+        """
+        result = []
+        # check vsan iscsi target service config (cluster level config)
+        auth_type = vc_vsan_vmomi_client.get_vsan_iscsi_targets_auth_type_for_cluster(cluster_ref)
+        if auth_type is not None:
+            result.append({f"{self.__get_dc_cluster_target_path(cluster_ref)}": auth_type})
+
+        # check each individual targets
+        if vc_vsan_vmomi_client.is_vsan_iscsi_targets_enabled_for_cluster(cluster_ref):
+            cluster_iscsi_targets = vc_vsan_vmomi_client.get_vsan_iscsi_targets_for_cluster()
+            iscsi_targets = cluster_iscsi_targets.GetIscsiTargets(cluster_ref)
+            for iscsi_target in iscsi_targets:
+                auth_type = iscsi_target.authSpec.authType
+                result.append(
+                    {f"{self.__get_dc_cluster_target_path(cluster_ref, target_name=iscsi_target.alias)}": auth_type}
+                )
+        return result
+
     def __get_dc_cluster_target_path(self, cluster_ref, target_name=None) -> str:
         if target_name:
             return f"{cluster_ref.parent.parent.name}/{cluster_ref.name}/{target_name}"
@@ -1,17 +1,13 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
-import json
 import logging
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Tuple
 
-import requests
-
 from config_modules_vmware.controllers.base_controller import BaseController
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.auth.contexts.vrslcm_context import VrslcmContext
-from config_modules_vmware.framework.clients.aria_suite import aria_auth
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
@@ -43,14 +39,12 @@ class DnsConfig(BaseController):
         scope="",  # any information or limitations about how the controller operates. i.e. runs as a CLI on VCSA.
     )
 
-    http_headers = None
-
-    def _call_dns_api(self, hostname: str, http_method: str, name: str = None, server: str = None) -> dict:
+    def _call_dns_api(self, context: VrslcmContext, http_method: str, name: str = None, server: str = None) -> dict:
         """
-        Call DNS API.
+        Call DNS API over the pooled connections of the context client.
 
-        :param hostname: Hostname of the server.
-        :type hostname: str
+        :param context: vRealize suite LCM context
+        :type context: VrslcmContext
         :param name: DNS server name.
         :type name: str
         :param server: DNS server IP.
@@ -66,19 +60,11 @@ class DnsConfig(BaseController):
         else:
             request_body = None
 
-        if not self.http_headers:
-            self.http_headers = aria_auth.get_http_headers()
-        dns_query_response = requests.request(
-            http_method,
-            f"https://{hostname}/lcm/lcops/api/v2/settings/dns",
-            headers=self.http_headers,
-            data=json.dumps(request_body),
-            verify=False,
-            timeout=60,
+        aria_rest_client = context.aria_rest_client()
+        dns_query_response_body = aria_rest_client.request(
+            http_method, f"{aria_rest_client.get_base_url()}/lcm/lcops/api/v2/settings/dns", body=request_body
         )
-        dns_query_response.raise_for_status()
-        dns_query_response_body = dns_query_response.json()
-        logger.debug(f"DNS query response body: {dns_query_response_body}")
+        logger.debug("DNS query response body: %s", dns_query_response_body)
         return dns_query_response_body
 
     def get(self, context: VrslcmContext) -> Tuple[Dict, List[Any]]:
@@ -101,8 +87,8 @@ class DnsConfig(BaseController):
         logger.info("Getting DNS servers.")
         errors = []
         try:
-            dns_query_response = self._call_dns_api(context.hostname, "GET")
-            logger.debug(f"DNS query response: {dns_query_response}")
+            dns_query_response = self._call_dns_api(context, "GET")
+            logger.debug("DNS query response: %s", dns_query_response)
             dns_servers = []
             for dns_server_item in dns_query_response:
                 dns_servers.append(dns_server_item.get("hostName"))
@@ -149,21 +135,23 @@ class DnsConfig(BaseController):
         logger.info("Setting DNS control config for audit.")
         errors = []
         try:
-            dns_query_response = self._call_dns_api(context.hostname, "GET")
-            logger.debug(f"Current DNS servers: {dns_query_response}")
+            dns_query_response = self._call_dns_api(context, "GET")
+            logger.debug("Current DNS servers: %s", dns_query_response)
             desired_dns_servers = desired_values.get("servers", [])
             logger.debug(f"Desired DNS servers: {desired_dns_servers}")
 
+            # settings/dns is a single settings resource, entries are deleted sequentially over the pooled session
             for dns_server_item in dns_query_response:
                 logger.info(f"Deleting DNS entry: {dns_server_item}")
-                self._call_dns_api(context.hostname, "DELETE", dns_server_item["name"], dns_server_item["hostName"])
+                self._call_dns_api(context, "DELETE", dns_server_item["name"], dns_server_item["hostName"])
 
+            # entries are added sequentially, the order of the desired servers is kept
             for i in range(0, len(desired_dns_servers)):
                 server = desired_dns_servers[i]
                 # replicating the implementation from aslcm_dns salt module
                 name = "dns" + (str(i) if i != 0 else "")
                 logger.info(f"Adding DNS entry name: {name} server: {server}")
-                self._call_dns_api(context.hostname, "POST", name, server)
+                self._call_dns_api(context, "POST", name, server)
 
             status = RemediateStatus.SUCCESS
         except Exception as e:
@@ -1,5 +1,6 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
+from config_modules_vmware.framework.auth.session_pool import SessionPool
 from config_modules_vmware.framework.clients.sddc_manager import sddc_manager_consts
 from config_modules_vmware.framework.clients.sddc_manager.sddc_manager_rest_client import SDDCManagerRestClient
 
@@ -28,6 +29,7 @@ class SDDCManagerContext(BaseContext):
         self._password = password
         self._ssl_thumbprint = ssl_thumbprint
         self._verify_ssl = verify_ssl
+        self._use_session_pool = SessionPool.is_enabled()
         self._sddc_manager_rest_client = None
 
     def __enter__(self):
@@ -39,8 +41,11 @@ class SDDCManagerContext(BaseContext):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Called when the consumer's 'with context:' block ends.
-        Disconnects from any instantiated clients.
+        Disconnects from any instantiated clients, or returns them to the session pool if enabled.
         """
+        if self._sddc_manager_rest_client and self._use_session_pool:
+            SessionPool.release(self._sddc_manager_rest_client)
+            self._sddc_manager_rest_client = None
         if self._sddc_manager_rest_client:
             del self._sddc_manager_rest_client
             self._sddc_manager_rest_client = None
@@ -51,9 +56,30 @@ class SDDCManagerContext(BaseContext):
         Initializes if one does not exist.
         """
         if not self._sddc_manager_rest_client:
-            self._sddc_manager_rest_client = SDDCManagerRestClient(
-                self._hostname, self._username, self._password, self._ssl_thumbprint, self._verify_ssl
-            )
+
+            def create_client():
+                return SDDCManagerRestClient(
+                    self._hostname, self._username, self._password, self._ssl_thumbprint, self._verify_ssl
+                )
+
+            if self._use_session_pool:
+                key = SessionPool.make_key(
+                    SDDCManagerRestClient,
+                    self._hostname,
+                    username=self._username,
+                    secret=self._password,
+                    ssl_thumbprint=self._ssl_thumbprint,
+                    verify_ssl=self._verify_ssl,
+                )
+                # the token is dropped with the client, there is no logout call
+                self._sddc_manager_rest_client = SessionPool.acquire(
+                    key,
+                    create_client,
+                    lambda client: None,
+                    health_check_func=SDDCManagerRestClient.is_session_active,
+                )
+            else:
+                self._sddc_manager_rest_client = create_client()
         return self._sddc_manager_rest_client
 
     @property
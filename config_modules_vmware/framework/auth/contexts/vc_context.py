@@ -2,6 +2,7 @@
 import logging
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
+from config_modules_vmware.framework.auth.session_pool import SessionPool
 from config_modules_vmware.framework.auth.ssl.cert_info import CertInfo
 from config_modules_vmware.framework.clients.vcenter.vc_invsvc_mob3_client import VcInvsvcMob3Client
 from config_modules_vmware.framework.clients.vcenter.vc_rest_client import VcRestClient
@@ -9,6 +10,7 @@ from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VcVm
 from config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client import VcVmomiSSOClient
 from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import VcVsanVmomiClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.services.config import Config
 
 logger = LoggerAdapter(logging.getLogger(__name__))
 
@@ -57,11 +59,15 @@ class VcenterContext(BaseContext):
         if isinstance(cert_info, CertInfo):
             cert_info = [cert_info]
         self._cert_info = cert_info
+        self._use_session_pool = SessionPool.is_enabled()
         self._vc_vmomi_client = None
         self._vc_rest_client = None
         self._vc_vmomi_sso_client = None
         self._vc_vsan_vmomi_client = None
         self._vc_invsvc_mob3_client = None
+        self._inventory_index = None
+        self._alarm_catalog = None
+        self._authorization_snapshot = None
 
     def __enter__(self):
         """
@@ -72,8 +78,26 @@ class VcenterContext(BaseContext):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
         Called when the consumer's 'with context:' block ends.
-        Disconnects from any instantiated clients.
+        Disconnects from any instantiated clients, or returns them to the session pool if enabled.
         """
+        if self._use_session_pool:
+            # query results cached on the clients are only valid for this context
+            if self._vc_vsan_vmomi_client and not isinstance(self._vc_vsan_vmomi_client, Exception):
+                self._vc_vsan_vmomi_client.invalidate_vsan_cluster_cache()
+            if self._vc_vmomi_sso_client and not isinstance(self._vc_vmomi_sso_client, Exception):
+                self._vc_vmomi_sso_client.clear_principal_cache()
+            for client in (
+                self._vc_vmomi_client,
+                self._vc_rest_client,
+                self._vc_vmomi_sso_client,
+                self._vc_vsan_vmomi_client,
+            ):
+                if client and not isinstance(client, Exception):
+                    SessionPool.release(client)
+            self._vc_vmomi_client = None
+            self._vc_rest_client = None
+            self._vc_vmomi_sso_client = None
+            self._vc_vsan_vmomi_client = None
         if self._vc_vmomi_client:
             self._vc_vmomi_client.disconnect()
         if self._vc_rest_client and isinstance(self._vc_rest_client, VcRestClient):
@@ -88,6 +112,39 @@ class VcenterContext(BaseContext):
             self._vc_invsvc_mob3_client.disconnect()
             del self._vc_invsvc_mob3_client
             self._vc_invsvc_mob3_client = None
+        self._inventory_index = None
+        self._alarm_catalog = None
+        self._authorization_snapshot = None
+
+    def _get_client(self, client_type, create_func, close_func, secret, max_age=None):
+        """
+        Create a client, or acquire one from the session pool if enabled.
+        :param client_type: Client class, part of the session pool key.
+        :type client_type: :class:'type'
+        :param create_func: Function creating and logging in the client.
+        :type create_func: Callable
+        :param close_func: Function logging out the client.
+        :type close_func: Callable
+        :param secret: Password or SAML token the client logs in with, part of the session pool key.
+        :type secret: :class:'str'
+        :param max_age: Max lifetime in seconds of a pooled session.
+        :type max_age: :class:'int'
+        :return: Client instance.
+        """
+        if not self._use_session_pool:
+            return create_func()
+        key = SessionPool.make_key(
+            client_type,
+            self._hostname,
+            username=self._username,
+            secret=secret,
+            ssl_thumbprint=self._ssl_thumbprint,
+            verify_ssl=self._verify_ssl,
+            cert_info=self._cert_info,
+        )
+        return SessionPool.acquire(
+            key, create_func, close_func, health_check_func=client_type.is_session_active, max_age=max_age
+        )
 
     def vc_vmomi_client(self):
         """
@@ -95,13 +152,18 @@ class VcenterContext(BaseContext):
         Initializes if one does not exist.
         """
         if not self._vc_vmomi_client:
-            self._vc_vmomi_client = VcVmomiClient(
-                self._hostname,
-                self._username,
-                self._password,
-                ssl_thumbprint=self._ssl_thumbprint,
-                saml_token=self._saml_token,
-                verify_ssl=self._verify_ssl,
+            self._vc_vmomi_client = self._get_client(
+                VcVmomiClient,
+                lambda: VcVmomiClient(
+                    self._hostname,
+                    self._username,
+                    self._password,
+                    ssl_thumbprint=self._ssl_thumbprint,
+                    saml_token=self._saml_token,
+                    verify_ssl=self._verify_ssl,
+                ),
+                VcVmomiClient.disconnect,
+                self._saml_token or self._password,
             )
         return self._vc_vmomi_client
 
@@ -112,13 +174,18 @@ class VcenterContext(BaseContext):
         """
         if not self._vc_rest_client:
             try:
-                self._vc_rest_client = VcRestClient(
-                    self._hostname,
-                    self._username,
+                self._vc_rest_client = self._get_client(
+                    VcRestClient,
+                    lambda: VcRestClient(
+                        self._hostname,
+                        self._username,
+                        self._password,
+                        ssl_thumbprint=self._ssl_thumbprint,
+                        verify_ssl=self._verify_ssl,
+                        cert_info=self._cert_info,
+                    ),
+                    VcRestClient.delete_vmware_api_session_id,
                     self._password,
-                    ssl_thumbprint=self._ssl_thumbprint,
-                    verify_ssl=self._verify_ssl,
-                    cert_info=self._cert_info,
                 )
             except Exception as e:
                 logger.error(f"VcRestClient initialization failed: [{str(e)}]")
@@ -134,12 +201,19 @@ class VcenterContext(BaseContext):
         Initializes if one does not exist.
         """
         if not self._vc_vmomi_sso_client:
-            self._vc_vmomi_sso_client = VcVmomiSSOClient(
-                hostname=self._hostname,
-                user=self._username,
-                pwd=self._password,
-                ssl_thumbprint=self._ssl_thumbprint,
-                verify_ssl=self._verify_ssl,
+            # a pooled SSO client is handed out with at least half of its SAML token lifetime left
+            self._vc_vmomi_sso_client = self._get_client(
+                VcVmomiSSOClient,
+                lambda: VcVmomiSSOClient(
+                    hostname=self._hostname,
+                    user=self._username,
+                    pwd=self._password,
+                    ssl_thumbprint=self._ssl_thumbprint,
+                    verify_ssl=self._verify_ssl,
+                ),
+                VcVmomiSSOClient.disconnect,
+                self._password,
+                max_age=Config.get_section("vcenter.vmomi.sso").getint("SAMLTokenDurationSeconds") // 2,
             )
         return self._vc_vmomi_sso_client
 
@@ -149,12 +223,17 @@ class VcenterContext(BaseContext):
         Initializes if one does not exist.
         """
         if not self._vc_vsan_vmomi_client:
-            self._vc_vsan_vmomi_client = VcVsanVmomiClient(
-                hostname=self._hostname,
-                user=self._username,
-                pwd=self._password,
-                ssl_thumbprint=self._ssl_thumbprint,
-                verify_ssl=self._verify_ssl,
+            self._vc_vsan_vmomi_client = self._get_client(
+                VcVsanVmomiClient,
+                lambda: VcVsanVmomiClient(
+                    hostname=self._hostname,
+                    user=self._username,
+                    pwd=self._password,
+                    ssl_thumbprint=self._ssl_thumbprint,
+                    verify_ssl=self._verify_ssl,
+                ),
+                VcVsanVmomiClient.disconnect,
+                self._password,
             )
         return self._vc_vsan_vmomi_client
 
@@ -189,3 +268,52 @@ class VcenterContext(BaseContext):
                 cert_info=self._cert_info,
             )
         return self._vc_invsvc_mob3_client
+
+    def inventory_index(self, refresh=False):
+        """
+        Returns the inventory tree index of this vCenter, shared by all controllers using this context.
+        Builds it with a single property collector pass if one does not exist or a refresh is requested.
+        :param refresh: Rebuild the index, e.g. after entities were added, moved or renamed.
+        :type refresh: :class:'bool'
+        :return: InventoryIndex
+        """
+        if self._inventory_index is None or refresh:
+            self._inventory_index = self.vc_vmomi_client().build_inventory_index()
+        return self._inventory_index
+
+    def alarm_catalog(self, refresh=False):
+        """
+        Returns the catalog of alarm definitions of this vCenter, shared by all alarm controllers using this context.
+        Builds it with a single property collector call if one does not exist or a refresh is requested.
+        :param refresh: Rebuild the catalog.
+        :type refresh: :class:'bool'
+        :return: AlarmCatalog
+        """
+        if self._alarm_catalog is None or refresh:
+            self._alarm_catalog = self.vc_vmomi_client().build_alarm_catalog()
+        return self._alarm_catalog
+
+    def invalidate_alarm_catalog(self):
+        """
+        Drops the cached alarm catalog, so the next lookup sees alarms created or reconfigured since it was built.
+        """
+        self._alarm_catalog = None
+
+    def authorization_snapshot(self, refresh=False):
+        """
+        Returns the snapshot of roles and permissions of this vCenter, shared by all controllers using this context.
+        Builds it with one roleList read and one RetrieveAllPermissions call if one does not exist or a refresh
+        is requested.
+        :param refresh: Rebuild the snapshot.
+        :type refresh: :class:'bool'
+        :return: AuthorizationSnapshot
+        """
+        if self._authorization_snapshot is None or refresh:
+            self._authorization_snapshot = self.vc_vmomi_client().build_authorization_snapshot()
+        return self._authorization_snapshot
+
+    def invalidate_authorization_snapshot(self):
+        """
+        Drops the cached authorization snapshot, so the next lookup sees permissions set or removed since it was built.
+        """
+        self._authorization_snapshot = None
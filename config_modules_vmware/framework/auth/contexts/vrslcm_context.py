@@ -1,10 +1,12 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
+from config_modules_vmware.framework.clients.aria_suite.aria_rest_client import AriaRestClient
 
 
 class VrslcmContext(BaseContext):
     """
     Class to be shared among vRealize suite LCM config-modules controllers.
+    It supports context manager to close the pooled connections during the exit of this object.
     """
 
     def __init__(self, hostname=None):
@@ -14,3 +16,28 @@ class VrslcmContext(BaseContext):
         :type hostname: :class:'str'
         """
         super().__init__(BaseContext.ProductEnum.VRSLCM, hostname=hostname)
+        self._aria_rest_client = None
+
+    def __enter__(self):
+        """
+        Called when the consumer starts the 'with context:' block
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Called when the consumer's 'with context:' block ends.
+        Closes the pooled connections of any instantiated clients.
+        """
+        if self._aria_rest_client:
+            self._aria_rest_client.close()
+            self._aria_rest_client = None
+
+    def aria_rest_client(self):
+        """
+        Returns the instance of an AriaRestClient, shared by all controllers using this context.
+        Initializes if one does not exist.
+        """
+        if not self._aria_rest_client:
+            self._aria_rest_client = AriaRestClient(self._hostname)
+        return self._aria_rest_client
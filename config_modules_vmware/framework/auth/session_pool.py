@@ -0,0 +1,286 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Process-wide pool of authenticated clients shared across contexts.
+"""
+import atexit
+import hashlib
+import logging
+import threading
+import time
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+SESSION_POOL_CONFIG_SECTION = "session.pool"
+
+
+class _PooledSession(object):
+    """
+    Bookkeeping for a single client held by the pool.
+    """
+
+    def __init__(self, key, client, close_func, health_check_func, max_age):
+        now = time.monotonic()
+        self.key = key
+        self.client = client
+        self.close_func = close_func
+        self.health_check_func = health_check_func
+        self.max_age = max_age
+        self.created_at = now
+        self.last_used = now
+
+    def is_expired(self, now, idle_timeout):
+        """
+        Whether the session has been idle longer than the idle timeout or outlived its max age.
+        """
+        if idle_timeout and now - self.last_used > idle_timeout:
+            return True
+        return bool(self.max_age) and now - self.created_at > self.max_age
+
+
+class SessionPool:
+    """
+    Pool of authenticated clients, keyed by client type, target, principal and TLS settings.
+
+    Contexts acquire clients from the pool instead of logging in on every context and release them on exit,
+    so a process running many contexts against the same target logs in once per pooled session.
+    Sessions idle for longer than the health check interval are checked before being handed out again,
+    and sessions idle for longer than the idle timeout are logged out and evicted.
+    The number of sessions per key is capped, callers wait for a session to be released once the cap is reached.
+    """
+
+    _condition = threading.Condition()
+    # key -> list of idle sessions, most recently used last
+    _idle = {}
+    # key -> number of sessions handed out or being created
+    _leased_count = {}
+    # id(client) -> leased session
+    _leased = {}
+    _atexit_registered = False
+
+    @classmethod
+    def _get_config(cls):
+        return Config.get_section(SESSION_POOL_CONFIG_SECTION)
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        Whether contexts should acquire their clients from the pool.
+        :return: True if the pool is enabled in the configuration.
+        :rtype: bool
+        """
+        return cls._get_config().getboolean("Enabled", fallback=False)
+
+    @staticmethod
+    def make_key(
+        client_type, hostname, username=None, secret=None, ssl_thumbprint=None, verify_ssl=True, cert_info=None
+    ):
+        """
+        Build the pool key for a client. The secret is only kept as a digest, so that a changed password or token
+        never reuses a session authenticated with the previous one.
+        :param client_type: Client class.
+        :type client_type: :class:'type'
+        :param hostname: Target hostname.
+        :type hostname: :class:'str'
+        :param username: Principal used to log in.
+        :type username: :class:'str'
+        :param secret: Password or SAML token used to log in.
+        :type secret: :class:'str'
+        :param ssl_thumbprint: Target thumbprint.
+        :type ssl_thumbprint: :class:'str'
+        :param verify_ssl: Flag to enable/disable SSL verification.
+        :type verify_ssl: :class:'boolean'
+        :param cert_info: List of CertInfo used to verify the target.
+        :type cert_info: :class:'list'
+        :return: Pool key.
+        :rtype: tuple
+        """
+        secret_digest = hashlib.sha256(secret.encode("utf-8")).hexdigest() if secret else None
+        cert_settings = tuple(
+            (cert.certificate_str, cert.enforce_hostname_verification, cert.enforce_date_validity_checking)
+            for cert in cert_info or []
+        )
+        return (
+            client_type.__name__,
+            hostname,
+            username,
+            secret_digest,
+            ssl_thumbprint,
+            bool(verify_ssl),
+            cert_settings,
+        )
+
+    @classmethod
+    def acquire(cls, key, create_func, close_func, health_check_func=None, max_age=None):
+        """
+        Get a client for the key, reusing an idle pooled session when one is available.
+        :param key: Pool key, see :meth:`make_key`.
+        :type key: :class:'tuple'
+        :param create_func: Function creating and logging in a new client.
+        :type create_func: Callable
+        :param close_func: Function logging out a client, called with the client.
+        :type close_func: Callable
+        :param health_check_func: Function called with the client before reusing it, returns True if usable.
+        :type health_check_func: Callable
+        :param max_age: Max lifetime in seconds of a session, e.g. for clients authenticated with a token.
+        :type max_age: :class:'int'
+        :return: Client.
+        :raises Exception: If no session is released within the acquire timeout.
+        """
+        config = cls._get_config()
+        max_sessions = config.getint("MaxSessionsPerTarget")
+        health_check_interval = config.getint("HealthCheckIntervalSeconds")
+        deadline = time.monotonic() + config.getint("AcquireTimeoutSeconds")
+        cls._register_atexit()
+
+        pooled_session = None
+        expired_sessions = []
+        with cls._condition:
+            while True:
+                expired_sessions.extend(cls._evict_expired_locked(config.getint("IdleTimeoutSeconds")))
+                idle_sessions = cls._idle.get(key)
+                if idle_sessions:
+                    pooled_session = idle_sessions.pop()
+                    cls._leased_count[key] = cls._leased_count.get(key, 0) + 1
+                    cls._leased[id(pooled_session.client)] = pooled_session
+                    break
+                if cls._leased_count.get(key, 0) < max_sessions:
+                    # reserve the slot before creating the client outside the lock
+                    cls._leased_count[key] = cls._leased_count.get(key, 0) + 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Exception(f"Timed out waiting for a pooled session to {key[1]}")
+                cls._condition.wait(remaining)
+        cls._close_sessions(expired_sessions)
+
+        if pooled_session is not None:
+            if time.monotonic() - pooled_session.last_used <= health_check_interval or cls._is_healthy(pooled_session):
+                logger.debug(f"Reusing pooled {key[0]} session to {key[1]}")
+                return pooled_session.client
+            logger.info(f"Pooled {key[0]} session to {key[1]} failed health check, logging in again")
+            with cls._condition:
+                cls._leased.pop(id(pooled_session.client), None)
+            cls._close_sessions([pooled_session])
+
+        try:
+            client = create_func()
+        except Exception:
+            with cls._condition:
+                cls._leased_count[key] -= 1
+                cls._condition.notify()
+            raise
+        with cls._condition:
+            cls._leased[id(client)] = _PooledSession(key, client, close_func, health_check_func, max_age)
+        logger.debug(f"Created pooled {key[0]} session to {key[1]}")
+        return client
+
+    @classmethod
+    def release(cls, client):
+        """
+        Return a client to the pool, keeping its session for the next context.
+        :param client: Client returned by :meth:`acquire`.
+        """
+        expired_sessions = []
+        with cls._condition:
+            pooled_session = cls._leased.pop(id(client), None)
+            if pooled_session is None:
+                return
+            cls._leased_count[pooled_session.key] -= 1
+            pooled_session.last_used = time.monotonic()
+            cls._idle.setdefault(pooled_session.key, []).append(pooled_session)
+            expired_sessions.extend(cls._evict_expired_locked(cls._get_config().getint("IdleTimeoutSeconds")))
+            cls._condition.notify_all()
+        cls._close_sessions(expired_sessions)
+
+    @classmethod
+    def discard(cls, client):
+        """
+        Log out a client acquired from the pool and free its slot, e.g. after a failure left it unusable.
+        :param client: Client returned by :meth:`acquire`.
+        """
+        with cls._condition:
+            pooled_session = cls._leased.pop(id(client), None)
+            if pooled_session is None:
+                return
+            cls._leased_count[pooled_session.key] -= 1
+            cls._condition.notify_all()
+        cls._close_sessions([pooled_session])
+
+    @classmethod
+    def close_all(cls):
+        """
+        Log out all sessions held by the pool, including the ones still handed out.
+        """
+        with cls._condition:
+            pooled_sessions = [session for sessions in cls._idle.values() for session in sessions]
+            pooled_sessions.extend(cls._leased.values())
+            cls._idle = {}
+            cls._leased = {}
+            cls._leased_count = {}
+            cls._condition.notify_all()
+        cls._close_sessions(pooled_sessions)
+
+    @classmethod
+    def get_session_counts(cls) -> dict:
+        """
+        Get the number of sessions per client type and target, by state.
+        :return: Dict of (client type, hostname, 'leased' or 'idle') to number of sessions.
+        :rtype: dict
+        """
+        with cls._condition:
+            states = [(key, count, "leased") for key, count in cls._leased_count.items()]
+            states.extend((key, len(sessions), "idle") for key, sessions in cls._idle.items())
+        session_counts = {}
+        for key, count, state in states:
+            if count:
+                label_values = (key[0], key[1], state)
+                session_counts[label_values] = session_counts.get(label_values, 0) + count
+        return session_counts
+
+    @classmethod
+    def _evict_expired_locked(cls, idle_timeout):
+        """
+        Remove expired idle sessions, must be called with the condition held.
+        :return: Removed sessions, to be closed once the condition is released.
+        """
+        now = time.monotonic()
+        expired_sessions = []
+        for key in list(cls._idle):
+            sessions = cls._idle[key]
+            expired_sessions.extend(session for session in sessions if session.is_expired(now, idle_timeout))
+            sessions[:] = [session for session in sessions if not session.is_expired(now, idle_timeout)]
+            if not sessions:
+                del cls._idle[key]
+        return expired_sessions
+
+    @staticmethod
+    def _is_healthy(pooled_session):
+        if pooled_session.health_check_func is None:
+            return True
+        try:
+            return bool(pooled_session.health_check_func(pooled_session.client))
+        except Exception as e:
+            logger.warning(f"Health check of pooled session failed: {str(e)}")
+            return False
+
+    @staticmethod
+    def _close_sessions(pooled_sessions):
+        for pooled_session in pooled_sessions:
+            try:
+                pooled_session.close_func(pooled_session.client)
+            except Exception as e:
+                logger.warning(f"Failed to close pooled {pooled_session.key[0]} session: {str(e)}")
+
+    @classmethod
+    def _register_atexit(cls):
+        with cls._condition:
+            if not cls._atexit_registered:
+                atexit.register(cls.close_all)
+                cls._atexit_registered = True
+
+
+metrics.SESSION_POOL_SESSIONS.set_function(SessionPool.get_session_counts)
@@ -11,16 +11,18 @@ from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 logger = LoggerAdapter(logging.getLogger(__name__))
 
 
-def get_http_headers() -> dict:
+def get_http_headers(session: requests.Session = None) -> dict:
     """
     Retrieves http headers to be used in the controllers. This retrieves the credentials of aria LCM appliance using a local API.
+    :param session: HTTP session to make the call with, a new connection is opened if not provided.
+    :type session: requests.Session
     :return: Dictionary of http headers
     :rtype: dict
     :raise: Exception
     """
     try:
         logger.debug("Making call to get http headers.")
-        response = requests.get(GET_PASSWORD_LOCAL_URL, timeout=60)
+        response = (session or requests).get(GET_PASSWORD_LOCAL_URL, timeout=60)
         response.raise_for_status()
         get_response = response.json()
         username = get_response["username"]
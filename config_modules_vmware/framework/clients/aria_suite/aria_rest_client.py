@@ -0,0 +1,102 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import json
+import logging
+import threading
+import time
+from http import HTTPStatus
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config_modules_vmware.framework.clients.aria_suite import aria_auth
+from config_modules_vmware.framework.logging import timings
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.services.config import Config
+
+# Set up logger
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+
+class AriaRestClient(object):
+    """
+    Class that exposes the aria suite LCM REST APIs over a pooled keep-alive HTTP session.
+    The auth headers are retrieved from the appliance local API once and reused for a configured amount of time.
+    """
+
+    def __init__(self, hostname):
+        """
+        Initialize AriaRestClient.
+        :param hostname: aria suite LCM hostname
+        :type hostname: :class:'str'
+        """
+        self._hostname = hostname
+        self._base_url = f"https://{hostname}"
+        self.aria_rest_config = Config.get_section("aria.rest")
+        self.max_connections = self.aria_rest_config.getint("MaxConnections")
+        self._session = requests.Session()
+        self._session.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._http_headers = None
+        self._http_headers_time = 0
+        self._http_headers_lock = threading.Lock()
+
+    def get_base_url(self):
+        """
+        Get the base URL of the aria suite LCM REST APIs.
+        :return: base URL
+        :rtype: :class:'str'
+        """
+        return self._base_url
+
+    def get_http_headers(self, refresh=False) -> dict:
+        """
+        Get the http headers with the appliance credentials, retrieved again once they are older than the TTL.
+        :param refresh: Retrieve the headers again, e.g. after the credentials were rejected.
+        :type refresh: :class:'bool'
+        :return: Dictionary of http headers
+        :rtype: dict
+        """
+        ttl = self.aria_rest_config.getint("AuthHeadersTTLSeconds")
+        with self._http_headers_lock:
+            if refresh or not self._http_headers or time.monotonic() - self._http_headers_time > ttl:
+                self._http_headers = aria_auth.get_http_headers(session=self._session)
+                self._http_headers_time = time.monotonic()
+            return self._http_headers
+
+    def request(self, http_method: str, url: str, body=None):
+        """
+        Invoke an aria suite LCM REST API and return its json response body.
+        The auth headers are retrieved again once if the credentials are rejected.
+        :param http_method: the http operation (GET/POST/DELETE).
+        :type http_method: :class:'str'
+        :param url: API URL.
+        :type url: :class:'str'
+        :param body: request body, serialized to json.
+        :type body: :class:'dict'
+        :return: response body
+        :rtype: :class:'dict'
+        :raise: requests.exceptions.HTTPError
+        """
+        timeout = self.aria_rest_config.getint("APITimeoutSeconds")
+        data = json.dumps(body)
+        response = self._session.request(http_method, url, headers=self.get_http_headers(), data=data, timeout=timeout)
+        timings.record(timings.REST_CALLS)
+        if response.status_code == HTTPStatus.UNAUTHORIZED:
+            logger.info("Credentials rejected, retrieving http headers again.")
+            response = self._session.request(
+                http_method, url, headers=self.get_http_headers(refresh=True), data=data, timeout=timeout
+            )
+            timings.record(timings.REST_CALLS)
+        if timings.is_collecting():
+            timings.record(timings.REST_BYTES, len(response.content or b""))
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        """
+        Close the pooled connections.
+        :return: None
+        """
+        self._session.close()
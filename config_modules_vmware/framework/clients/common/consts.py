@@ -45,6 +45,7 @@ HOST_CHANGES = "host_changes"
 HOST_RESULTS = "host_results"
 NAME = "name"
 MESSAGE = "message"
+TIMINGS = "timings"
 OLD = "old"
 NEW = "new"
 CURRENT = "current"
@@ -2,15 +2,19 @@
 import inspect
 import json
 import logging
+import re
 from functools import partial
 from http import HTTPStatus
 from threading import Lock
+from urllib.parse import urlsplit
 
 import urllib3
 
-from config_modules_vmware.framework.clients.common import certificate_verification
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.common import ssl_context_cache
+from config_modules_vmware.framework.logging import timings
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import metrics
 from config_modules_vmware.services.config import Config
 
 BODY = "body"
@@ -18,6 +22,22 @@ HEADERS = "headers"
 
 logger = LoggerAdapter(logging.getLogger(__name__))
 
+# Path segments identifying a single object, e.g. numeric ids, UUIDs and managed object ids like 'domain-c8'
+_ID_PATH_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|[a-zA-Z]+-[a-zA-Z]*\d+)$")
+
+
+def get_metrics_endpoint(url):
+    """
+    Get the endpoint of a REST API url for metrics, i.e. the path with object ids replaced, so that the requests to
+    all objects of a type share the same endpoint.
+    :param url: HTTP URL.
+    :type url: 'str'
+    :return: Endpoint, e.g. '/api/vcenter/cluster/{id}'.
+    :rtype: 'str'
+    """
+    path = urlsplit(url).path
+    return "/".join("{id}" if _ID_PATH_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
 
 def get_smart_rest_client_class(urllib3_manager):
     class BaseRestClient(urllib3_manager):
@@ -85,7 +105,7 @@ def get_smart_rest_client_class(urllib3_manager):
             cert_validation_asked = "cert_reqs" in kwargs and kwargs["cert_reqs"] == consts.CERT_REQUIRED
 
             if cert_info:
-                context, successful_cert = certificate_verification.validate_all_certificates(
+                context, successful_cert = ssl_context_cache.get_validated_certificate_context(
                     hostname=kwargs.get("server_hostname"), certificate_list=cert_info
                 )
                 if context:
@@ -221,11 +241,15 @@ def get_smart_rest_client_class(urllib3_manager):
                 # Creates session headers if not exist
                 self._update_session_headers(get_session_headers_func, kwargs)
 
-                logger.info(f"Calling '{method}':'{url}'")
+                logger.info("Calling '%s':'%s'", method, url)
 
-                response = super(BaseRestClient, self).request(method=method, url=url, **kwargs)
-                logger.info(f"Response Code of '{method}' request on '{url}': {response.status}")
-                logger.debug(f"Response content of '{method}' request on '{url}': {response.data}")
+                with metrics.API_REQUEST_DURATION.time(method=method, endpoint=get_metrics_endpoint(url)):
+                    response = super(BaseRestClient, self).request(method=method, url=url, **kwargs)
+                logger.info("Response Code of '%s' request on '%s': %s", method, url, response.status)
+                logger.debug("Response content of '%s' request on '%s': %s", method, url, response.data)
+                timings.record(timings.REST_CALLS)
+                if timings.is_collecting():
+                    timings.record(timings.REST_BYTES, len(response.data or b""))
 
                 if response.status == 401 and i < 1 and get_session_headers_func:
                     logger.info("Session might have timed out. Re-establish.")
@@ -0,0 +1,103 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Process-wide cache of SSL contexts and certificate validation results shared by all clients.
+"""
+import logging
+import ssl
+import threading
+import time
+
+from config_modules_vmware.framework.clients.common import certificate_verification
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+# key -> (cached value, creation time)
+_cache = {}
+# key -> lock serializing the creation of the value, so a target is probed once even with concurrent clients
+_key_locks = {}
+_cache_lock = threading.Lock()
+
+
+def _get_ttl():
+    return Config.get_section("ssl.context.cache").getint("TTLSeconds")
+
+
+def _get_or_create(key, create_func):
+    """
+    Get the cached value for the key, or create and cache it if missing or older than the TTL.
+    Failures are not cached.
+    """
+    ttl = _get_ttl()
+    if ttl <= 0:
+        return create_func()
+    with _cache_lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        with _cache_lock:
+            cached = _cache.get(key)
+        if cached and time.monotonic() - cached[1] <= ttl:
+            return cached[0]
+        value = create_func()
+        with _cache_lock:
+            _cache[key] = (value, time.monotonic())
+        return value
+
+
+def get_ssl_context(protocol, verify_mode, capath=None) -> ssl.SSLContext:
+    """
+    Get an SSL context with the given protocol and verification mode, loading the CA path once per TTL.
+    The context does not depend on the target, so clients of all targets share it and must not modify it.
+
+    :param protocol: SSL protocol, e.g. ssl.PROTOCOL_TLSv1_2.
+    :type protocol: int
+    :param verify_mode: Verification mode, ssl.CERT_NONE or ssl.CERT_REQUIRED.
+    :type verify_mode: int
+    :param capath: CA certificates directory, loaded when verify_mode is ssl.CERT_REQUIRED.
+    :type capath: str
+    :return: SSL context.
+    :rtype: ssl.SSLContext
+    """
+
+    def create_ssl_context():
+        ssl_ctx = ssl.SSLContext(protocol=protocol)
+        ssl_ctx.verify_mode = verify_mode
+        if verify_mode == ssl.CERT_REQUIRED and capath:
+            ssl_ctx.load_verify_locations(capath=capath)
+        return ssl_ctx
+
+    return _get_or_create(("ssl_context", protocol, verify_mode, capath), create_ssl_context)
+
+
+def get_validated_certificate_context(hostname, certificate_list):
+    """
+    Get the result of :func:`certificate_verification.validate_all_certificates` for the target,
+    so the certificates of a target are probed at most once per TTL.
+
+    :param hostname: hostname to connect to.
+    :type hostname: str
+    :param certificate_list: List of CertInfo object with the certificate string and enforce hostname/date flags.
+    :type certificate_list: list[CertInfo]
+    :return: Tuple of SSLContext and successful CertInfo or None.
+    :rtype: tuple
+    """
+    cert_settings = tuple(
+        (cert.certificate_str, cert.enforce_hostname_verification, cert.enforce_date_validity_checking)
+        for cert in certificate_list
+    )
+    return _get_or_create(
+        ("certificate_verification", hostname, cert_settings),
+        lambda: certificate_verification.validate_all_certificates(
+            hostname=hostname, certificate_list=certificate_list
+        ),
+    )
+
+
+def clear():
+    """
+    Drop all cached SSL contexts and certificate validation results, e.g. after certificates were replaced.
+    """
+    with _cache_lock:
+        _cache.clear()
+        _key_locks.clear()
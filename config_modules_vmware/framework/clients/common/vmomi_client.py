@@ -7,6 +7,8 @@ from pyVmomi import SoapStubAdapter  # pylint: disable=E0401
 from pyVmomi import vim  # pylint: disable=E0401
 from pyVmomi import vmodl  # pylint: disable=E0401
 
+from config_modules_vmware.framework.logging import timings
+
 
 class VmomiClient(object):
     """
@@ -180,7 +182,7 @@ class VmomiClient(object):
             samlToken=self._saml_token,
             connectionPoolTimeout=5,
         )
-        return stub
+        return timings.instrument_soap_stub(stub)
 
     def connect(self):
         """
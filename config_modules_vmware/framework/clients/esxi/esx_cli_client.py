@@ -4,7 +4,9 @@ import os
 import shutil
 from typing import Tuple
 
+from config_modules_vmware.framework.logging import timings
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import metrics
 from config_modules_vmware.framework.utils import utils
 
 logger = LoggerAdapter(logging.getLogger(__name__))
@@ -66,4 +68,6 @@ class EsxCliClient(object):
         # Workaround for esxcli dependent on "HOME" environment variable
         if not env.get("HOME"):
             env["HOME"] = "/tmp"  # nosec
-        return utils.run_shell_cmd(command=esx_cli_cmd, env=env, raise_on_non_zero=raise_on_non_zero)
+        timings.record(timings.ESXCLI_CALLS)
+        with metrics.ESXCLI_COMMANDS_IN_FLIGHT.track_in_progress():
+            return utils.run_shell_cmd(command=esx_cli_cmd, env=env, raise_on_non_zero=raise_on_non_zero)
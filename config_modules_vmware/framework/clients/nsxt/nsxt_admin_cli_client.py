@@ -0,0 +1,111 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import logging
+import uuid
+from typing import List
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import utils
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+ADMIN_CLI_CMD = "su admin"
+ADMIN_CLI_SINGLE_CMD_FORMAT = "su -c '{command}' admin"
+ADMIN_CLI_EXIT_CMD = "exit"
+# The admin CLI reports failed commands on stdout with this prefix and keeps reading the next command.
+ADMIN_CLI_ERROR_PREFIX = "%"
+# Comment lines are echoed after the prompt by an interactive session, used to mark the output of a command.
+ADMIN_CLI_COMMENT_PREFIX = "#"
+
+
+class NsxtAdminCliClient(object):
+    """
+    Client for invoking NSX admin CLI commands as the admin user.
+    A batch of commands is sent to a single admin CLI session over stdin, so applying several changes spawns one
+    process instead of one per command.
+    """
+
+    def __init__(self):
+        """
+        Initialize NsxtAdminCliClient.
+        """
+        self._timeout = Config.get_section("nsxt.admin_cli").getint("TimeoutSeconds")
+
+    def run_command(self, command: str) -> str:
+        """
+        Run a single admin CLI command.
+        :param command: The admin CLI command to run, e.g. 'get ntp-servers'.
+        :type command: str
+        :return: The output of the command.
+        :rtype: str
+        :raise: Exception if the admin CLI reports an error.
+        """
+        self._validate_command(command)
+        output = utils.run_shell_cmd(ADMIN_CLI_SINGLE_CMD_FORMAT.format(command=command), timeout=self._timeout)[0]
+        self._raise_on_cli_error(output)
+        return output
+
+    def run_commands(self, commands: List[str]) -> str:
+        """
+        Run the admin CLI commands in order in a single admin CLI session.
+        Meant for commands which don't print anything on success, e.g. 'set'/'del'. The output of an interactive
+        session may include banners, prompts and command echo, use run_commands_and_read to read values.
+        :param commands: The admin CLI commands to run.
+        :type commands: List[str]
+        :return: The output of the session.
+        :rtype: str
+        :raise: Exception if the admin CLI reports an error for any of the commands.
+        """
+        if not commands:
+            return ""
+        return self._run_session(commands)
+
+    def run_commands_and_read(self, commands: List[str], read_command: str) -> str:
+        """
+        Run the admin CLI commands in order, then the read command, in a single admin CLI session.
+        The read command is surrounded by unique marker comments, only its output between the markers is returned.
+        :param commands: The admin CLI commands to run, e.g. 'set'/'del'.
+        :type commands: List[str]
+        :param read_command: The admin CLI command reading the result, e.g. 'get ntp-servers'.
+        :type read_command: str
+        :return: The output of the read command.
+        :rtype: str
+        :raise: Exception if the admin CLI reports an error for any of the commands or the markers are not found.
+        """
+        marker = f"config-modules-{uuid.uuid4().hex}"
+        begin_marker = f"{ADMIN_CLI_COMMENT_PREFIX} {marker} begin"
+        end_marker = f"{ADMIN_CLI_COMMENT_PREFIX} {marker} end"
+        output = self._run_session(list(commands) + [begin_marker, read_command, end_marker], marker=marker)
+        lines = output.splitlines()
+        begin_indexes = [i for i, line in enumerate(lines) if begin_marker in line]
+        end_indexes = [i for i, line in enumerate(lines) if end_marker in line]
+        if not begin_indexes or not end_indexes or end_indexes[0] < begin_indexes[-1]:
+            raise Exception(f"Output of admin CLI command '{read_command}' not found in the session output")
+        read_lines = lines[begin_indexes[-1] + 1 : end_indexes[0]]
+        # skip the echo of the read command after the prompt
+        if read_lines and read_lines[0].rstrip().endswith(read_command):
+            read_lines = read_lines[1:]
+        return "\n".join(read_lines) + "\n" if read_lines else ""
+
+    def _run_session(self, commands: List[str], marker: str = None) -> str:
+        for command in commands:
+            self._validate_command(command)
+        logger.debug(f"Running {len(commands)} admin CLI commands in a single session")
+        script = "\n".join(list(commands) + [ADMIN_CLI_EXIT_CMD]) + "\n"
+        output = utils.run_shell_cmd(ADMIN_CLI_CMD, timeout=self._timeout, input_to_stdin=script)[0]
+        # a CLI not supporting comments reports the markers as unknown commands
+        self._raise_on_cli_error(
+            "\n".join(line for line in output.splitlines() if marker is None or marker not in line)
+        )
+        return output
+
+    @staticmethod
+    def _validate_command(command: str):
+        if not command or "\n" in command or "'" in command:
+            raise ValueError(f"Invalid admin CLI command: {command!r}")
+
+    @staticmethod
+    def _raise_on_cli_error(output: str):
+        cli_errors = [line.strip() for line in output.splitlines() if line.strip().startswith(ADMIN_CLI_ERROR_PREFIX)]
+        if cli_errors:
+            raise Exception(f"Admin CLI command failed: {'; '.join(cli_errors)}")
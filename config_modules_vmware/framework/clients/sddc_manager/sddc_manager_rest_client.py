@@ -222,6 +222,15 @@ class SDDCManagerRestClient(object):
     def get_base_url(self):
         return self._base_url
 
+    def is_session_active(self):
+        """
+        Make a lightweight REST call with the current token, used as keep-alive by the session pool.
+        :return: True if the call succeeded.
+        :rtype: bool
+        """
+        self.get_helper(self._base_url + sddc_manager_consts.SDDC_MANAGER_URL)
+        return True
+
     def monitor_task(self, task_id, timeout_sec=None, poll_interval=None):
         """
         Monitor a given taskId for a given time
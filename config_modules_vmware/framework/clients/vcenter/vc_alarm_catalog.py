@@ -0,0 +1,93 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+In-memory catalog of vCenter alarm definitions.
+"""
+import logging
+
+from pyVmomi import vim  # pylint: disable=E0401
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+
+# Set up logger
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+
+class AlarmCatalog(object):
+    """
+    Catalog of alarm definitions with their 'info' already retrieved, indexed by event type id and target type.
+    All lookups are served from memory, so alarm info is not fetched again from vCenter after the catalog is built.
+    """
+
+    def __init__(self, alarm_infos):
+        """
+        Build the catalog from the output of :meth:`VcVmomiClient.retrieve_alarm_infos`.
+
+        :param alarm_infos: List of tuples of (alarm reference, alarm info).
+        :type alarm_infos: :class: 'list'
+        """
+        self._alarms = list(alarm_infos)
+        self._event_alarms = {}
+        self._target_alarms = {}
+        self._alarms_by_name = {}
+        for alarm_def, alarm_info in self._alarms:
+            self._alarms_by_name.setdefault(alarm_info.name, (alarm_def, alarm_info))
+            # alarm expression might not have 'expression' attribute if there is no expression
+            expressions = getattr(alarm_info.expression, "expression", None) or []
+            object_types = []
+            for expression in expressions:
+                if isinstance(expression, vim.alarm.EventAlarmExpression):
+                    self._event_alarms.setdefault(expression.eventTypeId, []).append(
+                        (alarm_def, alarm_info, expression)
+                    )
+                object_type = getattr(expression, "objectType", None)
+                if object_type is not None and object_type not in object_types:
+                    object_types.append(object_type)
+            for object_type in object_types:
+                self._target_alarms.setdefault(object_type, []).append((alarm_def, alarm_info))
+        logger.debug(f"Built alarm catalog with {len(self._alarms)} alarm definitions")
+
+    def __len__(self):
+        return len(self._alarms)
+
+    def get_all_alarms(self):
+        """
+        Get all alarm definitions.
+
+        :return: List of tuples of (alarm reference, alarm info).
+        :rtype: :class: 'list'
+        """
+        return list(self._alarms)
+
+    def get_event_alarms(self, event_type_id):
+        """
+        Get the event expressions with the given event type id, along with their alarm definitions.
+        An alarm with several matching expressions is returned once per expression.
+
+        :param event_type_id: Event type id, e.g. 'com.vmware.sso.PrincipalManagement'.
+        :type event_type_id: :class: 'str'
+        :return: List of tuples of (alarm reference, alarm info, event alarm expression).
+        :rtype: :class: 'list'
+        """
+        return list(self._event_alarms.get(event_type_id, []))
+
+    def get_alarms_by_target_type(self, object_type):
+        """
+        Get the alarm definitions with at least one expression on the given target type.
+
+        :param object_type: Managed entity type, e.g. vim.HostSystem.
+        :type object_type: :class: 'type'
+        :return: List of tuples of (alarm reference, alarm info).
+        :rtype: :class: 'list'
+        """
+        return list(self._target_alarms.get(object_type, []))
+
+    def get_alarm_by_name(self, name):
+        """
+        Get the alarm definition with the given name.
+
+        :param name: Alarm name.
+        :type name: :class: 'str'
+        :return: Tuple of (alarm reference, alarm info) or None if not found.
+        :rtype: :class: 'tuple'
+        """
+        return self._alarms_by_name.get(name)
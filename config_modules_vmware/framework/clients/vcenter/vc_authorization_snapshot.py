@@ -0,0 +1,115 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+In-memory snapshot of vCenter roles and permissions.
+"""
+import logging
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+
+# Set up logger
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+
+class AuthorizationSnapshot(object):
+    """
+    Snapshot of the authorization manager roles and of all permissions, indexed by role id, role name and principal.
+    All lookups are served from memory, so roles and permissions are not fetched again from vCenter after the
+    snapshot is built.
+    """
+
+    def __init__(self, roles, permissions):
+        """
+        Build the snapshot from the output of :meth:`VcVmomiClient.retrieve_authorization`.
+
+        :param roles: List of roles (vim.AuthorizationManager.Role) in the order of 'roleList'.
+        :type roles: :class: 'list'
+        :param permissions: List of permissions (vim.AuthorizationManager.Permission) on all entities.
+        :type permissions: :class: 'list'
+        """
+        self._roles = list(roles)
+        self._permissions = list(permissions)
+        self._roles_by_id = {}
+        self._roles_by_name = {}
+        for role in self._roles:
+            self._roles_by_id.setdefault(role.roleId, role)
+            self._roles_by_name.setdefault(role.name, role)
+        self._permissions_by_role_id = {}
+        self._permissions_by_principal = {}
+        for permission in self._permissions:
+            self._permissions_by_role_id.setdefault(permission.roleId, []).append(permission)
+            self._permissions_by_principal.setdefault(permission.principal.lower(), []).append(permission)
+        logger.debug(
+            f"Built authorization snapshot with {len(self._roles)} roles and {len(self._permissions)} permissions"
+        )
+
+    def get_roles(self):
+        """
+        Get all roles.
+
+        :return: List of roles in the order of the authorization manager 'roleList'.
+        :rtype: :class: 'list'
+        """
+        return list(self._roles)
+
+    def get_role_by_id(self, role_id):
+        """
+        Get the role with the given id.
+
+        :param role_id: Role id.
+        :type role_id: :class: 'int'
+        :return: Role or None if not found.
+        :rtype: vim.AuthorizationManager.Role
+        """
+        return self._roles_by_id.get(role_id)
+
+    def get_role_by_name(self, name):
+        """
+        Get the role with the given name.
+
+        :param name: Role name.
+        :type name: :class: 'str'
+        :return: Role or None if not found.
+        :rtype: vim.AuthorizationManager.Role
+        """
+        return self._roles_by_name.get(name)
+
+    def get_role_id_name_map(self):
+        """
+        Get the role names by role id.
+
+        :return: Dict of role id to role name.
+        :rtype: :class: 'dict'
+        """
+        return {role_id: role.name for role_id, role in self._roles_by_id.items()}
+
+    def get_role_name_id_map(self):
+        """
+        Get the role ids by role name.
+
+        :return: Dict of role name to role id.
+        :rtype: :class: 'dict'
+        """
+        return {name: role.roleId for name, role in self._roles_by_name.items()}
+
+    def get_permissions_by_role_id(self, role_id):
+        """
+        Get the permissions granting the role with the given id, on all entities.
+
+        :param role_id: Role id.
+        :type role_id: :class: 'int'
+        :return: List of permissions.
+        :rtype: :class: 'list'
+        """
+        return list(self._permissions_by_role_id.get(role_id, []))
+
+    def get_permissions_by_principal(self, principal):
+        """
+        Get the permissions of the user or group with the given name, on all entities.
+        Principal names are matched case-insensitively.
+
+        :param principal: User or group name including domain, e.g. 'VSPHERE.LOCAL\\Administrators'.
+        :type principal: :class: 'str'
+        :return: List of permissions.
+        :rtype: :class: 'list'
+        """
+        return list(self._permissions_by_principal.get(principal.lower(), []))
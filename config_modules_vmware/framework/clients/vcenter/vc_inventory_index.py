@@ -0,0 +1,201 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+In-memory index of the vCenter inventory tree.
+"""
+import logging
+
+from pyVmomi import vim  # pylint: disable=E0401
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+
+# Set up logger
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+PATH_SEPARATOR = "/"
+
+
+class InventoryIndex(object):
+    """
+    Index of the vCenter inventory tree built from a single property collector pass.
+
+    Entity paths are full inventory paths below the root folder, e.g.
+    '/SDDC-Datacenter/vm/Management VMs/vcenter-1' or '/SDDC-Datacenter/host/cluster-1'.
+    All lookups are served from memory, so no property is fetched from vCenter after the index is built.
+    """
+
+    def __init__(self, name_parent_index):
+        """
+        Build the index from the output of :meth:`VcVmomiClient.retrieve_name_parent_index`.
+
+        :param name_parent_index: Dict of moid to tuple of (entity reference, name, parent reference).
+        :type name_parent_index: :class: 'dict'
+        """
+        self._entities = {}
+        self._names = {}
+        self._parents = {}
+        for moid, (entity, name, parent) in name_parent_index.items():
+            self._entities[moid] = entity
+            self._names[moid] = name
+            self._parents[moid] = parent._moId if parent is not None else None
+        self._path_segments = {}
+        for moid in self._entities:
+            self._resolve_path_segments(moid)
+        self._moid_by_path = {}
+        for moid, segments in self._path_segments.items():
+            if segments is not None:
+                self._moid_by_path[self._join(segments)] = moid
+        logger.debug(f"Built inventory index with {len(self._entities)} entities")
+
+    @staticmethod
+    def _join(segments):
+        return "".join(PATH_SEPARATOR + segment for segment in segments)
+
+    def _resolve_path_segments(self, moid):
+        """
+        Resolve path segments of the entity and all its unresolved ancestors, each entity is resolved only once.
+        Entities whose parent chain leaves the index are resolved to None.
+        """
+        chain = []
+        while moid not in self._path_segments:
+            if moid not in self._entities:
+                self._path_segments[moid] = None
+                break
+            parent_moid = self._parents[moid]
+            if parent_moid is None:
+                # root folder, it is not part of the path
+                self._path_segments[moid] = ()
+                break
+            chain.append(moid)
+            moid = parent_moid
+        segments = self._path_segments[moid]
+        for child_moid in reversed(chain):
+            segments = None if segments is None else segments + (self._names[child_moid],)
+            self._path_segments[child_moid] = segments
+        return segments
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, moid):
+        return moid in self._entities
+
+    def get_ref(self, moid):
+        """
+        Get the managed object reference for a moid.
+
+        :param moid: Managed object id.
+        :type moid: :class: 'str'
+        :return: Managed object reference or None if not in inventory.
+        :rtype: :class: 'vim.ManagedEntity'
+        """
+        return self._entities.get(moid)
+
+    def get_name(self, moid):
+        """
+        Get the name of the entity.
+
+        :param moid: Managed object id.
+        :type moid: :class: 'str'
+        :return: Entity name or None if not in inventory.
+        :rtype: :class: 'str'
+        """
+        return self._names.get(moid)
+
+    def get_parent_moid(self, moid):
+        """
+        Get the moid of the parent entity.
+
+        :param moid: Managed object id.
+        :type moid: :class: 'str'
+        :return: Parent moid or None for the root folder and entities not in inventory.
+        :rtype: :class: 'str'
+        """
+        return self._parents.get(moid)
+
+    def get_path(self, moid):
+        """
+        Get the full inventory path of the entity.
+
+        :param moid: Managed object id.
+        :type moid: :class: 'str'
+        :return: Inventory path or None if the entity is not in inventory.
+        :rtype: :class: 'str'
+        """
+        segments = self._path_segments.get(moid)
+        return self._join(segments) if segments is not None else None
+
+    def get_moid(self, path):
+        """
+        Get the moid of the entity at the given full inventory path.
+
+        :param path: Inventory path, e.g. '/SDDC-Datacenter/host/cluster-1'.
+        :type path: :class: 'str'
+        :return: Moid or None if no entity is found at the path.
+        :rtype: :class: 'str'
+        """
+        return self._moid_by_path.get(path)
+
+    def get_moids_by_type(self, vimtype):
+        """
+        Get moids of all entities of the given type.
+
+        :param vimtype: Managed entity type.
+        :type vimtype: :class: 'type'
+        :return: List of moids.
+        :rtype: :class: 'list'
+        """
+        return [moid for moid, entity in self._entities.items() if isinstance(entity, vimtype)]
+
+    def get_ancestor(self, moid, vimtype):
+        """
+        Get the closest ancestor of the given type, e.g. the datacenter or cluster of an entity.
+
+        :param moid: Managed object id.
+        :type moid: :class: 'str'
+        :param vimtype: Managed entity type of the ancestor.
+        :type vimtype: :class: 'type'
+        :return: Moid of the ancestor or None if not found.
+        :rtype: :class: 'str'
+        """
+        parent_moid = self._parents.get(moid)
+        while parent_moid is not None:
+            if isinstance(self._entities.get(parent_moid), vimtype):
+                return parent_moid
+            parent_moid = self._parents.get(parent_moid)
+        return None
+
+    def get_vm_path_in_datacenter(self, vm_moid):
+        """
+        Get the path of a virtual machine in its datacenter, same format as
+        :meth:`VcVmomiClient.get_vm_path_in_datacenter`, e.g. 'SDDC-Datacenter/vm/Management VMs'.
+
+        :param vm_moid: Virtual machine moid.
+        :type vm_moid: :class: 'str'
+        :return: Path or None if the VM is not in a folder tree under a datacenter (e.g. VMs inside a vApp).
+        :rtype: :class: 'str'
+        """
+        folder_names = []
+        parent_moid = self._parents.get(vm_moid)
+        while parent_moid is not None:
+            parent = self._entities.get(parent_moid)
+            if isinstance(parent, vim.Datacenter):
+                return PATH_SEPARATOR.join([self._names[parent_moid]] + folder_names[::-1])
+            if not isinstance(parent, vim.Folder):
+                return None
+            folder_names.append(self._names[parent_moid])
+            parent_moid = self._parents.get(parent_moid)
+        return None
+
+    def get_cluster_path_moid_mapping(self):
+        """
+        Get the cluster path to moid mapping, same format as :meth:`VcVmomiClient.retrieve_cluster_path_moid_mapping`.
+
+        :return: Dict of cluster path (without 'host' folders) to cluster moid.
+        :rtype: :class: 'dict'
+        """
+        result = {}
+        for moid in self.get_moids_by_type(vim.ClusterComputeResource):
+            segments = self._path_segments.get(moid)
+            if segments is not None:
+                result[self._join(segment for segment in segments if segment != "host")] = moid
+        return result
@@ -1,17 +1,24 @@
 # Copyright 2025 Broadcom. All Rights Reserved.
 import logging
 import re
+import threading
 from typing import Tuple
 
 import urllib3
 
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.common.rest_client import SmartRestClient
 from config_modules_vmware.framework.clients.vcenter.vc_rest_client import VcRestClient
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 
 # Set up logger
 logger = LoggerAdapter(logging.getLogger(__name__))
 
+# Statuses of a mob3 method call rejected for its session, the method was not invoked.
+SESSION_FAILURE_STATUSES = (401, 403)
+# Error page of a mob3 method call rejected for an invalid or expired session nonce.
+INVALID_NONCE_PATTERN = re.compile(rb"vmware-session-nonce|session nonce", re.IGNORECASE)
+
 
 class VcInvsvcMob3Client(VcRestClient):
     """
@@ -39,12 +46,29 @@ class VcInvsvcMob3Client(VcRestClient):
         super().__init__(hostname, username, password, ssl_thumbprint, verify_ssl, cert_info, session_based=False)
         self._base_url = f"https://{hostname}/invsvc/mob3"
         self._basic_auth_header = urllib3.make_headers(basic_auth=f"{username}:{password}")
+        # session nonce and cookie, valid for all mob3 apis until the session is logged out or expires
+        self._session_nonce = None
+        self._session_nonce_lock = threading.Lock()
 
-    def get_session_nonce(self, url: str) -> Tuple[str, str]:
+    def get_session_nonce(self, url: str, refresh: bool = False) -> Tuple[str, str]:
         """Get session nonce for mob3 apis.
+        The nonce is bound to the session, not to the api, so it is retrieved once and reused for the session lifetime.
+
+        :param url: mob3 api url, used to retrieve the nonce if not cached.
+        :type url: str
+        :param refresh: Retrieve a new nonce, e.g. after the session expired.
+        :type refresh: bool
+        :return: Tuple of session nonce string and session cookie string.
+        :rtype: Tuple
+        """
+        with self._session_nonce_lock:
+            if refresh or not self._session_nonce:
+                self._session_nonce = self._retrieve_session_nonce(url)
+            return self._session_nonce
+
+    def _retrieve_session_nonce(self, url: str) -> Tuple[str, str]:
+        """Retrieve a new session nonce and session cookie from the mob3 api page.
 
-        :param vc_invsvc_mob3_client: vcenter inventory mob3 api client.
-        :type vc_invsvc_mob3_client: VcInvsvcMob3Client
         :param url: mob3 api url.
         :type url: str
         :return: Tuple of session nonce string and session cookie string.
@@ -67,6 +91,56 @@ class VcInvsvcMob3Client(VcRestClient):
         logger.error(f"Failed to retrieve session nonce: {response.status}")
         raise Exception(f"Failed to retrieve session nonce: {response.status}")
 
+    def invoke_method(self, url: str, params: str = None, headers: dict = None):
+        """Invoke a mob3 api method with the session nonce.
+        The cached nonce is retrieved again once if the call is rejected for its session or nonce, as the session
+        might have expired. Any other failure is raised without retry, as the methods are not idempotent, e.g. a
+        timed out call might have been applied.
+
+        :param url: mob3 api method url.
+        :type url: str
+        :param params: url encoded method parameters, without the session nonce.
+        :type params: str
+        :param headers: additional request headers.
+        :type headers: dict
+        :return: HTTP response.
+        :rtype: HTTPResponse
+        """
+        refresh = False
+        while True:
+            has_cached_nonce = self._session_nonce is not None
+            nonce, cookie_str = self.get_session_nonce(url, refresh=refresh)
+            body = f"vmware-session-nonce={nonce}"
+            if params:
+                body = f"{body}&{params}"
+            request_headers = {consts.CONTENT_TYPE: consts.HEADER_TYPE_WWW_FORM, **(headers or {})}
+            if cookie_str:
+                request_headers["Cookie"] = cookie_str
+            response = self.post_helper(
+                url, body=body, headers=request_headers, raw_response=True, raise_for_status=False
+            )
+            if response is None:
+                return response
+            if has_cached_nonce and not refresh and self._is_session_failure(response):
+                logger.info(f"Mob3 api call rejected with cached session nonce, retrieve a new one: {response.status}")
+                refresh = True
+                continue
+            SmartRestClient.raise_for_status(response, url)
+            return response
+
+    @staticmethod
+    def _is_session_failure(response) -> bool:
+        """Check if a mob3 method call was rejected for its session or session nonce.
+
+        :param response: HTTP response of the method call.
+        :type response: HTTPResponse
+        :return: True if rejected for its session or nonce.
+        :rtype: bool
+        """
+        if response.status in SESSION_FAILURE_STATUSES:
+            return True
+        return response.status >= 400 and bool(INVALID_NONCE_PATTERN.search(response.data or b""))
+
     def _extract_cookie_str(self, response):
         cookie = response.headers.get("set-cookie")
         if cookie:
@@ -80,6 +154,8 @@ class VcInvsvcMob3Client(VcRestClient):
         Disconnect the Mob 3 client instance.
         :return: None
         """
+        with self._session_nonce_lock:
+            self._session_nonce = None
         logout_url = f"{self._base_url}/logout"
         response = self.get_helper(logout_url, headers=self._basic_auth_header, raw_response=True)
         if response.status != 200:
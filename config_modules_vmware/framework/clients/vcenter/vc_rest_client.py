@@ -137,7 +137,7 @@ class VcRestClient(object):
         url = vc_consts.SESSION_ID_URL % hostname
         response = client.request(method="DELETE", url=url, headers=session_headers)
         logger.info(f"Response Code of 'DELETE' request on '{url}': {response.status}")
-        logger.debug(f"Response content of 'DELETE' request on '{url}': {response.data}")
+        logger.debug("Response content of 'DELETE' request on '%s': %s", url, response.data)
         if response.status == HTTPStatus.OK:
             logger.info(f"Delete vmware api session id succeeded. {str(session_headers)}")
         else:
@@ -157,6 +157,17 @@ class VcRestClient(object):
             return
         self._rest_client_session.delete_session()
 
+    def is_session_active(self):
+        """
+        Make a lightweight REST call on the current session, used as keep-alive by the session pool.
+        :return: True if the call succeeded.
+        :rtype: bool
+        """
+        if not self._rest_client_session:
+            return False
+        self.get_helper(self._base_url + vc_consts.VC_SYSTEM_VERSION_URL)
+        return True
+
     def vcsa_request(self, url, method, **kwargs):
         """
         Invokes VCSA API request
@@ -11,10 +11,15 @@ from threading import Lock
 
 from pyVim.connect import Disconnect  # pylint: disable=E0401
 from pyVmomi import vim  # pylint: disable=E0401
+from pyVmomi import vmodl  # pylint: disable=E0401
 from pyVmomi.VmomiSupport import publicVersions  # pylint: disable=E0401
 
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.common import ssl_context_cache
 from config_modules_vmware.framework.clients.common.vmomi_client import VmomiClient
+from config_modules_vmware.framework.clients.vcenter.vc_alarm_catalog import AlarmCatalog
+from config_modules_vmware.framework.clients.vcenter.vc_authorization_snapshot import AuthorizationSnapshot
+from config_modules_vmware.framework.clients.vcenter.vc_inventory_index import InventoryIndex
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.services.config import Config
 
@@ -80,21 +85,21 @@ class VcVmomiClient(object):
         :return: None
         """
         logger.info("Connecting to the vCenter Server")
-        ssl_ctx = ssl.SSLContext(protocol=ssl.PROTOCOL_TLSv1_2)
         if not self.verify_ssl:
             logger.info("Skipping SSL certificate verification")
-            ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
             self.ssl_thumbprint = None
         elif self.ssl_thumbprint:
             logger.info("Verifying using thumbprint")
-            ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
         elif self.saml_token:
             logger.info("Verifying using SAML token")
-            ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
         else:
             logger.info("Verifying server certificates")
-            ssl_ctx.verify_mode = ssl.CERT_REQUIRED
-            ssl_ctx.load_verify_locations(capath=consts.SSL_VERIFY_CA_PATH)
+            ssl_ctx = ssl_context_cache.get_ssl_context(
+                ssl.PROTOCOL_TLSv1_2, ssl.CERT_REQUIRED, capath=consts.SSL_VERIFY_CA_PATH
+            )
             self.ssl_thumbprint = None
 
         supportedVersion = version
@@ -226,6 +231,14 @@ class VcVmomiClient(object):
         """
         self.vmomi_client.disconnect()
 
+    def is_session_active(self):
+        """
+        Check whether the VC session is still authenticated, used as keep-alive by the session pool.
+        :return: True if the session is active.
+        :rtype: bool
+        """
+        return self.content.sessionManager.currentSession is not None
+
     def get_objects_from_container_by_vimtype(self, container, vimtype):
         """
         Searches the container for objects of type vimtype and returns a
@@ -392,6 +405,141 @@ class VcVmomiClient(object):
             vm_path = parent.name + vm_path
         return vm_path
 
+    def retrieve_properties(self, filter_spec):
+        """
+        Retrieves the properties selected by the filter spec with RetrievePropertiesEx,
+        following the continuation token until all pages are read.
+
+        :param filter_spec: Property collector filter spec.
+        :type filter_spec: :class: 'vmodl.query.PropertyCollector.FilterSpec'
+        :return: List of object contents.
+        :rtype: :class: 'list'
+        """
+        property_collector = self.content.propertyCollector
+        log_libcall("vmodl.query.PropertyCollector.RetrievePropertiesEx", [spec.type for spec in filter_spec.propSet])
+        retrieve_result = property_collector.RetrievePropertiesEx(
+            specSet=[filter_spec], options=vmodl.query.PropertyCollector.RetrieveOptions()
+        )
+        object_contents = []
+        while retrieve_result:
+            object_contents.extend(retrieve_result.objects)
+            if not retrieve_result.token:
+                break
+            log_libcall("vmodl.query.PropertyCollector.ContinueRetrievePropertiesEx")
+            retrieve_result = property_collector.ContinueRetrievePropertiesEx(token=retrieve_result.token)
+        return object_contents
+
+    def retrieve_name_parent_index(self, vimtypes):
+        """
+        Retrieves 'name' and 'parent' of all managed entities of the given types in one property collector pass.
+        The root folder is always included, so parent chains can be followed up to the top of the inventory.
+        The parent is returned as a managed object reference, so reading its '_moId' does not trigger another call.
+
+        :param vimtypes: List of managed entity types to retrieve.
+        :type vimtypes: :class: 'list'
+        :return: Dict of moid to tuple of (entity reference, name, parent reference).
+        :rtype: :class: 'dict'
+        """
+        property_collector = vmodl.query.PropertyCollector
+        log_libcall("vim.View.ViewManager.CreateContainerView", self.content.rootFolder, vimtypes, "True")
+        container_view = self.content.viewManager.CreateContainerView(
+            container=self.content.rootFolder, type=vimtypes, recursive=True
+        )
+        try:
+            traversal_spec = property_collector.TraversalSpec(
+                name="traverseView", path="view", skip=False, type=vim.view.ContainerView
+            )
+            object_specs = [
+                property_collector.ObjectSpec(obj=container_view, skip=True, selectSet=[traversal_spec]),
+                property_collector.ObjectSpec(obj=self.content.rootFolder, skip=False),
+            ]
+            property_types = list(vimtypes)
+            if not any(issubclass(vim.Folder, vimtype) for vimtype in property_types):
+                property_types.append(vim.Folder)
+            property_specs = [
+                property_collector.PropertySpec(type=vimtype, pathSet=["name", "parent"]) for vimtype in property_types
+            ]
+            filter_spec = property_collector.FilterSpec(objectSet=object_specs, propSet=property_specs)
+            index = {}
+            for object_content in self.retrieve_properties(filter_spec):
+                properties = {prop.name: prop.val for prop in object_content.propSet}
+                index[object_content.obj._moId] = (
+                    object_content.obj,
+                    properties.get("name"),
+                    properties.get("parent"),
+                )
+            return index
+        finally:
+            log_libcall("vim.View.ContainerView.DestroyView")
+            container_view.DestroyView()
+
+    def build_inventory_index(self, vimtypes=None):
+        """
+        Build an index of the inventory tree from a single property collector pass.
+
+        :param vimtypes: Managed entity types to include, all managed entities by default.
+        :type vimtypes: :class: 'list'
+        :return: Inventory index with path/moid lookups.
+        :rtype: :class: 'InventoryIndex'
+        """
+        return InventoryIndex(self.retrieve_name_parent_index(vimtypes or [vim.ManagedEntity]))
+
+    def retrieve_alarm_infos(self):
+        """
+        Retrieves the 'info' of all alarm definitions on the vCenter with one RetrievePropertiesEx call,
+        instead of fetching 'info' from each alarm separately.
+
+        :return: List of tuples of (alarm reference, alarm info) in the order returned by the alarm manager.
+        :rtype: :class: 'list'
+        """
+        property_collector = vmodl.query.PropertyCollector
+        log_libcall("vim.alarm.AlarmManager.GetAlarm", self.content.rootFolder)
+        alarm_refs = self.content.alarmManager.GetAlarm(self.content.rootFolder)
+        if not alarm_refs:
+            return []
+        filter_spec = property_collector.FilterSpec(
+            objectSet=[property_collector.ObjectSpec(obj=alarm_ref, skip=False) for alarm_ref in alarm_refs],
+            propSet=[property_collector.PropertySpec(type=vim.alarm.Alarm, pathSet=["info"])],
+        )
+        alarm_infos = {}
+        for object_content in self.retrieve_properties(filter_spec):
+            for prop in object_content.propSet:
+                if prop.name == "info":
+                    alarm_infos[object_content.obj._moId] = prop.val
+        return [(alarm_ref, alarm_infos[alarm_ref._moId]) for alarm_ref in alarm_refs if alarm_ref._moId in alarm_infos]
+
+    def build_alarm_catalog(self):
+        """
+        Build a catalog of all alarm definitions, indexed by event type id and target type.
+
+        :return: Alarm catalog.
+        :rtype: :class: 'AlarmCatalog'
+        """
+        return AlarmCatalog(self.retrieve_alarm_infos())
+
+    def retrieve_authorization(self):
+        """
+        Retrieves all roles and all permissions on the vCenter, with one RetrieveAllPermissions call
+        instead of retrieving the permissions of each role separately.
+
+        :return: Tuple of list of roles and list of permissions.
+        :rtype: :class: 'tuple'
+        """
+        authorization_manager = self.content.authorizationManager
+        roles = authorization_manager.roleList
+        log_libcall("vim.AuthorizationManager.RetrieveAllPermissions")
+        permissions = authorization_manager.RetrieveAllPermissions()
+        return roles or [], permissions or []
+
+    def build_authorization_snapshot(self):
+        """
+        Build a snapshot of all roles and permissions, indexed by role id, role name and principal.
+
+        :return: Authorization snapshot.
+        :rtype: :class: 'AuthorizationSnapshot'
+        """
+        return AuthorizationSnapshot(*self.retrieve_authorization())
+
     def get_objects_by_vimtype_and_name(self, vimtype, name):
         """
         Searches the VC for objects of type vimtype and name.
@@ -532,9 +680,12 @@ class VcVmomiClient(object):
             and comp_ref.host[0] == host_obj
         )
 
-    def retrieve_cluster_path_moid_mapping(self):
+    def retrieve_cluster_path_moid_mapping(self, inventory_index=None):
         """
         Retrieves the cluster path to moid mapping.
+        @param inventory_index: Inventory index to resolve the paths from, e.g. VcenterContext.inventory_index().
+            The parents of each cluster are walked if not given.
+        @type inventory_index: InventoryIndex
         @return: map of cluster moid to path
         @rtype: dict
         Sample response format:
@@ -542,6 +693,8 @@ class VcVmomiClient(object):
                "cluster-path-1": "cluster-moid",
             }
         """
+        if inventory_index is not None:
+            return inventory_index.get_cluster_path_moid_mapping()
         clusters = self.get_all_clusters()
         result_dict = {}
         if clusters:
@@ -5,7 +5,9 @@ Implementation of the Vc drivers to perform sso operations.
 """
 import logging
 import ssl
+import threading
 
+from config_modules_vmware.framework.clients.common import ssl_context_cache
 from config_modules_vmware.framework.clients.common.consts import SSL_VERIFY_CA_PATH
 from config_modules_vmware.framework.clients.common.consts import SSO_PATH
 from config_modules_vmware.framework.clients.common.consts import SSO_SERVICE_INSTANCE
@@ -14,6 +16,7 @@ from config_modules_vmware.framework.clients.common.consts import STS_PATH
 from config_modules_vmware.framework.clients.vcenter.dependencies.pyVim import sso as sts
 from config_modules_vmware.framework.clients.vcenter.dependencies.pyVmomi import SoapStubAdapter
 from config_modules_vmware.framework.clients.vcenter.dependencies.pyVmomi import sso
+from config_modules_vmware.framework.logging import timings
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.services.config import Config
 
@@ -61,6 +64,9 @@ class VcVmomiSSOClient(object):
         # need to use local domain even for external user like AD user.
         self.domain = VSPHERE_LOCAL_DOMAIN
         self.vc_vmomi_sso_config = Config.get_section("vcenter.vmomi.sso")
+        # principal directory lookups shared by all controllers using this client, see _get_cached_principals
+        self._principal_cache = {}
+        self._principal_cache_lock = threading.Lock()
         self.connect()
 
     def connect(self):
@@ -70,18 +76,16 @@ class VcVmomiSSOClient(object):
         """
         sts_url = STS_PATH.format(self.vc_name, self.domain)
         auth = sts.SsoAuthenticator(sts_url)
-        ssl_ctx = ssl.SSLContext(protocol=SSO_TLS_VERSION)
         if not self.verify_ssl:
             logger.info("Skipping SSL certificate verification")
-            ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = ssl_context_cache.get_ssl_context(SSO_TLS_VERSION, ssl.CERT_NONE)
             self.ssl_thumbprint = None
         elif self.ssl_thumbprint:
             logger.info("Verifying using thumbprint")
-            ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = ssl_context_cache.get_ssl_context(SSO_TLS_VERSION, ssl.CERT_NONE)
         else:
             logger.info("Verifying server certificates")
-            ssl_ctx.verify_mode = ssl.CERT_REQUIRED
-            ssl_ctx.load_verify_locations(capath=SSL_VERIFY_CA_PATH)
+            ssl_ctx = ssl_context_cache.get_ssl_context(SSO_TLS_VERSION, ssl.CERT_REQUIRED, capath=SSL_VERIFY_CA_PATH)
         sso_path = SSO_PATH.format(self.domain)
 
         logger.info(
@@ -98,14 +102,16 @@ class VcVmomiSSOClient(object):
             token_duration=self.vc_vmomi_sso_config.getint("SAMLTokenDurationSeconds"),
             ssl_context=ssl_ctx,
         )
-        self._stub = SoapStubAdapter(
-            host=self.vc_name,
-            port=self.port,
-            path=sso_path,
-            thumbprint=self.ssl_thumbprint,
-            sslContext=ssl_ctx,
-            samlToken=token,
-            version=self.version,
+        self._stub = timings.instrument_soap_stub(
+            SoapStubAdapter(
+                host=self.vc_name,
+                port=self.port,
+                path=sso_path,
+                thumbprint=self.ssl_thumbprint,
+                sslContext=ssl_ctx,
+                samlToken=token,
+                version=self.version,
+            )
         )
         sso_admin = sso.admin.ServiceInstance(SSO_SERVICE_INSTANCE, self._stub)
         self.content = sso_admin.RetrieveServiceContent()
@@ -120,6 +126,14 @@ class VcVmomiSSOClient(object):
         logger.info("Disconnected from SSO")
         self._stub = None
 
+    def is_session_active(self):
+        """
+        Check whether the SSO connection is still usable, used as keep-alive by the session pool.
+        :return: True if the connection is active.
+        :rtype: bool
+        """
+        return self._stub is not None and self.get_system_domain() is not None
+
     def set_password_lifetime_days(self, days=None):
         """
         Set the global password policy.
@@ -174,10 +188,46 @@ class VcVmomiSSOClient(object):
         :param domain: Domain name
         :return: Group info attribute.
         """
-        pid = sso.PrincipalId(name=groupname, domain=domain)
-        logger.info(f"vim.sso.admin.principalDiscoveryService.FindGroup. pID: '{pid}'")
-        group_info = self.content.principalDiscoveryService.FindGroup(pid)
-        return group_info
+
+        def find_group():
+            pid = sso.PrincipalId(name=groupname, domain=domain)
+            logger.info(f"vim.sso.admin.principalDiscoveryService.FindGroup. pID: '{pid}'")
+            return self.content.principalDiscoveryService.FindGroup(pid)
+
+        return self._get_cached_principals(("group", groupname.lower(), domain.lower()), find_group)
+
+    def _get_cached_principals(self, key, find_func):
+        """
+        Get the result of a principal directory lookup from the cache, looking it up if missing.
+        Failures are not cached. Lookups are cached for the lifetime of the client, until group membership is
+        changed through this client.
+
+        :param key: Cache key, tuple of lookup type, lower case group name and domain.
+        :param find_func: Function doing the lookup.
+        :return: Lookup result.
+        """
+        with self._principal_cache_lock:
+            if key in self._principal_cache:
+                return self._principal_cache[key]
+        result = find_func()
+        with self._principal_cache_lock:
+            return self._principal_cache.setdefault(key, result)
+
+    def clear_principal_cache(self):
+        """
+        Drop all cached principal directory lookups, e.g. before the client is reused by another context.
+        """
+        with self._principal_cache_lock:
+            self._principal_cache = {}
+
+    def _invalidate_group_membership(self):
+        """
+        Drop the cached group members after group membership was changed.
+        """
+        with self._principal_cache_lock:
+            self._principal_cache = {
+                key: value for key, value in self._principal_cache.items() if key[0] not in ("users", "groups")
+            }
 
     def remove_from_group(self, groupname, name, domain) -> None:
         """
@@ -195,6 +245,7 @@ class VcVmomiSSOClient(object):
         pid = sso.PrincipalId(name=name, domain=domain)
         logger.debug(f"Name - {name}, domain - {domain}, principal id - {pid}")
         self.content.principalManagementService.RemoveFromLocalGroup(pid, groupname)
+        self._invalidate_group_membership()
         return
 
     def add_user_to_group(self, groupname, name, domain) -> None:
@@ -213,6 +264,7 @@ class VcVmomiSSOClient(object):
         pid = sso.PrincipalId(name=name, domain=domain)
         logger.debug(f"Name - {name}, domain - {domain}, principal id - {pid}")
         self.content.principalManagementService.AddUserToLocalGroup(pid, groupname)
+        self._invalidate_group_membership()
         return
 
     def add_group_to_group(self, groupname, name, domain) -> None:
@@ -231,6 +283,7 @@ class VcVmomiSSOClient(object):
         pid = sso.PrincipalId(name=name, domain=domain)
         logger.debug(f"Name - {name}, domain - {domain}, principal id - {pid}")
         self.content.principalManagementService.AddGroupToLocalGroup(pid, groupname)
+        self._invalidate_group_membership()
         return
 
     def get_a_group_id(self, name, domain):
@@ -443,26 +496,37 @@ class VcVmomiSSOClient(object):
         system_domain = self.content.domainManagementService.GetSystemDomainName()
         return system_domain
 
+    @staticmethod
+    def _get_principal_key(principal_id):
+        # principal names and domains are case insensitive
+        return principal_id.name.lower(), principal_id.domain.lower()
+
     def find_users_in_group(self, group_id):
-        """Finds users of a group using PrincipalDiscoveryService.
+        """Finds users of a group using PrincipalDiscoveryService, cached per group.
 
         :param group_id: Group principalId.
         :return: List of Users.
         """
-        logger.info("vim.sso.admin.PrincipalDiscoveryService.findUsersInGroup")
-        users = self.content.principalDiscoveryService.FindUsersInGroup(
-            groupId=group_id, searchString="", limit=USER_QUERY_LIMIT
-        )
-        return users
+
+        def find_users():
+            logger.info("vim.sso.admin.PrincipalDiscoveryService.findUsersInGroup")
+            return self.content.principalDiscoveryService.FindUsersInGroup(
+                groupId=group_id, searchString="", limit=USER_QUERY_LIMIT
+            )
+
+        return self._get_cached_principals(("users",) + self._get_principal_key(group_id), find_users)
 
     def find_groups_in_group(self, group_id):
-        """Finds groups in a group using PrincipalDiscoveryService.
+        """Finds groups in a group using PrincipalDiscoveryService, cached per group.
 
         :param group_id: Group principalId.
         :return: List of Users.
         """
-        logger.info("vim.sso.admin.PrincipalDiscoveryService.FindGroupsInGroup")
-        groups = self.content.principalDiscoveryService.FindGroupsInGroup(
-            groupId=group_id, searchString="", limit=USER_QUERY_LIMIT
-        )
-        return groups
+
+        def find_groups():
+            logger.info("vim.sso.admin.PrincipalDiscoveryService.FindGroupsInGroup")
+            return self.content.principalDiscoveryService.FindGroupsInGroup(
+                groupId=group_id, searchString="", limit=USER_QUERY_LIMIT
+            )
+
+        return self._get_cached_principals(("groups",) + self._get_principal_key(group_id), find_groups)
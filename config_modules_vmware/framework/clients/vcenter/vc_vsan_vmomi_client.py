@@ -1,9 +1,13 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+import json
 import logging
+import os
 import ssl
+import stat
+import tempfile
+import threading
 from enum import Enum
-from urllib.request import urlopen
-from xml.dom import minidom  # nosec
+from xml.etree import ElementTree  # nosec
 
 from pyVmomi import SoapStubAdapter
 from pyVmomi import vim
@@ -11,14 +15,106 @@ from pyVmomi import VmomiSupport
 from pyVmomi.VmomiSupport import publicVersions  # pylint: disable=E0401
 
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.common import ssl_context_cache
+from config_modules_vmware.framework.clients.common.rest_client import get_smart_rest_client
+from config_modules_vmware.framework.clients.common.rest_client import SmartRestClient
 from config_modules_vmware.framework.clients.vcenter import vc_consts
 from config_modules_vmware.framework.clients.vcenter.dependencies.vsan_management import vsanmgmtObjects
 from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VcVmomiClient
 from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VmomiClient
+from config_modules_vmware.framework.logging import timings
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import task
+from config_modules_vmware.services.config import Config
 
 logger = LoggerAdapter(logging.getLogger(__name__))
 
+VSAN_NAMESPACE = "urn:vsan"
+VSAN_VMODL_DISCOVERY_TIMEOUT_SECONDS = 30
+
+# Whether vCenter serves the vSAN namespace, shared by all clients of this process and persisted to
+# 'VmodlVersionCacheFile' for other processes, "<hostname>:<build>" -> bool
+_vsan_namespace_cache = {}
+_vsan_namespace_cache_lock = threading.Lock()
+
+
+def query_clusters_concurrently(func, cluster_refs):
+    """
+    Call the function for each cluster, with at most 'MaxConcurrentClusterQueries' calls running at the same time.
+    :param func: Function called with a cluster reference.
+    :param cluster_refs: Cluster references.
+    :return: Results in the order of the clusters.
+    """
+    max_workers = Config.get_section("vcenter.vsan").getint("MaxConcurrentClusterQueries", fallback=1)
+    return task.map_concurrently(func, cluster_refs, max_workers=max_workers)
+
+
+def _get_vsan_namespace_cache_file():
+    cache_file = Config.get_section("vcenter.vsan").get("VmodlVersionCacheFile", fallback=None)
+    return os.path.expanduser(cache_file) if cache_file else None
+
+
+def _is_trusted(path, is_dir):
+    """
+    Check that a cache file or directory can only have been written by the current user, i.e. it is owned by the
+    current user, is not a symlink and is not writable by group or others.
+    :param path: The path.
+    :param is_dir: True if the path must be a directory, otherwise a regular file.
+    :return: True if trusted.
+    """
+    try:
+        path_stat = os.lstat(path)
+    except OSError:
+        return False
+    if not (stat.S_ISDIR(path_stat.st_mode) if is_dir else stat.S_ISREG(path_stat.st_mode)):
+        return False
+    if hasattr(os, "getuid") and path_stat.st_uid != os.getuid():
+        return False
+    return not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _load_persisted_vsan_namespace_cache():
+    """
+    Load the vSAN namespace cache persisted by other processes of the current user.
+    :return: Dict of "<hostname>:<build>" to bool, empty if persistence is disabled or the file is unreadable or
+        could have been written by another user.
+    """
+    cache_file = _get_vsan_namespace_cache_file()
+    if not cache_file or not os.path.isfile(cache_file):
+        return {}
+    if not _is_trusted(os.path.dirname(cache_file) or ".", is_dir=True) or not _is_trusted(cache_file, is_dir=False):
+        logger.warning(f"Ignoring vSAN VMODL version cache {cache_file} writable by other users")
+        return {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            persisted = json.load(f)
+        return persisted if isinstance(persisted, dict) else {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load vSAN VMODL version cache {cache_file}: {str(e)}")
+        return {}
+
+
+def _persist_vsan_namespace_cache(cache):
+    """
+    Atomically replace the persisted vSAN namespace cache, so concurrent readers never see a partial file.
+    The cache directory is created private to the current user, nothing is persisted in a directory writable by
+    other users.
+    """
+    cache_file = _get_vsan_namespace_cache_file()
+    if not cache_file:
+        return
+    try:
+        cache_dir = os.path.dirname(cache_file) or "."
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        if not _is_trusted(cache_dir, is_dir=True):
+            logger.warning(f"Not persisting vSAN VMODL version cache to {cache_dir} writable by other users")
+            return
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, delete=False, encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(f.name, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to persist vSAN VMODL version cache {cache_file}: {str(e)}")
+
 
 class VsanManagementObjectsEnum(Enum):
     """
@@ -80,6 +176,14 @@ class VcVsanVmomiClient:
         self.ssl_ctx = None
         self.vmomi_client = None
         self.vc_rest_client = None
+        self._vmodl_http_client = None
+        # vSAN stub and managed objects are created once and shared by all queries of this client
+        self._vsan_stub = None
+        self._vsan_mos = {}
+        # per cluster query results shared by all vSAN controllers using this client, cluster moid -> result
+        self._vsan_cluster_configs = {}
+        self._vsan_cluster_health_configs = {}
+        self._vsan_lock = threading.Lock()
         self.set_ssl_context()
         self.connect(version)
 
@@ -87,18 +191,18 @@ class VcVsanVmomiClient:
         """
         Set SSL context based on SSL thumbprint or SAML token.
         """
-        self.ssl_ctx = ssl.SSLContext(protocol=ssl.PROTOCOL_TLSv1_2)
         if not self.verify_ssl:
             logger.info("Skipping SSL certificate verification")
-            self.ssl_ctx.verify_mode = ssl.CERT_NONE
+            self.ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
             self.ssl_thumbprint = None
         elif self.ssl_thumbprint or self.saml_token:
             logger.info("Verifying without server certificates")
-            self.ssl_ctx.verify_mode = ssl.CERT_NONE
+            self.ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
         else:
             logger.info("Verifying server certificates")
-            self.ssl_ctx.verify_mode = ssl.CERT_REQUIRED
-            self.ssl_ctx.load_verify_locations(capath=consts.SSL_VERIFY_CA_PATH)
+            self.ssl_ctx = ssl_context_cache.get_ssl_context(
+                ssl.PROTOCOL_TLSv1_2, ssl.CERT_REQUIRED, capath=consts.SSL_VERIFY_CA_PATH
+            )
 
     def connect(self, version):
         """
@@ -136,23 +240,37 @@ class VcVsanVmomiClient:
         """
         self.vmomi_client.disconnect()
 
+    def is_session_active(self):
+        """
+        Check whether the VC session is still authenticated, used as keep-alive by the session pool.
+        :return: True if the session is active.
+        :rtype: bool
+        """
+        return self.content.sessionManager.currentSession is not None
+
     def get_vsan_vc_stub(self):
         """
-        Constructs a stub for vSAN API access using vCenter sessions from existing stubs.
+        Gets the stub for vSAN API access using vCenter sessions from existing stubs.
+        The stub is created once per client and follows the session cookie of the vCenter stub.
 
         :return: vSAN API stub.
         """
-        # Connect to vSAN service endpoint
-        logger.info("Connecting to the vSAN service endpoint")
-        vsan_stub = SoapStubAdapter(
-            host=self.vc_name,
-            path=vc_consts.VSAN_API_VC_SERVICE_ENDPOINT,
-            version=self.get_latest_vsan_vmodl_version(),
-            sslContext=self.ssl_ctx,
-        )
-        # Set cookie
-        vsan_stub.cookie = self.stub.soapStub.cookie
-        return vsan_stub
+        with self._vsan_lock:
+            if self._vsan_stub is None:
+                # Connect to vSAN service endpoint
+                logger.info("Connecting to the vSAN service endpoint")
+                self._vsan_stub = timings.instrument_soap_stub(
+                    SoapStubAdapter(
+                        host=self.vc_name,
+                        path=vc_consts.VSAN_API_VC_SERVICE_ENDPOINT,
+                        version=self.get_latest_vsan_vmodl_version(),
+                        sslContext=self.ssl_ctx,
+                    )
+                )
+            # Set cookie, the vCenter session may have been re-established since the stub was created
+            if self._vsan_stub.cookie != self.stub.soapStub.cookie:
+                self._vsan_stub.cookie = self.stub.soapStub.cookie
+            return self._vsan_stub
 
     def get_all_vsan_enabled_clusters(self):
         """
@@ -200,13 +318,16 @@ class VcVsanVmomiClient:
 
     def get_vsan_vc_mos_by_type(self, vsan_object_enum):
         """
-        Gets VSAN VC managed object by type.
+        Gets VSAN VC managed object by type, created once per client.
 
         :param vsan_object_enum: Enum value representing the VSAN object type.
         :return: VSAN VC managed object.
         """
         # get vsan VC stub
         vsan_stub = self.get_vsan_vc_stub()
+        vsan_mo = self._vsan_mos.get(vsan_object_enum)
+        if vsan_mo is not None:
+            return vsan_mo
         # Enum object mapping for vSAN system
         vsan_object_mapping = {
             VsanManagementObjectsEnum.VSAN_DISK_MANAGEMENT_SYSTEM: vim.cluster.VsanVcDiskManagementSystem,
@@ -222,41 +343,133 @@ class VcVsanVmomiClient:
         # get vSAN object class from mapping
         vsan_object_class = vsan_object_mapping.get(vsan_object_enum)
         if vsan_object_class:
-            return vsan_object_class(vsan_object_enum.value, vsan_stub)
+            return self._vsan_mos.setdefault(vsan_object_enum, vsan_object_class(vsan_object_enum.value, vsan_stub))
         else:
             raise ValueError(f"Unsupported VSAN object: {vsan_object_enum}")
 
     def get_latest_vsan_vmodl_version(self):
         """
         Gets the VMODL version by checking the existence of vSAN namespace.
+        The namespace check is cached per vCenter hostname and build, in memory and in 'VmodlVersionCacheFile',
+        so vsanServiceVersions.xml is downloaded once per vCenter build instead of on every vSAN stub.
         :return: VMODL version.
         """
         try:
             logger.info("Getting vSAN VMODL version")
-            vsan_vmodl_url = vc_consts.VSAN_VMODL_URL.format(self.vc_name)
-            # Adding ssl context
-            if hasattr(ssl, "_create_unverified_context") and hasattr(ssl, "_create_default_https_context"):
-                ssl._create_default_https_context = ssl._create_unverified_context
-            xml_doc = minidom.parse(urlopen(vsan_vmodl_url, timeout=30))  # nosec
-            for element in xml_doc.getElementsByTagName("name"):
-                if element.firstChild.nodeValue == "urn:vsan":
-                    return VmomiSupport.newestVersions.Get("vsan")
+            if self._has_vsan_namespace():
+                return VmomiSupport.newestVersions.Get("vsan")
             return VmomiSupport.newestVersions.Get("vim")
         except Exception as e:
             logger.error(str(e))
             return VmomiSupport.newestVersions.Get("vim")
 
+    def _has_vsan_namespace(self):
+        """
+        Check whether vCenter serves the vSAN namespace, from the cache if this vCenter build was already checked.
+        Failed checks are not cached.
+        :return: True if the vSAN namespace is served.
+        """
+        cache_key = f"{self.vc_name}:{self.content.about.build}"
+        with _vsan_namespace_cache_lock:
+            if cache_key not in _vsan_namespace_cache:
+                _vsan_namespace_cache.update(_load_persisted_vsan_namespace_cache())
+            if cache_key in _vsan_namespace_cache:
+                return _vsan_namespace_cache[cache_key]
+
+        has_vsan_namespace = self._discover_vsan_namespace()
+        with _vsan_namespace_cache_lock:
+            _vsan_namespace_cache.update(_load_persisted_vsan_namespace_cache())
+            _vsan_namespace_cache[cache_key] = has_vsan_namespace
+            _persist_vsan_namespace_cache(_vsan_namespace_cache)
+        return has_vsan_namespace
+
+    def _get_vmodl_http_client(self):
+        """
+        Get the pooled HTTP client used for vSAN VMODL discovery, verifying the server like the SOAP connection.
+        """
+        if self._vmodl_http_client is None:
+            if not self.verify_ssl or (not self.ssl_thumbprint and self.saml_token):
+                self._vmodl_http_client = get_smart_rest_client(cert_reqs=consts.CERT_NONE)
+            elif self.ssl_thumbprint:
+                self._vmodl_http_client = get_smart_rest_client(assert_fingerprint=self.ssl_thumbprint)
+            else:
+                self._vmodl_http_client = get_smart_rest_client(cert_reqs=consts.CERT_REQUIRED)
+        return self._vmodl_http_client
+
+    def _discover_vsan_namespace(self):
+        """
+        Stream vsanServiceVersions.xml and stop at the first vSAN namespace, without loading the whole document.
+        :return: True if the vSAN namespace is served.
+        """
+        vsan_vmodl_url = vc_consts.VSAN_VMODL_URL.format(self.vc_name)
+        response = self._get_vmodl_http_client().urlopen(
+            "GET", vsan_vmodl_url, preload_content=False, timeout=VSAN_VMODL_DISCOVERY_TIMEOUT_SECONDS
+        )
+        try:
+            SmartRestClient.raise_for_status(response, vsan_vmodl_url)
+            for _, element in ElementTree.iterparse(response, events=("end",)):  # nosec
+                if element.tag == "name" and element.text == VSAN_NAMESPACE:
+                    return True
+            return False
+        finally:
+            # the rest of the document is not read, so the connection is closed instead of returned to the pool
+            response.close()
+
+    def _get_cached_cluster_result(self, cache, cluster_ref, query_func):
+        """
+        Get the result of the query for the cluster from the cache, querying vCenter if missing.
+        Failures are not cached.
+        """
+        with self._vsan_lock:
+            if cluster_ref._moId in cache:
+                return cache[cluster_ref._moId]
+        result = query_func(cluster_ref)
+        with self._vsan_lock:
+            return cache.setdefault(cluster_ref._moId, result)
+
+    def invalidate_vsan_cluster_cache(self, cluster_ref=None):
+        """
+        Drop the cached vSAN cluster config and health config, e.g. after the cluster was reconfigured.
+        :param cluster_ref: Cluster to drop the results for, all clusters if None.
+        """
+        with self._vsan_lock:
+            if cluster_ref is None:
+                self._vsan_cluster_configs.clear()
+                self._vsan_cluster_health_configs.clear()
+            else:
+                self._vsan_cluster_configs.pop(cluster_ref._moId, None)
+                self._vsan_cluster_health_configs.pop(cluster_ref._moId, None)
+
+    def get_vsan_cluster_config_for_cluster(self, cluster_ref):
+        """
+        Gets vSAN cluster configuration for the cluster, queried once per client until invalidated.
+        The returned object is shared, callers must not modify it.
+        :return: vSAN cluster configuration.
+        """
+
+        def query_cluster_config(cluster):
+            logger.info(f"Retrieving vSAN cluster config for {cluster.name}")
+            return self.get_vsan_cluster_config_system().VsanClusterGetConfig(cluster)
+
+        return self._get_cached_cluster_result(self._vsan_cluster_configs, cluster_ref, query_cluster_config)
+
     def get_vsan_cluster_health_config_for_cluster(self, cluster_ref):
         """
-        Gets vSAN cluster health configuration for the first cluster.
+        Gets vSAN cluster health configuration for the cluster, queried once per client until invalidated.
+        Callers modifying the returned object must invalidate the cluster with :meth:`invalidate_vsan_cluster_cache`.
         :return: vSAN cluster health configuration.
         """
-        logger.info(f"Retrieving vSAN cluster health config for {cluster_ref.name}")
-        # Get vSAN cluster health system
-        vsan_health_system = self.get_vsan_vc_mos_by_type(VsanManagementObjectsEnum.VSAN_CLUSTER_HEALTH_SYSTEM)
-        # Query vSAN Cluster health config for cluster
-        vsan_health_config = vsan_health_system.QueryVsanClusterHealthConfig(cluster_ref)
-        return vsan_health_config
+
+        def query_cluster_health_config(cluster):
+            logger.info(f"Retrieving vSAN cluster health config for {cluster.name}")
+            # Get vSAN cluster health system
+            vsan_health_system = self.get_vsan_vc_mos_by_type(VsanManagementObjectsEnum.VSAN_CLUSTER_HEALTH_SYSTEM)
+            # Query vSAN Cluster health config for cluster
+            return vsan_health_system.QueryVsanClusterHealthConfig(cluster)
+
+        return self._get_cached_cluster_result(
+            self._vsan_cluster_health_configs, cluster_ref, query_cluster_health_config
+        )
 
     def get_vsan_proxy_config_for_cluster(self, cluster_ref):
         """
@@ -343,8 +556,7 @@ class VcVsanVmomiClient:
         :return: vSAN cluster iscsi targets configuration.
         """
         # Get vSAN cluster iscsi targets service config from vsan cluster config
-        vsan_cluster_config_system = self.get_vsan_vc_mos_by_type(VsanManagementObjectsEnum.VSAN_CLUSTER_CONFIG_SYSTEM)
-        return vsan_cluster_config_system.VsanClusterGetConfig(cluster_ref).iscsiConfig
+        return self.get_vsan_cluster_config_for_cluster(cluster_ref).iscsiConfig
 
     def get_vsan_iscsi_targets_auth_type_for_cluster(self, cluster_ref):
         """
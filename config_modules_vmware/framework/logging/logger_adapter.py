@@ -5,23 +5,58 @@ import re
 from config_modules_vmware.framework.logging.logging_context import LoggingContext
 from config_modules_vmware.services.config import Config
 
+# Placeholder of the message in the formatted templates, split on to insert the message.
+_MSG_PLACEHOLDER = "\x00"
+# Max number of formatted templates cached, the cache is cleared when full.
+_MAX_TEMPLATES = 4096
+
 
 class LoggerAdapter(logging.LoggerAdapter):
     """
     LoggerAdapter that formats log messages with values from LoggingContext.
+    Nothing is formatted for disabled levels. The format is applied once per (metadata, hostname) and cached, each
+    log call only inserts its message in the cached template.
     """
 
+    # Templates shared by all adapters, per (format, metadata id, hostname).
+    _templates = {}
+
     def __init__(self, logger, extra=None):
         super().__init__(logger, extra)
         self.format = Config.get_section("logging.adapter")["Format"]
         self.regex = re.compile("\\w+= ")
 
+    def log(self, level, msg, *args, **kwargs):
+        """
+        Log the message at the level, the message and its arguments are only processed if the level is enabled.
+        """
+        if self.isEnabledFor(level):
+            msg, kwargs = self._process(msg, kwargs, bool(args))
+            self.logger.log(level, msg, *args, **kwargs)
+
     def process(self, msg, kwargs):
-        if not self.format:
-            return super().process(msg, kwargs)
+        return self._process(msg, kwargs, False)
 
+    def _process(self, msg, kwargs, has_args):
+        if not self.format:
+            return msg, kwargs
         metadata = LoggingContext.get_controller_metadata_context()
         hostname = LoggingContext.get_hostname_context()
+        key = (self.format, id(metadata), hostname)
+        template = LoggerAdapter._templates.get(key)
+        # The metadata is kept in the cached template, so its id is not reused while cached.
+        if template is None or template[0] is not metadata:
+            template = self._format_template(metadata, hostname)
+            if len(LoggerAdapter._templates) >= _MAX_TEMPLATES:
+                LoggerAdapter._templates.clear()
+            LoggerAdapter._templates[key] = template
+        # Context values are escaped when the message is %-formatted with the arguments afterwards.
+        parts = template[2] if has_args else template[1]
+        if len(parts) == 1:
+            return parts[0], kwargs
+        return str(msg).join(parts), kwargs
+
+    def _format_template(self, metadata, hostname):
         attributes = {
             "controller_name": metadata.name if metadata else "",
             "configuration_id": metadata.configuration_id if metadata else "",
@@ -37,12 +72,13 @@ class LoggerAdapter(logging.LoggerAdapter):
             "scope": metadata.scope if metadata else "",
             "type": metadata.type.value if metadata and metadata.type else "",
             "hostname": hostname if hostname else "",
-            "msg": msg,
+            "msg": _MSG_PLACEHOLDER,
         }
-        formatted_msg = self.format.format_map(attributes)
+        formatted = self.format.format_map(attributes)
         # Remove empty key values i.e. "controller= "
-        formatted_msg = self.regex.sub("", formatted_msg)
-        return formatted_msg, kwargs
+        formatted = self.regex.sub("", formatted)
+        parts = formatted.split(_MSG_PLACEHOLDER)
+        return metadata, parts, [part.replace("%", "%%") for part in parts]
 
     def _get_products(self, metadata):
         if metadata:
@@ -1,7 +1,10 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+import time
 from contextvars import ContextVar
 from contextvars import Token
 
+from config_modules_vmware.framework.utils import metrics
+
 
 class LoggingContext:
     """
@@ -10,6 +13,8 @@ class LoggingContext:
 
     _controller_metadata_context = ContextVar("controller_metadata")
     _hostname_context = ContextVar("hostname")
+    _timings_context = ContextVar("timings")
+    _profiler_context = ContextVar("profiler")
 
     @classmethod
     def get_controller_metadata_context(cls):
@@ -69,22 +74,100 @@ class LoggingContext:
         """
         cls._hostname_context.reset(token)
 
+    @classmethod
+    def get_timings_context(cls):
+        """
+        Get timings context.
+        :return: The timings being collected if available else None
+        :rtype: Timings or None
+        """
+        return cls._timings_context.get(None)
+
+    @classmethod
+    def set_timings_context(cls, timings) -> Token:
+        """
+        Set timings context.
+        :param timings: The timings to collect into
+        :type timings: Timings
+        :return: The token of the set ContextVar
+        :rtype: Token
+        """
+        return cls._timings_context.set(timings)
+
+    @classmethod
+    def reset_timings_context(cls, token: Token):
+        """
+        Reset the timings context.
+        :param token: The ContextVar token
+        :type token: Token
+        """
+        cls._timings_context.reset(token)
+
+    @classmethod
+    def get_profiler_context(cls):
+        """
+        Get profiler context.
+        :return: The profiler of the current operation if available else None
+        :rtype: Profiler or None
+        """
+        return cls._profiler_context.get(None)
+
+    @classmethod
+    def set_profiler_context(cls, profiler) -> Token:
+        """
+        Set profiler context.
+        :param profiler: The profiler of the operation
+        :type profiler: Profiler
+        :return: The token of the set ContextVar
+        :rtype: Token
+        """
+        return cls._profiler_context.set(profiler)
+
+    @classmethod
+    def reset_profiler_context(cls, token: Token):
+        """
+        Reset the profiler context.
+        :param token: The ContextVar token
+        :type token: Token
+        """
+        cls._profiler_context.reset(token)
+
 
 class ControllerMetadataLoggingContext:
     """
     Context Manager to hold controller metadata context for logging.
+    The wall time spent in the context is observed in the controller duration metric and added to the timings being
+    collected, if any. The control is profiled when the operation is profiled per controller.
     """
 
     _metadata = None
     _token = None
+    _timings = None
+    _start_time = None
+    _profile_scope = None
 
     def __init__(self, metadata):
         self._metadata = metadata
 
     def __enter__(self):
         self._token = LoggingContext.set_controller_metadata_context(self._metadata)
+        self._timings = LoggingContext.get_timings_context()
+        profiler = LoggingContext.get_profiler_context()
+        if profiler is not None:
+            self._profile_scope = profiler.controller_scope(LoggingContext.get_hostname_context(), self._metadata)
+            if self._profile_scope is not None:
+                self._profile_scope.__enter__()
+        self._start_time = time.perf_counter()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed_time = time.perf_counter() - self._start_time
+        if self._profile_scope is not None:
+            self._profile_scope.__exit__(exc_type, exc_val, exc_tb)
+            self._profile_scope = None
+        metrics.CONTROLLER_DURATION.observe(elapsed_time, controller=self._metadata.path_in_schema)
+        if self._timings is not None:
+            self._timings.add_wall_time(LoggingContext.get_hostname_context(), self._metadata, elapsed_time)
+            self._timings = None
         LoggingContext.reset_controller_metadata_context(self._token)
         self._token = None
 
@@ -106,3 +189,49 @@ class HostnameLoggingContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         LoggingContext.reset_hostname_context(self._token)
         self._token = None
+
+
+class TimingsLoggingContext:
+    """
+    Context Manager to hold the timings collected for the controls run in the context.
+    No timings are collected when None is given.
+    """
+
+    _timings = None
+    _token = None
+
+    def __init__(self, timings):
+        self._timings = timings
+
+    def __enter__(self):
+        if self._timings is not None:
+            self._token = LoggingContext.set_timings_context(self._timings)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            LoggingContext.reset_timings_context(self._token)
+            self._token = None
+
+
+class ProfilerLoggingContext:
+    """
+    Context Manager to hold the profiler of the operation run in the context, started on enter and stopped on exit.
+    Nothing is profiled when None is given.
+    """
+
+    _profiler = None
+    _token = None
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def __enter__(self):
+        if self._profiler is not None:
+            self._token = LoggingContext.set_profiler_context(self._profiler)
+            self._profiler.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            self._profiler.stop()
+            LoggingContext.reset_profiler_context(self._token)
+            self._token = None
@@ -0,0 +1,244 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Opt-in profiling of ControllerInterface operations, per operation or per (hostname, control) of the current
+LoggingContext. Profiles are written to the configured directory when the operation completes.
+"""
+import cProfile
+import logging
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+CPROFILE = "cprofile"
+SAMPLING = "sampling"
+MODES = (CPROFILE, SAMPLING)
+# Key of the profile of a whole operation.
+OPERATION_KEY = "operation"
+
+# Key of the profile the current thread contributes to, inherited by the worker threads of a control.
+_profile_key_context = ContextVar("profile_key")
+
+
+def is_enabled() -> bool:
+    """
+    Check if profiling of all operations is enabled in config.
+    :return: True if operations are profiled.
+    :rtype: bool
+    """
+    return Config.get_section("profiling").getboolean("Enabled", fallback=False)
+
+
+def create_profiler(name: str, mode: str = None):
+    """
+    Create the profiler of an operation, if profiling is requested for the call or enabled in config.
+    :param name: Name of the operation, used as prefix of the profile files.
+    :type name: str
+    :param mode: Profiling mode requested for the call, one of MODES. The config is used if None.
+    :type mode: str
+    :return: The profiler, None if the operation is not profiled.
+    :rtype: Profiler or None
+    """
+    if mode is None and not is_enabled():
+        return None
+    return Profiler(name, mode=mode)
+
+
+def _sanitize(name: str) -> str:
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+def _collapse_stack(frame) -> str:
+    """Get the stack of the frame in the collapsed format, root frame first."""
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class Profiler(object):
+    """
+    Profiles one ControllerInterface operation with cProfile, or by sampling the stacks of the profiled threads at a
+    fixed interval. Only the thread running the operation and the worker threads started through
+    task.map_concurrently are profiled. Shared with worker threads through the copied LoggingContext, so updates are
+    serialized.
+    """
+
+    def __init__(self, name: str, mode: str = None):
+        """
+        :param name: Name of the operation, used as prefix of the profile files.
+        :type name: str
+        :param mode: Profiling mode, one of MODES. The configured mode is used if None.
+        :type mode: str
+        """
+        config = Config.get_section("profiling")
+        self._mode = mode or config.get("Mode", fallback=CPROFILE)
+        if self._mode not in MODES:
+            raise Exception(f"Unsupported profiling mode {self._mode}, must be one of {MODES}")
+        self._per_controller = config.getboolean("PerController", fallback=False)
+        self._output_dir = config.get("OutputDir", fallback="/tmp/config-module/profiles")  # nosec
+        self._sampling_interval = config.getfloat("SamplingIntervalMilliseconds", fallback=10) / 1000
+        self._prefix = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}-{_sanitize(name)}"
+        self._lock = threading.Lock()
+        # Key of the profile each profiled thread contributes to.
+        self._threads = {}
+        # pstats.Stats in cprofile mode, Counter of collapsed stacks in sampling mode, per key.
+        self._profiles = {}
+        self._stopped = threading.Event()
+        self._sampler = None
+        self._operation_scope = None
+        self.paths = []
+
+    @property
+    def mode(self) -> str:
+        """
+        :return: The profiling mode, one of MODES.
+        :rtype: str
+        """
+        return self._mode
+
+    @property
+    def per_controller(self) -> bool:
+        """
+        :return: True if one profile is written per (hostname, control) instead of one per operation.
+        :rtype: bool
+        """
+        return self._per_controller
+
+    def start(self):
+        """
+        Start profiling the operation on the current thread.
+        """
+        if self._mode == SAMPLING:
+            self._sampler = threading.Thread(target=self._sample, name="profiling-sampler", daemon=True)
+            self._sampler.start()
+        if not self._per_controller:
+            self._operation_scope = self.scope(OPERATION_KEY)
+            self._operation_scope.__enter__()
+
+    def stop(self) -> list:
+        """
+        Stop profiling and write the profiles to the output directory.
+        :return: The paths of the written profiles.
+        :rtype: list
+        """
+        if self._operation_scope is not None:
+            self._operation_scope.__exit__(None, None, None)
+            self._operation_scope = None
+        if self._sampler is not None:
+            self._stopped.set()
+            self._sampler.join()
+            self._sampler = None
+        try:
+            self._write_profiles()
+        except Exception as e:
+            logger.error(f"Failed to write profiles to {self._output_dir}: {e}")
+        return self.paths
+
+    def controller_scope(self, hostname, metadata):
+        """
+        Get the scope profiling a control on the current thread, when profiling per controller.
+        :param hostname: Hostname of the resource being operated on.
+        :type hostname: str
+        :param metadata: Metadata of the control.
+        :type metadata: ControllerMetadata
+        :return: The context manager of the scope, None when profiling per operation.
+        """
+        if not self._per_controller:
+            return None
+        return self.scope(f"{hostname or ''}-{metadata.path_in_schema}")
+
+    @contextmanager
+    def scope(self, key: str = None):
+        """
+        Profile the current thread into the profile of the key, unless the thread is already profiled.
+        :param key: Key of the profile, the key of the calling context is used if None.
+        :type key: str
+        """
+        key = key or _profile_key_context.get(None)
+        ident = threading.get_ident()
+        with self._lock:
+            skip = key is None or ident in self._threads
+            if not skip:
+                self._threads[ident] = key
+        if skip:
+            yield
+            return
+        token = _profile_key_context.set(key)
+        profile = cProfile.Profile() if self._mode == CPROFILE else None
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError as e:
+                # Another profiler is already active on the thread.
+                logger.warning(f"Failed to profile {key}: {e}")
+                profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            _profile_key_context.reset(token)
+            with self._lock:
+                del self._threads[ident]
+                if profile is not None:
+                    if key in self._profiles:
+                        self._profiles[key].add(profile)
+                    else:
+                        self._profiles[key] = pstats.Stats(profile)
+
+    def wrap(self, func):
+        """
+        Wrap a function called on a worker thread, so the worker thread is profiled into the profile of the caller.
+        :param func: The function.
+        :type func: Callable
+        :return: The wrapped function.
+        :rtype: Callable
+        """
+        key = _profile_key_context.get(None)
+
+        def wrapper(*args, **kwargs):
+            with self.scope(key):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    def _sample(self):
+        while not self._stopped.wait(self._sampling_interval):
+            frames = sys._current_frames()  # pylint: disable=W0212
+            with self._lock:
+                for ident, key in self._threads.items():
+                    frame = frames.get(ident)
+                    if frame is not None:
+                        self._profiles.setdefault(key, Counter())[_collapse_stack(frame)] += 1
+
+    def _write_profiles(self):
+        with self._lock:
+            profiles = dict(self._profiles)
+        if not profiles:
+            return
+        os.makedirs(self._output_dir, exist_ok=True)
+        for key, profile in profiles.items():
+            extension = "pstats" if self._mode == CPROFILE else "collapsed"
+            path = os.path.join(self._output_dir, f"{self._prefix}-{_sanitize(key)}.{extension}")
+            if self._mode == CPROFILE:
+                profile.dump_stats(path)
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    for stack, count in sorted(profile.items()):
+                        f.write(f"{stack} {count}\n")
+            self.paths.append(path)
+            logger.info(f"Profile of {key} written to {path}")
@@ -0,0 +1,148 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Per-controller timings and API call accounting, attributed to the (hostname, control) of the current LoggingContext.
+"""
+import threading
+
+from config_modules_vmware.framework.logging.logging_context import LoggingContext
+from config_modules_vmware.services.config import Config
+
+WALL_TIME_SECONDS = "wall_time_seconds"
+REST_CALLS = "rest_calls"
+REST_BYTES = "rest_bytes"
+SOAP_CALLS = "soap_calls"
+ESXCLI_CALLS = "esxcli_calls"
+COUNTERS = (WALL_TIME_SECONDS, REST_CALLS, REST_BYTES, SOAP_CALLS, ESXCLI_CALLS)
+# Key of the calls made by the workflow outside any control, e.g. listing the ESXi hosts of a vCenter.
+WORKFLOW_KEY = "workflow"
+
+
+def is_enabled() -> bool:
+    """
+    Check if timings are enabled in config.
+    :return: True if timings are recorded.
+    :rtype: bool
+    """
+    return Config.get_section("timings").getboolean("Enabled", fallback=False)
+
+
+class Timings(object):
+    """
+    Collects the wall time and API call counters of each control per host for one ControllerInterface operation.
+    Shared with worker threads through the copied LoggingContext, so updates are serialized.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+
+    def add(self, hostname, metadata, counter: str, amount=1):
+        """
+        Add to a counter of the control.
+        :param hostname: Hostname of the resource being operated on.
+        :type hostname: str
+        :param metadata: Metadata of the control, None outside controls.
+        :type metadata: ControllerMetadata
+        :param counter: Name of the counter, one of COUNTERS.
+        :type counter: str
+        :param amount: Amount to add.
+        :type amount: int or float
+        """
+        control = metadata.path_in_schema if metadata else WORKFLOW_KEY
+        with self._lock:
+            control_timings = self._timings.setdefault(hostname or "", {}).setdefault(
+                control, dict.fromkeys(COUNTERS, 0)
+            )
+            control_timings[counter] += amount
+
+    def add_wall_time(self, hostname, metadata, seconds: float):
+        """
+        Add the wall time spent in the control.
+        :param hostname: Hostname of the resource being operated on.
+        :type hostname: str
+        :param metadata: Metadata of the control.
+        :type metadata: ControllerMetadata
+        :param seconds: Elapsed time in seconds.
+        :type seconds: float
+        """
+        self.add(hostname, metadata, WALL_TIME_SECONDS, seconds)
+
+    def to_dict(self) -> dict:
+        """
+        Get the timings of each control per host.
+
+        .. code-block:: json
+
+            {
+              "vcenter-1.vsphere.local": {
+                "compliance_config.vcenter.ntp": {
+                  "wall_time_seconds": 0.412,
+                  "rest_calls": 2,
+                  "rest_bytes": 1843,
+                  "soap_calls": 0,
+                  "esxcli_calls": 0
+                }
+              }
+            }
+
+        :return: Dict of hostname to dict of control path in schema to counters.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                hostname: {
+                    control: {
+                        counter: round(value, 3) if counter == WALL_TIME_SECONDS else value
+                        for counter, value in control_timings.items()
+                    }
+                    for control, control_timings in host_timings.items()
+                }
+                for hostname, host_timings in self._timings.items()
+            }
+
+
+def is_collecting() -> bool:
+    """
+    Check if timings are being collected in the current context, e.g. to skip computing a costly amount.
+    :return: True if timings are being collected.
+    :rtype: bool
+    """
+    return LoggingContext.get_timings_context() is not None
+
+
+def record(counter: str, amount=1):
+    """
+    Add to a counter of the current (hostname, control), no-op when no timings are being collected.
+    :param counter: Name of the counter, one of COUNTERS.
+    :type counter: str
+    :param amount: Amount to add.
+    :type amount: int
+    """
+    timings = LoggingContext.get_timings_context()
+    if timings is not None:
+        timings.add(
+            LoggingContext.get_hostname_context(), LoggingContext.get_controller_metadata_context(), counter, amount
+        )
+
+
+def instrument_soap_stub(stub):
+    """
+    Count the SOAP calls made through the stub when timings are enabled, the stub is returned unchanged otherwise.
+    :param stub: SOAP stub.
+    :type stub: SoapStubAdapter
+    :return: The stub.
+    :rtype: SoapStubAdapter
+    """
+    if not is_enabled():
+        return stub
+
+    def counted(func):
+        def wrapper(*args, **kwargs):
+            record(SOAP_CALLS)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    stub.InvokeMethod = counted(stub.InvokeMethod)
+    stub.InvokeAccessor = counted(stub.InvokeAccessor)
+    return stub
@@ -17,6 +17,7 @@ class OutputResponse:
         Initialize a new OutputResponse instance.
         """
         self._message = None
+        self._timings = None
 
     @property
     def message(self):
@@ -38,6 +39,26 @@ class OutputResponse:
         """
         self._message = message
 
+    @property
+    def timings(self):
+        """
+        Return the timings of each control per host, if collected.
+
+        :return: timings.
+        :rtype: dict
+        """
+        return self._timings
+
+    @timings.setter
+    def timings(self, timings):
+        """
+        Update the timings of each control per host.
+
+        :param timings: Timings.
+        :type timings: dict
+        """
+        self._timings = timings
+
     def to_dict(self):
         """
         Get the reformatted output response as dict.
@@ -48,4 +69,6 @@ class OutputResponse:
         output_dict = {}
         if self._message:
             output_dict[consts.MESSAGE] = self._message
+        if self._timings:
+            output_dict[consts.TIMINGS] = self._timings
         return output_dict
@@ -1,6 +1,7 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
-import copy
 import numbers
+from collections import Counter
+from contextvars import ContextVar
 from enum import Enum
 from typing import Any
 from typing import List
@@ -13,18 +14,67 @@ class ComparatorOptionForList(Enum):
     COMPARE_WITHOUT_SORT: List will not be sorted before comparison, so [1,2] != [2,1].
     IDENTIFIER_BASED_COMPARISON: List is dicts with each element have an instance key.
     Compares each object based on keys and reports mismatch or missing dict objects.
+    COMPARE_AFTER_HASH: Same result as COMPARE_AFTER_SORT, so [1,2] == [2,1], but lists are compared as multisets of
+    hashable canonical keys in linear time instead of being sorted. Preferred for very large lists.
     Default is set to COMPARE_AFTER_SORT.
     """
 
     COMPARE_AFTER_SORT = 0
     COMPARE_WITHOUT_SORT = 1
     IDENTIFIER_BASED_COMPARISON = 2
+    COMPARE_AFTER_HASH = 3
 
     @classmethod
     def _missing_(cls, value):
         return cls.COMPARE_AFTER_SORT
 
 
+# Tags used to tell canonical lists and dicts apart from each other and from scalar values.
+_CANONICAL_LIST_TAG = object()
+_CANONICAL_DICT_TAG = object()
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _canonical_key(obj: Any) -> Any:
+    """Build the hashable canonical key, see Comparator.get_canonical_key."""
+    if isinstance(obj, dict):
+        return _CANONICAL_DICT_TAG, frozenset(
+            [(key, value if type(value) in _SCALAR_TYPES else _canonical_key(value)) for key, value in obj.items()]
+        )
+    elif isinstance(obj, list):
+        try:
+            # Fast path for lists of scalars, sorting is done in C and the result is only kept if it is hashable.
+            key = tuple(sorted(obj))
+            hash(key)
+            return _CANONICAL_LIST_TAG, key
+        except TypeError:
+            return _CANONICAL_LIST_TAG, frozenset(Counter(map(_canonical_key, obj)).items())
+    hash(obj)
+    return obj
+
+
+# Tag used for the fingerprint of a list of dicts compared by instance key.
+_FINGERPRINT_INSTANCE_LIST_TAG = object()
+
+
+def _fingerprint(obj: Any, ordered_lists: bool) -> Any:
+    """Build the hashable fingerprint, see Comparator.get_fingerprint."""
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is float or obj is None:
+        return obj
+    elif obj_type is dict:
+        return dict, frozenset([(key, _fingerprint(value, ordered_lists)) for key, value in obj.items()])
+    elif obj_type is list:
+        if ordered_lists:
+            return list, tuple([_fingerprint(item, ordered_lists) for item in obj])
+        return list, frozenset(Counter([_fingerprint(item, ordered_lists) for item in obj]).items())
+    hash(obj)
+    if isinstance(obj, numbers.Number) and obj_type is not bool:
+        # All numbers are considered same type by the comparator, so long(180) and int(180) are same.
+        return obj
+    return obj_type, obj
+
+
 class Comparator:
     """Class with utils methods for comparing two sets of configuration data based on comparator options."""
 
@@ -38,6 +88,110 @@ class Comparator:
         else:
             return obj
 
+    @staticmethod
+    def get_canonical_key(obj: Any) -> Any:
+        """Build a hashable canonical key for the data structure.
+
+        Two values have equal canonical keys if and only if they are equal after recursive sorting, i.e.
+        nested lists are treated as multisets and dicts as sets of key-value pairs. The key can be hashed,
+        so it is usable as a structural digest of the value.
+
+        :param obj: Data structure to build the key for.
+        :type obj: Any
+        :return: Hashable canonical key.
+        :rtype: Any
+        :raises: TypeError if the data contains a value which is not hashable and is not a list or dict.
+        """
+        return _canonical_key(obj)
+
+    @staticmethod
+    def get_fingerprint(
+        obj: Any, comparator_option=ComparatorOptionForList.COMPARE_AFTER_SORT, instance_key="name"
+    ) -> Any:
+        """Build a hashable fingerprint of the data structure normalized for the comparator option.
+
+        If the fingerprints of current and desired config are equal, get_non_compliant_configs with the same
+        comparator option and instance key reports no non_compliant configs. The fingerprint is stricter than
+        the comparator (i.e. bool and int are never equal), so unequal fingerprints only mean that the detailed
+        comparison is needed.
+
+        :param obj: Data structure to build the fingerprint for.
+        :type obj: Any
+        :param comparator_option: Enum for comparator option for list comparisons.
+        :type comparator_option: ComparatorOptionForList
+        :param instance_key: Optional instance_key needed for ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON
+        :type instance_key: str
+        :return: Hashable fingerprint or None if the data cannot be fingerprinted.
+        :rtype: Any
+        """
+        try:
+            if comparator_option == ComparatorOptionForList.COMPARE_WITHOUT_SORT:
+                return _fingerprint(obj, ordered_lists=True)
+            elif comparator_option != ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON:
+                return _fingerprint(obj, ordered_lists=False)
+            elif type(obj) is dict:
+                # Instance key at top level dict is always reported by the comparator.
+                if instance_key in obj:
+                    return None
+                return _fingerprint(obj, ordered_lists=False)
+            elif isinstance(obj, list) and all(isinstance(item, dict) for item in obj):
+                # Lists of dicts are compared in instance key order and each pair of dicts with plain equality.
+                sorted_list = Comparator._sort_list_by_instance_id(obj, instance_key)
+                return _FINGERPRINT_INSTANCE_LIST_TAG, tuple(
+                    [_fingerprint(item, ordered_lists=True) for item in sorted_list]
+                )
+            return _fingerprint(obj, ordered_lists=False)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def is_fingerprint_match(
+        current_config: Any,
+        desired_config: Any,
+        comparator_option=ComparatorOptionForList.COMPARE_AFTER_SORT,
+        instance_key="name",
+    ) -> bool:
+        """Check whether current and desired config have the same fingerprint.
+
+        The desired config fingerprint is taken from the active DesiredFingerprintCache if any.
+
+        :param current_config: Current config data structure.
+        :type current_config: Any
+        :param desired_config: Desired config data structure.
+        :type desired_config: Any
+        :param comparator_option: Enum for comparator option for list comparisons.
+        :type comparator_option: ComparatorOptionForList
+        :param instance_key: Optional instance_key needed for ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON
+        :type instance_key: str
+        :return: True if the fingerprints match, False if they don't or cannot be computed.
+        :rtype: bool
+        """
+        desired_fingerprint = DesiredFingerprintCache.get_fingerprint(desired_config, comparator_option, instance_key)
+        if desired_fingerprint is None:
+            return False
+        return Comparator.get_fingerprint(current_config, comparator_option, instance_key) == desired_fingerprint
+
+    @staticmethod
+    def _is_equal_after_hash(data_1: Any, data_2: Any) -> bool:
+        """Compare two data structures using canonical keys, lists are compared as multisets in linear time.
+
+        :param data_1: First data to compare.
+        :type data_1: Any
+        :param data_2: Second data to compare.
+        :type data_2: Any
+        :return: True if data is same after recursive sorting.
+        :rtype: bool
+        """
+        if not isinstance(data_1, list) or not isinstance(data_2, list):
+            return Comparator._sort_recursive(data_1) == Comparator._sort_recursive(data_2)
+        if len(data_1) != len(data_2):
+            return False
+        try:
+            return Counter(map(_canonical_key, data_1)) == Counter(map(_canonical_key, data_2))
+        except TypeError:
+            # Unhashable leaf values, fall back to sort based comparison.
+            return Comparator._sort_recursive(data_1) == Comparator._sort_recursive(data_2)
+
     @staticmethod
     def _sort_list_by_instance_id(list_: List[dict], instance_key: str = "name") -> List[dict]:
         """Sort the list based on the instance_key.
@@ -164,7 +318,8 @@ class Comparator:
                 {'instance_key': "ntp", 'key3': {'key3_2': [200, 300]}},
             ]
 
-        3. Default for all List (nested as well) is SORT the list and compare.
+        3. Default for all List (nested as well) is SORT the list and compare. COMPARE_AFTER_HASH gives the same
+        result without sorting, by comparing lists as multisets of canonical keys.
         4. For regular dicts it does check recursively and returns only the keys which are non_compliant.
 
         Sample input:
@@ -296,20 +451,64 @@ class Comparator:
 
             # For all other cases, based on compare_option either sort or not sort the data and compare.
             # Only when COMPARE_WITHOUT_SORT is set, do not sort the list.
+            # _sort_recursive builds new structures, so the input data is never modified.
             if comparator_option == ComparatorOptionForList.COMPARE_WITHOUT_SORT:
-                data_1 = current_config
-                data_2 = desired_config
+                is_equal = current_config == desired_config
+            elif comparator_option == ComparatorOptionForList.COMPARE_AFTER_HASH:
+                is_equal = Comparator._is_equal_after_hash(current_config, desired_config)
             else:
-                # Sort the data.
-                data_1 = copy.deepcopy(current_config)
-                data_2 = copy.deepcopy(desired_config)
-                data_1 = Comparator._sort_recursive(data_1)
-                data_2 = Comparator._sort_recursive(data_2)
+                is_equal = Comparator._sort_recursive(current_config) == Comparator._sort_recursive(desired_config)
 
             current_non_compliant_configs, desired_non_compliant_configs = None, None
             # If the data not equal and either current_config or desired_config is not None.
-            if (data_1 != data_2) and (current_config or desired_config):
+            if not is_equal and (current_config or desired_config):
                 current_non_compliant_configs = current_config
                 desired_non_compliant_configs = desired_config
 
         return current_non_compliant_configs, desired_non_compliant_configs
+
+
+class DesiredFingerprintCache:
+    """
+    Context Manager to cache desired config fingerprints, so a desired spec applied to many hosts
+    is only normalized once. Desired values must not be modified in place while the cache is active.
+    Nested usage reuses the outer cache.
+    """
+
+    _cache_context = ContextVar("desired_fingerprint_cache")
+    _token = None
+
+    def __enter__(self):
+        if self._cache_context.get(None) is None:
+            self._token = self._cache_context.set({})
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            self._cache_context.reset(self._token)
+            self._token = None
+
+    @classmethod
+    def get_fingerprint(cls, desired_config: Any, comparator_option, instance_key) -> Any:
+        """Get fingerprint of the desired config, from the active cache if available.
+
+        :param desired_config: Desired config data structure.
+        :type desired_config: Any
+        :param comparator_option: Enum for comparator option for list comparisons.
+        :type comparator_option: ComparatorOptionForList
+        :param instance_key: Instance key for ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON
+        :type instance_key: str
+        :return: Hashable fingerprint or None if the data cannot be fingerprinted.
+        :rtype: Any
+        """
+        cache = cls._cache_context.get(None)
+        if cache is None:
+            return Comparator.get_fingerprint(desired_config, comparator_option, instance_key)
+        cache_key = (id(desired_config), comparator_option, instance_key)
+        cached = cache.get(cache_key)
+        # The cached desired config is kept referenced, so its id cannot be reused by another object.
+        if cached is not None and cached[0] is desired_config:
+            return cached[1]
+        fingerprint = Comparator.get_fingerprint(desired_config, comparator_option, instance_key)
+        cache[cache_key] = (desired_config, fingerprint)
+        return fingerprint
@@ -0,0 +1,348 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Process-wide metrics registry exported in the Prometheus text exposition format.
+
+Metrics are updated from worker threads, each update holds the lock of its metric only for a dict update.
+"""
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names, label_values) -> str:
+    if not label_names:
+        return ""
+    labels = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values))
+    return f"{{{labels}}}"
+
+
+class _Metric(object):
+    """
+    Base class of a metric family, holding one value per set of label values.
+    """
+
+    metric_type = None
+
+    def __init__(self, name: str, documentation: str, label_names=()):
+        """
+        :param name: Metric name.
+        :type name: str
+        :param documentation: Help text of the metric.
+        :type documentation: str
+        :param label_names: Names of the labels, values are passed as keyword arguments on update.
+        :type label_names: tuple
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _get_label_values(self, labels: dict) -> tuple:
+        try:
+            if len(labels) == len(self.label_names):
+                return tuple(str(labels[name]) for name in self.label_names)
+        except KeyError:
+            pass
+        raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {tuple(labels)}")
+
+    def _add(self, amount, labels: dict):
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def get(self, **labels):
+        """
+        Get the current value for the label values.
+        :return: Current value, 0 if never updated.
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def collect(self) -> list:
+        """
+        Get the samples of the metric.
+        :return: List of (sample name, label names, label values, value).
+        :rtype: list
+        """
+        with self._lock:
+            values = list(self._values.items())
+        return [(self.name, self.label_names, label_values, value) for label_values, value in sorted(values)]
+
+    def clear(self):
+        """
+        Drop all values, e.g. between tests.
+        """
+        with self._lock:
+            self._values = {}
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count, e.g. number of API calls.
+    """
+
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        """
+        Increment the counter.
+        :param amount: Amount to add, must not be negative.
+        :param labels: Label values.
+        """
+        if amount < 0:
+            raise ValueError(f"Counter {self.name} can only be incremented")
+        self._add(amount, labels)
+
+
+class Gauge(_Metric):
+    """
+    Value that goes up and down, e.g. number of operations in progress.
+    Gauges derived from another component are computed on collection with :meth:`set_function`.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names=()):
+        super().__init__(name, documentation, label_names)
+        self._function = None
+
+    def inc(self, amount=1, **labels):
+        """
+        Increment the gauge.
+        """
+        self._add(amount, labels)
+
+    def dec(self, amount=1, **labels):
+        """
+        Decrement the gauge.
+        """
+        self._add(-amount, labels)
+
+    def set(self, value, **labels):
+        """
+        Set the gauge.
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            self._values[label_values] = value
+
+    @contextmanager
+    def track_in_progress(self, **labels):
+        """
+        Context manager incrementing the gauge while the block runs.
+        """
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def set_function(self, function):
+        """
+        Compute the gauge on collection instead of tracking it.
+        :param function: Function returning a dict of label values tuple to value.
+        :type function: Callable
+        """
+        self._function = function
+
+    def collect(self) -> list:
+        if self._function is None:
+            return super().collect()
+        values = [
+            (tuple(str(value) for value in label_values), value) for label_values, value in self._function().items()
+        ]
+        return [(self.name, self.label_names, label_values, value) for label_values, value in sorted(values)]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values in cumulative buckets, e.g. latencies in seconds.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        """
+        Observe a value.
+        :param value: Observed value.
+        :param labels: Label values.
+        """
+        label_values = self._get_label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            # per bucket counts followed by sum and count, buckets are accumulated on collection
+            state = self._values.get(label_values)
+            if state is None:
+                state = self._values[label_values] = [0] * (len(self.buckets) + 3)
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Context manager observing the duration of the block in seconds.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start_time, **labels)
+
+    def get(self, **labels):
+        """
+        Get the number of observations for the label values.
+        :return: Number of observations, 0 if never observed.
+        """
+        label_values = self._get_label_values(labels)
+        with self._lock:
+            state = self._values.get(label_values)
+            return state[-1] if state else 0
+
+    def collect(self) -> list:
+        with self._lock:
+            values = [(label_values, list(state)) for label_values, state in self._values.items()]
+        bucket_label_names = self.label_names + ("le",)
+        samples = []
+        for label_values, state in sorted(values):
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), state[:-2]):
+                cumulative_count += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        bucket_label_names,
+                        label_values + (_format_value(float(upper_bound)),),
+                        cumulative_count,
+                    )
+                )
+            samples.append((f"{self.name}_sum", self.label_names, label_values, state[-2]))
+            samples.append((f"{self.name}_count", self.label_names, label_values, state[-1]))
+        return samples
+
+
+class MetricsRegistry(object):
+    """
+    Registry of metric families. Registering a name again returns the existing metric, so modules can declare
+    the metrics they update at import time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _register(self, metric_class, name, documentation, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, label_names, **kwargs)
+            elif not isinstance(metric, metric_class) or metric.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} is already registered with another type or labels")
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names=()) -> Counter:
+        """
+        Get or register a counter.
+        """
+        return self._register(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names=()) -> Gauge:
+        """
+        Get or register a gauge.
+        """
+        return self._register(Gauge, name, documentation, label_names)
+
+    def histogram(self, name: str, documentation: str, label_names=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        """
+        Get or register a histogram.
+        """
+        return self._register(Histogram, name, documentation, label_names, buckets=buckets)
+
+    def generate_text(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+        :return: Metrics text, served with :data:`CONTENT_TYPE`.
+        :rtype: str
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            documentation = metric.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+            lines.append(f"# HELP {metric.name} {documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for sample_name, label_names, label_values, value in metric.collect():
+                lines.append(f"{sample_name}{_format_labels(label_names, label_values)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """
+        Drop the values of all metrics, registrations are kept.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+OPERATION_DURATION = REGISTRY.histogram(
+    "config_modules_operation_duration_seconds",
+    "Duration of ControllerInterface operations.",
+    ("operation", "controller_type"),
+)
+CONTROLLER_DURATION = REGISTRY.histogram(
+    "config_modules_controller_duration_seconds",
+    "Duration of a controller operation on one host.",
+    ("controller",),
+)
+API_REQUEST_DURATION = REGISTRY.histogram(
+    "config_modules_api_request_duration_seconds",
+    "Duration of vCenter and SDDC Manager REST API requests per endpoint.",
+    ("method", "endpoint"),
+)
+JOBS_IN_FLIGHT = REGISTRY.gauge(
+    "config_modules_jobs_in_flight",
+    "Number of ControllerInterface operations in progress.",
+    ("operation",),
+)
+BACKGROUND_JOBS = REGISTRY.gauge(
+    "config_modules_background_jobs",
+    "Number of background jobs of the API service, by status (pending or running).",
+    ("status",),
+)
+ESXCLI_COMMANDS_IN_FLIGHT = REGISTRY.gauge(
+    "config_modules_esxcli_commands_in_flight",
+    "Number of esxcli commands running or waiting for the esxcli process to exit.",
+)
+SESSION_POOL_SESSIONS = REGISTRY.gauge(
+    "config_modules_session_pool_sessions",
+    "Number of pooled sessions per client type and target, by state (leased or idle).",
+    ("client_type", "hostname", "state"),
+)
@@ -1,9 +1,18 @@
+import asyncio
 import concurrent.futures
+import contextvars
 import functools
 import threading
 import typing
 from concurrent.futures import Future
 
+from config_modules_vmware.framework.logging.logging_context import LoggingContext
+from config_modules_vmware.services.config import Config
+
+# Executor of the blocking functions awaited with run_async, created on first use.
+_async_executor = None
+_async_executor_lock = threading.Lock()
+
 
 class Task:
     """
@@ -110,6 +119,67 @@ def threadpool(func=None):
     return Task(func=None)(func)
 
 
+def map_concurrently(func, items, max_workers) -> list:
+    """Call the function for each item, with at most max_workers calls running at the same time.
+    Each call runs in a copy of the caller's context, so the logging context is kept on the worker threads. The worker
+    threads are profiled with the caller when the operation is profiled.
+    :param func: function called with a single item
+    :param items: items to call the function for
+    :param max_workers: maximum number of concurrent calls, calls are made sequentially on the current thread if 1
+    :return: results in the order of the items
+    :raises Exception: first exception raised by a call, in the order of the items, once all calls completed
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    profiler = LoggingContext.get_profiler_context()
+    if profiler is not None:
+        func = profiler.wrap(func)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def _get_async_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the executor of run_async, sized by MaxWorkers of the [async] config.
+    :return: executor
+    """
+    global _async_executor  # pylint: disable=W0603
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=Config.get_section("async").getint("MaxWorkers"), thread_name_prefix="config-modules-async"
+            )
+        return _async_executor
+
+
+async def run_async(func, *args, **kwargs):
+    """Await a blocking function run on the shared async executor, without blocking the event loop.
+    The function runs in a copy of the caller's context, so the logging context set by the calling task is kept on the
+    worker thread and changes made by the function are not seen by the caller. Cancelling the awaiting task does not
+    interrupt the function, its result is then discarded.
+    :param func: blocking function
+    :param args: positional arguments of the function
+    :param kwargs: keyword arguments of the function
+    :return: result of the function
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_async_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+def shutdown_async_executor(wait=True):
+    """Shutdown the executor of run_async, a new one is created on next use.
+    :param wait: wait for the running functions to complete
+    """
+    global _async_executor  # pylint: disable=W0603
+    with _async_executor_lock:
+        executor, _async_executor = _async_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
 class ThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
     """
     Class that submits functions to be completed on a separate worker thread if one is available.
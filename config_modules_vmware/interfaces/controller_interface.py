@@ -5,8 +5,12 @@ from typing import Dict
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.logging import profiling
+from config_modules_vmware.framework.logging import timings
 from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
 from config_modules_vmware.framework.logging.logging_context import HostnameLoggingContext
+from config_modules_vmware.framework.logging.logging_context import ProfilerLoggingContext
+from config_modules_vmware.framework.logging.logging_context import TimingsLoggingContext
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceResponse
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
@@ -23,6 +27,8 @@ from config_modules_vmware.framework.models.output_models.validate_configuration
 from config_modules_vmware.framework.models.output_models.validate_configuration_response import (
     ValidateConfigurationStatus,
 )
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.framework.utils import task
 from config_modules_vmware.interfaces.metadata_interface import ControllerMetadataInterface
 from config_modules_vmware.services.workflows.compliance_operations import ComplianceOperations
 from config_modules_vmware.services.workflows.configuration_operations import ConfigurationOperations
@@ -43,6 +49,7 @@ class ControllerInterface:
         metadata_filter: Callable[[ControllerMetadata], bool] = None,
         controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
         template: dict = None,
+        profiling_mode: str = None,
     ) -> Dict:
         """Get current configuration from controllers.
 
@@ -124,6 +131,9 @@ class ControllerInterface:
         :type controller_type: ControllerMetadata.ControllerType
         :param template: Template to populate for the targeted configuration
         :type template: dict
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
         :return: Get Current Configuration output.
         :rtype: dict
         """
@@ -137,6 +147,7 @@ class ControllerInterface:
                     Operations.GET_CURRENT,
                     metadata_filter,
                     controller_type,
+                    profiling_mode,
                 )
             except Exception as e:
                 logging.error(f"Exception in get current configuration {e}")
@@ -149,6 +160,7 @@ class ControllerInterface:
         desired_state_spec: Dict = None,
         metadata_filter: Callable[[ControllerMetadata], bool] = None,
         controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        profiling_mode: str = None,
     ) -> Dict:
         """Check audit compliance for the product or product attributes.
 
@@ -331,6 +343,9 @@ class ControllerInterface:
         :type metadata_filter: Callable[[ControllerMetadata], bool]
         :param controller_type: Type of controller to invoke
         :type controller_type: ControllerMetadata.ControllerType
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
         :return: Compliance output.
         :rtype: dict
         """
@@ -341,7 +356,12 @@ class ControllerInterface:
 
             try:
                 self._invoke_workflow(
-                    desired_state_spec, compliance_output, Operations.CHECK_COMPLIANCE, metadata_filter, controller_type
+                    desired_state_spec,
+                    compliance_output,
+                    Operations.CHECK_COMPLIANCE,
+                    metadata_filter,
+                    controller_type,
+                    profiling_mode,
                 )
             except Exception as e:
                 logging.error(f"Exception in check compliance workflow {e}")
@@ -354,6 +374,7 @@ class ControllerInterface:
         desired_state_spec: Dict = None,
         metadata_filter: Callable[[ControllerMetadata], bool] = None,
         controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        profiling_mode: str = None,
     ) -> Dict:
         """Remediate product attributes which are non-compliant.
 
@@ -515,6 +536,9 @@ class ControllerInterface:
         :type metadata_filter: Callable[[ControllerMetadata], bool]
         :param controller_type: Type of controller to invoke
         :type controller_type: ControllerMetadata.ControllerType
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
         :return: Remediation output.
         :rtype: dict
         """
@@ -524,7 +548,12 @@ class ControllerInterface:
             remediation_output.status = RemediateStatus.SUCCESS
             try:
                 self._invoke_workflow(
-                    desired_state_spec, remediation_output, Operations.REMEDIATE, metadata_filter, controller_type
+                    desired_state_spec,
+                    remediation_output,
+                    Operations.REMEDIATE,
+                    metadata_filter,
+                    controller_type,
+                    profiling_mode,
                 )
             except Exception as e:
                 logging.error(f"Exception in remediation workflow {e}")
@@ -532,6 +561,84 @@ class ControllerInterface:
                 remediation_output.message = str(e)
             return remediation_output.to_dict()
 
+    async def aget_current_configuration(
+        self,
+        metadata_filter: Callable[[ControllerMetadata], bool] = None,
+        controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        template: dict = None,
+        profiling_mode: str = None,
+    ) -> Dict:
+        """Async variant of :meth:`get_current_configuration`, run on the async executor without blocking the event
+        loop. The logging context of the calling task is kept.
+
+        :param metadata_filter: Function used to filter controllers based on metadata.
+        :type metadata_filter: Callable[[ControllerMetadata], bool]
+        :param controller_type: Type of controller to invoke
+        :type controller_type: ControllerMetadata.ControllerType
+        :param template: Template to populate for the targeted configuration
+        :type template: dict
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
+        :return: Get Current Configuration output.
+        :rtype: dict
+        """
+        return await task.run_async(
+            self.get_current_configuration, metadata_filter, controller_type, template, profiling_mode
+        )
+
+    async def acheck_compliance(
+        self,
+        desired_state_spec: Dict = None,
+        metadata_filter: Callable[[ControllerMetadata], bool] = None,
+        controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        profiling_mode: str = None,
+    ) -> Dict:
+        """Async variant of :meth:`check_compliance`, run on the async executor without blocking the event loop.
+        The logging context of the calling task is kept.
+
+        :param desired_state_spec: Desired state controls spec.
+        :type desired_state_spec: dict
+        :param metadata_filter: Function used to filter controllers based on metadata.
+        :type metadata_filter: Callable[[ControllerMetadata], bool]
+        :param controller_type: Type of controller to invoke
+        :type controller_type: ControllerMetadata.ControllerType
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
+        :return: Compliance output.
+        :rtype: dict
+        """
+        return await task.run_async(
+            self.check_compliance, desired_state_spec, metadata_filter, controller_type, profiling_mode
+        )
+
+    async def aremediate_with_desired_state(
+        self,
+        desired_state_spec: Dict = None,
+        metadata_filter: Callable[[ControllerMetadata], bool] = None,
+        controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        profiling_mode: str = None,
+    ) -> Dict:
+        """Async variant of :meth:`remediate_with_desired_state`, run on the async executor without blocking the
+        event loop. The logging context of the calling task is kept.
+
+        :param desired_state_spec: Desired state controls spec.
+        :type desired_state_spec: dict
+        :param metadata_filter: Function used to filter controllers based on metadata.
+        :type metadata_filter: Callable[[ControllerMetadata], bool]
+        :param controller_type: Type of controller to invoke
+        :type controller_type: ControllerMetadata.ControllerType
+        :param profiling_mode: Profile this call with 'cprofile' or 'sampling', see the [profiling] config.
+            The profiling config is used if None.
+        :type profiling_mode: str
+        :return: Remediation output.
+        :rtype: dict
+        """
+        return await task.run_async(
+            self.remediate_with_desired_state, desired_state_spec, metadata_filter, controller_type, profiling_mode
+        )
+
     def get_schema(
         self,
         controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
@@ -618,10 +725,13 @@ class ControllerInterface:
         operation: Operations,
         metadata_filter: Callable[[ControllerMetadata], bool] = None,
         controller_type: ControllerMetadata.ControllerType = ControllerMetadata.ControllerType.COMPLIANCE,
+        profiling_mode: str = None,
     ):
         """Invokes the respective workflow based on the input operation specified.
 
-        Response is returned in the provided output_response.
+        Response is returned in the provided output_response. When timings are enabled in config, the timings of
+        each control per host are also returned in the output_response. When profiling is requested or enabled in
+        config, the profiles are written to the profiling output directory.
 
         :param desired_state_spec: The input desired state spec.
         :param output_response: Instance of OutputResponse class.
@@ -630,17 +740,30 @@ class ControllerInterface:
         :type metadata_filter: Callable[[ControllerMetadata], bool]
         :param controller_type: Type of controller to invoke
         :type controller_type: ControllerMetadata.ControllerType
+        :param profiling_mode: Profiling mode of this call, the profiling config is used if None.
+        :type profiling_mode: str
         """
         controller_operation = {
             ControllerMetadata.ControllerType.COMPLIANCE: ComplianceOperations,
             ControllerMetadata.ControllerType.CONFIGURATION: ConfigurationOperations,
         }[controller_type]
-        workflow_response = controller_operation.operate(
-            self._context,
-            operation,
-            input_values=desired_state_spec,
-            metadata_filter=metadata_filter,
-        )
+        operation_timings = timings.Timings() if timings.is_enabled() else None
+        operation_profiler = profiling.create_profiler(f"{operation.value}-{self._context.hostname}", profiling_mode)
+        try:
+            with TimingsLoggingContext(operation_timings), ProfilerLoggingContext(operation_profiler):
+                with metrics.JOBS_IN_FLIGHT.track_in_progress(operation=operation.value):
+                    with metrics.OPERATION_DURATION.time(
+                        operation=operation.value, controller_type=controller_type.value
+                    ):
+                        workflow_response = controller_operation.operate(
+                            self._context,
+                            operation,
+                            input_values=desired_state_spec,
+                            metadata_filter=metadata_filter,
+                        )
+        finally:
+            if operation_timings is not None:
+                output_response.timings = operation_timings.to_dict()
         output_response.status = workflow_response.get(consts.STATUS)
         if (
             operation == Operations.GET_CURRENT
@@ -0,0 +1,357 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Background jobs of the API service, so long running operations do not hold an HTTP worker until they complete.
+
+A job runs an operation on one or more targets, one target after the other, on a bounded executor shared by all
+jobs. The result of each target is available as soon as the target completes, the job can be polled or its updates
+streamed until it is finished. A running job is cancelled between two targets, so large targets, e.g. the hosts of an
+ESXi fleet, are split into several targets to report progress and be cancellable.
+"""
+import concurrent.futures
+import logging
+import threading
+import time
+import uuid
+from enum import Enum
+from typing import Callable
+from typing import Dict
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+JOBS_CONFIG_SECTION = "service.jobs"
+
+
+class JobStatus(str, Enum):
+    """
+    Enum class for job status.
+    """
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job(object):
+    """
+    State and results of a job. Updated by the job thread and read by the request threads, so updates are serialized
+    and notified to the threads waiting for an update.
+    """
+
+    def __init__(self, operation: str, targets: Dict[str, Callable]):
+        """
+        :param operation: Name of the operation run on the targets.
+        :type operation: str
+        :param targets: Dict of target name to function running the operation on the target, returning its response.
+        :type targets: dict
+        """
+        self.id = str(uuid.uuid4())
+        self.operation = operation
+        self._targets = targets
+        self._condition = threading.Condition()
+        self._version = 0
+        self._status = JobStatus.PENDING
+        self._results = {}
+        self._created = time.time()
+        self._started = None
+        self._finished = None
+        self._cancel_requested = False
+        self._future = None
+
+    @property
+    def status(self) -> JobStatus:
+        """
+        :return: The status of the job.
+        :rtype: JobStatus
+        """
+        return self._status
+
+    @property
+    def finished(self):
+        """
+        :return: The time the job finished at, in seconds since the epoch, None if not finished.
+        :rtype: float
+        """
+        return self._finished
+
+    @property
+    def cancel_requested(self) -> bool:
+        """
+        :return: True if cancellation of the job was requested.
+        :rtype: bool
+        """
+        return self._cancel_requested
+
+    def to_dict(self, include_results: bool = True) -> dict:
+        """
+        Get the job status and the results of the completed targets.
+
+        .. code-block:: json
+
+            {
+              "job_id": "0f6c3c1e-8a57-4a9b-9a4e-5e5a3f0d6f21",
+              "operation": "check_compliance",
+              "status": "RUNNING",
+              "created": 1718000000.0,
+              "started": 1718000000.1,
+              "finished": null,
+              "targets": 2,
+              "completed_targets": 1,
+              "results": {
+                "vcenter:vcenter-1.vsphere.local": {
+                  "status": "COMPLIANT"
+                }
+              }
+            }
+
+        :param include_results: Include the results of the completed targets.
+        :type include_results: bool
+        :return: Dict of the job.
+        :rtype: dict
+        """
+        with self._condition:
+            job_dict = {
+                "job_id": self.id,
+                "operation": self.operation,
+                "status": self._status.value,
+                "created": self._created,
+                "started": self._started,
+                "finished": self._finished,
+                "targets": len(self._targets),
+                "completed_targets": len(self._results),
+            }
+            if include_results:
+                job_dict["results"] = dict(self._results)
+            return job_dict
+
+    def wait_for_update(self, version: int, timeout: float) -> int:
+        """
+        Wait until the job is updated after the given version or the timeout expires.
+        :param version: The last version seen by the caller, 0 initially.
+        :type version: int
+        :param timeout: Max time to wait in seconds.
+        :type timeout: float
+        :return: The current version of the job.
+        :rtype: int
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._version > version, timeout)
+            return self._version
+
+    def run(self):
+        """
+        Run the operation on each target, skipping the remaining targets once cancellation is requested. A target
+        raising an exception gets a FAILED result and fails the job, the remaining targets still run.
+        """
+        if not self._update_status(JobStatus.RUNNING, expected_status=JobStatus.PENDING):
+            return
+        failed = False
+        for target, func in self._targets.items():
+            if self._cancel_requested:
+                break
+            try:
+                result = func()
+            except Exception as e:
+                logger.error(f"Job {self.id} failed on {target}: {e}")
+                failed = True
+                result = {"status": JobStatus.FAILED.value, "message": str(e)}
+            with self._condition:
+                self._results[target] = result
+                self._version += 1
+                self._condition.notify_all()
+        if self._cancel_requested and len(self._results) < len(self._targets):
+            self._update_status(JobStatus.CANCELLED)
+        else:
+            self._update_status(JobStatus.FAILED if failed else JobStatus.SUCCEEDED)
+
+    def submit_to(self, executor: concurrent.futures.Executor):
+        """
+        Submit the job to run on the executor.
+        :param executor: The executor.
+        :type executor: concurrent.futures.Executor
+        """
+        self._future = executor.submit(self.run)
+
+    def cancel(self):
+        """
+        Request cancellation of the job. A pending job is cancelled right away, a running job is cancelled before its
+        next target, the target being run completes.
+        """
+        with self._condition:
+            self._cancel_requested = True
+        if self._future is not None and self._future.cancel():
+            self._update_status(JobStatus.CANCELLED, expected_status=JobStatus.PENDING)
+
+    def _update_status(self, status: JobStatus, expected_status: JobStatus = None) -> bool:
+        with self._condition:
+            if expected_status is not None and self._status != expected_status:
+                return False
+            if self._status in FINISHED_STATUSES:
+                return False
+            self._status = status
+            now = time.time()
+            if status == JobStatus.RUNNING:
+                self._started = now
+            elif status in FINISHED_STATUSES:
+                self._finished = now
+            self._version += 1
+            self._condition.notify_all()
+            return True
+
+
+class JobManager(object):
+    """
+    Runs the jobs on a bounded executor, at most max_concurrent_jobs at a time, and keeps them until they are
+    finished for longer than the retention time.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_concurrent_jobs: int, max_pending_jobs: int, retention_seconds: float):
+        """
+        :param max_concurrent_jobs: Max number of jobs running at the same time.
+        :type max_concurrent_jobs: int
+        :param max_pending_jobs: Max number of jobs waiting to run, submit raises over this limit.
+        :type max_pending_jobs: int
+        :param retention_seconds: Finished jobs are removed after this amount of time in seconds.
+        :type retention_seconds: float
+        """
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="config-modules-job"
+        )
+        self._max_pending_jobs = max_pending_jobs
+        self._retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    @classmethod
+    def get_instance(cls) -> "JobManager":
+        """
+        Get the job manager of the process, created from the [service.jobs] config on first use.
+        :return: The job manager.
+        :rtype: JobManager
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                config = Config.get_section(JOBS_CONFIG_SECTION)
+                cls._instance = JobManager(
+                    config.getint("MaxConcurrentJobs"),
+                    config.getint("MaxPendingJobs"),
+                    config.getfloat("RetentionSeconds"),
+                )
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls):
+        """
+        Shutdown the job manager of the process, if created, see :meth:`shutdown`.
+        """
+        with cls._instance_lock:
+            instance, cls._instance = cls._instance, None
+        if instance is not None:
+            instance.shutdown()
+
+    @classmethod
+    def get_instance_job_counts(cls) -> dict:
+        """
+        Get the number of pending and running jobs of the job manager of the process, exported as metrics.
+        :return: Dict of ('pending' or 'running',) to number of jobs, empty if the job manager is not created.
+        :rtype: dict
+        """
+        instance = cls._instance
+        if instance is None:
+            return {}
+        with instance._lock:
+            statuses = [job.status for job in instance._jobs.values()]
+        return {(status.value.lower(),): statuses.count(status) for status in (JobStatus.PENDING, JobStatus.RUNNING)}
+
+    def submit(self, operation: str, targets: Dict[str, Callable]) -> Job:
+        """
+        Submit a job running the operation on the targets.
+        :param operation: Name of the operation.
+        :type operation: str
+        :param targets: Dict of target name to function running the operation on the target, returning its response.
+        :type targets: dict
+        :return: The submitted job.
+        :rtype: Job
+        :raises Exception: If max_pending_jobs jobs are already waiting to run.
+        """
+        job = Job(operation, targets)
+        with self._lock:
+            self._remove_expired_locked()
+            pending_jobs = sum(1 for other_job in self._jobs.values() if other_job.status == JobStatus.PENDING)
+            if pending_jobs >= self._max_pending_jobs:
+                raise Exception(f"Too many pending jobs ({pending_jobs}), retry later")
+            self._jobs[job.id] = job
+            job.submit_to(self._executor)
+        logger.info(f"Submitted job {job.id} running {operation} on {len(targets)} target(s)")
+        return job
+
+    def get(self, job_id: str) -> Job or None:
+        """
+        Get a job.
+        :param job_id: The job id.
+        :type job_id: str
+        :return: The job, None if not found or expired.
+        :rtype: Job or None
+        """
+        with self._lock:
+            self._remove_expired_locked()
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> list:
+        """
+        Get all jobs, most recent first.
+        :return: List of jobs.
+        :rtype: list
+        """
+        with self._lock:
+            self._remove_expired_locked()
+            return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> Job or None:
+        """
+        Request cancellation of a job, see :meth:`Job.cancel`.
+        :param job_id: The job id.
+        :type job_id: str
+        :return: The job, None if not found or expired.
+        :rtype: Job or None
+        """
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+            logger.info(f"Cancellation requested for job {job_id}")
+        return job
+
+    def shutdown(self, wait: bool = True):
+        """
+        Cancel the pending jobs, request cancellation of the running jobs and stop the executor.
+        :param wait: Wait for the running jobs to complete their current target.
+        :type wait: bool
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=wait)
+
+    def _remove_expired_locked(self):
+        now = time.time()
+        for job_id in [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished is not None and now - job.finished > self._retention_seconds
+        ]:
+            del self._jobs[job_id]
+
+
+metrics.BACKGROUND_JOBS.set_function(JobManager.get_instance_job_counts)
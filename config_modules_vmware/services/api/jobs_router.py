@@ -0,0 +1,279 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Routes submitting ControllerInterface operations as background jobs and polling or streaming their status and
+results. Included in the FastAPI app with ``app.include_router(jobs_router.router)``.
+"""
+import hashlib
+import json
+import time
+from enum import Enum
+from typing import List
+from typing import Optional
+
+from fastapi import APIRouter
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic import Field
+
+from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
+from config_modules_vmware.framework.auth.contexts.esxi_context import EsxiContext
+from config_modules_vmware.framework.auth.contexts.sddc_manager_context import SDDCManagerContext
+from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
+from config_modules_vmware.framework.auth.contexts.vrslcm_context import VrslcmContext
+from config_modules_vmware.interfaces.controller_interface import ControllerInterface
+from config_modules_vmware.services.api.jobs import FINISHED_STATUSES
+from config_modules_vmware.services.api.jobs import JobManager
+from config_modules_vmware.services.api.jobs import JOBS_CONFIG_SECTION
+from config_modules_vmware.services.api.result_cache import CACHE_AGE_SECONDS
+from config_modules_vmware.services.api.result_cache import ResultCache
+from config_modules_vmware.services.config import Config
+
+# Interval in seconds between two keep-alive events of a job stream without update.
+STREAM_KEEP_ALIVE_SECONDS = 15
+
+router = APIRouter()
+
+
+class JobOperation(str, Enum):
+    """
+    Enum class for the operations run by jobs.
+    """
+
+    GET_CURRENT = "get_current_configuration"
+    CHECK_COMPLIANCE = "check_compliance"
+    REMEDIATE = "remediate_with_desired_state"
+
+
+class JobTarget(BaseModel):
+    """
+    Target of a job and the credentials to connect to it. For ESXi, the hostname and credentials are the vCenter ones.
+    """
+
+    product: BaseContext.ProductEnum
+    hostname: str
+    username: Optional[str] = None
+    password: Optional[str] = Field(default=None, repr=False)
+    ssl_thumbprint: Optional[str] = None
+    verify_ssl: bool = True
+    esxi_host_names: Optional[List[str]] = None
+
+
+class JobRequest(BaseModel):
+    """
+    Request submitting a job.
+    """
+
+    operation: JobOperation
+    targets: List[JobTarget] = Field(min_length=1)
+    desired_state_spec: Optional[dict] = None
+    template: Optional[dict] = None
+    # Serve get_current_configuration and check_compliance from the result cache, when enabled.
+    use_cache: bool = True
+
+
+def _create_context(target: JobTarget) -> BaseContext:
+    if target.product == BaseContext.ProductEnum.VCENTER:
+        return VcenterContext(
+            hostname=target.hostname,
+            username=target.username,
+            password=target.password,
+            ssl_thumbprint=target.ssl_thumbprint,
+            verify_ssl=target.verify_ssl,
+        )
+    elif target.product == BaseContext.ProductEnum.ESXI:
+        return EsxiContext(
+            vc_hostname=target.hostname,
+            vc_username=target.username,
+            vc_password=target.password,
+            vc_ssl_thumbprint=target.ssl_thumbprint,
+            esxi_host_names=target.esxi_host_names,
+            verify_ssl=target.verify_ssl,
+        )
+    elif target.product == BaseContext.ProductEnum.SDDC_MANAGER:
+        return SDDCManagerContext(
+            hostname=target.hostname,
+            username=target.username,
+            password=target.password,
+            ssl_thumbprint=target.ssl_thumbprint,
+            verify_ssl=target.verify_ssl,
+        )
+    elif target.product == BaseContext.ProductEnum.VRSLCM:
+        return VrslcmContext(target.hostname)
+    elif target.product in (BaseContext.ProductEnum.NSXT_MANAGER, BaseContext.ProductEnum.NSXT_EDGE):
+        return BaseContext(target.product, hostname=target.hostname)
+    raise Exception(f"Unsupported product {target.product.value}")
+
+
+def _get_target_name(target: JobTarget) -> str:
+    # the hostname of an ESXi target is its vCenter, several targets can split the hosts of a vCenter
+    target_name = f"{target.product.value}:{target.hostname}"
+    if target.esxi_host_names:
+        target_name = f"{target_name}/{','.join(target.esxi_host_names)}"
+    return target_name
+
+
+def _split_target(target: JobTarget) -> List[JobTarget]:
+    # a job reports progress and is cancelled between targets, the hosts of an ESXi target are split in batches
+    batch_size = Config.get_section(JOBS_CONFIG_SECTION).getint("EsxiHostBatchSize", fallback=0)
+    if target.product != BaseContext.ProductEnum.ESXI or not target.esxi_host_names or batch_size <= 0:
+        return [target]
+    host_names = target.esxi_host_names
+    return [
+        target.model_copy(update={"esxi_host_names": host_names[i : i + batch_size]})
+        for i in range(0, len(host_names), batch_size)
+    ]
+
+
+def _get_cache_target(target: JobTarget) -> str:
+    # results are invalidated per product and hostname, a remediation of some ESXi hosts invalidates all ESXi
+    # results of the vCenter
+    return f"{target.product.value}:{target.hostname}"
+
+
+def _get_cache_target_options(target: JobTarget) -> dict:
+    # the password is only kept as a digest, a cached result is only served to callers with the credentials and TLS
+    # settings it was computed with
+    password_digest = hashlib.sha256(target.password.encode("utf-8")).hexdigest() if target.password else None
+    return {
+        "username": target.username,
+        "password_digest": password_digest,
+        "ssl_thumbprint": target.ssl_thumbprint,
+        "verify_ssl": target.verify_ssl,
+        "esxi_host_names": sorted(target.esxi_host_names or []),
+    }
+
+
+def _run_operation(job_request: JobRequest, target: JobTarget) -> dict:
+    result_cache = ResultCache.get_instance()
+    if result_cache is None:
+        return _run_operation_on_target(job_request, target)
+    cache_target = _get_cache_target(target)
+    if job_request.operation == JobOperation.REMEDIATE:
+        try:
+            return _run_operation_on_target(job_request, target)
+        finally:
+            result_cache.invalidate_target(cache_target)
+    spec = job_request.template if job_request.operation == JobOperation.GET_CURRENT else job_request.desired_state_spec
+    key = ResultCache.make_key(
+        cache_target,
+        job_request.operation.value,
+        spec,
+        target_options=_get_cache_target_options(target),
+    )
+    if job_request.use_cache:
+        result = result_cache.get(key)
+        if result is not None:
+            return result
+    started = time.monotonic()
+    result = _run_operation_on_target(job_request, target)
+    result_cache.put(key, result, started)
+    return dict(result, **{CACHE_AGE_SECONDS: 0})
+
+
+def _run_operation_on_target(job_request: JobRequest, target: JobTarget) -> dict:
+    with _create_context(target) as context:
+        controller_interface = ControllerInterface(context)
+        if job_request.operation == JobOperation.GET_CURRENT:
+            return controller_interface.get_current_configuration(template=job_request.template)
+        elif job_request.operation == JobOperation.CHECK_COMPLIANCE:
+            return controller_interface.check_compliance(job_request.desired_state_spec)
+        return controller_interface.remediate_with_desired_state(job_request.desired_state_spec)
+
+
+def _get_job(job_id: str):
+    job = JobManager.get_instance().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.post("/jobs", status_code=202)
+def submit_job(job_request: JobRequest) -> dict:
+    """
+    Submit a job running the operation on each target, one target after the other. The hosts of ESXi targets listing
+    their hosts are split in targets of at most 'EsxiHostBatchSize' hosts. Targets are named '<product>:<hostname>',
+    followed by '/<ESXi hosts>' for ESXi targets listing their hosts.
+    :param job_request: The job request.
+    :type job_request: JobRequest
+    :return: The submitted job.
+    :rtype: dict
+    """
+    targets = {}
+    for target in (split_target for target in job_request.targets for split_target in _split_target(target)):
+        target_name = _get_target_name(target)
+        if target_name in targets:
+            raise HTTPException(status_code=422, detail=f"Duplicate target {target_name}")
+        targets[target_name] = lambda target=target: _run_operation(job_request, target)
+    try:
+        job = JobManager.get_instance().submit(job_request.operation.value, targets)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return job.to_dict()
+
+
+@router.get("/jobs")
+def list_jobs() -> list:
+    """
+    Get the status of all jobs, most recent first.
+    :return: List of jobs, without their results.
+    :rtype: list
+    """
+    return [job.to_dict(include_results=False) for job in JobManager.get_instance().list_jobs()]
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str) -> dict:
+    """
+    Get the status of a job and the results of its completed targets.
+    :param job_id: The job id.
+    :type job_id: str
+    :return: The job.
+    :rtype: dict
+    """
+    return _get_job(job_id).to_dict()
+
+
+@router.get("/jobs/{job_id}/events")
+def stream_job(job_id: str) -> StreamingResponse:
+    """
+    Stream the job as newline delimited json, one line per update until the job is finished. Each line holds the job
+    and the results of the targets completed since the previous line.
+    :param job_id: The job id.
+    :type job_id: str
+    :return: The streaming response.
+    :rtype: StreamingResponse
+    """
+    job = _get_job(job_id)
+
+    def generate_events():
+        version = 0
+        sent_results = set()
+        while True:
+            version = job.wait_for_update(version, STREAM_KEEP_ALIVE_SECONDS)
+            job_dict = job.to_dict()
+            job_dict["results"] = {
+                target: result for target, result in job_dict["results"].items() if target not in sent_results
+            }
+            sent_results.update(job_dict["results"])
+            job_dict["time"] = time.time()
+            yield json.dumps(job_dict, default=str) + "\n"
+            if job.status in FINISHED_STATUSES:
+                return
+
+    return StreamingResponse(generate_events(), media_type="application/x-ndjson")
+
+
+@router.delete("/jobs/{job_id}")
+def cancel_job(job_id: str) -> dict:
+    """
+    Cancel a job. A pending job is cancelled right away, a running job is cancelled once its current target completes.
+    :param job_id: The job id.
+    :type job_id: str
+    :return: The job.
+    :rtype: dict
+    """
+    job = JobManager.get_instance().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.to_dict()
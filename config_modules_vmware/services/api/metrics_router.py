@@ -0,0 +1,21 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Route exporting the metrics registry of the API service process in the Prometheus text format.
+Included in the FastAPI app with ``app.include_router(metrics_router.router)``.
+"""
+from fastapi import APIRouter
+from fastapi import Response
+
+from config_modules_vmware.framework.utils import metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Get the metrics of the process in the Prometheus text exposition format.
+    :return: Metrics response.
+    :rtype: Response
+    """
+    return Response(content=metrics.REGISTRY.generate_text(), media_type=metrics.CONTENT_TYPE)
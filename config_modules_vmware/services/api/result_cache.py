@@ -0,0 +1,163 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Cache of the responses of the API service operations, so dashboards repeating the same request on the same targets
+do not run every controller again against the targets.
+
+Responses are keyed by target, operation, hash of the canonical desired state spec or template and metadata filter,
+expire after a TTL and are evicted least recently used first once the cache is full. A remediation invalidates all
+responses cached for its target.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from config_modules_vmware.framework.logging.logger_adapter import LoggerAdapter
+from config_modules_vmware.services.config import Config
+
+logger = LoggerAdapter(logging.getLogger(__name__))
+
+RESULT_CACHE_CONFIG_SECTION = "service.result_cache"
+# Key added to the responses served from the cache.
+CACHE_AGE_SECONDS = "cache_age_seconds"
+# Statuses of the responses never cached, so a transient failure is retried on the next request.
+_UNCACHED_STATUSES = ("FAILED", "ERROR")
+
+
+def get_spec_hash(spec) -> str:
+    """
+    Get the hash of the canonical json of a desired state spec or template, independent of the order of its keys.
+    :param spec: The desired state spec or template.
+    :type spec: dict
+    :return: The hex digest of the spec.
+    :rtype: str
+    """
+    canonical_spec = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical_spec.encode("utf-8")).hexdigest()
+
+
+class ResultCache(object):
+    """
+    Size bounded LRU cache of operation responses with a TTL. Shared by the job threads, so access is serialized.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """
+        :param ttl_seconds: Responses expire after this amount of time in seconds.
+        :type ttl_seconds: float
+        :param max_entries: Max number of cached responses, the least recently used are evicted over it.
+        :type max_entries: int
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (creation time, response), least recently used first
+        self._entries = OrderedDict()
+        # target -> time of its last invalidation
+        self._invalidated = {}
+
+    @classmethod
+    def get_instance(cls) -> "ResultCache" or None:
+        """
+        Get the result cache of the process, created from the [service.result_cache] config on first use.
+        :return: The result cache, None if disabled in config.
+        :rtype: ResultCache or None
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                config = Config.get_section(RESULT_CACHE_CONFIG_SECTION)
+                if not config.getboolean("Enabled", fallback=False):
+                    return None
+                cls._instance = ResultCache(config.getfloat("TTLSeconds"), config.getint("MaxEntries"))
+            return cls._instance
+
+    @staticmethod
+    def make_key(target: str, operation: str, spec=None, metadata_filter=None, target_options=None) -> tuple:
+        """
+        Build the cache key of an operation response.
+        :param target: Name of the target, responses are invalidated per target name.
+        :type target: str
+        :param operation: Name of the operation.
+        :type operation: str
+        :param spec: Desired state spec or template of the operation.
+        :type spec: dict
+        :param metadata_filter: Function used to filter controllers, keyed by identity.
+        :type metadata_filter: Callable[[ControllerMetadata], bool]
+        :param target_options: Options of the target changing its responses, e.g. the ESXi hosts or the user.
+        :type target_options: dict
+        :return: Cache key.
+        :rtype: tuple
+        """
+        return target, operation, get_spec_hash(spec), metadata_filter, get_spec_hash(target_options)
+
+    def get(self, key: tuple) -> dict or None:
+        """
+        Get a cached response.
+        :param key: Cache key, see :meth:`make_key`.
+        :type key: tuple
+        :return: Copy of the response with its age in seconds in 'cache_age_seconds', None if not cached or expired.
+        :rtype: dict or None
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created, response = entry
+            if now - created > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return dict(response, **{CACHE_AGE_SECONDS: round(now - created, 3)})
+
+    def put(self, key: tuple, response: dict, started: float = None):
+        """
+        Cache a response, unless it failed or its target was invalidated while the operation was running.
+        :param key: Cache key, see :meth:`make_key`.
+        :type key: tuple
+        :param response: The operation response.
+        :type response: dict
+        :param started: The :func:`time.monotonic` time the operation started at, the response is cached as of it.
+        :type started: float
+        """
+        status = response.get("status")
+        if getattr(status, "value", status) in _UNCACHED_STATUSES:
+            return
+        created = time.monotonic() if started is None else started
+        with self._lock:
+            if created <= self._invalidated.get(key[0], float("-inf")):
+                return
+            self._entries[key] = (created, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_target(self, target: str) -> int:
+        """
+        Remove the responses cached for a target, e.g. after a remediation ran on it.
+        :param target: Name of the target as given to :meth:`make_key`.
+        :type target: str
+        :return: Number of removed responses.
+        :rtype: int
+        """
+        with self._lock:
+            self._invalidated[target] = time.monotonic()
+            keys = [key for key in self._entries if key[0] == target]
+            for key in keys:
+                del self._entries[key]
+        if keys:
+            logger.info(f"Invalidated {len(keys)} cached response(s) of {target}")
+        return len(keys)
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._invalidated.clear()
@@ -0,0 +1,193 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+"""
+Logging of the API service process, configured from the [service.logging.*] config sections.
+
+With [service.logging.async] enabled, request threads only put the log records on a queue and a single listener
+thread writes them to the log file and the console in batches, so requests never block on file I/O.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
+
+from config_modules_vmware.services.config import Config
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(name)s - %(message)s"
+
+_lock = threading.Lock()
+# Handlers added to the root logger and listener of the queue, if any, of the current configuration.
+_handlers = []
+_listener = None
+
+
+class BatchingRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler tracking the size of the file in bytes instead of seeking it for every record, and optionally
+    leaving the flush of the file to the caller so records can be written in batches.
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int, flush_each_record: bool = True):
+        """
+        :param filename: Path of the log file.
+        :type filename: str
+        :param max_bytes: The file is rotated before reaching this size in bytes, 0 to never rotate.
+        :type max_bytes: int
+        :param backup_count: Number of rotated files kept.
+        :type backup_count: int
+        :param flush_each_record: Flush the file after each record, otherwise flush has to be called by the caller.
+        :type flush_each_record: bool
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self._flush_each_record = flush_each_record
+        self._size = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+                self._size = self.stream.tell()
+            # the file is encoded, non ascii characters take several bytes
+            msg_size = len(msg.encode(self.encoding))
+            if self.maxBytes > 0 and self._size and self._size + msg_size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                self._size = 0
+            self.stream.write(msg)
+            self._size += msg_size
+            if self._flush_each_record:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:  # pylint: disable=W0703
+            self.handleError(record)
+
+
+class BlockingQueueHandler(QueueHandler):
+    """
+    QueueHandler waiting for room in a bounded queue instead of dropping the record when the queue is full.
+    """
+
+    def enqueue(self, record):
+        self.queue.put(record)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    QueueListener handling the records available in the queue in batches and flushing the handlers once per batch.
+    All records put in the queue before stop is called are handled.
+    """
+
+    def __init__(self, record_queue: queue.Queue, *handlers, batch_size: int = 100):
+        super().__init__(record_queue, *handlers, respect_handler_level=True)
+        self._batch_size = max(batch_size, 1)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def _monitor(self):
+        stopped = False
+        while not stopped:
+            batch = [self.dequeue(True)]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    stopped = True
+                else:
+                    self.handle(record)
+                self.queue.task_done()
+            if stopped:
+                # Records put by threads which got the queue handler before it was removed from the root logger.
+                self._handle_remaining()
+            for handler in self.handlers:
+                handler.flush()
+
+    def _handle_remaining(self):
+        while True:
+            try:
+                record = self.dequeue(False)
+            except queue.Empty:
+                return
+            self.handle(record)
+            self.queue.task_done()
+
+
+def configure_logging():
+    """
+    Configure the root logger of the API service with the rotating file and console handlers of the config, through
+    a queue and a listener thread when async logging is enabled. Replaces the previous configuration, if any. The
+    queue is drained by shutdown_logging, also called at exit.
+    """
+    global _listener  # pylint: disable=W0603
+    file_config = Config.get_section("service.logging.file")
+    console_config = Config.get_section("service.logging.console")
+    async_config = Config.get_section("service.logging.async")
+    async_enabled = async_config.getboolean("Enabled", fallback=False)
+
+    log_file_dir = file_config.get("LogFileDir")
+    os.makedirs(log_file_dir, exist_ok=True)
+    file_handler = BatchingRotatingFileHandler(
+        os.path.join(log_file_dir, file_config.get("FileName")),
+        max_bytes=file_config.getint("FileSize"),
+        backup_count=file_config.getint("MaxCount"),
+        flush_each_record=not async_enabled,
+    )
+    file_handler.setLevel(file_config.get("LogLevel"))
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_config.get("LogLevel"))
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+
+    shutdown_logging()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(min(file_handler.level, console_handler.level))
+    with _lock:
+        if async_enabled:
+            record_queue = queue.Queue(maxsize=async_config.getint("QueueSize", fallback=10000))
+            _listener = BatchingQueueListener(
+                record_queue,
+                file_handler,
+                console_handler,
+                batch_size=async_config.getint("BatchSize", fallback=100),
+            )
+            _listener.start()
+            queue_handler = BlockingQueueHandler(record_queue)
+            queue_handler.setLevel(root_logger.level)
+            _handlers.append(queue_handler)
+        else:
+            _handlers.extend((file_handler, console_handler))
+        for handler in _handlers:
+            root_logger.addHandler(handler)
+
+
+def shutdown_logging():
+    """
+    Remove the handlers added by configure_logging from the root logger, then write all queued records and close the
+    handlers. No-op if logging is not configured.
+    """
+    global _listener  # pylint: disable=W0603
+    with _lock:
+        root_logger = logging.getLogger()
+        handlers = list(_handlers)
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+        _handlers.clear()
+        if _listener is not None:
+            _listener.stop()
+            handlers.extend(_listener.handlers)
+            _listener = None
+        for handler in handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -28,15 +28,15 @@ def control_config_compliance_check(control_config, product, auth_context=None):
         optional auth context to access product.
     """
 
-    logger.info("Running check compliance workflow...")
     if not auth_context:
-        config = __opts__
-        auth_context = compliance_control_util.create_auth_context(config=config, product=product)
+        with compliance_control_util.lease_auth_context(config=__opts__, product=product) as auth_context:
+            return control_config_compliance_check(control_config, product, auth_context=auth_context)
 
+    logger.info("Running check compliance workflow...")
     try:
         controller_interface_obj = ControllerInterface(auth_context)
         response_check_compliance = controller_interface_obj.check_compliance(desired_state_spec=control_config)
-        logger.debug(f"Response for compliance check {response_check_compliance}")
+        logger.debug("Response for compliance check %s", response_check_compliance)
         return response_check_compliance
     except Exception as exc:
         logger.error(f"Compliance check encountered an error: {str(exc)}")
@@ -56,16 +56,15 @@ def control_config_remediate(control_config, product, auth_context=None):
         Optional auth context to access product.
     """
 
-    logger.info("Running remediation workflow...")
-
     if not auth_context:
-        config = __opts__
-        auth_context = compliance_control_util.create_auth_context(config=config, product=product)
+        with compliance_control_util.lease_auth_context(config=__opts__, product=product) as auth_context:
+            return control_config_remediate(control_config, product, auth_context=auth_context)
 
+    logger.info("Running remediation workflow...")
     try:
         controller_interface_obj = ControllerInterface(auth_context)
         response_remediate = controller_interface_obj.remediate_with_desired_state(desired_state_spec=control_config)
-        logger.debug(f"Remediation response {response_remediate}")
+        logger.debug("Remediation response %s", response_remediate)
         return response_remediate
 
     except Exception as exc:
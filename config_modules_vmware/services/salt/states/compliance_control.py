@@ -1,5 +1,4 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
-import json
 import logging
 
 import config_modules_vmware.services.salt.utils.compliance_control as compliance_control_util
@@ -18,6 +17,110 @@ def __virtual__():
     return __virtualname__
 
 
+def _check_product_control(name, compliance_config, product, ids=None):
+    """
+    Check or remediate the control config of a single product, using the cached auth context of the product.
+    Returns the state return dict.
+    """
+    product_control_config = compliance_config.get(product)
+    if not product_control_config:
+        err_msg = f"Desired spec is empty for {product}"
+        logger.error(err_msg)
+        return {
+            "name": name,
+            "result": None,
+            "changes": {},
+            "comment": err_msg,
+        }
+    control_config = {
+        "compliance_config": {product: compliance_control_util.copy_control_config(product_control_config)}
+    }
+    with compliance_control_util.lease_auth_context(config=__opts__, product=product, ids=ids) as auth_context:
+        return _run_product_control(name, control_config, product, auth_context)
+
+
+def _run_product_control(name, control_config, product, auth_context):
+    """
+    Check or remediate the control config of a single product with the given auth context.
+    Returns the state return dict.
+    """
+    if __opts__["test"]:
+        # If in test mode, perform audit
+        logger.info("Running in test mode. Performing check compliance.")
+        compliance_response = __salt__["vmware_compliance_control.control_config_compliance_check"](
+            control_config=control_config,
+            product=product,
+            auth_context=auth_context,
+        )
+
+        compliance_status = compliance_response["status"]
+        logger.debug(f"Compliance check completed with {compliance_status} status.")
+        if compliance_status == ComplianceStatus.COMPLIANT or compliance_status == ComplianceStatus.SKIPPED:
+            ret = {
+                "name": name,
+                "result": True,
+                "comment": compliance_status,
+                "changes": compliance_response.get("changes", {}),
+            }
+        elif compliance_status == ComplianceStatus.NON_COMPLIANT or compliance_status == ComplianceStatus.FAILED:
+            ret = {
+                "name": name,
+                "result": (None if compliance_status == ComplianceStatus.NON_COMPLIANT else False),
+                "comment": compliance_status,
+                "changes": compliance_response.get("changes", {}),
+            }
+        else:
+            # Exception running compliance workflow
+            ret = {
+                "name": name,
+                "result": False,
+                "comment": compliance_status,
+                "changes": {"message": compliance_response.get("message", "Exception running compliance.")},
+            }
+    else:
+        # Not in test mode, proceed with pre-check and remediation
+        logger.debug("Performing remediation.")
+        remediate_response = __salt__["vmware_compliance_control.control_config_remediate"](
+            control_config=control_config,
+            product=product,
+            auth_context=auth_context,
+        )
+        remediate_status = remediate_response["status"]
+        logger.debug(f"Remediation completed with {remediate_status} status.")
+        if remediate_status == RemediateStatus.SUCCESS or remediate_status == RemediateStatus.SKIPPED:
+            ret = {
+                "name": name,
+                "result": True,
+                "comment": remediate_status,
+                "changes": remediate_response.get("changes", {}),
+            }
+        elif remediate_status == RemediateStatus.FAILED or remediate_status == RemediateStatus.PARTIAL:
+            ret = {
+                "name": name,
+                "result": False,
+                "comment": remediate_status,
+                "changes": remediate_response.get("changes", {}),
+            }
+        else:
+            # Exception running remediation workflow
+            ret = {
+                "name": name,
+                "result": False,
+                "comment": remediate_status,
+                "changes": {
+                    "message": remediate_response.get("message", "Exception running remediation."),
+                },
+            }
+    return ret
+
+
+def _get_compliance_config(control_config):
+    compliance_config = control_config.get("compliance_config") if isinstance(control_config, dict) else None
+    if not isinstance(compliance_config, dict) or not compliance_config:
+        raise Exception("Desired spec is empty or not in correct format")
+    return compliance_config
+
+
 def check_control(name, control_config, product, ids=None):
     """
     Check and apply vcenter control configs. Control config can be ntp, dns, syslog, etc.
@@ -35,96 +138,9 @@ def check_control(name, control_config, product, ids=None):
 
     logger.info(f"Starting compliance check for {name}")
 
-    config = __opts__
-    auth_context = compliance_control_util.create_auth_context(config=config, product=product, ids=ids)
-    control_config = json.loads(json.dumps(control_config))
-
     try:
-        compliance_config = control_config.get("compliance_config")
-        if not isinstance(compliance_config, dict) or not compliance_config:
-            raise Exception("Desired spec is empty or not in correct format")
-        else:
-            product_control_config = control_config.get("compliance_config", {}).get(product)
-            if product_control_config:
-                control_config = {"compliance_config": {product: product_control_config}}
-            else:
-                err_msg = f"Desired spec is empty for {product}"
-                logger.error(err_msg)
-                return {
-                    "name": name,
-                    "result": None,
-                    "changes": {},
-                    "comment": err_msg,
-                }
-
-        if __opts__["test"]:
-            # If in test mode, perform audit
-            logger.info("Running in test mode. Performing check compliance.")
-            compliance_response = __salt__["vmware_compliance_control.control_config_compliance_check"](
-                control_config=control_config,
-                product=product,
-                auth_context=auth_context,
-            )
-
-            compliance_status = compliance_response["status"]
-            logger.debug(f"Compliance check completed with {compliance_status} status.")
-            if compliance_status == ComplianceStatus.COMPLIANT or compliance_status == ComplianceStatus.SKIPPED:
-                ret = {
-                    "name": name,
-                    "result": True,
-                    "comment": compliance_status,
-                    "changes": compliance_response.get("changes", {}),
-                }
-            elif compliance_status == ComplianceStatus.NON_COMPLIANT or compliance_status == ComplianceStatus.FAILED:
-                ret = {
-                    "name": name,
-                    "result": (None if compliance_status == ComplianceStatus.NON_COMPLIANT else False),
-                    "comment": compliance_status,
-                    "changes": compliance_response.get("changes", {}),
-                }
-            else:
-                # Exception running compliance workflow
-                ret = {
-                    "name": name,
-                    "result": False,
-                    "comment": compliance_status,
-                    "changes": {"message": compliance_response.get("message", "Exception running compliance.")},
-                }
-        else:
-            # Not in test mode, proceed with pre-check and remediation
-            logger.debug("Performing remediation.")
-            remediate_response = __salt__["vmware_compliance_control.control_config_remediate"](
-                control_config=control_config,
-                product=product,
-                auth_context=auth_context,
-            )
-            remediate_status = remediate_response["status"]
-            logger.debug(f"Remediation completed with {remediate_status} status.")
-            if remediate_status == RemediateStatus.SUCCESS or remediate_status == RemediateStatus.SKIPPED:
-                ret = {
-                    "name": name,
-                    "result": True,
-                    "comment": remediate_status,
-                    "changes": remediate_response.get("changes", {}),
-                }
-            elif remediate_status == RemediateStatus.FAILED or remediate_status == RemediateStatus.PARTIAL:
-                ret = {
-                    "name": name,
-                    "result": False,
-                    "comment": remediate_status,
-                    "changes": remediate_response.get("changes", {}),
-                }
-            else:
-                # Exception running remediation workflow
-                ret = {
-                    "name": name,
-                    "result": False,
-                    "comment": remediate_status,
-                    "changes": {
-                        "message": remediate_response.get("message", "Exception running remediation."),
-                    },
-                }
-
+        compliance_config = _get_compliance_config(control_config)
+        ret = _check_product_control(name, compliance_config, product, ids=ids)
     except Exception as e:
         # Exception occurred
         error_message = f"An error occurred: {str(e)}"
@@ -137,3 +153,62 @@ def check_control(name, control_config, product, ids=None):
 
     logger.debug(f"Completed workflow for {name}")
     return ret
+
+
+def check_controls(name, control_config, products=None, ids=None):
+    """
+    Check and apply the control configs of several products in one state.
+    Return control compliance responses if test=true. Otherwise, return remediate responses.
+    The state result is False if any product failed, None if any product is non-compliant, True otherwise.
+
+    name
+        Config name
+    control_config
+        control config dict object, with the control configs of all products.
+    products
+        Optional list of appliance names to check. Defaults to all products in the control config.
+    ids
+        List of product ids within the parent product.
+    """
+
+    logger.info(f"Starting compliance check for {name}")
+
+    try:
+        compliance_config = _get_compliance_config(control_config)
+    except Exception as e:
+        # Exception occurred
+        error_message = f"An error occurred: {str(e)}"
+        return {
+            "name": name,
+            "result": False,
+            "changes": {},
+            "comment": error_message,
+        }
+
+    results = []
+    comments = []
+    changes = {}
+    for product in products or list(compliance_config):
+        try:
+            product_ret = _check_product_control(name, compliance_config, product, ids=ids)
+        except Exception as e:
+            product_ret = {"result": False, "changes": {}, "comment": f"An error occurred: {str(e)}"}
+        results.append(product_ret["result"])
+        comments.append(f"{product}: {product_ret['comment']}")
+        if product_ret["changes"]:
+            changes[product] = product_ret["changes"]
+
+    if False in results:
+        result = False
+    elif None in results:
+        result = None
+    else:
+        result = True
+
+    logger.debug(f"Completed workflow for {name}")
+    return {
+        "name": name,
+        "result": result,
+        "changes": changes,
+        "comment": "; ".join(comments),
+    }
@@ -1,5 +1,10 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+import atexit
+import contextlib
+import hashlib
 import logging
+import threading
+import time
 
 import salt.exceptions
 
@@ -10,9 +15,29 @@ from config_modules_vmware.framework.auth.contexts.sddc_manager_context import (
 )
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.auth.contexts.vrslcm_context import VrslcmContext
+from config_modules_vmware.services.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Auth contexts shared by the states and execution module calls of a salt job in this minion process,
+# key -> _CachedAuthContext
+_auth_context_cache = {}
+_auth_context_cache_lock = threading.Lock()
+_close_auth_contexts_registered = False
+
+
+class _CachedAuthContext:
+    """
+    Cached auth context and the number of callers using it. An expired context is removed from the cache and only
+    exited once its last caller is done with it.
+    """
+
+    def __init__(self, auth_context, created):
+        self.auth_context = auth_context
+        self.created = created
+        self.leases = 0
+        self.expired = False
+
 
 def _create_vcenter_context(conf, fqdn):
     return VcenterContext(
@@ -62,12 +87,31 @@ def _get_conf(config, product):
     )
 
 
+def _get_fqdn(config, conf):
+    # Fetch fqdn from grains if available
+    return config.get("grains", {}).get("fqdn") or conf.get("host")
+
+
+def _get_auth_context_cache_key(config, product, ids=None):
+    conf = _get_conf(config, product)
+    password = conf.get("password")
+    return (
+        # contexts are not shared across jobs, so a job never sees inventory cached by a previous or concurrent job
+        config.get("jid"),
+        product,
+        _get_fqdn(config, conf),
+        tuple(sorted(ids)) if ids else None,
+        conf.get("user"),
+        # only a digest of the password is kept, so a changed password never reuses a stale context
+        hashlib.sha256(password.encode("utf-8")).hexdigest() if password else None,
+        conf.get("ssl_thumbprint"),
+        conf.get("verify_ssl", True),
+    )
+
+
 def _create_product_context(config, product, ids=None):
     conf = _get_conf(config, product)
-    # Fetch fqdn from grains if available
-    fqdn = config.get("grains", {}).get("fqdn")
-    if not fqdn:
-        fqdn = conf.get("host")
+    fqdn = _get_fqdn(config, conf)
     if product == BaseContext.ProductEnum.VCENTER.value:
         return _create_vcenter_context(conf, fqdn)
     elif product == BaseContext.ProductEnum.SDDC_MANAGER.value:
@@ -87,3 +131,95 @@ def _create_product_context(config, product, ids=None):
 def create_auth_context(config, product, ids=None):
     logger.debug(f"Creating auth context for product {product}")
     return _create_product_context(config=config, product=product, ids=ids)
+
+
+@contextlib.contextmanager
+def lease_auth_context(config, product, ids=None):
+    """
+    Lease the auth context for a product from the minion process cache, creating it on first use.
+    A highstate with several states against the same product then logs in once instead of once per state.
+    Cached contexts are keyed by salt job id ('jid' of the salt opts), so the inventory and alarm data cached on a
+    context is only seen by the states of one job, and expire after 'CacheTimeoutSeconds' of the
+    'salt.auth_context' config section. An expired context is exited once no caller leases it anymore, so a job
+    running longer than the timeout keeps its context. Calls outside of a job get a new context.
+
+    config
+        salt opts.
+    product
+        appliance name - vcenter, sddc-manager, etc.
+    ids
+        List of product ids within the parent product.
+    """
+    cache_timeout = Config.get_section("salt.auth_context").getint("CacheTimeoutSeconds")
+    if cache_timeout <= 0 or not config.get("jid"):
+        yield create_auth_context(config=config, product=product, ids=ids)
+        return
+    global _close_auth_contexts_registered
+    key = _get_auth_context_cache_key(config, product, ids)
+    with _auth_context_cache_lock:
+        if not _close_auth_contexts_registered:
+            atexit.register(close_auth_contexts)
+            _close_auth_contexts_registered = True
+        now = time.monotonic()
+        # contexts of finished jobs are never requested again, remove all expired contexts and exit the idle ones
+        idle_contexts = []
+        for expired_key, cached in list(_auth_context_cache.items()):
+            if now - cached.created > cache_timeout:
+                del _auth_context_cache[expired_key]
+                cached.expired = True
+                if not cached.leases:
+                    idle_contexts.append(cached.auth_context)
+        cached = _auth_context_cache.get(key)
+        if cached:
+            logger.debug(f"Reusing cached auth context for product {product}")
+        else:
+            auth_context = create_auth_context(config=config, product=product, ids=ids)
+            auth_context.__enter__()
+            cached = _CachedAuthContext(auth_context, now)
+            _auth_context_cache[key] = cached
+        cached.leases += 1
+    for idle_context in idle_contexts:
+        _exit_auth_context(idle_context)
+    try:
+        yield cached.auth_context
+    finally:
+        with _auth_context_cache_lock:
+            cached.leases -= 1
+            exit_context = cached.expired and not cached.leases
+        if exit_context:
+            _exit_auth_context(cached.auth_context)
+
+
+def _exit_auth_context(auth_context):
+    try:
+        auth_context.__exit__(None, None, None)
+    except Exception as e:
+        logger.warning(f"Failed to close auth context: {str(e)}")
+
+
+def close_auth_contexts():
+    """
+    Exit all cached auth contexts, disconnecting their clients.
+    Registered to run when the minion process exits.
+    """
+    with _auth_context_cache_lock:
+        auth_contexts = [cached.auth_context for cached in _auth_context_cache.values()]
+        _auth_context_cache.clear()
+    for auth_context in auth_contexts:
+        _exit_auth_context(auth_context)
+
+
+def copy_control_config(control_config):
+    """
+    Copy a control config into plain dicts and lists, so the workflows can neither modify the caller's
+    pillar data nor receive salt specific container types.
+    Replaces a json dumps/loads round trip, without serializing the whole config to a string.
+
+    control_config
+        control config dict object, or any nested value of it.
+    """
+    if isinstance(control_config, dict):
+        return {key: copy_control_config(value) for key, value in control_config.items()}
+    if isinstance(control_config, (list, tuple)):
+        return [copy_control_config(value) for value in control_config]
+    return control_config
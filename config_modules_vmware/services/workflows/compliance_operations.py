@@ -1,5 +1,6 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 import logging
+from contextlib import nullcontext
 from typing import Callable
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
@@ -13,6 +14,7 @@ from config_modules_vmware.framework.models.controller_models.metadata import Co
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.get_current_response import GetCurrentConfigurationStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
+from config_modules_vmware.framework.utils.comparator import DesiredFingerprintCache
 from config_modules_vmware.schemas import schema_utility
 from config_modules_vmware.services.config import Config
 from config_modules_vmware.services.mapper import mapper_utils
@@ -55,7 +57,11 @@ class ComplianceOperations(OperationsInterface):
                 Operations.GET_CURRENT: GetCurrentConfigurationStatus.SUCCESS,
             }[operation]
             result = {consts.STATUS: default_status}
-            cls._esxi_workflow(result, input_values, context, operation, metadata_filter)
+            # The same desired spec is checked on every host, cache its fingerprints for the run.
+            # Not used for remediation, since controllers may modify the desired values while remediating.
+            fingerprint_cache = DesiredFingerprintCache() if operation == Operations.CHECK_COMPLIANCE else nullcontext()
+            with fingerprint_cache:
+                cls._esxi_workflow(result, input_values, context, operation, metadata_filter)
             # Remove empty result
             if not result[consts.RESULT]:
                 del result[consts.RESULT]
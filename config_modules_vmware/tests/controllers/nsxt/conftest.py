@@ -0,0 +1,3 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+# Shares the fake NSX admin CLI with the NSX controller tests.
+from config_modules_vmware.tests.framework.clients.nsxt.conftest import fake_nsx_admin_cli  # noqa: F401
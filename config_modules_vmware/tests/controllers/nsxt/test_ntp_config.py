@@ -7,6 +7,25 @@ from config_modules_vmware.framework.models.output_models.compliance_response im
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
 
+def create_admin_cli(current_servers, updated_servers):
+    """
+    Fake admin CLI, single commands print the current servers. An interactive session echoes the commands after the
+    prompt and its 'get ntp-servers' prints the updated servers.
+    """
+
+    def run_shell_cmd(command, timeout, input_to_stdin=None):
+        if input_to_stdin is None:
+            return current_servers, ""
+        output = ["NSX CLI (Manager, Policy, Controller 4.1.0.0.0). Press ? for command list or enter: help"]
+        for line in input_to_stdin.splitlines():
+            output.append(f"nsx-manager> {line}")
+            if line == "get ntp-servers":
+                output.append(updated_servers)
+        return "\n".join(output) + "\n", ""
+
+    return run_shell_cmd
+
+
 class TestNtpConfig:
 
     def setup_method(self):
@@ -53,11 +72,20 @@ class TestNtpConfig:
     @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
     def test_set_success(self, mock_run_shell_cmd):
         desired_value = {"servers": ["time.google.com"]}
-        mock_run_shell_cmd.side_effect = [("time.vmware.com", ""), ("", ""), ("", ""), ("time.google.com", "")]
+        mock_run_shell_cmd.side_effect = create_admin_cli("time.vmware.com", "time.google.com")
         status, errors = self.config.set(self.context, desired_value)
 
         assert status == RemediateStatus.SUCCESS
         assert not errors
+        # adds, deletes and read back in a single admin CLI session
+        assert mock_run_shell_cmd.call_count == 2
+        assert mock_run_shell_cmd.call_args.args[0] == "su admin"
+        script = mock_run_shell_cmd.call_args.kwargs["input_to_stdin"].splitlines()
+        assert script[:2] == ["set ntp-server time.google.com", "del ntp-server time.vmware.com"]
+        assert script[2].startswith("# config-modules-") and script[2].endswith(" begin")
+        assert script[3:4] == ["get ntp-servers"]
+        assert script[4] == script[2].replace(" begin", " end")
+        assert script[5:] == ["exit"]
 
     @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
     def test_set_current_value(self, mock_run_shell_cmd):
@@ -67,6 +95,7 @@ class TestNtpConfig:
 
         assert status == RemediateStatus.SUCCESS
         assert not errors
+        mock_run_shell_cmd.assert_called_once()
 
     @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
     def test_set_get_call_failed(self, mock_run_shell_cmd):
@@ -90,7 +119,7 @@ class TestNtpConfig:
     @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
     def test_set_validate_failed(self, mock_run_shell_cmd):
         desired_value = {"servers": ["time.google.com"]}
-        mock_run_shell_cmd.side_effect = [("time.vmware.com", ""), ("", ""), ("", ""), ("time.vmware.com", "")]
+        mock_run_shell_cmd.side_effect = create_admin_cli("time.vmware.com", "time.vmware.com")
         status, errors = self.config.set(self.context, desired_value)
 
         assert status == RemediateStatus.FAILED
@@ -100,8 +129,27 @@ class TestNtpConfig:
     @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
     def test_remediate(self, mock_run_shell_cmd):
         desired_value = {"servers": ["time.google.com"]}
-        mock_run_shell_cmd.side_effect = [("time.vmware.com", ""), ("time.vmware.com", ""), ("", ""), ("", ""),
-                                          ("time.google.com", "")]
+        mock_run_shell_cmd.side_effect = create_admin_cli("time.vmware.com", "time.google.com")
         status = self.config.remediate(self.context, desired_value)
 
         assert status.get(consts.STATUS) == RemediateStatus.SUCCESS
+
+    @patch('config_modules_vmware.framework.utils.utils.run_shell_cmd')
+    def test_set_cli_error(self, mock_run_shell_cmd):
+        desired_value = {"servers": ["time.error.com"]}
+        mock_run_shell_cmd.side_effect = [("time.google.com", ""), ("% Invalid value: time.error.com\n", "")]
+        status, errors = self.config.set(self.context, desired_value)
+
+        assert status == RemediateStatus.FAILED
+        assert errors == ["Admin CLI command failed: % Invalid value: time.error.com"]
+
+    def test_set_fake_admin_cli(self, fake_nsx_admin_cli):
+        (fake_nsx_admin_cli / "ntp-servers").write_text("time.vmware.com\ntime.google.com\n")
+        desired_value = {"servers": ["time.google.com", "time.nist.gov", "pool.ntp.org"]}
+        status, errors = self.config.set(self.context, desired_value)
+
+        assert status == RemediateStatus.SUCCESS
+        assert not errors
+        assert sorted((fake_nsx_admin_cli / "ntp-servers").read_text().split()) == sorted(desired_value["servers"])
+        # one process to get the current servers, one to apply all changes and read back the result
+        assert (fake_nsx_admin_cli / "invocations").read_text() == "-c get ntp-servers admin\nadmin\n"
@@ -5,6 +5,7 @@ from pyVmomi import vim
 from config_modules_vmware.controllers.vcenter.alarm_remote_syslog_failure_config import AlarmRemoteSyslogFailureConfig
 from config_modules_vmware.controllers.vcenter.alarm_remote_syslog_failure_config import ESX_REMOTE_SYSLOG_FAILURE_EVENT
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_alarm_catalog import AlarmCatalog
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
@@ -76,6 +77,7 @@ class TestAlarmRemoteSyslogFailureConfig:
         self.mock_alarm_manager.GetAlarm.return_value = [self.mock_alarm_def1, self.mock_alarm_def2]
 
         self.mock_vc_context.vc_vmomi_client().content.alarmManager = self.mock_alarm_manager
+        self.mock_vc_context.alarm_catalog.side_effect = self.build_alarm_catalog
 
         self.expected_alarms = [{
             'alarm_name': 'Mocked Alarm1',
@@ -119,6 +121,11 @@ class TestAlarmRemoteSyslogFailureConfig:
             ]
         }]
 
+    def build_alarm_catalog(self, refresh=False):
+        content = self.mock_vc_context.vc_vmomi_client().content
+        alarm_defs = content.alarmManager.GetAlarm(content.rootFolder)
+        return AlarmCatalog([(alarm_def, alarm_def.info) for alarm_def in alarm_defs])
+
     @patch("config_modules_vmware.controllers.vcenter.utils.vc_alarms_utils.get_target_type")
     def test_get_success(self, mock_get_target_type):
         mock_get_target_type.return_value = 'VCENTER'
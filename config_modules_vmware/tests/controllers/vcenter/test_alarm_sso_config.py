@@ -6,6 +6,7 @@ from config_modules_vmware.controllers.vcenter.alarm_sso_config import AlarmSSOC
 from config_modules_vmware.controllers.vcenter.alarm_sso_config import SSO_EVENT_ID
 from config_modules_vmware.controllers.vcenter.utils import vc_alarms_utils
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_alarm_catalog import AlarmCatalog
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
@@ -77,6 +78,7 @@ class TestAlarmSSOConfig:
         self.mock_alarm_manager.GetAlarm.return_value = [self.mock_alarm_def1, self.mock_alarm_def2]
 
         self.mock_vc_context.vc_vmomi_client().content.alarmManager = self.mock_alarm_manager
+        self.mock_vc_context.alarm_catalog.side_effect = self.build_alarm_catalog
 
         self.expected_alarms = [{
             'alarm_name': 'Mocked Alarm1',
@@ -120,6 +122,11 @@ class TestAlarmSSOConfig:
             ]
         }]
 
+    def build_alarm_catalog(self, refresh=False):
+        content = self.mock_vc_context.vc_vmomi_client().content
+        alarm_defs = content.alarmManager.GetAlarm(content.rootFolder)
+        return AlarmCatalog([(alarm_def, alarm_def.info) for alarm_def in alarm_defs])
+
     @patch("config_modules_vmware.controllers.vcenter.utils.vc_alarms_utils.get_target_type")
     def test_get_success(self, mock_get_target_type):
         mock_get_target_type.return_value = 'VCENTER'
@@ -137,6 +144,18 @@ class TestAlarmSSOConfig:
         status, errors = self.controller.set(self.mock_vc_context, self.expected_alarms)
         assert status == RemediateStatus.SUCCESS
         assert errors == []
+        self.mock_vc_context.invalidate_alarm_catalog.assert_called_once()
+
+    @patch("config_modules_vmware.controllers.vcenter.utils.vc_alarms_utils.get_target_type")
+    def test_get_uses_retrieved_alarm_info(self, mock_get_target_type):
+        mock_get_target_type.return_value = 'VCENTER'
+        # alarm references without 'info', details must come from the catalog
+        alarm_def = MagicMock(spec=[])
+        self.mock_vc_context.alarm_catalog.side_effect = None
+        self.mock_vc_context.alarm_catalog.return_value = AlarmCatalog([(alarm_def, self.mock_alarm_def1.info)])
+        result, errors = self.controller.get(self.mock_vc_context)
+        assert errors == []
+        assert result == self.expected_alarms
 
     def test_set_failed_exception(self):
         self.mock_vc_context.vc_vmomi_client.side_effect = Exception("Test exception")
@@ -1,10 +1,12 @@
 from mock import MagicMock
 from mock import patch
+from pyVmomi import vim  # pylint: disable=E0401
 
 from config_modules_vmware.controllers.vcenter.datastore_transit_encryption_config import DatastoreTransitEncryptionPolicy
 from config_modules_vmware.controllers.vcenter.datastore_transit_encryption_config import REKEY_INTERVAL_KEY
 from config_modules_vmware.controllers.vcenter.datastore_transit_encryption_config import TRANSIT_ENCRYPTION_ENABLED
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_inventory_index import InventoryIndex
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
@@ -80,6 +82,18 @@ class TestDatastoreTransitEncryptionPolicy:
         ccs_config.dataInTransitEncryptionConfig.rekeyInterval = cluster_spec.get("rekey_interval")
         return ccs_config
 
+    def get_cluster_config_side_effect(self, mocked_vsan_ccs):
+        """
+        Map the cluster refs to their vSAN cluster config, clusters are queried concurrently
+        :param mocked_vsan_ccs:
+        :return:
+        """
+        cluster_configs = {
+            cluster_ref._moId: vsan_ccs
+            for cluster_ref, vsan_ccs in zip(self.all_vsan_enabled_mock_cluster_refs, mocked_vsan_ccs)
+        }
+        return lambda cluster_ref: cluster_configs[cluster_ref._moId]
+
     def create_mock_objs_all_vsan_clusters(self, cluster_specs):
         """
         Create pyvmomi like mock object for all clusters
@@ -87,17 +101,41 @@ class TestDatastoreTransitEncryptionPolicy:
         :return:
         """
         all_vsan_cluster_refs = []
-        for cluster_spec in cluster_specs:
+        for index, cluster_spec in enumerate(cluster_specs):
             cluster_ref = MagicMock()
+            cluster_ref._moId = f"domain-c{index}"
             cluster_ref.name = cluster_spec.get("cluster_name")
             cluster_ref.parent.parent.name = cluster_spec.get("datacenter_name")
             all_vsan_cluster_refs.append(cluster_ref)
         return all_vsan_cluster_refs
 
-    def create_datacenter_mock(self, name):
-        datacenter_mock = MagicMock()
-        datacenter_mock.name = name
-        return datacenter_mock
+    def create_inventory_index(self, cluster_refs, cluster_specs):
+        """
+        Create inventory index with the clusters placed in the host folder of their datacenter
+        :param cluster_refs:
+        :param cluster_specs:
+        :return:
+        """
+        def entity(vimtype, moid):
+            entity_ref = MagicMock(spec=vimtype)
+            entity_ref._moId = moid
+            return entity_ref
+
+        root_folder = entity(vim.Folder, "group-d1")
+        name_parent_index = {"group-d1": (root_folder, "Datacenters", None)}
+        host_folders = {}
+        for cluster_ref, cluster_spec in zip(cluster_refs, cluster_specs):
+            datacenter_name = cluster_spec.get("datacenter_name")
+            if datacenter_name not in host_folders:
+                datacenter = entity(vim.Datacenter, f"datacenter-{len(host_folders)}")
+                host_folder = entity(vim.Folder, f"group-h{len(host_folders)}")
+                name_parent_index[datacenter._moId] = (datacenter, datacenter_name, root_folder)
+                name_parent_index[host_folder._moId] = (host_folder, "host", datacenter)
+                host_folders[datacenter_name] = host_folder
+            name_parent_index[cluster_ref._moId] = (
+                cluster_ref, cluster_spec.get("cluster_name"), host_folders[datacenter_name]
+            )
+        return InventoryIndex(name_parent_index)
 
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient")
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
@@ -107,8 +145,9 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.compliant_mocked_vsan_ccs
-        mock_vc_vmomi_client.find_datacenter_for_obj.side_effect = [self.create_datacenter_mock(cluster_config["datacenter_name"]) for cluster_config in self.compliant_cluster_configs]
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.compliant_mocked_vsan_ccs)
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index(self.all_vsan_enabled_mock_cluster_refs, self.compliant_cluster_configs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -140,7 +179,8 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.non_compliant_mocked_vsan_ccs
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.non_compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -157,7 +197,8 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.compliant_mocked_vsan_ccs
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -192,7 +233,8 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.compliant_mocked_vsan_ccs
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -218,10 +260,11 @@ class TestDatastoreTransitEncryptionPolicy:
         }
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vmomi_client.find_datacenter_for_obj.side_effect = [self.create_datacenter_mock(cluster_config["datacenter_name"]) for cluster_config in self.non_compliant_cluster_configs]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index(self.all_vsan_enabled_mock_cluster_refs, self.non_compliant_cluster_configs)
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.non_compliant_mocked_vsan_ccs
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.non_compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -265,8 +308,9 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.non_compliant_mocked_vsan_ccs + self.non_compliant_mocked_vsan_ccs
-        mock_vc_vmomi_client.find_datacenter_for_obj.side_effect = [self.create_datacenter_mock(cluster_config["datacenter_name"]) for cluster_config in self.compliant_cluster_configs]
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.non_compliant_mocked_vsan_ccs)
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index(self.all_vsan_enabled_mock_cluster_refs, self.compliant_cluster_configs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -284,7 +328,8 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.compliant_mocked_vsan_ccs
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -327,7 +372,9 @@ class TestDatastoreTransitEncryptionPolicy:
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
 
         mock_vsan_ccs = MagicMock()
-        mock_vsan_ccs.VsanClusterGetConfig.side_effect = self.non_compliant_mocked_vsan_ccs + [expected_errors]
+        mock_vsan_ccs.ReconfigureEx.side_effect = expected_errors
+        mock_vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster.side_effect = \
+            self.get_cluster_config_side_effect(self.non_compliant_mocked_vsan_ccs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_config_system.return_value = mock_vsan_ccs
 
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
@@ -6,6 +6,7 @@ from config_modules_vmware.controllers.vcenter.users_groups_roles_config import
 from config_modules_vmware.controllers.vcenter.users_groups_roles_config import UsersGroupsRolesConfig
 from config_modules_vmware.controllers.vcenter.utils import vc_users_groups_roles_utils
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.clients.vcenter.vc_authorization_snapshot import AuthorizationSnapshot
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.remediate_response import RemediateStatus
 
@@ -108,8 +109,11 @@ class TestUsersGroupsRolesConfig:
         self.mock_content = MagicMock()
         self.mock_content.rootFolder = "group-d1"
         self.mock_content.authorizationManager.roleList = self.mock_roles
-        self.mock_content.authorizationManager.RetrieveRolePermissions.side_effect = \
-            self._retrieve_permissions_side_effect
+        for role, permissions in zip(self.mock_roles, self.mock_role_permissions):
+            for permission in permissions:
+                permission.roleId = role.roleId
+        self.mock_content.authorizationManager.RetrieveAllPermissions.return_value = \
+            [permission for permissions in self.mock_role_permissions for permission in permissions]
         self.ad_specs = [
             {
                 "domain_name": "test_domain_name",
@@ -130,11 +134,13 @@ class TestUsersGroupsRolesConfig:
         ]
         self.domain_mock_obj = self.__create_mock_sso_domain_object(self.ad_specs)
 
-    def _retrieve_permissions_side_effect(self, role_id):
-        if role_id < 4:
-            return self.mock_role_permissions[role_id]
-        else:
-            return ValueError("Unknown Role Id.")
+    @staticmethod
+    def _mock_authorization_snapshot(mock_vc_context):
+        def build_authorization_snapshot(refresh=False):
+            authorization_manager = mock_vc_context.vc_vmomi_client().content.authorizationManager
+            return AuthorizationSnapshot(authorization_manager.roleList, authorization_manager.RetrieveAllPermissions())
+
+        mock_vc_context.authorization_snapshot.side_effect = build_authorization_snapshot
 
     @staticmethod
     def __create_mock_sso_domain_object(sso_specs):
@@ -172,6 +178,7 @@ class TestUsersGroupsRolesConfig:
     @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.get_global_permissions")
     def test_get_success(self, mock_get_global_permissions, mock_vc_context):
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
         self.controller._create_alias_domain_name_mapping(mock_vc_context)
 
@@ -201,6 +208,7 @@ class TestUsersGroupsRolesConfig:
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
     def test_get_failed(self, mock_vc_context):
         mock_vc_context.vc_vmomi_client.side_effect = Exception("Test exception")
+        self._mock_authorization_snapshot(mock_vc_context)
 
         result, errors = self.controller.get(mock_vc_context)
         assert result == {}
@@ -208,13 +216,14 @@ class TestUsersGroupsRolesConfig:
 
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
     @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.get_global_permissions")
-    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.add_global_permission")
-    def test_set_success(self, mock_add_global_permission, mock_get_global_permissions, mock_vc_context):
+    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.add_global_permissions")
+    def test_set_success(self, mock_add_global_permissions, mock_get_global_permissions, mock_vc_context):
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         #mock_vc_context.vc_invsvc_mob3_client.return_value = mock_vc_invsvc_mob3_client
         #mock_vc_invsvc_mob3_client.get_global_permissions.return_value = self.mock_global_permissions
         mock_get_global_permissions.return_value = self.mock_global_permissions
-        mock_add_global_permission.return_value = None
+        mock_add_global_permissions.return_value = None
         remediate_drifts = {
             "global":
                 [
@@ -231,6 +240,7 @@ class TestUsersGroupsRolesConfig:
         # Assert expected results.
         assert status == RemediateStatus.SUCCESS
         assert errors == []
+        mock_vc_context.invalidate_authorization_snapshot.assert_called_once()
 
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient")
@@ -239,6 +249,7 @@ class TestUsersGroupsRolesConfig:
         mock_vc_vmomi_sso_client.get_all_domains.return_value = self.domain_mock_obj
         mock_vc_context.vc_vmomi_sso_client.return_value = mock_vc_vmomi_sso_client
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
         desired_values = {
             "global": [
@@ -275,6 +286,7 @@ class TestUsersGroupsRolesConfig:
         mock_vc_vmomi_sso_client.get_all_domains.return_value = self.domain_mock_obj
         mock_vc_context.vc_vmomi_sso_client.return_value = mock_vc_vmomi_sso_client
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
         desired_values = {
             "global": [
@@ -311,6 +323,7 @@ class TestUsersGroupsRolesConfig:
         mock_vc_vmomi_sso_client.get_all_domains.return_value = self.domain_mock_obj
         mock_vc_context.vc_vmomi_sso_client.return_value = mock_vc_vmomi_sso_client
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
 
         result = self.controller.check_compliance(mock_vc_context, self.desired_values)
@@ -341,6 +354,7 @@ class TestUsersGroupsRolesConfig:
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient")
     def test_check_compliance_with_get_failed(self, mock_vc_vmomi_sso_client, mock_vc_context):
         mock_vc_context.vc_vmomi_client.side_effect = Exception("Test exception")
+        self._mock_authorization_snapshot(mock_vc_context)
         result = self.controller.check_compliance(mock_vc_context, self.desired_values)
         # Assert expected results.
         expected_result = {
@@ -352,15 +366,16 @@ class TestUsersGroupsRolesConfig:
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient")
     @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.get_global_permissions")
-    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.remove_global_permission")
-    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.add_global_permission")
-    def test_remediation_success(self, mock_add_global_permission, mock_remove_global_permission, mock_get_global_permissions, mock_vc_vmomi_sso_client, mock_vc_context):
+    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.remove_global_permissions")
+    @patch("config_modules_vmware.controllers.vcenter.utils.vc_users_groups_roles_utils.add_global_permissions")
+    def test_remediation_success(self, mock_add_global_permissions, mock_remove_global_permissions, mock_get_global_permissions, mock_vc_vmomi_sso_client, mock_vc_context):
         mock_vc_vmomi_sso_client.get_all_domains.return_value = self.domain_mock_obj
         mock_vc_context.vc_vmomi_sso_client.return_value = mock_vc_vmomi_sso_client
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
-        mock_remove_global_permission.return_value = None
-        mock_add_global_permission.return_value = None
+        mock_remove_global_permissions.return_value = None
+        mock_add_global_permissions.return_value = None
 
         result = self.controller.remediate(mock_vc_context, self.desired_values)
 
@@ -386,6 +401,16 @@ class TestUsersGroupsRolesConfig:
         assert result[consts.STATUS] == RemediateStatus.SUCCESS
         assert result[consts.NEW] == self.desired_values
         assert result[consts.OLD] == expected_current
+        # global permission changes are applied in one removal and one addition call
+        mock_remove_global_permissions.assert_called_once()
+        assert sorted(mock_remove_global_permissions.call_args.args[1]) == [
+            ("abc.com\\user1", False), ("test.com\\group4", True), ("test_domain_name2\\user3", False),
+            ("test_domain_name\\group1", True),
+        ]
+        mock_add_global_permissions.assert_called_once()
+        assert mock_add_global_permissions.call_args.args[1] == [
+            ("abc.com\\user1", self.mock_roles[0].roleId, False, False)
+        ]
 
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient")
@@ -394,6 +419,7 @@ class TestUsersGroupsRolesConfig:
         mock_vc_vmomi_sso_client.get_all_domains.return_value = self.domain_mock_obj
         mock_vc_context.vc_vmomi_sso_client.return_value = mock_vc_vmomi_sso_client
         mock_vc_context.vc_vmomi_client.return_value.content = self.mock_content
+        self._mock_authorization_snapshot(mock_vc_context)
         mock_get_global_permissions.return_value = self.mock_global_permissions
 
         desired_values = {
@@ -120,6 +120,7 @@ class TestVmMigrateEncryptionPolicy:
             "Failed to remediate VM: vcenter-1 - "
         ]
         # Pyvmomi type MagicMock objects
+        self.vm_path_index = {}
         self.mocked_vm_refs_compliant_overrides = self.create_all_vm_mock_refs(self.compliant_vm_configs_overrides)
         self.mocked_vm_refs_non_compliant_overrides = self.create_all_vm_mock_refs(self.non_compliant_vm_configs_overrides)
         self.mocked_vm_refs_compliant = self.create_all_vm_mock_refs(self.compliant_vm_configs)
@@ -136,6 +137,8 @@ class TestVmMigrateEncryptionPolicy:
         for vm_config in vm_configs:
             vm_ref = MagicMock()
             vm_ref.name = vm_config.get("vm_name")
+            vm_ref._moId = f"vm-{vm_config.get('vm_name')}"
+            self.vm_path_index[vm_ref._moId] = vm_config.get("path")
             vm_ref.config = vim.vm.ConfigInfo()
             if not create_bad_mock:
                 vm_ref.config.migrateEncryption = vm_config.get("migrate_encryption_policy")
@@ -151,6 +154,11 @@ class TestVmMigrateEncryptionPolicy:
             all_vm_mock_refs.append(vm_ref)
         return all_vm_mock_refs
 
+    def create_inventory_index_mock(self, vm_path_index):
+        inventory_index = MagicMock()
+        inventory_index.get_vm_path_in_datacenter.side_effect = vm_path_index.get
+        return inventory_index
+
     def set_vm_ref_property(self, vm_name, vm_refs, vm_bad_state=False, vm_encrypted=False):
         for vm_ref in vm_refs:
             if vm_ref.name == vm_name:
@@ -166,13 +174,7 @@ class TestVmMigrateEncryptionPolicy:
     def test_get_success(self, mock_vc_vmomi_client, mock_vc_context):
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
 
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result, errors = self.controller.get(mock_vc_context)
@@ -185,6 +187,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_error = Exception("Failed to get VM migrate encryption policy")
 
         mock_vc_vmomi_client.get_objects_by_vimtype.side_effect = expected_error
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result, errors = self.controller.get(mock_vc_context)
@@ -195,12 +198,13 @@ class TestVmMigrateEncryptionPolicy:
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient")
     def test_set_success(self, mock_vc_vmomi_client, mock_vc_context):
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
         non_compliant_configs = result.get(consts.CURRENT, [])
         vc_vmomi_client = mock_vc_context.vc_vmomi_client()
-        _, _, errors = self.controller._VmMigrateEncryptionPolicy__set_vm_migrate_encryption_policy_for_all_non_compliant_vms(vc_vmomi_client, self.compliant_value, non_compliant_configs)
+        _, _, errors = self.controller._VmMigrateEncryptionPolicy__set_vm_migrate_encryption_policy_for_all_non_compliant_vms(vc_vmomi_client, mock_vc_context.inventory_index(), self.compliant_value, non_compliant_configs)
         assert errors == []
 
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
@@ -210,12 +214,13 @@ class TestVmMigrateEncryptionPolicy:
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
         mock_vc_vmomi_client.wait_for_task.side_effect = expected_error
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
         non_compliant_configs = result.get(consts.CURRENT, [])
         vc_vmomi_client = mock_vc_context.vc_vmomi_client()
-        _, _, errors = self.controller._VmMigrateEncryptionPolicy__set_vm_migrate_encryption_policy_for_all_non_compliant_vms(vc_vmomi_client, self.compliant_value, non_compliant_configs)
+        _, _, errors = self.controller._VmMigrateEncryptionPolicy__set_vm_migrate_encryption_policy_for_all_non_compliant_vms(vc_vmomi_client, mock_vc_context.inventory_index(), self.compliant_value, non_compliant_configs)
         assert errors == self.remediate_failure_messages
 
     @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
@@ -224,13 +229,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: ComplianceStatus.COMPLIANT}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
@@ -243,13 +242,7 @@ class TestVmMigrateEncryptionPolicy:
 
         self.set_vm_ref_property("Test-VM-01", self.mocked_vm_refs_compliant, vm_bad_state=True)
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
@@ -262,13 +255,7 @@ class TestVmMigrateEncryptionPolicy:
 
         self.set_vm_ref_property("Test-VM-01", self.mocked_vm_refs_compliant, vm_encrypted=True)
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
@@ -280,14 +267,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: ComplianceStatus.COMPLIANT}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant_overrides
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/dev2",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value_overrides)
@@ -306,14 +286,7 @@ class TestVmMigrateEncryptionPolicy:
 
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant_overrides
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/dev2",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.non_compliant_value_overrides)
@@ -333,13 +306,7 @@ class TestVmMigrateEncryptionPolicy:
         }
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
@@ -352,6 +319,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: ComplianceStatus.FAILED, consts.ERRORS: [str(expected_error)]}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.side_effect = expected_error
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_value)
@@ -363,6 +331,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: RemediateStatus.SKIPPED, consts.ERRORS: [consts.CONTROL_ALREADY_COMPLIANT]}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -381,18 +350,7 @@ class TestVmMigrateEncryptionPolicy:
             consts.NEW: desired_configs,
         }
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -416,18 +374,7 @@ class TestVmMigrateEncryptionPolicy:
             vm_ref.config.template = True
         mock_get_resource_pool.return_value = MagicMock(), []
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -455,18 +402,7 @@ class TestVmMigrateEncryptionPolicy:
             vm_ref.config.template = True
             vm_ref.parent = datacenter
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -483,18 +419,7 @@ class TestVmMigrateEncryptionPolicy:
             vm_ref.config.template = True
         mock_get_resource_pool.return_value = None, ["Resource pool not found"]
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
-        mock_vc_vmomi_client.get_vm_path_in_datacenter.side_effect = ["SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/Management VMs",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/db_workloads/ms-sql",
-                                                                      "SDDC-Datacenter/vm/dev",
-                                                                      "SDDC-Datacenter/vm/Management VMs"]
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -507,6 +432,7 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: RemediateStatus.FAILED, consts.ERRORS: [str(expected_error)]}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.side_effect = expected_error
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
@@ -531,8 +457,47 @@ class TestVmMigrateEncryptionPolicy:
         expected_result = {consts.STATUS: RemediateStatus.FAILED, consts.ERRORS: expected_error}
 
         mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_non_compliant
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(self.vm_path_index)
         mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
         mock_vc_vmomi_client.wait_for_task.side_effect = pyvmomi_error
 
         result = self.controller.remediate(mock_vc_context, self.compliant_value)
         assert result == expected_result
+
+    @patch("config_modules_vmware.framework.auth.contexts.vc_context.VcenterContext")
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient")
+    def test_get_path_not_in_index(self, mock_vc_vmomi_client, mock_vc_context):
+        mock_vc_vmomi_client.get_objects_by_vimtype.return_value = self.mocked_vm_refs_compliant
+        vm_path_index = dict(self.vm_path_index)
+        vm_path_index.pop("vm-ubuntu-dev-box")
+        mock_vc_context.inventory_index.return_value = self.create_inventory_index_mock(vm_path_index)
+        mock_vc_vmomi_client.get_vm_path_in_datacenter.return_value = "SDDC-Datacenter/vm/dev"
+        mock_vc_context.vc_vmomi_client.return_value = mock_vc_vmomi_client
+
+        result, errors = self.controller.get(mock_vc_context)
+        assert result == self.get_compliant_vm_configs
+        assert errors == []
+        mock_vc_context.inventory_index.assert_called_once()
+        mock_vc_vmomi_client.get_vm_path_in_datacenter.assert_called_once()
+
+    def test_compile_vm_name_matchers(self):
+        matchers = self.controller._compile_vm_name_matchers(["vCLS-[0-9a-f]{8}", "Test-VM-01"])
+        assert len(matchers) == 1
+        assert self.controller._vm_name_check("vcls-0123abcd-suffix", matchers)
+        assert self.controller._vm_name_check("test-vm-01", matchers)
+        assert not self.controller._vm_name_check("my-Test-VM-01", matchers)
+        assert self.controller._compile_vm_name_matchers([]) == []
+
+    def test_compile_vm_name_matchers_not_combinable(self):
+        matchers = self.controller._compile_vm_name_matchers(["(a)\\1", "(?i)test-vm"])
+        assert len(matchers) == 2
+        assert self.controller._vm_name_check("aa", matchers)
+        assert self.controller._vm_name_check("TEST-VM-01", matchers)
+        assert not self.controller._vm_name_check("ab", matchers)
+
+    def test_compile_vm_name_matchers_with_groups(self):
+        matchers = self.controller._compile_vm_name_matchers(["(a)b", "(c)\\1"])
+        assert len(matchers) == 2
+        assert self.controller._vm_name_check("ab", matchers)
+        assert self.controller._vm_name_check("cc", matchers)
+        assert not self.controller._vm_name_check("ca", matchers)
@@ -80,6 +80,18 @@ class TestVSANHCLProxyConfig:
         vsan_proxy_mock_object.vsanTelemetryProxy.password = proxy_spec.get("password")
         return vsan_proxy_mock_object
 
+    def get_proxy_config_side_effect(self, cluster_proxy_configs):
+        """
+        Map the cluster refs to their proxy config by cluster name, clusters are queried concurrently
+        :param cluster_proxy_configs:
+        :return:
+        """
+        proxy_configs = {
+            cluster_proxy_config.get("cluster_name"): dict(cluster_proxy_config)
+            for cluster_proxy_config in cluster_proxy_configs
+        }
+        return lambda cluster_ref: proxy_configs[cluster_ref.name]
+
     def create_mock_objs_all_vsan_clusters(self, cluster_proxy_configs):
         """
         Create pyvmomi like mock object for all clusters
@@ -97,11 +109,8 @@ class TestVSANHCLProxyConfig:
     @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient")
     def test_get_success(self, mock_vc_vsan_vmomi_client, mock_vc_context):
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.compliant_cluster_configs[0],
-            self.compliant_cluster_configs[1],
-            self.compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.compliant_cluster_configs)
         mock_vc_context.vc_vsan_vmomi_client.return_value = mock_vc_vsan_vmomi_client
 
         result, errors = self.controller.get(mock_vc_context)
@@ -126,11 +135,8 @@ class TestVSANHCLProxyConfig:
     def test_set_success(self, mock_vc_vsan_vmomi_client, mock_vc_context):
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.compliant_cluster_configs[0],
-            self.compliant_cluster_configs[1],
-            self.compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.compliant_cluster_configs)
         mock_vc_vsan_vmomi_client.get_vsan_config_by_key_for_cluster.return_value = vim.option.OptionValue(
             key="enableinternetaccess", value=self.compliant_cluster_proxy_config["internet_access_enabled"]
         )
@@ -158,11 +164,8 @@ class TestVSANHCLProxyConfig:
         expected_result = {consts.STATUS: ComplianceStatus.COMPLIANT}
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.compliant_cluster_configs[0],
-            self.compliant_cluster_configs[1],
-            self.compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.compliant_cluster_configs)
         mock_vc_context.vc_vsan_vmomi_client.return_value = mock_vc_vsan_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_cluster_proxy_config)
@@ -178,11 +181,8 @@ class TestVSANHCLProxyConfig:
         }
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.non_compliant_cluster_configs[0],
-            self.non_compliant_cluster_configs[1],
-            self.non_compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.non_compliant_cluster_configs)
         mock_vc_context.vc_vsan_vmomi_client.return_value = mock_vc_vsan_vmomi_client
 
         result = self.controller.check_compliance(mock_vc_context, self.compliant_cluster_proxy_config)
@@ -206,11 +206,8 @@ class TestVSANHCLProxyConfig:
         expected_result = {consts.STATUS: RemediateStatus.SKIPPED, consts.ERRORS: [consts.CONTROL_ALREADY_COMPLIANT]}
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.compliant_cluster_configs[0],
-            self.compliant_cluster_configs[1],
-            self.compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.compliant_cluster_configs)
         mock_vc_context.vc_vsan_vmomi_client.return_value = mock_vc_vsan_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_cluster_proxy_config)
@@ -226,11 +223,8 @@ class TestVSANHCLProxyConfig:
         }
 
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.non_compliant_cluster_configs[0],
-            self.non_compliant_cluster_configs[1],
-            self.non_compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.non_compliant_cluster_configs)
         mock_vc_vsan_vmomi_client.get_vsan_cluster_health_config_for_cluster.side_effect = [
             self.create_vsan_cluster_proxy_mock_obj(self.non_compliant_cluster_configs[0]),
             self.create_vsan_cluster_proxy_mock_obj(self.non_compliant_cluster_configs[1]),
@@ -272,11 +266,8 @@ class TestVSANHCLProxyConfig:
 
         mock_vc_vsan_vmomi_client.get_vsan_health_system.side_effect = expected_error
         mock_vc_vsan_vmomi_client.get_all_vsan_enabled_clusters.return_value = self.all_vsan_enabled_mock_cluster_refs
-        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = [
-            self.non_compliant_cluster_configs[0],
-            self.non_compliant_cluster_configs[1],
-            self.non_compliant_cluster_configs[2],
-        ]
+        mock_vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster.side_effect = \
+            self.get_proxy_config_side_effect(self.non_compliant_cluster_configs)
         mock_vc_context.vc_vsan_vmomi_client.return_value = mock_vc_vsan_vmomi_client
 
         result = self.controller.remediate(mock_vc_context, self.compliant_cluster_proxy_config)
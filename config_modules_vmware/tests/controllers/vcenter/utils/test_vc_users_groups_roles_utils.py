@@ -0,0 +1,128 @@
+# Copyright 2025 Broadcom. All Rights Reserved.
+from urllib.parse import unquote_plus
+
+import pytest
+from mock import MagicMock
+
+from config_modules_vmware.controllers.vcenter.utils import vc_users_groups_roles_utils
+
+
+def build_permission_html(name, group, propagate, role_id):
+    return f"""
+<li>
+<table>
+<tr><th>NAME</th><th>TYPE</th><th>VALUE</th></tr>
+<tr><td>dynamicProperty</td><td>DynamicProperty[]</td><td>Unset</td></tr>
+<tr><td>dynamicType</td><td>string</td><td>Unset</td></tr>
+<tr><td>principal</td><td>Principal</td><td>
+  <table>
+  <tr><th>NAME</th><th>TYPE</th><th>VALUE</th></tr>
+  <tr><td>dynamicProperty</td><td>DynamicProperty[]</td><td>Unset</td></tr>
+  <tr><td>dynamicType</td><td>string</td><td>Unset</td></tr>
+  <tr><td>group</td><td>boolean</td><td>{str(group).lower()}</td></tr>
+  <tr><td>name</td><td>string</td><td>{name}</td></tr>
+  </table>
+</td></tr>
+<tr><td>propagate</td><td>boolean</td><td>{str(propagate).lower()}</td></tr>
+<tr><td>roles</td><td>long[]</td><td><ul class="noindent"><li> {role_id} </li></ul></td></tr>
+<tr><td>version</td><td>long</td><td>1</td></tr>
+</table>
+</li>"""
+
+
+PERMISSIONS_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Method Invocation Result: Permission[]</title></head>
+<body>
+<form method="post"><input name="vmware-session-nonce" type="hidden" value="nonce"></form>
+<h1>Method Invocation Result: Permission[]</h1>
+<ul>
+<li><a href="#">Returns</a></li>
+{}
+{}
+</ul>
+</body></html>
+""".format(
+    build_permission_html("VSPHERE.LOCAL\\Administrators", True, True, -1),
+    build_permission_html("abc.com\\user&amp;1", False, False, 1103),
+)
+
+
+class TestVcUsersGroupsRolesUtils:
+
+    def setup_method(self):
+        self.mock_client = MagicMock()
+        self.mock_client.get_base_url.return_value = "https://vc_hostname/invsvc/mob3"
+        self.mock_client.invoke_method.return_value.status = 200
+
+    def test_parse_global_permissions(self):
+        assert vc_users_groups_roles_utils._parse_global_permissions(PERMISSIONS_HTML) == [
+            {"name": "VSPHERE.LOCAL\\Administrators", "type": "GROUP", "propagate": True, "role_id": -1},
+            {"name": "abc.com\\user&1", "type": "USER", "propagate": False, "role_id": 1103},
+        ]
+
+    def test_parse_global_permissions_split_chunks(self, monkeypatch):
+        monkeypatch.setattr(vc_users_groups_roles_utils, "PARSE_CHUNK_SIZE", 7)
+        permissions = vc_users_groups_roles_utils._parse_global_permissions(PERMISSIONS_HTML)
+        assert [permission["name"] for permission in permissions] == \
+            ["VSPHERE.LOCAL\\Administrators", "abc.com\\user&1"]
+
+    @pytest.mark.parametrize(
+        "replacements",
+        [
+            [("</li></ul>", "</li>\n</ul>")],
+            [("</ul></td>", "</ul> </td>")],
+            [("<td><ul", "<td>\n  <ul"), ("<li> ", "<li>"), (" </li>", "</li>")],
+            [("><", ">\n  <")],
+        ],
+    )
+    def test_parse_global_permissions_extra_whitespace(self, replacements):
+        html = PERMISSIONS_HTML
+        for old, new in replacements:
+            html = html.replace(old, new)
+        # whitespace is only added between tags, the values are kept
+        html = html.replace(">\n  <td>", "><td>").replace("</td>\n  <", "</td><")
+        assert vc_users_groups_roles_utils._parse_global_permissions(html) == [
+            {"name": "VSPHERE.LOCAL\\Administrators", "type": "GROUP", "propagate": True, "role_id": -1},
+            {"name": "abc.com\\user&1", "type": "USER", "propagate": False, "role_id": 1103},
+        ]
+
+    def test_parse_global_permissions_empty(self):
+        html = '<html><body><ul><li><a href="#">Returns</a></li></ul></body></html>'
+        assert vc_users_groups_roles_utils._parse_global_permissions(html) == []
+
+    def test_get_global_permissions(self):
+        self.mock_client.invoke_method.return_value.data = PERMISSIONS_HTML.encode("utf-8")
+        permissions = vc_users_groups_roles_utils.get_global_permissions(self.mock_client)
+        assert len(permissions) == 2
+        assert self.mock_client.invoke_method.call_args.args[0].endswith(
+            "method=AuthorizationService.GetGlobalAccessControlList"
+        )
+
+    def test_add_global_permissions_batched(self):
+        vc_users_groups_roles_utils.add_global_permissions(
+            self.mock_client, [("abc.com\\user1", 1103, False, True), ("abc.com\\group1", -1, True, False)]
+        )
+        self.mock_client.invoke_method.assert_called_once()
+        params = unquote_plus(self.mock_client.invoke_method.call_args.kwargs["params"])
+        assert params.startswith("permissions=<permissions>")
+        assert params.count("<permissions>") == 2
+        assert "<name>abc.com\\user1</name>" in params and "<roles>-1</roles>" in params
+
+    def test_remove_global_permissions_batched(self):
+        vc_users_groups_roles_utils.remove_global_permissions(
+            self.mock_client, [("abc.com\\user1", False), ("abc.com\\group1", True)]
+        )
+        self.mock_client.invoke_method.assert_called_once()
+        params = unquote_plus(self.mock_client.invoke_method.call_args.kwargs["params"])
+        assert params.count("<principals>") == 2
+        assert "<name>abc.com\\group1</name>" in params
+
+    def test_batch_without_changes_not_invoked(self):
+        vc_users_groups_roles_utils.add_global_permissions(self.mock_client, [])
+        vc_users_groups_roles_utils.remove_global_permissions(self.mock_client, [])
+        self.mock_client.invoke_method.assert_not_called()
+
+    def test_add_global_permission_failed(self):
+        self.mock_client.invoke_method.return_value.status = 500
+        with pytest.raises(Exception, match="Failed to add global permission: 500"):
+            vc_users_groups_roles_utils.add_global_permission(self.mock_client, "abc.com\\user1", 1103, False, True)
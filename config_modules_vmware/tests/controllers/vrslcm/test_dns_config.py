@@ -20,7 +20,7 @@ class TestDnsConfig:
         self.config = DnsConfig()
         patch('config_modules_vmware.framework.clients.aria_suite.aria_auth.get_http_headers', return_value="").start()
 
-    @patch('config_modules_vmware.controllers.vrslcm.dns_config.requests.request')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
     def test_check_compliance(self, mock_request):
         get_dns_api_response = [{"hostName": "8.8.8.8", "name": "dns1"}, {"hostName": "8.8.4.4", "name": "dns2"}]
         desired_value = {"mode": "is_static", "servers": [server['hostName'] for server in get_dns_api_response]}
@@ -31,7 +31,7 @@ class TestDnsConfig:
             result = self.config.check_compliance(context=self.context, desired_values=desired_value)
             assert result.get(consts.STATUS) == ComplianceStatus.COMPLIANT
 
-    @patch('config_modules_vmware.controllers.vrslcm.dns_config.requests.request')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
     def test_non_compliance(self, mock_request):
         get_dns_api_response = [{"hostName": "8.8.8.8", "name": "dns1"}, {"hostName": "8.8.4.4", "name": "dns2"}]
         desired_value = {"mode": "is_static", "servers": ["8.8.8.8", "4.4.4.4"]}
@@ -43,7 +43,7 @@ class TestDnsConfig:
         assert result.get(consts.CURRENT) == {"servers": [server["hostName"] for server in get_dns_api_response]}
         assert result.get(consts.DESIRED) == {"servers": desired_value.get("servers", {})}
 
-    @patch('config_modules_vmware.controllers.vrslcm.dns_config.requests.request')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
     def test_compliance_failed(self, mock_request):
         expected_error = "test exception"
         expected_errors = [requests.exceptions.HTTPError(expected_error)]
@@ -56,7 +56,7 @@ class TestDnsConfig:
         assert result.get(consts.STATUS) == ComplianceStatus.FAILED
         assert result.get(consts.ERRORS) == [expected_error]
 
-    @patch('config_modules_vmware.controllers.vrslcm.dns_config.requests.request')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
     def test_remediate_success(self, mock_request):
         mock_get = Mock()
         mock_get.json.return_value = [{"hostName": "8.8.4.4", "name": "dns1"}, {"hostName": "8.8.8.8", "name": "dns2"}]
@@ -68,23 +68,24 @@ class TestDnsConfig:
         desired_value = {"mode": "is_static", "servers": ["time.google.com", "time.vmware.com"]}
         mock_request.side_effect = [mock_get, mock_get, mock_call, mock_call, mock_call, mock_call]
         status = self.config.remediate(self.context, desired_value)
-        mock_request.assert_has_calls([
-            call("GET", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data=ANY, verify=False, timeout=ANY),
-            call("GET", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data=ANY, verify=False, timeout=ANY),
-            call("DELETE", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data='{"name": "dns1", "hostName": "8.8.4.4"}', verify=False, timeout=ANY),
-            call("DELETE", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data='{"name": "dns2", "hostName": "8.8.8.8"}', verify=False, timeout=ANY),
-            call("POST", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data='{"name": "dns", "hostName": "time.google.com"}', verify=False, timeout=ANY),
-            call("POST", f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns", headers=ANY,
-                 data='{"name": "dns1", "hostName": "time.vmware.com"}', verify=False, timeout=ANY)
-        ])
+        dns_url = f"https://{self.hostname}/lcm/lcops/api/v2/settings/dns"
+        assert mock_request.call_args_list[:2] == [
+            call("GET", dns_url, headers=ANY, data=ANY, timeout=ANY),
+            call("GET", dns_url, headers=ANY, data=ANY, timeout=ANY),
+        ]
+        # existing entries are deleted sequentially
+        assert mock_request.call_args_list[2:4] == [
+            call("DELETE", dns_url, headers=ANY, data='{"name": "dns1", "hostName": "8.8.4.4"}', timeout=ANY),
+            call("DELETE", dns_url, headers=ANY, data='{"name": "dns2", "hostName": "8.8.8.8"}', timeout=ANY),
+        ]
+        # desired entries are added in order
+        assert mock_request.call_args_list[4:] == [
+            call("POST", dns_url, headers=ANY, data='{"name": "dns", "hostName": "time.google.com"}', timeout=ANY),
+            call("POST", dns_url, headers=ANY, data='{"name": "dns1", "hostName": "time.vmware.com"}', timeout=ANY),
+        ]
         assert status.get(consts.STATUS) == RemediateStatus.SUCCESS
 
-    @patch('config_modules_vmware.controllers.vrslcm.dns_config.requests.request')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
     def test_remediate_failed(self, mock_request):
         mock_get = Mock()
         mock_get.json.return_value = [{"hostName": "8.8.8.8", "name": "dns1"}, {"hostName": "8.8.4.4", "name": "dns2"}]
@@ -103,5 +104,22 @@ class TestDnsConfig:
         assert result.get(consts.STATUS) == RemediateStatus.FAILED
         assert result.get(consts.ERRORS) == [expected_error]
 
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_auth.get_http_headers')
+    @patch('config_modules_vmware.framework.clients.aria_suite.aria_rest_client.requests.Session.request')
+    def test_context_client_shared(self, mock_request, mock_get_http_headers):
+        mock_get_http_headers.return_value = {"Authorization": "Basic token"}
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.json.return_value = [{"hostName": "8.8.8.8", "name": "dns"}]
+        desired_value = {"servers": ["8.8.8.8"]}
+        with self.context:
+            aria_rest_client = self.context.aria_rest_client()
+            self.config.check_compliance(self.context, desired_value)
+            DnsConfig().check_compliance(self.context, desired_value)
+            assert self.context.aria_rest_client() is aria_rest_client
+        # credentials are retrieved once for all controllers of the context
+        mock_get_http_headers.assert_called_once()
+        assert mock_request.call_count == 2
+        assert self.context._aria_rest_client is None
+
     def teardown_method(self):
         patch.stopall()
@@ -2,6 +2,7 @@
 from mock import patch
 
 from config_modules_vmware.framework.auth.contexts.sddc_manager_context import SDDCManagerContext
+from config_modules_vmware.framework.auth.session_pool import SessionPool
 
 
 class TestSDDCManagerContext:
@@ -41,6 +42,24 @@ class TestSDDCManagerContext:
             assert self.verify_ssl in args
         assert self.context._sddc_manager_rest_client is None
 
+    @patch('config_modules_vmware.framework.auth.session_pool.SessionPool.is_enabled')
+    @patch('config_modules_vmware.framework.clients.sddc_manager.sddc_manager_rest_client.SDDCManagerRestClient'
+           '.__init__')
+    def test_sddc_manager_context_session_pool(self, mock_rest_client, mock_is_enabled):
+        mock_rest_client.return_value = None
+        mock_is_enabled.return_value = True
+        try:
+            with SDDCManagerContext(hostname=self.hostname, username=self.username, password=self.password,
+                                    ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                rest_client = context.sddc_manager_rest_client()
+            assert context._sddc_manager_rest_client is None
+            with SDDCManagerContext(hostname=self.hostname, username=self.username, password=self.password,
+                                    ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                assert context.sddc_manager_rest_client() is rest_client
+            assert mock_rest_client.call_count == 1
+        finally:
+            SessionPool.close_all()
+
     @patch('config_modules_vmware.framework.clients.sddc_manager.sddc_manager_rest_client.SDDCManagerRestClient'
            '.get_helper')
     def test_sddc_manager_context_product_version(self, mock_rest_client):
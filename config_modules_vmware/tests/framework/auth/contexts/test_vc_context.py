@@ -2,6 +2,7 @@
 from mock import patch
 
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
+from config_modules_vmware.framework.auth.session_pool import SessionPool
 from config_modules_vmware.framework.auth.ssl.cert_info import CertInfo
 
 
@@ -99,3 +100,86 @@ class TestVcenterContext:
         product_version = "8.0.3"
         mock_rest_client.return_value = product_version
         assert self.context.product_version == product_version
+
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.connect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.disconnect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.build_inventory_index')
+    def test_vc_context_inventory_index(self, mock_build_inventory_index, mock_vc_vmomi_client_disconnect,
+                                        mock_vc_vmomi_client_connect):
+        mock_build_inventory_index.side_effect = ["index-1", "index-2"]
+        with self.context:
+            assert self.context.inventory_index() == "index-1"
+            assert self.context.inventory_index() == "index-1"
+            assert self.context.inventory_index(refresh=True) == "index-2"
+        assert mock_build_inventory_index.call_count == 2
+        assert self.context._inventory_index is None
+
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.connect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.disconnect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.build_alarm_catalog')
+    def test_vc_context_alarm_catalog(self, mock_build_alarm_catalog, mock_vc_vmomi_client_disconnect,
+                                      mock_vc_vmomi_client_connect):
+        mock_build_alarm_catalog.side_effect = ["catalog-1", "catalog-2", "catalog-3"]
+        with self.context:
+            assert self.context.alarm_catalog() == "catalog-1"
+            assert self.context.alarm_catalog() == "catalog-1"
+            self.context.invalidate_alarm_catalog()
+            assert self.context.alarm_catalog() == "catalog-2"
+            assert self.context.alarm_catalog(refresh=True) == "catalog-3"
+        assert mock_build_alarm_catalog.call_count == 3
+        assert self.context._alarm_catalog is None
+
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.connect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.disconnect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.'
+           'build_authorization_snapshot')
+    def test_vc_context_authorization_snapshot(self, mock_build_authorization_snapshot,
+                                               mock_vc_vmomi_client_disconnect, mock_vc_vmomi_client_connect):
+        mock_build_authorization_snapshot.side_effect = ["snapshot-1", "snapshot-2", "snapshot-3"]
+        with self.context:
+            assert self.context.authorization_snapshot() == "snapshot-1"
+            assert self.context.authorization_snapshot() == "snapshot-1"
+            self.context.invalidate_authorization_snapshot()
+            assert self.context.authorization_snapshot() == "snapshot-2"
+            assert self.context.authorization_snapshot(refresh=True) == "snapshot-3"
+        assert mock_build_authorization_snapshot.call_count == 3
+        assert self.context._authorization_snapshot is None
+
+    @patch('config_modules_vmware.framework.auth.session_pool.SessionPool.is_enabled')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.connect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_client.VcVmomiClient.disconnect')
+    def test_vc_context_session_pool(self, mock_vc_vmomi_client_disconnect, mock_vc_vmomi_client_connect,
+                                     mock_is_enabled):
+        mock_is_enabled.return_value = True
+        try:
+            with VcenterContext(hostname=self.hostname, username=self.username, password=self.password,
+                                ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                vc_vmomi_client = context.vc_vmomi_client()
+            assert mock_vc_vmomi_client_disconnect.call_count == 0
+            assert context._vc_vmomi_client is None
+            with VcenterContext(hostname=self.hostname, username=self.username, password=self.password,
+                                ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                assert context.vc_vmomi_client() is vc_vmomi_client
+            assert mock_vc_vmomi_client_connect.call_count == 1
+            with VcenterContext(hostname=self.hostname, username=self.username, password="other_password",
+                                ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                assert context.vc_vmomi_client() is not vc_vmomi_client
+            assert mock_vc_vmomi_client_connect.call_count == 2
+        finally:
+            SessionPool.close_all()
+        assert mock_vc_vmomi_client_disconnect.call_count == 2
+
+    @patch('config_modules_vmware.framework.auth.session_pool.SessionPool.is_enabled')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient.connect')
+    @patch('config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient.disconnect')
+    def test_vc_context_session_pool_clears_client_caches(self, mock_vc_vmomi_sso_client_disconnect,
+                                                          mock_vc_vmomi_sso_client_connect, mock_is_enabled):
+        mock_is_enabled.return_value = True
+        try:
+            with VcenterContext(hostname=self.hostname, username=self.username, password=self.password,
+                                ssl_thumbprint=self.ssl_thumbprint, verify_ssl=self.verify_ssl) as context:
+                vc_vmomi_sso_client = context.vc_vmomi_sso_client()
+                vc_vmomi_sso_client._principal_cache[("group", "trustedadmins", "vsphere.local")] = "group"
+            assert vc_vmomi_sso_client._principal_cache == {}
+        finally:
+            SessionPool.close_all()
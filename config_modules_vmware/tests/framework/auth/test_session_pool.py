@@ -0,0 +1,155 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import configparser
+
+import pytest
+from mock import MagicMock
+from mock import patch
+
+from config_modules_vmware.framework.auth.session_pool import SessionPool
+from config_modules_vmware.framework.auth.ssl.cert_info import CertInfo
+from config_modules_vmware.framework.utils import metrics
+
+
+class TestSessionPool:
+
+    def setup_method(self):
+        conf = configparser.ConfigParser()
+        conf.read_dict({"session.pool": {"Enabled": "true",
+                                         "MaxSessionsPerTarget": "2",
+                                         "IdleTimeoutSeconds": "600",
+                                         "HealthCheckIntervalSeconds": "60",
+                                         "AcquireTimeoutSeconds": "0"}})
+        self.config = conf["session.pool"]
+        self.config_patcher = patch.object(SessionPool, "_get_config", return_value=self.config)
+        self.config_patcher.start()
+        SessionPool.close_all()
+        self.key = SessionPool.make_key(MagicMock, "vc_hostname", username="user", secret="pwd")
+        self.close_func = MagicMock()
+
+    def teardown_method(self):
+        SessionPool.close_all()
+        self.config_patcher.stop()
+
+    def test_is_enabled(self):
+        assert SessionPool.is_enabled()
+        self.config["Enabled"] = "false"
+        assert not SessionPool.is_enabled()
+
+    def test_make_key(self):
+        assert self.key == SessionPool.make_key(MagicMock, "vc_hostname", username="user", secret="pwd")
+        assert "pwd" not in self.key
+        assert self.key != SessionPool.make_key(MagicMock, "vc_hostname", username="user", secret="other_pwd")
+        assert self.key != SessionPool.make_key(MagicMock, "vc_hostname", username="user", secret="pwd",
+                                                verify_ssl=False)
+        assert SessionPool.make_key(MagicMock, "vc_hostname", cert_info=[CertInfo(certificate_str="cert1")]) != \
+            SessionPool.make_key(MagicMock, "vc_hostname", cert_info=[CertInfo(certificate_str="cert2")])
+
+    def test_acquire_reuses_released_client(self):
+        create_func = MagicMock(side_effect=[MagicMock(), MagicMock()])
+        client = SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.release(client)
+        assert SessionPool.acquire(self.key, create_func, self.close_func) is client
+        assert create_func.call_count == 1
+        self.close_func.assert_not_called()
+
+    def test_acquire_does_not_share_leased_client(self):
+        create_func = MagicMock(side_effect=[MagicMock(), MagicMock()])
+        client_1 = SessionPool.acquire(self.key, create_func, self.close_func)
+        client_2 = SessionPool.acquire(self.key, create_func, self.close_func)
+        assert client_1 is not client_2
+        assert create_func.call_count == 2
+
+    def test_acquire_max_sessions_timeout(self):
+        create_func = MagicMock(side_effect=[MagicMock(), MagicMock(), MagicMock()])
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        with pytest.raises(Exception, match="Timed out waiting for a pooled session to vc_hostname"):
+            SessionPool.acquire(self.key, create_func, self.close_func)
+        other_key = SessionPool.make_key(MagicMock, "other_hostname", username="user", secret="pwd")
+        assert SessionPool.acquire(other_key, create_func, self.close_func) is not None
+
+    def test_acquire_create_failure_frees_slot(self):
+        client = MagicMock()
+        create_func = MagicMock(side_effect=[Exception("login failed"), Exception("login failed"), client, client])
+        for _ in range(2):
+            with pytest.raises(Exception, match="login failed"):
+                SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.acquire(self.key, create_func, self.close_func)
+
+    @patch("config_modules_vmware.framework.auth.session_pool.time.monotonic")
+    def test_acquire_health_check(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        client = MagicMock()
+        new_client = MagicMock()
+        create_func = MagicMock(side_effect=[client, new_client])
+        health_check_func = MagicMock(return_value=False)
+        SessionPool.acquire(self.key, create_func, self.close_func, health_check_func=health_check_func)
+        SessionPool.release(client)
+
+        # within health check interval, reused as is
+        mock_monotonic.return_value = 1030
+        assert SessionPool.acquire(self.key, create_func, self.close_func, health_check_func) is client
+        health_check_func.assert_not_called()
+        SessionPool.release(client)
+
+        # past health check interval, unhealthy session is closed and replaced
+        mock_monotonic.return_value = 1100
+        assert SessionPool.acquire(self.key, create_func, self.close_func, health_check_func) is new_client
+        health_check_func.assert_called_once_with(client)
+        self.close_func.assert_called_once_with(client)
+
+    @patch("config_modules_vmware.framework.auth.session_pool.time.monotonic")
+    def test_idle_timeout_eviction(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        client = MagicMock()
+        new_client = MagicMock()
+        create_func = MagicMock(side_effect=[client, new_client])
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.release(client)
+        mock_monotonic.return_value = 1601
+        assert SessionPool.acquire(self.key, create_func, self.close_func) is new_client
+        self.close_func.assert_called_once_with(client)
+
+    @patch("config_modules_vmware.framework.auth.session_pool.time.monotonic")
+    def test_max_age_eviction(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        client = MagicMock()
+        create_func = MagicMock(return_value=client)
+        SessionPool.acquire(self.key, create_func, self.close_func, max_age=300)
+        mock_monotonic.return_value = 1301
+        SessionPool.release(client)
+        self.close_func.assert_called_once_with(client)
+
+    def test_discard(self):
+        client = MagicMock()
+        create_func = MagicMock(return_value=client)
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.discard(client)
+        self.close_func.assert_called_once_with(client)
+        SessionPool.acquire(self.key, create_func, self.close_func)
+        assert create_func.call_count == 2
+
+    def test_close_all(self):
+        create_func = MagicMock(side_effect=[MagicMock(), MagicMock()])
+        client_1 = SessionPool.acquire(self.key, create_func, self.close_func)
+        client_2 = SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.release(client_1)
+        self.close_func.side_effect = [Exception("logout failed"), None]
+        SessionPool.close_all()
+        assert self.close_func.call_count == 2
+        closed_clients = [call.args[0] for call in self.close_func.call_args_list]
+        assert client_1 in closed_clients and client_2 in closed_clients
+
+    def test_session_counts_metric(self):
+        create_func = MagicMock(side_effect=[MagicMock(), MagicMock()])
+        client_1 = SessionPool.acquire(self.key, create_func, self.close_func)
+        client_2 = SessionPool.acquire(self.key, create_func, self.close_func)
+        SessionPool.release(client_2)
+        assert SessionPool.get_session_counts() == {("MagicMock", "vc_hostname", "leased"): 1,
+                                                    ("MagicMock", "vc_hostname", "idle"): 1}
+        metrics_text = metrics.REGISTRY.generate_text()
+        assert 'config_modules_session_pool_sessions{client_type="MagicMock",hostname="vc_hostname",' \
+               'state="leased"} 1' in metrics_text
+        SessionPool.release(client_1)
+        assert SessionPool.get_session_counts() == {("MagicMock", "vc_hostname", "idle"): 2}
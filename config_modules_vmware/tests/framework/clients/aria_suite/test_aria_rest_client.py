@@ -0,0 +1,65 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import pytest
+from mock import MagicMock
+from mock import patch
+from requests import HTTPError
+
+from config_modules_vmware.framework.clients.aria_suite.aria_rest_client import AriaRestClient
+
+
+def create_response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(f"{status_code} error")
+    return response
+
+
+class TestAriaRestClient:
+
+    def setup_method(self):
+        self.get_http_headers_patcher = patch(
+            "config_modules_vmware.framework.clients.aria_suite.aria_auth.get_http_headers"
+        )
+        self.mock_get_http_headers = self.get_http_headers_patcher.start()
+        self.mock_get_http_headers.side_effect = [{"Authorization": "Basic token-1"},
+                                                  {"Authorization": "Basic token-2"}]
+        self.client = AriaRestClient("vrslcm_hostname")
+        self.client._session = MagicMock()
+        self.url = f"{self.client.get_base_url()}/lcm/lcops/api/v2/settings/dns"
+
+    def teardown_method(self):
+        self.get_http_headers_patcher.stop()
+
+    def test_http_headers_cached(self):
+        self.client._session.request.return_value = create_response(200, [])
+        assert self.client.request("GET", self.url) == []
+        self.client.request("POST", self.url, body={"name": "dns", "hostName": "8.8.8.8"})
+        self.mock_get_http_headers.assert_called_once_with(session=self.client._session)
+        assert self.client._session.request.call_args.kwargs["data"] == '{"name": "dns", "hostName": "8.8.8.8"}'
+
+    @patch("config_modules_vmware.framework.clients.aria_suite.aria_rest_client.time.monotonic")
+    def test_http_headers_ttl(self, mock_monotonic):
+        self.client._session.request.return_value = create_response(200, [])
+        mock_monotonic.return_value = 1000
+        self.client.request("GET", self.url)
+        mock_monotonic.return_value = 1601
+        self.client.request("GET", self.url)
+        assert self.mock_get_http_headers.call_count == 2
+        assert self.client._session.request.call_args.kwargs["headers"] == {"Authorization": "Basic token-2"}
+
+    def test_unauthorized_retried_with_new_http_headers(self):
+        self.client._session.request.side_effect = [create_response(401), create_response(200, [])]
+        assert self.client.request("GET", self.url) == []
+        assert self.client._session.request.call_args.kwargs["headers"] == {"Authorization": "Basic token-2"}
+
+    def test_request_failed(self):
+        self.client._session.request.return_value = create_response(404)
+        with pytest.raises(HTTPError, match="404 error"):
+            self.client.request("GET", self.url)
+        self.mock_get_http_headers.assert_called_once()
+
+    def test_close(self):
+        self.client.close()
+        self.client._session.close.assert_called_once()
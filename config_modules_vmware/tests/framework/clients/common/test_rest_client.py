@@ -0,0 +1,13 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from config_modules_vmware.framework.clients.common.rest_client import get_metrics_endpoint
+
+
+class TestRestClient:
+
+    def test_get_metrics_endpoint(self):
+        assert get_metrics_endpoint("https://vc/api/vcenter/cluster/domain-c8?names=a") == "/api/vcenter/cluster/{id}"
+        assert get_metrics_endpoint("/v1/domains/1e2bd5a8-9a39-4c3b-9c2a-123456789abc/clusters") == \
+            "/v1/domains/{id}/clusters"
+        assert get_metrics_endpoint("https://sddc/v1/system/dns-config") == "/v1/system/dns-config"
+        assert get_metrics_endpoint("/api/esx/settings/clusters/domain-c1/software/drafts/12") == \
+            "/api/esx/settings/clusters/{id}/software/drafts/{id}"
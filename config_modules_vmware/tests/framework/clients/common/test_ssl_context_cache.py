@@ -0,0 +1,70 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import ssl
+
+from mock import MagicMock
+from mock import patch
+
+from config_modules_vmware.framework.auth.ssl.cert_info import CertInfo
+from config_modules_vmware.framework.clients.common import ssl_context_cache
+
+
+class TestSslContextCache:
+
+    def setup_method(self):
+        ssl_context_cache.clear()
+        self.hostname = "vc_hostname"
+        self.cert_info_list = [CertInfo("certificate string")]
+
+    def teardown_method(self):
+        ssl_context_cache.clear()
+
+    def test_get_ssl_context(self):
+        ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
+        assert ssl_ctx.verify_mode == ssl.CERT_NONE
+        assert ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE) is ssl_ctx
+        assert ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLS, ssl.CERT_NONE) is not ssl_ctx
+
+    @patch("ssl.SSLContext.load_verify_locations")
+    def test_get_ssl_context_cert_required(self, mock_load_verify_locations):
+        ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_REQUIRED, capath="/etc/ssl/certs")
+        assert ssl_ctx.verify_mode == ssl.CERT_REQUIRED
+        assert ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_REQUIRED, capath="/etc/ssl/certs") \
+            is ssl_ctx
+        mock_load_verify_locations.assert_called_once_with(capath="/etc/ssl/certs")
+
+    @patch("config_modules_vmware.framework.clients.common.certificate_verification.validate_all_certificates")
+    def test_get_validated_certificate_context(self, mock_validate_all_certificates):
+        mock_validate_all_certificates.side_effect = [(MagicMock(), None), (MagicMock(), None)]
+        result = ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list)
+        assert ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list) is result
+        assert mock_validate_all_certificates.call_count == 1
+
+        # other target is probed again
+        ssl_context_cache.get_validated_certificate_context("other_hostname", self.cert_info_list)
+        assert mock_validate_all_certificates.call_count == 2
+
+    @patch("config_modules_vmware.framework.clients.common.ssl_context_cache.time.monotonic")
+    @patch("config_modules_vmware.framework.clients.common.certificate_verification.validate_all_certificates")
+    def test_get_validated_certificate_context_ttl(self, mock_validate_all_certificates, mock_monotonic):
+        mock_validate_all_certificates.side_effect = [(MagicMock(), None), (MagicMock(), None)]
+        mock_monotonic.return_value = 1000
+        result = ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list)
+        mock_monotonic.return_value = 1601
+        assert ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list) is not result
+        assert mock_validate_all_certificates.call_count == 2
+
+    @patch("config_modules_vmware.framework.clients.common.certificate_verification.validate_all_certificates")
+    def test_get_validated_certificate_context_failure_not_cached(self, mock_validate_all_certificates):
+        mock_validate_all_certificates.side_effect = [Exception("No valid certificate found"), (MagicMock(), None)]
+        try:
+            ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list)
+        except Exception as e:
+            assert str(e) == "No valid certificate found"
+        assert ssl_context_cache.get_validated_certificate_context(self.hostname, self.cert_info_list) is not None
+        assert mock_validate_all_certificates.call_count == 2
+
+    @patch("config_modules_vmware.framework.clients.common.ssl_context_cache.Config.get_section")
+    def test_cache_disabled(self, mock_get_section):
+        mock_get_section.return_value.getint.return_value = 0
+        ssl_ctx = ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE)
+        assert ssl_context_cache.get_ssl_context(ssl.PROTOCOL_TLSv1_2, ssl.CERT_NONE) is not ssl_ctx
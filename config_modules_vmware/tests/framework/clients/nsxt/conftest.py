@@ -0,0 +1,46 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import os
+import sys
+
+import pytest
+
+
+# Fake 'su' standing in for the NSX admin CLI, keeps the NTP servers in a file and logs every invocation.
+FAKE_NSX_ADMIN_CLI_SU = """#!/bin/sh
+DIR=$(dirname "$0")
+echo "$@" >> "$DIR/invocations"
+run() {
+  case "$1" in
+    "set ntp-server "*) echo "${1#set ntp-server }" >> "$DIR/ntp-servers" ;;
+    "del ntp-server "*) grep -vxF "${1#del ntp-server }" "$DIR/ntp-servers" > "$DIR/ntp-servers.tmp"
+                        mv "$DIR/ntp-servers.tmp" "$DIR/ntp-servers" ;;
+    "get ntp-servers") cat "$DIR/ntp-servers" ;;
+    "#"*|"exit") ;;
+    *) echo "% Command not found: $1" ;;
+  esac
+}
+if [ "$1" = "-c" ]; then
+  run "$2"
+else
+  # an interactive session prints a banner and echoes every command after the prompt, like nsxcli
+  echo "NSX CLI (Manager, Policy, Controller 4.1.0.0.0). Press ? for command list or enter: help"
+  while IFS= read -r line; do echo "nsx-manager> $line"; run "$line"; done
+fi
+"""
+
+
+@pytest.fixture
+def fake_nsx_admin_cli(tmp_path, monkeypatch):
+    """
+    Put a fake 'su' running the NSX admin CLI commands first in PATH.
+    Returns the directory holding the 'ntp-servers' state file and the 'invocations' log.
+    """
+    if sys.platform.startswith("win"):
+        pytest.skip("fake admin CLI requires a POSIX shell")
+    su_path = tmp_path / "su"
+    su_path.write_text(FAKE_NSX_ADMIN_CLI_SU)
+    su_path.chmod(0o755)
+    (tmp_path / "ntp-servers").write_text("")
+    (tmp_path / "invocations").write_text("")
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    return tmp_path
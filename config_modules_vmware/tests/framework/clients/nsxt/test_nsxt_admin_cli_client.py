@@ -0,0 +1,85 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import pytest
+from mock import patch
+
+from config_modules_vmware.framework.clients.nsxt.nsxt_admin_cli_client import NsxtAdminCliClient
+
+
+class TestNsxtAdminCliClient:
+
+    def setup_method(self):
+        self.client = NsxtAdminCliClient()
+
+    @patch("config_modules_vmware.framework.utils.utils.run_shell_cmd")
+    def test_run_commands_single_session(self, mock_run_shell_cmd):
+        mock_run_shell_cmd.return_value = ("time.google.com\n", "", 0)
+        output = self.client.run_commands(["set ntp-server time.google.com", "del ntp-server time.vmware.com",
+                                           "get ntp-servers"])
+        assert output == "time.google.com\n"
+        mock_run_shell_cmd.assert_called_once()
+        assert mock_run_shell_cmd.call_args.args == ("su admin",)
+        assert mock_run_shell_cmd.call_args.kwargs["input_to_stdin"] == \
+            "set ntp-server time.google.com\ndel ntp-server time.vmware.com\nget ntp-servers\nexit\n"
+
+    @patch("config_modules_vmware.framework.utils.utils.run_shell_cmd")
+    def test_run_commands_empty(self, mock_run_shell_cmd):
+        assert self.client.run_commands([]) == ""
+        mock_run_shell_cmd.assert_not_called()
+
+    @patch("config_modules_vmware.framework.utils.utils.run_shell_cmd")
+    def test_run_commands_invalid_command(self, mock_run_shell_cmd):
+        with pytest.raises(ValueError):
+            self.client.run_commands(["set ntp-server time.google.com\ndel ntp-server time.vmware.com"])
+        with pytest.raises(ValueError):
+            self.client.run_command("set ntp-server 'time.google.com")
+        mock_run_shell_cmd.assert_not_called()
+
+    def test_run_command_fake_admin_cli(self, fake_nsx_admin_cli):
+        (fake_nsx_admin_cli / "ntp-servers").write_text("time.vmware.com\n")
+        assert self.client.run_command("get ntp-servers") == "time.vmware.com\n"
+        assert (fake_nsx_admin_cli / "invocations").read_text() == "-c get ntp-servers admin\n"
+
+    def test_run_commands_fake_admin_cli(self, fake_nsx_admin_cli):
+        (fake_nsx_admin_cli / "ntp-servers").write_text("time.vmware.com\n")
+        output = self.client.run_commands(["set ntp-server time.google.com", "del ntp-server time.vmware.com",
+                                           "get ntp-servers"])
+        assert "time.google.com\n" in output
+        assert (fake_nsx_admin_cli / "ntp-servers").read_text() == "time.google.com\n"
+        assert (fake_nsx_admin_cli / "invocations").read_text() == "admin\n"
+
+    def test_run_commands_and_read_fake_admin_cli(self, fake_nsx_admin_cli):
+        (fake_nsx_admin_cli / "ntp-servers").write_text("time.vmware.com\n")
+        output = self.client.run_commands_and_read(
+            ["set ntp-server time.google.com", "del ntp-server time.vmware.com"], "get ntp-servers"
+        )
+        assert output == "time.google.com\n"
+        assert (fake_nsx_admin_cli / "invocations").read_text() == "admin\n"
+
+    def test_run_commands_and_read_without_change(self, fake_nsx_admin_cli):
+        assert self.client.run_commands_and_read([], "get ntp-servers") == ""
+
+    @patch("config_modules_vmware.framework.utils.utils.run_shell_cmd")
+    def test_run_commands_and_read_markers_reported_as_unknown(self, mock_run_shell_cmd):
+        def run_session(command, timeout, input_to_stdin):
+            output = []
+            for line in input_to_stdin.splitlines():
+                output.append(f"nsx-manager> {line}")
+                if line.startswith("#"):
+                    output.append(f"% Command not found: {line}")
+                elif line == "get ntp-servers":
+                    output.append("time.google.com")
+            return "\n".join(output) + "\n", "", 0
+
+        mock_run_shell_cmd.side_effect = run_session
+        assert self.client.run_commands_and_read(["set ntp-server time.google.com"], "get ntp-servers") == \
+            "time.google.com\n"
+
+    @patch("config_modules_vmware.framework.utils.utils.run_shell_cmd")
+    def test_run_commands_and_read_markers_not_found(self, mock_run_shell_cmd):
+        mock_run_shell_cmd.return_value = ("time.google.com\n", "", 0)
+        with pytest.raises(Exception, match="Output of admin CLI command 'get ntp-servers' not found"):
+            self.client.run_commands_and_read(["set ntp-server time.google.com"], "get ntp-servers")
+
+    def test_run_commands_fake_admin_cli_error(self, fake_nsx_admin_cli):
+        with pytest.raises(Exception, match="Admin CLI command failed: % Command not found: set ntp-servers"):
+            self.client.run_commands(["set ntp-servers time.google.com", "get ntp-servers"])
@@ -0,0 +1,60 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from mock import MagicMock
+from pyVmomi import vim  # pylint: disable=E0401
+
+from config_modules_vmware.framework.clients.vcenter.vc_alarm_catalog import AlarmCatalog
+
+
+def event_expression(event_type_id, object_type):
+    expression = MagicMock(spec=vim.alarm.EventAlarmExpression)
+    expression.eventTypeId = event_type_id
+    expression.objectType = object_type
+    return expression
+
+
+def alarm(name, expressions):
+    alarm_def = MagicMock(spec=[])
+    alarm_info = MagicMock()
+    alarm_info.name = name
+    if expressions is None:
+        alarm_info.expression = None
+    else:
+        alarm_info.expression.expression = expressions
+    return alarm_def, alarm_info
+
+
+class TestAlarmCatalog:
+
+    def setup_method(self):
+        self.sso_expression = event_expression("com.vmware.sso.PrincipalManagement", vim.Folder)
+        self.syslog_expression = event_expression("esx.problem.vmsyslogd.remote.failure", vim.HostSystem)
+        self.syslog_expression_2 = event_expression("esx.problem.vmsyslogd.remote.failure", vim.HostSystem)
+        self.state_expression = MagicMock(spec=vim.alarm.StateAlarmExpression)
+        self.state_expression.objectType = vim.VirtualMachine
+        self.sso_alarm = alarm("SSO alarm", [self.sso_expression])
+        self.syslog_alarm = alarm("Syslog alarm", [self.syslog_expression, self.syslog_expression_2])
+        self.state_alarm = alarm("State alarm", [self.state_expression])
+        self.empty_alarm = alarm("Empty alarm", None)
+        self.catalog = AlarmCatalog([self.sso_alarm, self.syslog_alarm, self.state_alarm, self.empty_alarm])
+
+    def test_get_event_alarms(self):
+        assert len(self.catalog) == 4
+        assert self.catalog.get_event_alarms("com.vmware.sso.PrincipalManagement") == [
+            (*self.sso_alarm, self.sso_expression)
+        ]
+        # An alarm is returned once per matching expression
+        assert self.catalog.get_event_alarms("esx.problem.vmsyslogd.remote.failure") == [
+            (*self.syslog_alarm, self.syslog_expression),
+            (*self.syslog_alarm, self.syslog_expression_2),
+        ]
+        assert self.catalog.get_event_alarms("unknown") == []
+
+    def test_get_alarms_by_target_type(self):
+        assert self.catalog.get_alarms_by_target_type(vim.HostSystem) == [self.syslog_alarm]
+        assert self.catalog.get_alarms_by_target_type(vim.VirtualMachine) == [self.state_alarm]
+        assert self.catalog.get_alarms_by_target_type(vim.Datastore) == []
+
+    def test_get_alarm_by_name(self):
+        assert self.catalog.get_alarm_by_name("Empty alarm") == self.empty_alarm
+        assert self.catalog.get_alarm_by_name("unknown") is None
+        assert self.catalog.get_all_alarms() == [self.sso_alarm, self.syslog_alarm, self.state_alarm, self.empty_alarm]
@@ -0,0 +1,47 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from mock import MagicMock
+
+from config_modules_vmware.framework.clients.vcenter.vc_authorization_snapshot import AuthorizationSnapshot
+
+
+def role(role_id, name):
+    mock_role = MagicMock(roleId=role_id)
+    mock_role.name = name
+    return mock_role
+
+
+def permission(principal, role_id, entity="group-d1"):
+    return MagicMock(principal=principal, roleId=role_id, entity=entity)
+
+
+class TestAuthorizationSnapshot:
+
+    def setup_method(self):
+        self.admin_role = role(-1, "Admin")
+        self.read_only_role = role(-2, "ReadOnly")
+        self.custom_role = role(1103, "Custom")
+        self.admins_permission = permission("VSPHERE.LOCAL\\Administrators", -1)
+        self.user_permission = permission("abc.com\\user1", 1103)
+        self.user_vm_permission = permission("ABC.COM\\User1", -2, entity="vm-1")
+        self.snapshot = AuthorizationSnapshot(
+            [self.admin_role, self.read_only_role, self.custom_role],
+            [self.admins_permission, self.user_permission, self.user_vm_permission],
+        )
+
+    def test_get_roles(self):
+        assert self.snapshot.get_roles() == [self.admin_role, self.read_only_role, self.custom_role]
+        assert self.snapshot.get_role_by_id(1103) is self.custom_role
+        assert self.snapshot.get_role_by_name("ReadOnly") is self.read_only_role
+        assert self.snapshot.get_role_by_id(1) is None
+        assert self.snapshot.get_role_by_name("unknown") is None
+        assert self.snapshot.get_role_id_name_map() == {-1: "Admin", -2: "ReadOnly", 1103: "Custom"}
+        assert self.snapshot.get_role_name_id_map() == {"Admin": -1, "ReadOnly": -2, "Custom": 1103}
+
+    def test_get_permissions_by_role_id(self):
+        assert self.snapshot.get_permissions_by_role_id(-1) == [self.admins_permission]
+        assert self.snapshot.get_permissions_by_role_id(1) == []
+
+    def test_get_permissions_by_principal(self):
+        assert self.snapshot.get_permissions_by_principal("abc.com\\USER1") == \
+            [self.user_permission, self.user_vm_permission]
+        assert self.snapshot.get_permissions_by_principal("abc.com\\user2") == []
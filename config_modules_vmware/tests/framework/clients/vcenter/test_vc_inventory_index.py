@@ -0,0 +1,74 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from mock import MagicMock
+from pyVmomi import vim  # pylint: disable=E0401
+
+from config_modules_vmware.framework.clients.vcenter.vc_inventory_index import InventoryIndex
+
+
+def entity(vimtype, moid):
+    ref = MagicMock(spec=vimtype)
+    ref._moId = moid
+    return ref
+
+
+class TestInventoryIndex:
+
+    def setup_method(self):
+        self.root = entity(vim.Folder, "group-d1")
+        self.datacenter = entity(vim.Datacenter, "datacenter-1")
+        self.vm_folder = entity(vim.Folder, "group-v1")
+        self.nested_folder = entity(vim.Folder, "group-v2")
+        self.host_folder = entity(vim.Folder, "group-h1")
+        self.cluster = entity(vim.ClusterComputeResource, "domain-c1")
+        self.host = entity(vim.HostSystem, "host-1")
+        self.vapp = entity(vim.VirtualApp, "resgroup-v1")
+        self.vm_1 = entity(vim.VirtualMachine, "vm-1")
+        self.vm_2 = entity(vim.VirtualMachine, "vm-2")
+        self.vm_3 = entity(vim.VirtualMachine, "vm-3")
+        self.orphan = entity(vim.VirtualMachine, "vm-4")
+        self.inventory_index = InventoryIndex({
+            "group-d1": (self.root, "Datacenters", None),
+            "datacenter-1": (self.datacenter, "SDDC-Datacenter", self.root),
+            "group-v1": (self.vm_folder, "vm", self.datacenter),
+            "group-v2": (self.nested_folder, "Management VMs", self.vm_folder),
+            "group-h1": (self.host_folder, "host", self.datacenter),
+            "domain-c1": (self.cluster, "SDDC-Cluster", self.host_folder),
+            "host-1": (self.host, "esxi-1", self.cluster),
+            "resgroup-v1": (self.vapp, "vapp", self.vm_folder),
+            "vm-1": (self.vm_1, "vcenter-1", self.nested_folder),
+            "vm-2": (self.vm_2, "nsx-mgmt-1", self.vm_folder),
+            "vm-3": (self.vm_3, "vapp-vm", self.vapp),
+            "vm-4": (self.orphan, "orphan", entity(vim.Folder, "group-unknown")),
+        })
+
+    def test_path_lookups(self):
+        assert len(self.inventory_index) == 12
+        assert "host-1" in self.inventory_index
+        assert self.inventory_index.get_path("group-d1") == ""
+        assert self.inventory_index.get_path("host-1") == "/SDDC-Datacenter/host/SDDC-Cluster/esxi-1"
+        assert self.inventory_index.get_path("vm-1") == "/SDDC-Datacenter/vm/Management VMs/vcenter-1"
+        assert self.inventory_index.get_path("vm-4") is None
+        assert self.inventory_index.get_path("vm-unknown") is None
+        assert self.inventory_index.get_moid("/SDDC-Datacenter/host/SDDC-Cluster") == "domain-c1"
+        assert self.inventory_index.get_moid("/SDDC-Datacenter/vm/vapp/vapp-vm") == "vm-3"
+        assert self.inventory_index.get_moid("/SDDC-Datacenter/vm/unknown") is None
+
+    def test_entity_lookups(self):
+        assert self.inventory_index.get_ref("host-1") is self.host
+        assert self.inventory_index.get_name("domain-c1") == "SDDC-Cluster"
+        assert self.inventory_index.get_parent_moid("host-1") == "domain-c1"
+        assert self.inventory_index.get_parent_moid("group-d1") is None
+        assert sorted(self.inventory_index.get_moids_by_type(vim.VirtualMachine)) == ["vm-1", "vm-2", "vm-3", "vm-4"]
+        assert self.inventory_index.get_ancestor("host-1", vim.Datacenter) == "datacenter-1"
+        assert self.inventory_index.get_ancestor("host-1", vim.ClusterComputeResource) == "domain-c1"
+        assert self.inventory_index.get_ancestor("datacenter-1", vim.Datacenter) is None
+
+    def test_get_vm_path_in_datacenter(self):
+        assert self.inventory_index.get_vm_path_in_datacenter("vm-1") == "SDDC-Datacenter/vm/Management VMs"
+        assert self.inventory_index.get_vm_path_in_datacenter("vm-2") == "SDDC-Datacenter/vm"
+        # VMs outside the folder tree are not resolved
+        assert self.inventory_index.get_vm_path_in_datacenter("vm-3") is None
+        assert self.inventory_index.get_vm_path_in_datacenter("vm-4") is None
+
+    def test_get_cluster_path_moid_mapping(self):
+        assert self.inventory_index.get_cluster_path_moid_mapping() == {"/SDDC-Datacenter/SDDC-Cluster": "domain-c1"}
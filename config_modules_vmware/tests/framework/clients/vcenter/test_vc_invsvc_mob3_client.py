@@ -0,0 +1,93 @@
+# Copyright 2025 Broadcom. All Rights Reserved.
+import pytest
+from mock import MagicMock
+
+from config_modules_vmware.framework.clients.vcenter.vc_invsvc_mob3_client import VcInvsvcMob3Client
+
+
+def create_nonce_response(nonce, cookie):
+    response = MagicMock()
+    response.status = 200
+    response.headers = {"set-cookie": f"{cookie}; Path=/invsvc; Secure; HttpOnly"}
+    response.data = f'<input name="vmware-session-nonce" type="hidden" value="{nonce}">'.encode("utf-8")
+    return response
+
+
+def create_method_response(status=200, data=b""):
+    response = MagicMock()
+    response.status = status
+    response.reason = "Reason"
+    response.data = data
+    return response
+
+
+class TestVcInvsvcMob3Client:
+
+    def setup_method(self):
+        self.mob3_client = VcInvsvcMob3Client("vc_hostname", "user", "pwd", verify_ssl=False)
+        self.mob3_client.get_helper = MagicMock()
+        self.mob3_client.post_helper = MagicMock(return_value=create_method_response())
+        self.url = f"{self.mob3_client.get_base_url()}/?moid=authorizationService&method=AuthorizationService.Test"
+
+    def test_session_nonce_reused(self):
+        self.mob3_client.get_helper.return_value = create_nonce_response("nonce_1", "vmware_soap_session=s1")
+        self.mob3_client.invoke_method(self.url, params="principals=a")
+        self.mob3_client.invoke_method(self.url)
+        assert self.mob3_client.get_helper.call_count == 1
+        first_call, second_call = self.mob3_client.post_helper.call_args_list
+        assert first_call.kwargs["body"] == "vmware-session-nonce=nonce_1&principals=a"
+        assert first_call.kwargs["headers"]["Cookie"] == "vmware_soap_session=s1"
+        assert second_call.kwargs["body"] == "vmware-session-nonce=nonce_1"
+
+    @pytest.mark.parametrize(
+        "rejected_response",
+        [
+            create_method_response(401),
+            create_method_response(403),
+            create_method_response(500, b"<h1>Invalid vmware-session-nonce</h1>"),
+        ],
+    )
+    def test_expired_session_nonce_refreshed(self, rejected_response):
+        self.mob3_client.get_helper.side_effect = [
+            create_nonce_response("nonce_1", "vmware_soap_session=s1"),
+            create_nonce_response("nonce_2", "vmware_soap_session=s2"),
+        ]
+        self.mob3_client.invoke_method(self.url)
+        self.mob3_client.post_helper.side_effect = [rejected_response, create_method_response()]
+        self.mob3_client.invoke_method(self.url)
+        assert self.mob3_client.get_helper.call_count == 2
+        last_call = self.mob3_client.post_helper.call_args
+        assert last_call.kwargs["body"] == "vmware-session-nonce=nonce_2"
+        assert last_call.kwargs["headers"]["Cookie"] == "vmware_soap_session=s2"
+
+    def test_failure_with_new_session_nonce_not_retried(self):
+        self.mob3_client.get_helper.return_value = create_nonce_response("nonce_1", "vmware_soap_session=s1")
+        self.mob3_client.post_helper.return_value = create_method_response(401)
+        with pytest.raises(Exception, match="401 Client Error"):
+            self.mob3_client.invoke_method(self.url)
+        assert self.mob3_client.post_helper.call_count == 1
+
+    @pytest.mark.parametrize(
+        "failure",
+        [create_method_response(500, b"<h1>Internal Server Error</h1>"), Exception("Read timed out")],
+    )
+    def test_other_failure_with_cached_session_nonce_not_retried(self, failure):
+        self.mob3_client.get_helper.return_value = create_nonce_response("nonce_1", "vmware_soap_session=s1")
+        self.mob3_client.invoke_method(self.url)
+        self.mob3_client.post_helper.reset_mock()
+        if isinstance(failure, Exception):
+            self.mob3_client.post_helper.side_effect = failure
+        else:
+            self.mob3_client.post_helper.return_value = failure
+        with pytest.raises(Exception, match="Read timed out|500 Server Error"):
+            self.mob3_client.invoke_method(self.url)
+        assert self.mob3_client.post_helper.call_count == 1
+        assert self.mob3_client.get_helper.call_count == 1
+
+    def test_disconnect_drops_session_nonce(self):
+        self.mob3_client.get_helper.return_value = create_nonce_response("nonce_1", "vmware_soap_session=s1")
+        self.mob3_client.invoke_method(self.url)
+        self.mob3_client.disconnect()
+        self.mob3_client.invoke_method(self.url)
+        # nonce page twice, logout once
+        assert self.mob3_client.get_helper.call_count == 3
@@ -1,6 +1,7 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 from mock import MagicMock
 from mock import patch
+from pyVmomi import vim  # pylint: disable=E0401
 
 from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VcVmomiClient
 
@@ -8,7 +9,36 @@ from config_modules_vmware.framework.clients.vcenter.vc_vmomi_client import VcVm
 class TestVcVmomiClient:
 
     @patch.object(VcVmomiClient, "connect")
-    def test_retrieve_cluster_path(self, connect):
+    def test_retrieve_cluster_path_with_index(self, connect):
+        def entity(vimtype, moid):
+            ref = MagicMock(spec=vimtype)
+            ref._moId = moid
+            return ref
+
+        # root folder, datacenter, folder under datacenter, host folder and cluster
+        root = entity(vim.Folder, "group-d1")
+        datacenter = entity(vim.Datacenter, "datacenter-1")
+        folder = entity(vim.Folder, "group-h2")
+        host_folder = entity(vim.Folder, "group-h1")
+        cluster = entity(vim.ClusterComputeResource, "domain-1")
+        name_parent_index = {
+            "group-d1": (root, "Datacenters", None),
+            "datacenter-1": (datacenter, "testDatacenter", root),
+            "group-h2": (folder, "testFolder", datacenter),
+            "group-h1": (host_folder, "host", folder),
+            "domain-1": (cluster, "testCluster", host_folder),
+        }
+
+        vc_vmomi_client = VcVmomiClient(hostname="hostname", user="username", pwd="password")
+        with patch.object(VcVmomiClient, "retrieve_name_parent_index", return_value=name_parent_index):
+            inventory_index = vc_vmomi_client.build_inventory_index()
+        with patch.object(VcVmomiClient, "get_all_clusters") as mock_get_all_clusters:
+            cluster_path_moid_mapping = vc_vmomi_client.retrieve_cluster_path_moid_mapping(inventory_index)
+            assert cluster_path_moid_mapping == {"/testDatacenter/testFolder/testCluster": "domain-1"}
+            mock_get_all_clusters.assert_not_called()
+
+    @patch.object(VcVmomiClient, "connect")
+    def test_retrieve_cluster_path_without_index(self, connect):
         # root datacenter
         root = MagicMock()
         root.name = "Datacenters"
@@ -44,3 +74,79 @@ class TestVcVmomiClient:
                                                   saml_token='saml_token')
             cluster_path_moid_mapping = vc_vmomi_client.retrieve_cluster_path_moid_mapping()
             assert cluster_path_moid_mapping == expected_cluster_path_moid_mapping
+
+    @patch.object(VcVmomiClient, "connect")
+    def test_retrieve_name_parent_index(self, connect):
+        vc_vmomi_client = VcVmomiClient(hostname="hostname", user="username", pwd="password")
+        vc_vmomi_client.content = MagicMock()
+        vc_vmomi_client.content.rootFolder = MagicMock(spec=vim.Folder)
+        container_view = MagicMock(spec=vim.view.ContainerView)
+        vc_vmomi_client.content.viewManager.CreateContainerView.return_value = container_view
+        folder = MagicMock()
+        folder._moId = "group-v1"
+        vm = MagicMock()
+        vm._moId = "vm-1"
+
+        def object_content(obj, name, parent):
+            name_prop = MagicMock(val=name)
+            name_prop.name = "name"
+            parent_prop = MagicMock(val=parent)
+            parent_prop.name = "parent"
+            return MagicMock(obj=obj, propSet=[name_prop, parent_prop])
+
+        first_page = MagicMock(objects=[object_content(folder, "vm", None)], token="token")
+        second_page = MagicMock(objects=[object_content(vm, "vcenter-1", folder)], token=None)
+        property_collector = vc_vmomi_client.content.propertyCollector
+        property_collector.RetrievePropertiesEx.return_value = first_page
+        property_collector.ContinueRetrievePropertiesEx.return_value = second_page
+
+        index = vc_vmomi_client.retrieve_name_parent_index([vim.Folder, vim.VirtualMachine])
+        assert index == {"group-v1": (folder, "vm", None), "vm-1": (vm, "vcenter-1", folder)}
+        property_collector.RetrievePropertiesEx.assert_called_once()
+        property_collector.ContinueRetrievePropertiesEx.assert_called_once_with(token="token")
+        container_view.DestroyView.assert_called_once()
+
+    @patch.object(VcVmomiClient, "connect")
+    def test_retrieve_alarm_infos(self, connect):
+        vc_vmomi_client = VcVmomiClient(hostname="hostname", user="username", pwd="password")
+        vc_vmomi_client.content = MagicMock()
+        alarm_refs = [MagicMock(spec=vim.alarm.Alarm), MagicMock(spec=vim.alarm.Alarm)]
+        for index, alarm_ref in enumerate(alarm_refs):
+            alarm_ref._moId = f"alarm-{index}"
+        vc_vmomi_client.content.alarmManager.GetAlarm.return_value = alarm_refs
+
+        info_props = []
+        for alarm_ref in reversed(alarm_refs):
+            info_prop = MagicMock(val=f"info-{alarm_ref._moId}")
+            info_prop.name = "info"
+            info_props.append(MagicMock(obj=alarm_ref, propSet=[info_prop]))
+        property_collector = vc_vmomi_client.content.propertyCollector
+        property_collector.RetrievePropertiesEx.return_value = MagicMock(objects=info_props, token=None)
+
+        alarm_infos = vc_vmomi_client.retrieve_alarm_infos()
+        assert alarm_infos == [(alarm_refs[0], "info-alarm-0"), (alarm_refs[1], "info-alarm-1")]
+        property_collector.RetrievePropertiesEx.assert_called_once()
+        property_collector.ContinueRetrievePropertiesEx.assert_not_called()
+
+    @patch.object(VcVmomiClient, "connect")
+    def test_retrieve_alarm_infos_no_alarms(self, connect):
+        vc_vmomi_client = VcVmomiClient(hostname="hostname", user="username", pwd="password")
+        vc_vmomi_client.content = MagicMock()
+        vc_vmomi_client.content.alarmManager.GetAlarm.return_value = []
+        assert vc_vmomi_client.retrieve_alarm_infos() == []
+        vc_vmomi_client.content.propertyCollector.RetrievePropertiesEx.assert_not_called()
+
+    @patch.object(VcVmomiClient, "connect")
+    def test_build_authorization_snapshot(self, connect):
+        vc_vmomi_client = VcVmomiClient(hostname="hostname", user="username", pwd="password")
+        vc_vmomi_client.content = MagicMock()
+        authorization_manager = vc_vmomi_client.content.authorizationManager
+        authorization_manager.roleList = [MagicMock(roleId=-1), MagicMock(roleId=1103)]
+        authorization_manager.RetrieveAllPermissions.return_value = [
+            MagicMock(principal="VSPHERE.LOCAL\\Administrators", roleId=-1)
+        ]
+        snapshot = vc_vmomi_client.build_authorization_snapshot()
+        assert snapshot.get_roles() == authorization_manager.roleList
+        assert len(snapshot.get_permissions_by_role_id(-1)) == 1
+        authorization_manager.RetrieveAllPermissions.assert_called_once_with()
+        authorization_manager.RetrieveRolePermissions.assert_not_called()
@@ -0,0 +1,71 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import pytest
+from mock import MagicMock
+from mock import patch
+
+from config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client import VcVmomiSSOClient
+
+
+def create_principal(name, domain):
+    principal = MagicMock()
+    principal.id.name = name
+    principal.id.domain = domain
+    return principal
+
+
+class TestVcVmomiSSOClient:
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vmomi_sso_client.VcVmomiSSOClient.connect")
+    def setup_method(self, method, mock_connect):
+        self.sso_client = VcVmomiSSOClient("vc_hostname", "user", "pwd", verify_ssl=False)
+        self.sso_client.content = MagicMock()
+        self.principal_discovery_service = self.sso_client.content.principalDiscoveryService
+        self.admins = create_principal("Administrators", "vsphere.local")
+        self.devops = create_principal("devops", "vsphere.local")
+        self.oncall = create_principal("oncall", "vsphere.local")
+        self.users = {
+            "administrators": [create_principal("admin", "vsphere.local")],
+            "devops": [create_principal("dev-1", "vmware.com"), create_principal("admin", "VSPHERE.LOCAL")],
+            "oncall": [create_principal("dev-2", "vmware.com")],
+        }
+        self.groups = {
+            "administrators": [self.devops],
+            # cycle back to the parent group
+            "devops": [self.oncall, self.admins],
+            "oncall": [],
+        }
+        self.principal_discovery_service.FindUsersInGroup.side_effect = \
+            lambda groupId, searchString, limit: self.users[groupId.name.lower()]
+        self.principal_discovery_service.FindGroupsInGroup.side_effect = \
+            lambda groupId, searchString, limit: self.groups[groupId.name.lower()]
+
+    def test_get_group_cached(self):
+        group = self.sso_client._get_group("TrustedAdmins", "vsphere.local")
+        assert self.sso_client._get_group("trustedadmins", "VSPHERE.LOCAL") is group
+        assert self.principal_discovery_service.FindGroup.call_count == 1
+
+    def test_find_members_in_group_cached(self):
+        assert self.sso_client.find_users_in_group(self.devops.id) is self.users["devops"]
+        assert self.sso_client.find_groups_in_group(self.admins.id) is self.groups["administrators"]
+        # members are shared with the other controllers using the client
+        assert self.sso_client.find_users_in_group(create_principal("DEVOPS", "vsphere.local").id) is \
+            self.users["devops"]
+        assert self.sso_client.find_groups_in_group(self.admins.id) is self.groups["administrators"]
+        assert self.principal_discovery_service.FindUsersInGroup.call_count == 1
+        assert self.principal_discovery_service.FindGroupsInGroup.call_count == 1
+
+    def test_group_membership_change_invalidates_cache(self):
+        self.sso_client._get_group("TrustedAdmins", "vsphere.local")
+        self.sso_client.find_users_in_group(self.admins.id)
+        self.sso_client.add_user_to_group("Administrators", "dev-2", "vmware.com")
+        self.sso_client.find_users_in_group(self.admins.id)
+        self.sso_client._get_group("TrustedAdmins", "vsphere.local")
+        assert self.principal_discovery_service.FindUsersInGroup.call_count == 2
+        assert self.principal_discovery_service.FindGroup.call_count == 1
+
+    def test_lookup_failure_not_cached(self):
+        self.principal_discovery_service.FindGroupsInGroup.side_effect = [Exception("timed out"), []]
+        with pytest.raises(Exception, match="timed out"):
+            self.sso_client.find_groups_in_group(self.oncall.id)
+        assert self.sso_client.find_groups_in_group(self.oncall.id) == []
+        assert self.principal_discovery_service.FindGroupsInGroup.call_count == 2
@@ -0,0 +1,187 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import io
+import json
+import os
+
+import pytest
+from mock import MagicMock
+from mock import patch
+from pyVmomi import vim
+from pyVmomi import VmomiSupport
+
+from config_modules_vmware.framework.clients.vcenter import vc_vsan_vmomi_client
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import VcVsanVmomiClient
+from config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client import VsanManagementObjectsEnum
+
+VSAN_SERVICE_VERSIONS_XML = b"""<?xml version="1.0" encoding="UTF-8" ?>
+<namespaces version="1.0">
+ <namespace>
+  <name>urn:vim25</name>
+  <version>8.0.3.0</version>
+ </namespace>
+ <namespace>
+  <name>urn:vsan</name>
+  <version>8.0.3.0</version>
+ </namespace>
+</namespaces>
+"""
+
+VIM_SERVICE_VERSIONS_XML = b"""<?xml version="1.0" encoding="UTF-8" ?>
+<namespaces version="1.0">
+ <namespace>
+  <name>urn:vim25</name>
+  <version>8.0.3.0</version>
+ </namespace>
+</namespaces>
+"""
+
+
+class TestVcVsanVmomiClient:
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient.connect")
+    def setup_method(self, method, mock_connect):
+        vc_vsan_vmomi_client._vsan_namespace_cache.clear()
+        self.vc_vsan_vmomi_client = VcVsanVmomiClient("vc_hostname", "user", "pwd", verify_ssl=False)
+        self.vc_vsan_vmomi_client.content = MagicMock()
+        self.vc_vsan_vmomi_client.content.about.build = "24022515"
+        self.mock_http_client = MagicMock()
+        self.vc_vsan_vmomi_client._vmodl_http_client = self.mock_http_client
+
+    def teardown_method(self):
+        vc_vsan_vmomi_client._vsan_namespace_cache.clear()
+
+    def _mock_response(self, xml):
+        response = io.BytesIO(xml)
+        response.status = 200
+        response.reason = "OK"
+        return response
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client._get_vsan_namespace_cache_file")
+    def test_get_latest_vsan_vmodl_version_cached(self, mock_get_cache_file):
+        mock_get_cache_file.return_value = None
+        self.mock_http_client.urlopen.return_value = self._mock_response(VSAN_SERVICE_VERSIONS_XML)
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        assert self.mock_http_client.urlopen.call_count == 1
+        assert self.mock_http_client.urlopen.call_args.kwargs["preload_content"] is False
+
+        # new vCenter build is discovered again
+        self.vc_vsan_vmomi_client.content.about.build = "24305161"
+        self.mock_http_client.urlopen.return_value = self._mock_response(VIM_SERVICE_VERSIONS_XML)
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vim")
+        assert self.mock_http_client.urlopen.call_count == 2
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client._get_vsan_namespace_cache_file")
+    def test_get_latest_vsan_vmodl_version_failure_not_cached(self, mock_get_cache_file):
+        mock_get_cache_file.return_value = None
+        failed_response = self._mock_response(b"")
+        failed_response.status = 503
+        failed_response.reason = "Service Unavailable"
+        self.mock_http_client.urlopen.side_effect = [failed_response,
+                                                     self._mock_response(VSAN_SERVICE_VERSIONS_XML)]
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vim")
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        assert self.mock_http_client.urlopen.call_count == 2
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client._get_vsan_namespace_cache_file")
+    def test_get_latest_vsan_vmodl_version_persisted(self, mock_get_cache_file, tmp_path):
+        cache_file = os.path.join(tmp_path, "cache", "vsan_vmodl_versions.json")
+        mock_get_cache_file.return_value = cache_file
+        self.mock_http_client.urlopen.return_value = self._mock_response(VSAN_SERVICE_VERSIONS_XML)
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        with open(cache_file, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"vc_hostname:24022515": True}
+
+        # another process starts with an empty memory cache and reads the persisted one
+        vc_vsan_vmomi_client._vsan_namespace_cache.clear()
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        assert self.mock_http_client.urlopen.call_count == 1
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client._get_vsan_namespace_cache_file")
+    def test_get_latest_vsan_vmodl_version_corrupt_cache_file(self, mock_get_cache_file, tmp_path):
+        cache_file = os.path.join(tmp_path, "vsan_vmodl_versions.json")
+        with open(cache_file, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        mock_get_cache_file.return_value = cache_file
+        self.mock_http_client.urlopen.return_value = self._mock_response(VIM_SERVICE_VERSIONS_XML)
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vim")
+        with open(cache_file, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"vc_hostname:24022515": False}
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client._get_vsan_namespace_cache_file")
+    def test_get_latest_vsan_vmodl_version_untrusted_cache_file(self, mock_get_cache_file, tmp_path):
+        cache_dir = os.path.join(tmp_path, "shared")
+        os.makedirs(cache_dir)
+        os.chmod(cache_dir, 0o777)
+        cache_file = os.path.join(cache_dir, "vsan_vmodl_versions.json")
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"vc_hostname:24022515": False}, f)
+        mock_get_cache_file.return_value = cache_file
+        self.mock_http_client.urlopen.return_value = self._mock_response(VSAN_SERVICE_VERSIONS_XML)
+        # the file pinning the vim version is ignored, and not replaced in a directory writable by other users
+        assert self.vc_vsan_vmomi_client.get_latest_vsan_vmodl_version() == VmomiSupport.newestVersions.Get("vsan")
+        assert self.mock_http_client.urlopen.call_count == 1
+        with open(cache_file, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"vc_hostname:24022515": False}
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient."
+           "get_latest_vsan_vmodl_version")
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.SoapStubAdapter")
+    def test_get_vsan_vc_stub_reused(self, mock_soap_stub_adapter, mock_get_latest_vsan_vmodl_version):
+        self.vc_vsan_vmomi_client.stub = MagicMock()
+        self.vc_vsan_vmomi_client.stub.soapStub.cookie = "cookie_1"
+        vsan_stub = self.vc_vsan_vmomi_client.get_vsan_vc_stub()
+        assert vsan_stub.cookie == "cookie_1"
+
+        # session re-established, the stub follows the new cookie
+        self.vc_vsan_vmomi_client.stub.soapStub.cookie = "cookie_2"
+        assert self.vc_vsan_vmomi_client.get_vsan_vc_stub() is vsan_stub
+        assert vsan_stub.cookie == "cookie_2"
+        mock_soap_stub_adapter.assert_called_once()
+        mock_get_latest_vsan_vmodl_version.assert_called_once()
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient.get_vsan_vc_stub")
+    def test_get_vsan_vc_mos_by_type_reused(self, mock_get_vsan_vc_stub):
+        health_system = self.vc_vsan_vmomi_client.get_vsan_vc_mos_by_type(
+            VsanManagementObjectsEnum.VSAN_CLUSTER_HEALTH_SYSTEM
+        )
+        assert self.vc_vsan_vmomi_client.get_vsan_health_system() is health_system
+        assert self.vc_vsan_vmomi_client.get_vsan_cluster_config_system() is not health_system
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient."
+           "get_vsan_cluster_config_system")
+    def test_get_vsan_cluster_config_for_cluster_cached(self, mock_get_vsan_cluster_config_system):
+        cluster_ref = MagicMock()
+        cluster_ref._moId = "domain-c1"
+        other_cluster_ref = MagicMock()
+        other_cluster_ref._moId = "domain-c2"
+        vsan_ccs = mock_get_vsan_cluster_config_system.return_value
+        vsan_ccs.VsanClusterGetConfig.side_effect = lambda cluster: MagicMock()
+
+        # auth type and enablement of iscsi targets share the same cluster config
+        self.vc_vsan_vmomi_client.get_vsan_iscsi_targets_auth_type_for_cluster(cluster_ref)
+        self.vc_vsan_vmomi_client.is_vsan_iscsi_targets_enabled_for_cluster(cluster_ref)
+        cluster_config = self.vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster(cluster_ref)
+        assert vsan_ccs.VsanClusterGetConfig.call_count == 1
+        assert self.vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster(other_cluster_ref) is not cluster_config
+        assert vsan_ccs.VsanClusterGetConfig.call_count == 2
+
+        self.vc_vsan_vmomi_client.invalidate_vsan_cluster_cache(cluster_ref)
+        assert self.vc_vsan_vmomi_client.get_vsan_cluster_config_for_cluster(cluster_ref) is not cluster_config
+        assert vsan_ccs.VsanClusterGetConfig.call_count == 3
+
+    @patch("config_modules_vmware.framework.clients.vcenter.vc_vsan_vmomi_client.VcVsanVmomiClient."
+           "get_vsan_vc_mos_by_type")
+    def test_get_vsan_cluster_health_config_for_cluster_cached(self, mock_get_vsan_vc_mos_by_type):
+        cluster_ref = MagicMock()
+        cluster_ref._moId = "domain-c1"
+        vsan_health_config = MagicMock()
+        vsan_health_config.configs = [vim.option.OptionValue(key="enableinternetaccess", value="true")]
+        vsan_health_system = mock_get_vsan_vc_mos_by_type.return_value
+        vsan_health_system.QueryVsanClusterHealthConfig.side_effect = [Exception("timed out"), vsan_health_config]
+        with pytest.raises(Exception, match="timed out"):
+            self.vc_vsan_vmomi_client.get_vsan_cluster_health_config_for_cluster(cluster_ref)
+
+        # failures are not cached, proxy and internet access config share the same health config
+        assert self.vc_vsan_vmomi_client.get_vsan_proxy_config_for_cluster(cluster_ref)["internet_access_enabled"]
+        assert vsan_health_system.QueryVsanClusterHealthConfig.call_count == 2
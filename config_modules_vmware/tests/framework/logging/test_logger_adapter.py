@@ -1,6 +1,7 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
 import logging
 
+from mock import MagicMock
 from mock import patch
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
@@ -113,3 +114,62 @@ class TestLoggerAdapter:
 
         logger.info("TEST %s", "ARG")
         assert expected_log in caplog.text
+
+    @patch('config_modules_vmware.services.config.Config.get_section')
+    @patch('config_modules_vmware.framework.logging.logging_context.LoggingContext.get_hostname_context')
+    @patch('config_modules_vmware.framework.logging.logging_context.LoggingContext.get_controller_metadata_context')
+    def test_logging_disabled_level(
+            self,
+            mock_logging_metadata_context,
+            mock_logging_hostname_context,
+            mock_config_get_section,
+            caplog
+    ):
+        mock_config_get_section.return_value = {
+            "Format": "hostname={hostname} {msg}"
+        }
+        caplog.set_level(logging.INFO)
+        logger = LoggerAdapter(logging.getLogger(__name__))
+        payload = MagicMock()
+
+        logger.debug("Response content: %s", payload)
+        assert not caplog.text
+        # neither the context nor the deferred arguments are formatted
+        mock_logging_metadata_context.assert_not_called()
+        mock_logging_hostname_context.assert_not_called()
+        payload.__str__.assert_not_called()
+
+    @patch('config_modules_vmware.services.config.Config.get_section')
+    @patch('config_modules_vmware.framework.logging.logging_context.LoggingContext.get_hostname_context')
+    @patch('config_modules_vmware.framework.logging.logging_context.LoggingContext.get_controller_metadata_context')
+    def test_logging_format_cached_per_context(
+            self,
+            mock_logging_metadata_context,
+            mock_logging_hostname_context,
+            mock_config_get_section,
+            caplog
+    ):
+        mock_config_get_section.return_value = {
+            "Format": "hostname={hostname} controller={controller_name} title={title} {msg}"
+        }
+        metadata = MagicMock()
+        metadata.name = "ntp"
+        metadata.title = "Use 100% of the NTP servers"
+        mock_logging_metadata_context.return_value = metadata
+        mock_logging_hostname_context.return_value = "vc-1"
+        caplog.set_level(logging.INFO)
+        logger = LoggerAdapter(logging.getLogger(__name__))
+
+        with patch.object(LoggerAdapter, "_format_template", wraps=logger._format_template) as mock_format_template:
+            logger.info("first key= %s", "ARG")
+            logger.info("second 50%")
+            assert mock_format_template.call_count == 1
+
+            mock_logging_hostname_context.return_value = None
+            logger.info("third")
+            assert mock_format_template.call_count == 2
+
+        assert "hostname=vc-1 controller=ntp title=Use 100% of the NTP servers first key= ARG" in caplog.text
+        assert "hostname=vc-1 controller=ntp title=Use 100% of the NTP servers second 50%" in caplog.text
+        assert "controller=ntp title=Use 100% of the NTP servers third" in caplog.text
+        assert "hostname= " not in caplog.text
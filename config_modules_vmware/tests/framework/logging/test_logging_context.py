@@ -1,4 +1,5 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+from mock import MagicMock
 from mock.mock import patch
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
@@ -6,6 +7,7 @@ from config_modules_vmware.framework.logging.logging_context import ControllerMe
 from config_modules_vmware.framework.logging.logging_context import HostnameLoggingContext
 from config_modules_vmware.framework.logging.logging_context import LoggingContext
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
+from config_modules_vmware.framework.utils import metrics
 
 
 class TestLoggingContext:
@@ -98,3 +100,13 @@ class TestLoggingContext:
             assert LoggingContext.get_hostname_context() == test_hostname
 
         assert LoggingContext.get_hostname_context() is None
+
+    def test_controller_metadata_context_duration_metric(self):
+        test_controller_metadata = MagicMock()
+        test_controller_metadata.path_in_schema = "compliance_config.test_product.duration_metric"
+        count = metrics.CONTROLLER_DURATION.get(controller=test_controller_metadata.path_in_schema)
+
+        with ControllerMetadataLoggingContext(test_controller_metadata):
+            pass
+
+        assert metrics.CONTROLLER_DURATION.get(controller=test_controller_metadata.path_in_schema) == count + 1
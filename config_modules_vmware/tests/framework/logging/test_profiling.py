@@ -0,0 +1,115 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import os
+import pstats
+import time
+
+import pytest
+from mock import MagicMock
+from mock import patch
+
+from config_modules_vmware.framework.logging import profiling
+from config_modules_vmware.framework.logging.logging_context import ControllerMetadataLoggingContext
+from config_modules_vmware.framework.logging.logging_context import HostnameLoggingContext
+from config_modules_vmware.framework.logging.logging_context import LoggingContext
+from config_modules_vmware.framework.logging.logging_context import ProfilerLoggingContext
+from config_modules_vmware.framework.utils import task
+
+
+def create_metadata(path_in_schema):
+    metadata = MagicMock()
+    metadata.path_in_schema = path_in_schema
+    return metadata
+
+
+def busy_function(_=None):
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+
+
+class TestProfiling:
+
+    def setup_method(self):
+        self.ntp_metadata = create_metadata("compliance_config.vcenter.ntp")
+        self.dns_metadata = create_metadata("compliance_config.vcenter.dns")
+
+    def create_profiler(self, tmp_path, mode, per_controller=False):
+        config = {
+            "Mode": "cprofile",
+            "PerController": str(per_controller),
+            "OutputDir": str(tmp_path),
+            "SamplingIntervalMilliseconds": "1",
+        }
+        with patch("config_modules_vmware.framework.logging.profiling.Config.get_section") as mock_get_section:
+            mock_get_section.return_value.get.side_effect = lambda key, fallback=None: config.get(key, fallback)
+            mock_get_section.return_value.getboolean.side_effect = lambda key, fallback=None: config[key] == "True"
+            mock_get_section.return_value.getfloat.side_effect = lambda key, fallback=None: float(config[key])
+            return profiling.Profiler("check_compliance-vc-1", mode=mode)
+
+    @patch("config_modules_vmware.framework.logging.profiling.is_enabled")
+    def test_create_profiler_disabled(self, mock_is_enabled):
+        mock_is_enabled.return_value = False
+        assert profiling.create_profiler("check_compliance-vc-1") is None
+        with ProfilerLoggingContext(None):
+            assert LoggingContext.get_profiler_context() is None
+        with ControllerMetadataLoggingContext(self.ntp_metadata):
+            pass
+
+    def test_unsupported_mode(self, tmp_path):
+        with pytest.raises(Exception):
+            self.create_profiler(tmp_path, "tracing")
+
+    def test_cprofile_per_operation(self, tmp_path):
+        profiler = self.create_profiler(tmp_path, profiling.CPROFILE)
+        with ProfilerLoggingContext(profiler), HostnameLoggingContext("vc-1"):
+            assert LoggingContext.get_profiler_context() is profiler
+            with ControllerMetadataLoggingContext(self.ntp_metadata):
+                busy_function()
+                task.map_concurrently(busy_function, range(2), max_workers=2)
+        assert LoggingContext.get_profiler_context() is None
+
+        assert len(profiler.paths) == 1
+        assert profiler.paths[0].endswith("-check_compliance-vc-1-operation.pstats")
+        stats = pstats.Stats(profiler.paths[0])
+        busy_function_calls = [
+            calls for (_, _, function), (calls, *_) in stats.stats.items() if function == "busy_function"
+        ]
+        # called once on the operation thread and once on each worker thread
+        assert busy_function_calls == [3]
+
+    def test_cprofile_per_controller(self, tmp_path):
+        profiler = self.create_profiler(tmp_path, profiling.CPROFILE, per_controller=True)
+        with ProfilerLoggingContext(profiler), HostnameLoggingContext("vc-1"):
+            for _ in range(2):
+                with ControllerMetadataLoggingContext(self.ntp_metadata):
+                    busy_function()
+            with ControllerMetadataLoggingContext(self.dns_metadata):
+                busy_function()
+
+        assert sorted(os.path.basename(path).split("-", 2)[2] for path in profiler.paths) == [
+            "check_compliance-vc-1-vc-1-compliance_config.vcenter.dns.pstats",
+            "check_compliance-vc-1-vc-1-compliance_config.vcenter.ntp.pstats",
+        ]
+        ntp_path = next(path for path in profiler.paths if path.endswith("ntp.pstats"))
+        stats = pstats.Stats(ntp_path)
+        assert [calls for (_, _, function), (calls, *_) in stats.stats.items() if function == "busy_function"] == [2]
+
+    def test_sampling_per_operation(self, tmp_path):
+        profiler = self.create_profiler(tmp_path, profiling.SAMPLING)
+        with ProfilerLoggingContext(profiler):
+            busy_function()
+
+        assert len(profiler.paths) == 1
+        assert profiler.paths[0].endswith("-operation.collapsed")
+        with open(profiler.paths[0], encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert lines
+        assert any("busy_function (" in line for line in lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_no_profile_written_outside_controllers(self, tmp_path):
+        profiler = self.create_profiler(tmp_path, profiling.CPROFILE, per_controller=True)
+        with ProfilerLoggingContext(profiler):
+            busy_function()
+        assert profiler.paths == []
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,88 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from mock import MagicMock
+from mock import patch
+
+from config_modules_vmware.framework.logging import timings
+from config_modules_vmware.framework.logging.logging_context import ControllerMetadataLoggingContext
+from config_modules_vmware.framework.logging.logging_context import HostnameLoggingContext
+from config_modules_vmware.framework.logging.logging_context import LoggingContext
+from config_modules_vmware.framework.logging.logging_context import TimingsLoggingContext
+from config_modules_vmware.framework.utils import task
+
+
+def create_metadata(path_in_schema):
+    metadata = MagicMock()
+    metadata.path_in_schema = path_in_schema
+    return metadata
+
+
+class TestTimings:
+
+    def setup_method(self):
+        self.ntp_metadata = create_metadata("compliance_config.vcenter.ntp")
+        self.dns_metadata = create_metadata("compliance_config.vcenter.dns")
+
+    def test_record_not_collecting(self):
+        assert not timings.is_collecting()
+        # no-op outside of a timings context
+        timings.record(timings.REST_CALLS)
+        with TimingsLoggingContext(None):
+            assert LoggingContext.get_timings_context() is None
+
+    def test_record_per_host_and_control(self):
+        operation_timings = timings.Timings()
+        with TimingsLoggingContext(operation_timings):
+            assert timings.is_collecting()
+            with HostnameLoggingContext("vc-1"):
+                timings.record(timings.REST_CALLS)
+                with ControllerMetadataLoggingContext(self.ntp_metadata):
+                    timings.record(timings.REST_CALLS)
+                    timings.record(timings.REST_BYTES, 100)
+                    timings.record(timings.SOAP_CALLS)
+                with ControllerMetadataLoggingContext(self.dns_metadata):
+                    with HostnameLoggingContext("esx-1"):
+                        timings.record(timings.ESXCLI_CALLS)
+        assert LoggingContext.get_timings_context() is None
+
+        result = operation_timings.to_dict()
+        assert result["vc-1"][timings.WORKFLOW_KEY][timings.REST_CALLS] == 1
+        ntp_timings = result["vc-1"]["compliance_config.vcenter.ntp"]
+        assert ntp_timings[timings.REST_CALLS] == 1
+        assert ntp_timings[timings.REST_BYTES] == 100
+        assert ntp_timings[timings.SOAP_CALLS] == 1
+        assert ntp_timings[timings.ESXCLI_CALLS] == 0
+        assert ntp_timings[timings.WALL_TIME_SECONDS] >= 0
+        assert result["esx-1"]["compliance_config.vcenter.dns"][timings.ESXCLI_CALLS] == 1
+        assert set(result["vc-1"]["compliance_config.vcenter.dns"]) == set(timings.COUNTERS)
+
+    @patch("config_modules_vmware.framework.logging.logging_context.time.perf_counter")
+    def test_wall_time(self, mock_perf_counter):
+        mock_perf_counter.side_effect = [10.0, 10.25, 20.0, 20.5]
+        operation_timings = timings.Timings()
+        with TimingsLoggingContext(operation_timings), HostnameLoggingContext("vc-1"):
+            for _ in range(2):
+                with ControllerMetadataLoggingContext(self.ntp_metadata):
+                    pass
+        assert operation_timings.to_dict()["vc-1"]["compliance_config.vcenter.ntp"][timings.WALL_TIME_SECONDS] == 0.75
+
+    def test_record_in_worker_threads(self):
+        operation_timings = timings.Timings()
+        with TimingsLoggingContext(operation_timings), HostnameLoggingContext("vc-1"):
+            with ControllerMetadataLoggingContext(self.ntp_metadata):
+                task.map_concurrently(lambda _: timings.record(timings.SOAP_CALLS), range(20), max_workers=4)
+        assert operation_timings.to_dict()["vc-1"]["compliance_config.vcenter.ntp"][timings.SOAP_CALLS] == 20
+
+    @patch("config_modules_vmware.framework.logging.timings.is_enabled")
+    def test_instrument_soap_stub(self, mock_is_enabled):
+        mock_is_enabled.return_value = False
+        stub = MagicMock()
+        invoke_method = stub.InvokeMethod
+        assert timings.instrument_soap_stub(stub).InvokeMethod is invoke_method
+
+        mock_is_enabled.return_value = True
+        stub = timings.instrument_soap_stub(MagicMock())
+        operation_timings = timings.Timings()
+        with TimingsLoggingContext(operation_timings), HostnameLoggingContext("vc-1"):
+            stub.InvokeMethod("mo", "info", ())
+            stub.InvokeAccessor("mo", "info")
+        assert operation_timings.to_dict()["vc-1"][timings.WORKFLOW_KEY][timings.SOAP_CALLS] == 2
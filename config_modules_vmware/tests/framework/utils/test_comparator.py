@@ -1,6 +1,9 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+from mock import patch
+
 from config_modules_vmware.framework.utils.comparator import Comparator
 from config_modules_vmware.framework.utils.comparator import ComparatorOptionForList
+from config_modules_vmware.framework.utils.comparator import DesiredFingerprintCache
 
 
 def test_comparator_option_missing_value_returns_default():
@@ -280,3 +283,112 @@ def test_is_data_same_type_for_numbers():
     assert Comparator.is_data_same_type(data_2, data_3) is True
     assert Comparator.is_data_same_type(data_1, data_4) is False
     assert Comparator.is_data_same_type(data_1, data_5) is False
+
+
+def test_get_non_compliant_configs_hash_matches_sort():
+    data_pairs = [
+        ([1, 2], [2, 1]),
+        ([1, 2], [1, 2, 3]),
+        ([1, 1, 2], [1, 2, 2]),
+        ([{'port': 90, 'ip': '10.10.10.10'}, {'port': 80, 'ip': '10.10.10.20'}],
+         [{'port': 80, 'ip': '10.10.10.20'}, {'port': 90, 'ip': '10.10.10.10'}]),
+        ([{'name': 'pg1', 'vlans': [10, 20]}, {'name': 'pg2', 'vlans': []}],
+         [{'name': 'pg2', 'vlans': []}, {'name': 'pg1', 'vlans': [20, 10]}]),
+        ([{'name': 'pg1', 'vlans': [10, 20]}], [{'name': 'pg1', 'vlans': [10, 30]}]),
+        ([{'name': 'pg1', 'vlans': [10, 20]}], [{'name': 'pg1', 'vlans': [10, 20], 'mtu': 1500}]),
+        ([1800, True], [1800.0, 1]),
+        ([], None),
+        ([], []),
+        ({'key1': [[1, 2], [3]], 'key2': 'abc'}, {'key1': [[3], [2, 1]], 'key2': 'abc'}),
+        ({'key1': [[1, 2], [3]], 'key2': 'abc'}, {'key1': [[3], [2, 2]], 'key2': 'abc'}),
+    ]
+    for data_1, data_2 in data_pairs:
+        expected = Comparator.get_non_compliant_configs(
+            data_1, data_2, comparator_option=ComparatorOptionForList.COMPARE_AFTER_SORT)
+        result = Comparator.get_non_compliant_configs(
+            data_1, data_2, comparator_option=ComparatorOptionForList.COMPARE_AFTER_HASH)
+        assert result == expected
+
+
+def test_get_non_compliant_configs_hash_large_list():
+    data_1 = [{'name': f'pg-{i}', 'vlan': i % 4094, 'tags': [i, 'a', 'b']} for i in range(5000)]
+    data_2 = [{'name': f'pg-{i}', 'vlan': i % 4094, 'tags': ['b', 'a', i]} for i in reversed(range(5000))]
+    current, desired = Comparator.get_non_compliant_configs(
+        data_1, data_2, comparator_option=ComparatorOptionForList.COMPARE_AFTER_HASH)
+    assert current is None
+    assert desired is None
+
+    data_2[100]['vlan'] = 1
+    current, desired = Comparator.get_non_compliant_configs(
+        data_1, data_2, comparator_option=ComparatorOptionForList.COMPARE_AFTER_HASH)
+    assert current is data_1
+    assert desired is data_2
+
+
+def test_get_non_compliant_configs_hash_unhashable_falls_back_to_sort():
+    data_1 = [{'key': {1, 2}}]
+    data_2 = [{'key': {2, 1}}]
+    current, desired = Comparator.get_non_compliant_configs(
+        data_1, data_2, comparator_option=ComparatorOptionForList.COMPARE_AFTER_HASH)
+    assert current is None
+    assert desired is None
+
+
+def test_get_canonical_key():
+    assert Comparator.get_canonical_key([{'a': [1, 2]}, 'b']) == Comparator.get_canonical_key(['b', {'a': [2, 1]}])
+    assert Comparator.get_canonical_key([1, 1, 2]) != Comparator.get_canonical_key([1, 2, 2])
+    assert Comparator.get_canonical_key({'a': 1}) != Comparator.get_canonical_key([('a', 1)])
+    assert hash(Comparator.get_canonical_key({'a': [1, {'b': None}]})) is not None
+
+
+def test_fingerprint_match_implies_compliant():
+    data_pairs = [
+        ({'key1': [1, 2], 'key2': {'key3': 'abc'}}, {'key2': {'key3': 'abc'}, 'key1': [2, 1]}),
+        ([{'name': 'a', 'value': [1, 2]}, {'name': 'b', 'value': []}],
+         [{'name': 'b', 'value': []}, {'name': 'a', 'value': [1, 2]}]),
+        ({'key1': 1800}, {'key1': 1800.0}),
+        ([], []),
+        ({}, {}),
+        ('abc', 'abc'),
+    ]
+    for comparator_option in ComparatorOptionForList:
+        for data_1, data_2 in data_pairs:
+            if Comparator.is_fingerprint_match(data_1, data_2, comparator_option):
+                current, desired = Comparator.get_non_compliant_configs(data_1, data_2, comparator_option)
+                assert not current and not desired
+
+
+def test_fingerprint_match_stricter_than_comparator():
+    # bool and int are different types for the comparator.
+    assert not Comparator.is_fingerprint_match({'key1': True}, {'key1': 1})
+    # Order matters without sort.
+    assert Comparator.is_fingerprint_match([1, 2], [2, 1], ComparatorOptionForList.COMPARE_AFTER_SORT)
+    assert not Comparator.is_fingerprint_match([1, 2], [2, 1], ComparatorOptionForList.COMPARE_WITHOUT_SORT)
+    # Instance key comparison pairs dicts in instance key order and compares them without sorting nested lists.
+    assert not Comparator.is_fingerprint_match(
+        [{'name': 'a', 'value': [1, 2]}], [{'name': 'a', 'value': [2, 1]}],
+        ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON)
+    assert not Comparator.is_fingerprint_match(
+        [{'name': 'a', 'value': 1}, {'name': 'a', 'value': 2}], [{'name': 'a', 'value': 2}, {'name': 'a', 'value': 1}],
+        ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON)
+    assert Comparator.get_fingerprint(
+        {'name': 'a'}, ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON, 'name') is None
+    assert Comparator.get_fingerprint(
+        [{'value': 1}], ComparatorOptionForList.IDENTIFIER_BASED_COMPARISON, 'name') is None
+    assert Comparator.get_fingerprint([{'key': {1, 2}}]) is None
+
+
+def test_desired_fingerprint_cache():
+    desired = [{'name': 'a', 'value': [1, 2]}]
+    with patch('config_modules_vmware.framework.utils.comparator.Comparator.get_fingerprint',
+               wraps=Comparator.get_fingerprint) as get_fingerprint_mock:
+        with DesiredFingerprintCache():
+            for _ in range(3):
+                assert Comparator.is_fingerprint_match([{'name': 'a', 'value': [2, 1]}], desired)
+        # One call for each current value and one call for the desired value.
+        assert get_fingerprint_mock.call_count == 4
+
+        get_fingerprint_mock.reset_mock()
+        for _ in range(3):
+            assert Comparator.is_fingerprint_match([{'name': 'a', 'value': [2, 1]}], desired)
+        assert get_fingerprint_mock.call_count == 6
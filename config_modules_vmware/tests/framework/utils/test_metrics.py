@@ -0,0 +1,100 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import pytest
+from mock import patch
+
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.framework.utils import task
+
+
+class TestMetrics:
+
+    def setup_method(self):
+        self.registry = metrics.MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.counter("test_calls_total", "Number of calls.", ("method",))
+        counter.inc(method="GET")
+        counter.inc(2, method="GET")
+        counter.inc(method="POST")
+        assert counter.get(method="GET") == 3
+        assert self.registry.generate_text() == (
+            "# HELP test_calls_total Number of calls.\n"
+            "# TYPE test_calls_total counter\n"
+            'test_calls_total{method="GET"} 3\n'
+            'test_calls_total{method="POST"} 1\n'
+        )
+        with pytest.raises(ValueError):
+            counter.inc(-1, method="GET")
+        with pytest.raises(ValueError):
+            counter.inc(endpoint="/api")
+
+    def test_gauge(self):
+        gauge = self.registry.gauge("test_in_flight", "In flight.")
+        with gauge.track_in_progress():
+            assert gauge.get() == 1
+            with pytest.raises(Exception):
+                with gauge.track_in_progress():
+                    assert gauge.get() == 2
+                    raise Exception("failed")
+            assert gauge.get() == 1
+        assert gauge.get() == 0
+        gauge.set(1.5)
+        assert "test_in_flight 1.5\n" in self.registry.generate_text()
+
+    def test_gauge_function(self):
+        gauge = self.registry.gauge("test_sessions", "Sessions.", ("hostname", "state"))
+        gauge.set_function(lambda: {("vc-2", "idle"): 1, ("vc-1", "leased"): 2})
+        assert self.registry.generate_text().splitlines()[2:] == [
+            'test_sessions{hostname="vc-1",state="leased"} 2',
+            'test_sessions{hostname="vc-2",state="idle"} 1',
+        ]
+
+    @patch("config_modules_vmware.framework.utils.metrics.time.perf_counter")
+    def test_histogram(self, mock_perf_counter):
+        mock_perf_counter.side_effect = [1.0, 1.2]
+        histogram = self.registry.histogram("test_duration_seconds", "Duration.", ("operation",), buckets=(0.1, 1))
+        histogram.observe(0.05, operation="get")
+        histogram.observe(5, operation="get")
+        with histogram.time(operation="get"):
+            pass
+        assert histogram.get(operation="get") == 3
+        assert self.registry.generate_text().splitlines()[2:] == [
+            'test_duration_seconds_bucket{operation="get",le="0.1"} 1',
+            'test_duration_seconds_bucket{operation="get",le="1"} 2',
+            'test_duration_seconds_bucket{operation="get",le="+Inf"} 3',
+            'test_duration_seconds_sum{operation="get"} 5.25',
+            'test_duration_seconds_count{operation="get"} 3',
+        ]
+
+    def test_label_value_escaped(self):
+        counter = self.registry.counter("test_errors_total", "Errors\nby message.", ("message",))
+        counter.inc(message='say "hi"\\\n')
+        assert self.registry.generate_text() == (
+            "# HELP test_errors_total Errors\\nby message.\n"
+            "# TYPE test_errors_total counter\n"
+            'test_errors_total{message="say \\"hi\\"\\\\\\n"} 1\n'
+        )
+
+    def test_register_existing(self):
+        counter = self.registry.counter("test_calls_total", "Number of calls.", ("method",))
+        assert self.registry.counter("test_calls_total", "Number of calls.", ("method",)) is counter
+        with pytest.raises(ValueError):
+            self.registry.gauge("test_calls_total", "Number of calls.", ("method",))
+        with pytest.raises(ValueError):
+            self.registry.counter("test_calls_total", "Number of calls.", ("endpoint",))
+        counter.inc(method="GET")
+        self.registry.clear()
+        assert counter.get(method="GET") == 0
+
+    def test_update_from_worker_threads(self):
+        counter = self.registry.counter("test_calls_total", "Number of calls.")
+        histogram = self.registry.histogram("test_duration_seconds", "Duration.")
+
+        def update(_):
+            for _ in range(1000):
+                counter.inc()
+                histogram.observe(0.5)
+
+        task.map_concurrently(update, range(8), max_workers=8)
+        assert counter.get() == 8000
+        assert histogram.get() == 8000
@@ -1,8 +1,12 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+import asyncio
 import concurrent
+import contextvars
 import threading
 import time
 
+import pytest
+
 from config_modules_vmware.framework.utils import task
 
 
@@ -103,3 +107,92 @@ def invoke_multithreaded_function_3():
     assert threading.current_thread() is not threading.main_thread()
     multithreaded_task = invoke_multithreaded_function_1(threading.current_thread())
     multithreaded_task.result()
+
+
+def test_map_concurrently():
+    """
+    Test that results keep the order of the items and calls are spread over at most max_workers threads.
+    """
+    lock = threading.Lock()
+    thread_names = set()
+
+    def square(i):
+        with lock:
+            thread_names.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return i * i
+
+    assert task.map_concurrently(square, range(8), max_workers=3) == [i * i for i in range(8)]
+    assert 1 < len(thread_names) <= 3
+
+
+def test_map_concurrently_propagates_context():
+    """
+    Test that the caller's context variables are visible in the calls.
+    """
+    context_var = contextvars.ContextVar("context_var", default=None)
+    context_var.set("caller value")
+    assert task.map_concurrently(lambda _: context_var.get(), range(4), max_workers=4) == ["caller value"] * 4
+
+
+def test_map_concurrently_raises_first_error():
+    """
+    Test that the error of the first failing item is raised after all calls completed.
+    """
+    calls = []
+
+    def fail_on_odd(i):
+        calls.append(i)
+        if i % 2:
+            raise Exception(f"failed {i}")
+        return i
+
+    with pytest.raises(Exception, match="failed 1"):
+        task.map_concurrently(fail_on_odd, range(6), max_workers=3)
+    assert sorted(calls) == list(range(6))
+
+
+def test_map_concurrently_sequential():
+    """
+    Test that calls are made on the current thread with a single worker.
+    """
+    assert task.map_concurrently(lambda _: threading.current_thread(), range(3), max_workers=1) == \
+        [threading.current_thread()] * 3
+
+
+def test_run_async_keeps_context_and_does_not_block_loop():
+    """
+    Test that awaited functions run concurrently on worker threads, each with the context of its calling task.
+    """
+    context_var = contextvars.ContextVar("context_var", default=None)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def blocking_function():
+        # only passes once the three functions run at the same time
+        barrier.wait()
+        context_var.set("changed by the function")
+        return context_var.get(), threading.current_thread()
+
+    async def call(value):
+        context_var.set(value)
+        result = await task.run_async(blocking_function)
+        assert context_var.get() == value
+        return result
+
+    async def main():
+        return await asyncio.gather(call("task 1"), call("task 2"), call("task 3"))
+
+    results = asyncio.run(main())
+    assert [value for value, _ in results] == ["changed by the function"] * 3
+    assert threading.current_thread() not in [thread for _, thread in results]
+
+
+def test_run_async_raises():
+    """
+    Test that the error of the function is raised to the awaiting task.
+    """
+    def fail():
+        raise Exception("failed")
+
+    with pytest.raises(Exception, match="failed"):
+        asyncio.run(task.run_async(fail))
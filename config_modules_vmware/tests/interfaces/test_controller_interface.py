@@ -1,9 +1,15 @@
 # Copyright 2024 Broadcom. All Rights Reserved.
+import asyncio
+import threading
+
 from mock import MagicMock
 from mock import patch
 
 from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
 from config_modules_vmware.framework.clients.common import consts
+from config_modules_vmware.framework.logging import timings
+from config_modules_vmware.framework.logging.logging_context import ControllerMetadataLoggingContext
+from config_modules_vmware.framework.logging.logging_context import LoggingContext
 from config_modules_vmware.framework.models.controller_models.metadata import ControllerMetadata
 from config_modules_vmware.framework.models.output_models.compliance_response import ComplianceStatus
 from config_modules_vmware.framework.models.output_models.get_current_response import GetCurrentConfigurationStatus
@@ -197,6 +203,83 @@ class TestControllerInterface:
             self.context_mock, Operations.CHECK_COMPLIANCE, input_values=self.desired_state_spec, metadata_filter=None)
         assert result == expected_compliance_response
 
+    @patch('config_modules_vmware.framework.logging.timings.is_enabled')
+    @patch('config_modules_vmware.services.workflows.compliance_operations.ComplianceOperations.operate')
+    def test_check_compliance_with_timings(self, compliance_operation_operate_mock, is_enabled_mock):
+        self.context_mock.hostname = "vc-1"
+        ntp_metadata = MagicMock()
+        ntp_metadata.path_in_schema = "compliance_config.vcenter.ntp"
+
+        def operate(*args, **kwargs):
+            with ControllerMetadataLoggingContext(ntp_metadata):
+                timings.record(timings.REST_CALLS)
+                timings.record(timings.REST_BYTES, 512)
+            return {'status': ComplianceStatus.COMPLIANT}
+
+        compliance_operation_operate_mock.side_effect = operate
+
+        # disabled by default, the response has no timings
+        is_enabled_mock.return_value = False
+        assert consts.TIMINGS not in self.control_config.check_compliance(self.desired_state_spec)
+
+        is_enabled_mock.return_value = True
+        result = self.control_config.check_compliance(self.desired_state_spec)
+        ntp_timings = result[consts.TIMINGS]["vc-1"]["compliance_config.vcenter.ntp"]
+        assert ntp_timings[timings.REST_CALLS] == 1
+        assert ntp_timings[timings.REST_BYTES] == 512
+        assert ntp_timings[timings.SOAP_CALLS] == 0
+
+    @patch('config_modules_vmware.framework.logging.profiling.Profiler')
+    @patch('config_modules_vmware.framework.logging.profiling.is_enabled')
+    @patch('config_modules_vmware.services.workflows.compliance_operations.ComplianceOperations.operate')
+    def test_check_compliance_with_profiling(self, compliance_operation_operate_mock, is_enabled_mock,
+                                             profiler_mock):
+        self.context_mock.hostname = "vc-1"
+        compliance_operation_operate_mock.return_value = {'status': ComplianceStatus.COMPLIANT}
+
+        # disabled by default, nothing is profiled
+        is_enabled_mock.return_value = False
+        self.control_config.check_compliance(self.desired_state_spec)
+        profiler_mock.assert_not_called()
+
+        # profiled when requested for the call
+        self.control_config.check_compliance(self.desired_state_spec, profiling_mode="sampling")
+        profiler_mock.assert_called_once_with("check_compliance-vc-1", mode="sampling")
+        profiler_mock.return_value.start.assert_called_once()
+        profiler_mock.return_value.stop.assert_called_once()
+
+    @patch('config_modules_vmware.services.workflows.compliance_operations.ComplianceOperations.operate')
+    def test_async_operations(self, compliance_operation_operate_mock):
+        self.context_mock.hostname = "vc-1"
+        barrier = threading.Barrier(3, timeout=5)
+        hostnames = []
+
+        def operate(context, operation, **kwargs):
+            # the three operations run at the same time, each with the logging context of the workflow
+            barrier.wait()
+            hostnames.append(LoggingContext.get_hostname_context())
+            if operation == Operations.GET_CURRENT:
+                return {'status': GetCurrentConfigurationStatus.SUCCESS, 'result': {}}
+            if operation == Operations.CHECK_COMPLIANCE:
+                return {'status': ComplianceStatus.COMPLIANT}
+            return {'status': RemediateStatus.SUCCESS}
+
+        compliance_operation_operate_mock.side_effect = operate
+
+        async def main():
+            return await asyncio.gather(
+                self.control_config.aget_current_configuration(),
+                self.control_config.acheck_compliance(self.desired_state_spec),
+                self.control_config.aremediate_with_desired_state(self.desired_state_spec),
+            )
+
+        get_current_result, compliance_result, remediate_result = asyncio.run(main())
+        assert get_current_result['status'] == GetCurrentConfigurationStatus.SUCCESS
+        assert compliance_result['status'] == ComplianceStatus.COMPLIANT
+        assert remediate_result['status'] == RemediateStatus.SUCCESS
+        assert hostnames == ["vc-1"] * 3
+        assert LoggingContext.get_hostname_context() is None
+
     @patch('config_modules_vmware.services.workflows.compliance_operations.ComplianceOperations.operate')
     def test_check_compliance_exception(self, compliance_operation_operate_mock):
         compliance_operation_operate_mock.side_effect = Exception('Test Exception')
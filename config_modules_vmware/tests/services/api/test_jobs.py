@@ -0,0 +1,117 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import threading
+import time
+
+import pytest
+from mock import patch
+
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.services.api.jobs import JobManager
+from config_modules_vmware.services.api.jobs import JobStatus
+
+
+class TestJobs:
+
+    def setup_method(self):
+        self.job_manager = JobManager(max_concurrent_jobs=1, max_pending_jobs=2, retention_seconds=3600)
+        self.release = threading.Event()
+
+    def teardown_method(self):
+        self.release.set()
+        self.job_manager.shutdown()
+
+    def wait_for_status(self, job, statuses, timeout=5):
+        version = 0
+        while job.status not in statuses:
+            version = job.wait_for_update(version, timeout)
+        return job.to_dict()
+
+    def blocking_target(self):
+        assert self.release.wait(5)
+        return {"status": "COMPLIANT"}
+
+    def test_run_job(self):
+        job = self.job_manager.submit("check_compliance", {
+            "vcenter:vc-1": lambda: {"status": "COMPLIANT"},
+            "vcenter:vc-2": lambda: {"status": "NON_COMPLIANT"},
+        })
+        job_dict = self.wait_for_status(job, (JobStatus.SUCCEEDED,))
+        assert job_dict["operation"] == "check_compliance"
+        assert job_dict["targets"] == 2
+        assert job_dict["completed_targets"] == 2
+        assert job_dict["results"] == {
+            "vcenter:vc-1": {"status": "COMPLIANT"},
+            "vcenter:vc-2": {"status": "NON_COMPLIANT"},
+        }
+        assert job_dict["started"] >= job_dict["created"]
+        assert job_dict["finished"] >= job_dict["started"]
+        assert self.job_manager.get(job.id) is job
+        assert self.job_manager.list_jobs() == [job]
+
+    def test_partial_results_and_failure(self):
+        def failing_target():
+            raise Exception("Connection refused")
+
+        job = self.job_manager.submit("get_current_configuration", {
+            "vcenter:vc-1": lambda: {"status": "SUCCESS"},
+            "vcenter:vc-2": self.blocking_target,
+            "vcenter:vc-3": failing_target,
+        })
+        version = 0
+        while job.to_dict()["completed_targets"] < 1:
+            version = job.wait_for_update(version, 5)
+        job_dict = job.to_dict()
+        assert job_dict["status"] == JobStatus.RUNNING
+        assert job_dict["results"] == {"vcenter:vc-1": {"status": "SUCCESS"}}
+
+        self.release.set()
+        job_dict = self.wait_for_status(job, (JobStatus.FAILED,))
+        assert job_dict["results"]["vcenter:vc-3"] == {"status": "FAILED", "message": "Connection refused"}
+
+    def test_cancel_pending_and_running_jobs(self):
+        running_job = self.job_manager.submit("check_compliance", {
+            "vcenter:vc-1": self.blocking_target,
+            "vcenter:vc-2": lambda: {"status": "COMPLIANT"},
+        })
+        pending_job = self.job_manager.submit("check_compliance", {"vcenter:vc-3": lambda: {"status": "COMPLIANT"}})
+        self.wait_for_status(running_job, (JobStatus.RUNNING,))
+
+        assert self.job_manager.cancel(pending_job.id) is pending_job
+        assert pending_job.status == JobStatus.CANCELLED
+        self.job_manager.cancel(running_job.id)
+        assert running_job.status == JobStatus.RUNNING
+
+        self.release.set()
+        job_dict = self.wait_for_status(running_job, (JobStatus.CANCELLED,))
+        # the target being run completes, the next ones are skipped
+        assert list(job_dict["results"]) == ["vcenter:vc-1"]
+        assert pending_job.to_dict()["results"] == {}
+        assert self.job_manager.cancel("unknown") is None
+
+    def test_max_pending_jobs(self):
+        running_job = self.job_manager.submit("check_compliance", {"vcenter:vc-1": self.blocking_target})
+        self.wait_for_status(running_job, (JobStatus.RUNNING,))
+        for _ in range(2):
+            self.job_manager.submit("check_compliance", {"vcenter:vc-1": self.blocking_target})
+        with pytest.raises(Exception):
+            self.job_manager.submit("check_compliance", {"vcenter:vc-1": self.blocking_target})
+
+    def test_retention(self):
+        self.job_manager = JobManager(max_concurrent_jobs=1, max_pending_jobs=2, retention_seconds=0)
+        job = self.job_manager.submit("check_compliance", {"vcenter:vc-1": lambda: {"status": "COMPLIANT"}})
+        self.wait_for_status(job, (JobStatus.SUCCEEDED,))
+        while self.job_manager.get(job.id) is not None:
+            time.sleep(0.01)
+        assert self.job_manager.list_jobs() == []
+
+    def test_instance_job_counts_exported(self):
+        with patch.object(JobManager, "_instance", None):
+            assert JobManager.get_instance_job_counts() == {}
+            JobManager._instance = self.job_manager
+            running_job = self.job_manager.submit("check_compliance", {"vcenter:vc-1": self.blocking_target})
+            self.wait_for_status(running_job, (JobStatus.RUNNING,))
+            self.job_manager.submit("check_compliance", {"vcenter:vc-2": self.blocking_target})
+            assert JobManager.get_instance_job_counts() == {("pending",): 1, ("running",): 1}
+            text = metrics.REGISTRY.generate_text()
+            assert 'config_modules_background_jobs{status="pending"} 1' in text
+            assert 'config_modules_background_jobs{status="running"} 1' in text
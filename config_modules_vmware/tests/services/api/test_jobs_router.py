@@ -0,0 +1,209 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from mock import patch
+
+from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
+from config_modules_vmware.services.api import jobs_router
+from config_modules_vmware.services.api.jobs import JobManager
+from config_modules_vmware.services.api.result_cache import ResultCache
+
+
+class TestJobsRouter:
+
+    def setup_method(self):
+        app = FastAPI()
+        app.include_router(jobs_router.router)
+        self.client = TestClient(app)
+        self.job_manager = JobManager(max_concurrent_jobs=2, max_pending_jobs=10, retention_seconds=3600)
+        self.job_request = {
+            "operation": "check_compliance",
+            "targets": [
+                {"product": "vcenter", "hostname": "vc-1", "username": "user", "password": "pass"},
+                {"product": "vcenter", "hostname": "vc-2", "username": "user", "password": "pass"},
+            ],
+            "desired_state_spec": {"compliance_config": {"vcenter": {}}},
+        }
+
+    def teardown_method(self):
+        self.job_manager.shutdown()
+
+    @patch("config_modules_vmware.services.api.jobs_router.ControllerInterface")
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_submit_and_stream_job(self, mock_get_instance, mock_controller_interface):
+        mock_get_instance.return_value = self.job_manager
+        contexts = []
+
+        def create_controller_interface(context):
+            contexts.append(context)
+            return mock_controller_interface.return_value
+
+        mock_controller_interface.side_effect = create_controller_interface
+        mock_controller_interface.return_value.check_compliance.return_value = {"status": "COMPLIANT"}
+
+        response = self.client.post("/jobs", json=self.job_request)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.json()["operation"] == "check_compliance"
+
+        response = self.client.get(f"/jobs/{job_id}/events")
+        assert response.headers["content-type"] == "application/x-ndjson"
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert events[-1]["status"] == "SUCCEEDED"
+        streamed_results = {}
+        for event in events:
+            assert not set(event["results"]) & set(streamed_results)
+            streamed_results.update(event["results"])
+        assert streamed_results == {"vcenter:vc-1": {"status": "COMPLIANT"}, "vcenter:vc-2": {"status": "COMPLIANT"}}
+
+        assert [context.hostname for context in contexts] == ["vc-1", "vc-2"]
+        assert all(isinstance(context, VcenterContext) for context in contexts)
+        mock_controller_interface.return_value.check_compliance.assert_called_with(
+            self.job_request["desired_state_spec"]
+        )
+
+        response = self.client.get(f"/jobs/{job_id}")
+        assert response.json()["results"] == streamed_results
+        response = self.client.get("/jobs")
+        assert [job["job_id"] for job in response.json()] == [job_id]
+        assert "results" not in response.json()[0]
+
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_unknown_job(self, mock_get_instance):
+        mock_get_instance.return_value = self.job_manager
+        assert self.client.get("/jobs/unknown").status_code == 404
+        assert self.client.get("/jobs/unknown/events").status_code == 404
+        assert self.client.delete("/jobs/unknown").status_code == 404
+
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_submit_job_rejected(self, mock_get_instance):
+        mock_get_instance.return_value.submit.side_effect = Exception("Too many pending jobs (10), retry later")
+        response = self.client.post("/jobs", json=self.job_request)
+        assert response.status_code == 503
+
+        self.job_request["targets"] = []
+        assert self.client.post("/jobs", json=self.job_request).status_code == 422
+
+    @patch("config_modules_vmware.services.api.jobs_router.ControllerInterface")
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_submit_job_esxi_targets_of_same_vcenter(self, mock_get_instance, mock_controller_interface):
+        mock_get_instance.return_value = self.job_manager
+        contexts = []
+
+        def create_controller_interface(context):
+            contexts.append(context)
+            return mock_controller_interface.return_value
+
+        mock_controller_interface.side_effect = create_controller_interface
+        mock_controller_interface.return_value.check_compliance.return_value = {"status": "COMPLIANT"}
+        self.job_request["targets"] = [
+            {"product": "esxi", "hostname": "vc-1", "username": "user", "password": "pass", "esxi_host_names": ["h1"]},
+            {"product": "esxi", "hostname": "vc-1", "username": "user", "password": "pass", "esxi_host_names": ["h2"]},
+        ]
+
+        response = self.client.post("/jobs", json=self.job_request)
+        assert response.json()["targets"] == 2
+        job_id = response.json()["job_id"]
+        self.client.get(f"/jobs/{job_id}/events")
+        assert set(self.client.get(f"/jobs/{job_id}").json()["results"]) == {"esxi:vc-1/h1", "esxi:vc-1/h2"}
+        assert [context.esxi_host_names for context in contexts] == [["h1"], ["h2"]]
+
+    @patch("config_modules_vmware.services.api.jobs_router.ControllerInterface")
+    @patch("config_modules_vmware.services.api.jobs_router.ResultCache.get_instance")
+    @patch("config_modules_vmware.services.api.jobs_router.Config.get_section")
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_submit_job_esxi_hosts_split_in_batches(
+        self, mock_get_instance, mock_get_section, mock_get_result_cache, mock_controller_interface
+    ):
+        mock_get_instance.return_value = self.job_manager
+        mock_get_result_cache.return_value = None
+        mock_get_section.return_value.getint.return_value = 2
+        mock_controller_interface.return_value.check_compliance.return_value = {"status": "COMPLIANT"}
+        self.job_request["targets"] = [
+            {
+                "product": "esxi",
+                "hostname": "vc-1",
+                "username": "user",
+                "password": "pass",
+                "esxi_host_names": ["h1", "h2", "h3"],
+            },
+            {"product": "esxi", "hostname": "vc-2", "username": "user", "password": "pass"},
+        ]
+
+        response = self.client.post("/jobs", json=self.job_request)
+        assert response.json()["targets"] == 3
+        job_id = response.json()["job_id"]
+        self.client.get(f"/jobs/{job_id}/events")
+        assert set(self.client.get(f"/jobs/{job_id}").json()["results"]) == {
+            "esxi:vc-1/h1,h2",
+            "esxi:vc-1/h3",
+            "esxi:vc-2",
+        }
+
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_submit_job_duplicate_targets(self, mock_get_instance):
+        mock_get_instance.return_value = self.job_manager
+        self.job_request["targets"][1] = dict(self.job_request["targets"][0], username="other-user")
+        response = self.client.post("/jobs", json=self.job_request)
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Duplicate target vcenter:vc-1"
+
+    @patch("config_modules_vmware.services.api.jobs_router.ControllerInterface")
+    @patch("config_modules_vmware.services.api.jobs_router.ResultCache.get_instance")
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_result_cache(self, mock_get_instance, mock_get_result_cache, mock_controller_interface):
+        mock_get_instance.return_value = self.job_manager
+        mock_get_result_cache.return_value = ResultCache(ttl_seconds=60, max_entries=10)
+        mock_controller_interface.return_value.check_compliance.return_value = {"status": "COMPLIANT"}
+        mock_controller_interface.return_value.remediate_with_desired_state.return_value = {"status": "SUCCESS"}
+
+        def run_job(job_request):
+            job_id = self.client.post("/jobs", json=job_request).json()["job_id"]
+            self.client.get(f"/jobs/{job_id}/events")
+            return self.client.get(f"/jobs/{job_id}").json()["results"]
+
+        results = run_job(self.job_request)
+        assert all(result["cache_age_seconds"] == 0 for result in results.values())
+        results = run_job(self.job_request)
+        assert results["vcenter:vc-1"]["status"] == "COMPLIANT"
+        assert all("cache_age_seconds" in result for result in results.values())
+        assert mock_controller_interface.return_value.check_compliance.call_count == 2
+
+        run_job(dict(self.job_request, use_cache=False))
+        assert mock_controller_interface.return_value.check_compliance.call_count == 4
+
+        remediate_request = dict(self.job_request, operation="remediate_with_desired_state")
+        remediate_request["targets"] = self.job_request["targets"][:1]
+        results = run_job(remediate_request)
+        assert "cache_age_seconds" not in results["vcenter:vc-1"]
+        results = run_job(self.job_request)
+        assert results["vcenter:vc-1"]["cache_age_seconds"] == 0
+        assert "cache_age_seconds" in results["vcenter:vc-2"]
+        assert mock_controller_interface.return_value.check_compliance.call_count == 5
+
+    @patch("config_modules_vmware.services.api.jobs_router.ControllerInterface")
+    @patch("config_modules_vmware.services.api.jobs_router.ResultCache.get_instance")
+    @patch("config_modules_vmware.services.api.jobs.JobManager.get_instance")
+    def test_result_cache_keyed_by_credentials_and_tls_settings(
+        self, mock_get_instance, mock_get_result_cache, mock_controller_interface
+    ):
+        mock_get_instance.return_value = self.job_manager
+        mock_get_result_cache.return_value = ResultCache(ttl_seconds=60, max_entries=10)
+        mock_controller_interface.return_value.check_compliance.return_value = {"status": "COMPLIANT"}
+        self.job_request["targets"] = self.job_request["targets"][:1]
+
+        def run_job(**target_options):
+            job_request = dict(self.job_request, targets=[dict(self.job_request["targets"][0], **target_options)])
+            job_id = self.client.post("/jobs", json=job_request).json()["job_id"]
+            self.client.get(f"/jobs/{job_id}/events")
+            return self.client.get(f"/jobs/{job_id}").json()["results"]["vcenter:vc-1"]
+
+        assert run_job()["cache_age_seconds"] == 0
+        assert run_job(password="other-pass")["cache_age_seconds"] == 0
+        assert run_job(ssl_thumbprint="AA:BB")["cache_age_seconds"] == 0
+        assert run_job(verify_ssl=False)["cache_age_seconds"] == 0
+        assert mock_controller_interface.return_value.check_compliance.call_count == 4
+        run_job(password="other-pass")
+        assert mock_controller_interface.return_value.check_compliance.call_count == 4
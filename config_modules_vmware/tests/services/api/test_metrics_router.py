@@ -0,0 +1,22 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config_modules_vmware.framework.utils import metrics
+from config_modules_vmware.services.api import metrics_router
+
+
+class TestMetricsRouter:
+
+    def setup_method(self):
+        app = FastAPI()
+        app.include_router(metrics_router.router)
+        self.client = TestClient(app)
+
+    def test_get_metrics(self):
+        with metrics.JOBS_IN_FLIGHT.track_in_progress(operation="check_compliance"):
+            response = self.client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == metrics.CONTENT_TYPE
+        assert "# TYPE config_modules_operation_duration_seconds histogram" in response.text
+        assert 'config_modules_jobs_in_flight{operation="check_compliance"} 1' in response.text
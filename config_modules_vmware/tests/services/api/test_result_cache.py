@@ -0,0 +1,97 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import time
+
+from mock import patch
+
+from config_modules_vmware.services.api.result_cache import get_spec_hash
+from config_modules_vmware.services.api.result_cache import ResultCache
+
+
+class TestResultCache:
+
+    def setup_method(self):
+        self.result_cache = ResultCache(ttl_seconds=60, max_entries=2)
+        self.spec = {"compliance_config": {"vcenter": {"ntp": {"value": {"mode": "NTP", "servers": ["10.0.0.250"]}}}}}
+
+    def test_spec_hash_independent_of_key_order(self):
+        reordered_spec = {
+            "compliance_config": {"vcenter": {"ntp": {"value": {"servers": ["10.0.0.250"], "mode": "NTP"}}}}
+        }
+        assert get_spec_hash(self.spec) == get_spec_hash(reordered_spec)
+        assert get_spec_hash(self.spec) != get_spec_hash({"compliance_config": {"vcenter": {}}})
+
+    def test_get_and_put(self):
+        key = ResultCache.make_key("vcenter:vc-1", "check_compliance", self.spec)
+        assert self.result_cache.get(key) is None
+        response = {"status": "COMPLIANT"}
+        self.result_cache.put(key, response, started=time.monotonic() - 5)
+        cached_response = self.result_cache.get(key)
+        assert cached_response["status"] == "COMPLIANT"
+        assert cached_response["cache_age_seconds"] >= 5
+        assert "cache_age_seconds" not in response
+        assert (
+            self.result_cache.get(ResultCache.make_key("vcenter:vc-1", "get_current_configuration", self.spec)) is None
+        )
+        assert self.result_cache.get(ResultCache.make_key("vcenter:vc-2", "check_compliance", self.spec)) is None
+
+    def test_key_includes_metadata_filter_and_target_options(self):
+        def metadata_filter(metadata):
+            return True
+
+        key = ResultCache.make_key(
+            "esxi:vc-1", "check_compliance", self.spec, metadata_filter, {"esxi_host_names": ["a"]}
+        )
+        self.result_cache.put(key, {"status": "COMPLIANT"})
+        assert self.result_cache.get(
+            ResultCache.make_key(
+                "esxi:vc-1", "check_compliance", self.spec, metadata_filter, {"esxi_host_names": ["a"]}
+            )
+        )
+        assert not self.result_cache.get(
+            ResultCache.make_key("esxi:vc-1", "check_compliance", self.spec, None, {"esxi_host_names": ["a"]})
+        )
+        assert not self.result_cache.get(
+            ResultCache.make_key(
+                "esxi:vc-1", "check_compliance", self.spec, metadata_filter, {"esxi_host_names": ["b"]}
+            )
+        )
+
+    def test_failed_responses_not_cached(self):
+        key = ResultCache.make_key("vcenter:vc-1", "check_compliance", self.spec)
+        self.result_cache.put(key, {"status": "FAILED", "message": "Connection refused"})
+        assert self.result_cache.get(key) is None
+
+    def test_expired(self):
+        key = ResultCache.make_key("vcenter:vc-1", "check_compliance", self.spec)
+        self.result_cache.put(key, {"status": "COMPLIANT"}, started=time.monotonic() - 61)
+        assert self.result_cache.get(key) is None
+
+    def test_least_recently_used_evicted(self):
+        keys = [ResultCache.make_key(f"vcenter:vc-{i}", "check_compliance", self.spec) for i in range(3)]
+        self.result_cache.put(keys[0], {"status": "COMPLIANT"})
+        self.result_cache.put(keys[1], {"status": "COMPLIANT"})
+        assert self.result_cache.get(keys[0])
+        self.result_cache.put(keys[2], {"status": "COMPLIANT"})
+        assert self.result_cache.get(keys[0])
+        assert self.result_cache.get(keys[1]) is None
+        assert self.result_cache.get(keys[2])
+
+    def test_invalidate_target(self):
+        key_1 = ResultCache.make_key("vcenter:vc-1", "check_compliance", self.spec)
+        key_2 = ResultCache.make_key("vcenter:vc-2", "check_compliance", self.spec)
+        started = time.monotonic()
+        self.result_cache.put(key_1, {"status": "COMPLIANT"})
+        self.result_cache.put(key_2, {"status": "COMPLIANT"})
+        assert self.result_cache.invalidate_target("vcenter:vc-1") == 1
+        assert self.result_cache.get(key_1) is None
+        assert self.result_cache.get(key_2)
+        # Response of an operation started before the invalidation.
+        self.result_cache.put(key_1, {"status": "COMPLIANT"}, started=started)
+        assert self.result_cache.get(key_1) is None
+        self.result_cache.put(key_1, {"status": "COMPLIANT"})
+        assert self.result_cache.get(key_1)
+
+    @patch("config_modules_vmware.services.api.result_cache.Config.get_section")
+    def test_get_instance_disabled(self, mock_get_section):
+        mock_get_section.return_value.getboolean.return_value = False
+        assert ResultCache.get_instance() is None
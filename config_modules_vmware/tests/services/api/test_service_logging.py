@@ -0,0 +1,112 @@
+# Copyright 2024 Broadcom. All Rights Reserved.
+import configparser
+import logging
+import os
+import threading
+
+from mock import patch
+
+from config_modules_vmware.services.api import service_logging
+
+
+class TestServiceLogging:
+
+    def setup_method(self):
+        self.root_logger = logging.getLogger()
+        self.root_level = self.root_logger.level
+        self.logger = logging.getLogger(__name__)
+
+    def teardown_method(self):
+        service_logging.shutdown_logging()
+        self.root_logger.setLevel(self.root_level)
+
+    def configure_logging(self, tmp_path, async_enabled, file_size=10485760, max_count=5):
+        config = configparser.ConfigParser()
+        config.read_dict({
+            "service.logging.file": {
+                "LogFileDir": str(tmp_path),
+                "FileName": "app.log",
+                "FileSize": str(file_size),
+                "MaxCount": str(max_count),
+                "LogLevel": "INFO",
+            },
+            "service.logging.console": {
+                "LogLevel": "ERROR",
+            },
+            "service.logging.async": {
+                "Enabled": str(async_enabled),
+                "QueueSize": "16",
+                "BatchSize": "8",
+            },
+        })
+        with patch("config_modules_vmware.services.config.Config.get_section") as mock_get_section:
+            mock_get_section.side_effect = lambda section: config[section]
+            service_logging.configure_logging()
+
+    def log_from_threads(self, num_threads, num_records):
+        def log_records(thread_index):
+            for record_index in range(num_records):
+                self.logger.info("record %d-%d", thread_index, record_index)
+
+        threads = [threading.Thread(target=log_records, args=(i,)) for i in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def read_log_file(self, tmp_path, name="app.log"):
+        with open(os.path.join(tmp_path, name), encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_async_logging_writes_all_records_on_shutdown(self, tmp_path):
+        self.configure_logging(tmp_path, async_enabled=True)
+        assert any(isinstance(handler, service_logging.BlockingQueueHandler) for handler in self.root_logger.handlers)
+        self.log_from_threads(4, 250)
+        self.logger.debug("debug record")
+        service_logging.shutdown_logging()
+
+        assert not any(isinstance(handler, service_logging.BlockingQueueHandler)
+                       for handler in self.root_logger.handlers)
+        lines = self.read_log_file(tmp_path)
+        assert len(lines) == 1000
+        assert {line.rsplit(" - ", 1)[1] for line in lines} == {
+            f"record {i}-{j}" for i in range(4) for j in range(250)
+        }
+        assert " INFO " in lines[0]
+
+    def test_sync_logging(self, tmp_path):
+        self.configure_logging(tmp_path, async_enabled=False)
+        assert any(isinstance(handler, service_logging.BatchingRotatingFileHandler)
+                   for handler in self.root_logger.handlers)
+        self.logger.info("sync record")
+        # written before shutdown
+        assert self.read_log_file(tmp_path)[0].endswith("sync record")
+
+    def test_reconfigure_replaces_handlers(self, tmp_path):
+        self.configure_logging(tmp_path, async_enabled=True)
+        handlers = list(self.root_logger.handlers)
+        self.configure_logging(tmp_path, async_enabled=True)
+        self.logger.info("single record")
+        service_logging.shutdown_logging()
+        assert self.root_logger.handlers == [handler for handler in handlers
+                                             if not isinstance(handler, service_logging.BlockingQueueHandler)]
+        assert len(self.read_log_file(tmp_path)) == 1
+
+    def test_rotation(self, tmp_path):
+        self.configure_logging(tmp_path, async_enabled=True, file_size=1000, max_count=2)
+        self.log_from_threads(1, 100)
+        service_logging.shutdown_logging()
+
+        assert sorted(os.listdir(tmp_path)) == ["app.log", "app.log.1", "app.log.2"]
+        for name in ("app.log", "app.log.1", "app.log.2"):
+            assert os.path.getsize(os.path.join(tmp_path, name)) < 1000
+        assert self.read_log_file(tmp_path)[-1].endswith("record 0-99")
+
+    def test_rotation_non_ascii(self, tmp_path):
+        self.configure_logging(tmp_path, async_enabled=True, file_size=1000, max_count=2)
+        for record_index in range(100):
+            self.logger.info("%s %d", "✓" * 100, record_index)
+        service_logging.shutdown_logging()
+
+        for name in ("app.log", "app.log.1", "app.log.2"):
+            assert os.path.getsize(os.path.join(tmp_path, name)) < 1000
@@ -124,3 +124,70 @@ def test_check_control_config(
     assert result is not None
     assert result["comment"] == expected_comment
     assert result["result"] == expected_result
+
+
+def mock_multi_product_control_config():
+    return {
+        "compliance_config": {
+            "vcenter": mock_valid_control_config()["compliance_config"]["vcenter"],
+            "sddc_manager": {
+                "ntp": {
+                    "value": {"servers": ["ntp server"]},
+                    "metadata": {"configuration_id": "1605", "configuration_title": "time server"},
+                }
+            },
+        }
+    }
+
+
+@pytest.mark.parametrize(
+    "product_statuses, products, expected_result, expected_comment",
+    [
+        ([ComplianceStatus.COMPLIANT, ComplianceStatus.SKIPPED], None, True,
+         f"vcenter: {ComplianceStatus.COMPLIANT}; sddc_manager: {ComplianceStatus.SKIPPED}"),
+        ([ComplianceStatus.COMPLIANT, ComplianceStatus.NON_COMPLIANT], None, None,
+         f"vcenter: {ComplianceStatus.COMPLIANT}; sddc_manager: {ComplianceStatus.NON_COMPLIANT}"),
+        ([ComplianceStatus.FAILED, ComplianceStatus.NON_COMPLIANT], None, False,
+         f"vcenter: {ComplianceStatus.FAILED}; sddc_manager: {ComplianceStatus.NON_COMPLIANT}"),
+        ([ComplianceStatus.COMPLIANT], ["sddc_manager"], True, f"sddc_manager: {ComplianceStatus.COMPLIANT}"),
+    ],
+)
+def test_check_controls(product_statuses, products, expected_result, expected_comment):
+    mock_compliance_check = MagicMock(
+        side_effect=[{"status": status, "changes": {"status": status}} for status in product_statuses]
+    )
+    with patch.dict(
+            compliance_control.__salt__,
+            {"vmware_compliance_control.control_config_compliance_check": mock_compliance_check},
+    ):
+        with patch.dict(compliance_control.__opts__, {"test": True}):
+            result = compliance_control.check_controls(
+                name=NAME, control_config=mock_multi_product_control_config(), products=products
+            )
+
+    assert result["result"] == expected_result
+    assert result["comment"] == expected_comment
+    assert len(result["changes"]) == len(product_statuses)
+    for call, product in zip(mock_compliance_check.call_args_list, products or ["vcenter", "sddc_manager"]):
+        assert call.kwargs["product"] == product
+        assert list(call.kwargs["control_config"]["compliance_config"]) == [product]
+
+
+def test_check_controls_invalid_config():
+    result = compliance_control.check_controls(name=NAME, control_config={})
+    assert result["result"] is False
+    assert result["comment"] == "An error occurred: Desired spec is empty or not in correct format"
+
+
+def test_check_control_reuses_auth_context():
+    mock_compliance_check = MagicMock(return_value={"status": ComplianceStatus.COMPLIANT})
+    with patch.dict(
+            compliance_control.__salt__,
+            {"vmware_compliance_control.control_config_compliance_check": mock_compliance_check},
+    ):
+        with patch.dict(compliance_control.__opts__, {"test": True, "jid": "20240101000000000001"}):
+            for _ in range(2):
+                compliance_control.check_control(name=NAME, control_config=mock_valid_control_config(),
+                                                 product="vcenter")
+    auth_contexts = [call.kwargs["auth_context"] for call in mock_compliance_check.call_args_list]
+    assert auth_contexts[0] is auth_contexts[1]
@@ -1,10 +1,15 @@
 """
 Unit Tests for compliance control utils.
 """
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
 import pytest
 import salt.exceptions
 
 from config_modules_vmware.framework.auth.contexts.base_context import BaseContext
+from config_modules_vmware.framework.auth.contexts.vc_context import VcenterContext
+from config_modules_vmware.services.config import Config
 from config_modules_vmware.services.salt.utils import compliance_control
 
 
@@ -77,3 +82,97 @@ def test_unsupported_product_auth_context():
         compliance_control.create_auth_context(
             config={"saltext.vmware": {}}, product="unsupported_product", ids=None
         )
+
+
+def lease(config, product, ids=None):
+    with compliance_control.lease_auth_context(config=config, product=product, ids=ids) as auth_context:
+        return auth_context
+
+
+def cached_contexts():
+    return [cached.auth_context for cached in compliance_control._auth_context_cache.values()]
+
+
+@patch("config_modules_vmware.services.salt.utils.compliance_control.time.monotonic")
+def test_lease_auth_context_cache(mock_monotonic):
+    compliance_control.close_auth_contexts()
+    mock_monotonic.return_value = 1000
+    config = dict(vcenter_pillar(), jid="20240101000000000001")
+    auth_context = lease(config, "vcenter")
+    assert lease(config, "vcenter") is auth_context
+
+    # different product, ids, password or job get their own context
+    assert lease(config, "esxi", ids=["host-1"]) is not auth_context
+    other_config = dict(vcenter_pillar(), jid="20240101000000000001")
+    other_config["vcenter"]["password"] = "new-password"
+    assert lease(other_config, "vcenter") is not auth_context
+    other_job_config = dict(vcenter_pillar(), jid="20240101000000000002")
+    assert lease(other_job_config, "vcenter") is not auth_context
+
+    with patch.object(VcenterContext, "__exit__") as mock_exit:
+        compliance_control.close_auth_contexts()
+        assert mock_exit.call_count == 4
+    assert not compliance_control._auth_context_cache
+
+
+@patch("config_modules_vmware.services.salt.utils.compliance_control.time.monotonic")
+def test_lease_auth_context_cache_expired(mock_monotonic):
+    compliance_control.close_auth_contexts()
+    mock_monotonic.return_value = 1000
+    config = dict(vcenter_pillar(), jid="20240101000000000001")
+    auth_context = lease(config, "vcenter")
+
+    # idle expired contexts, including the ones of other jobs, are exited and removed
+    with patch.object(VcenterContext, "__exit__") as mock_exit:
+        mock_monotonic.return_value = 1301
+        other_job_config = dict(vcenter_pillar(), jid="20240101000000000002")
+        other_job_context = lease(other_job_config, "vcenter")
+        assert other_job_context is not auth_context
+        mock_exit.assert_called_once_with(None, None, None)
+        assert cached_contexts() == [other_job_context]
+        compliance_control.close_auth_contexts()
+
+
+@patch("config_modules_vmware.services.salt.utils.compliance_control.time.monotonic")
+def test_lease_auth_context_expired_while_leased(mock_monotonic):
+    compliance_control.close_auth_contexts()
+    mock_monotonic.return_value = 1000
+    config = dict(vcenter_pillar(), jid="20240101000000000001")
+    other_job_config = dict(vcenter_pillar(), jid="20240101000000000002")
+    with patch.object(VcenterContext, "__exit__") as mock_exit:
+        with compliance_control.lease_auth_context(config=config, product="vcenter") as auth_context:
+            # a job running longer than the timeout keeps its context while another job expires it
+            mock_monotonic.return_value = 1301
+            other_job_context = lease(other_job_config, "vcenter")
+            mock_exit.assert_not_called()
+            assert cached_contexts() == [other_job_context]
+            # new leases of the job get a new context
+            assert lease(config, "vcenter") is not auth_context
+        mock_exit.assert_called_once_with(None, None, None)
+        compliance_control.close_auth_contexts()
+
+
+def test_lease_auth_context_without_job():
+    compliance_control.close_auth_contexts()
+    auth_context = lease(vcenter_pillar(), "vcenter")
+    assert lease(vcenter_pillar(), "vcenter") is not auth_context
+    assert not compliance_control._auth_context_cache
+
+
+def test_lease_auth_context_cache_disabled():
+    compliance_control.close_auth_contexts()
+    section = MagicMock()
+    section.getint.return_value = 0
+    with patch.object(Config, "get_section", return_value=section):
+        config = dict(vcenter_pillar(), jid="20240101000000000001")
+        auth_context = lease(config, "vcenter")
+        assert lease(config, "vcenter") is not auth_context
+    assert not compliance_control._auth_context_cache
+
+
+def test_copy_control_config():
+    control_config = {"vcenter": {"ntp": {"value": {"servers": ("ntp server",), "mode": "NTP"}}}}
+    result = compliance_control.copy_control_config(control_config)
+    assert result == {"vcenter": {"ntp": {"value": {"servers": ["ntp server"], "mode": "NTP"}}}}
+    result["vcenter"]["ntp"]["value"]["mode"] = "PTP"
+    assert control_config["vcenter"]["ntp"]["value"]["mode"] == "NTP"